@@ -1,11 +1,10 @@
 """
 pytest 설정 및 공통 fixture 정의
 """
+import json
 import pytest
 import time
 import allure
-from appium import webdriver
-from appium.options.common.base import AppiumOptions
 
 # 페이지 객체들을 import
 from pages.login_page import LoginPage
@@ -14,7 +13,22 @@ from pages.home_page import HomePage
 
 # 헬퍼 함수를 import
 from utils.capabilities_loader import get_capabilities
-from utils.account_loader import get_account_credentials
+from utils.account_pool import account_pool
+from utils.login_state import login_state
+from utils.driver_pool import DriverPool, RESET_MODES, RESET_RESTART, RESET_CLEAR, DEFAULT_APPIUM_URL
+from utils.device_matrix import resolve_target_devices, appium_urls_for, isolate_capabilities
+from utils.smart_wait import wait_stats
+from utils.locator_profiler import locator_profiler
+from utils.command_tracer import command_tracer, to_jsonl, to_chrome_trace
+from utils.step_timing import step_timings
+from utils.failure_artifacts import FailureArtifacts
+from utils.screenshot_store import screenshot_store
+from utils.screen_recorder import ScreenRecorder
+from utils.result_collector import result_collector, marker_names
+from utils.allure_report import GENERATE_LOG_FILE, start_background_generation, update_environment_properties, write_summary
+from utils.git_info import GIT_ENVIRONMENT_PREFIX, allure_environment, get_git_info
+from utils.config_registry import ConfigError, export_registries, seed_registries
+from utils.perf_baseline import PERF_MODES, KIND_TEST, PerfBaseline, device_samples, step_samples, print_regressions
 
 
 def pytest_addoption(parser):
@@ -26,6 +40,13 @@ def pytest_addoption(parser):
         pytest --device galaxy_s22_real
         pytest  (기본값: iPad_9th_15.7_real)
         pytest --auto-report  (테스트 후 자동으로 Allure 리포트 생성)
+        pytest --app-reset clear  (테스트 사이 앱 데이터까지 삭제)
+        pytest --devices iPad_a,galaxy_b  (디바이스별로 병렬 실행)
+        pytest --all-devices  (devices.json의 모든 디바이스에서 병렬 실행)
+        pytest --profile-locators  (locator 조회 시간 측정 + 더 빠른 locator 추천)
+        pytest --trace-commands  (모든 WebDriver 명령 기록 → Allure 첨부 + reports/command_trace.json)
+        pytest --record-screen 30  (화면을 계속 녹화하고 실패 시 직전 30초 영상을 Allure에 첨부)
+        pytest --perf-regression fail  (이전 실행 기준선보다 유의미하게 느려지면 실패 처리)
     """
     parser.addoption(
         "--device",
@@ -33,12 +54,65 @@ def pytest_addoption(parser):
         default="stg_iPad_9th_15.7_real",
         help="디바이스 이름 (devices.json에 정의된 키)"
     )
+    parser.addoption(
+        "--devices",
+        action="store",
+        default=None,
+        help="병렬 실행할 디바이스 목록 (콤마 구분, devices.json에 정의된 키)"
+    )
+    parser.addoption(
+        "--all-devices",
+        action="store_true",
+        default=False,
+        help="devices.json에 정의된 모든 디바이스에서 병렬 실행"
+    )
+    parser.addoption(
+        "--appium-url",
+        action="store",
+        default=DEFAULT_APPIUM_URL,
+        help="Appium 서버 URL (멀티 디바이스 모드에서는 디바이스 순번만큼 포트 증가)"
+    )
+    parser.addoption(
+        "--app-reset",
+        action="store",
+        default=RESET_RESTART,
+        choices=RESET_MODES,
+        help="테스트 사이 앱 초기화 방식 (restart: 종료 후 재실행, clear: 데이터 삭제 후 재실행 - 지원하지 않는 iOS 실기기는 restart, none: 유지)"
+    )
     parser.addoption(
         "--auto-report",
         action="store_true",
         default=False,
         help="테스트 종료 후 자동으로 Allure 리포트 생성"
     )
+    parser.addoption(
+        "--profile-locators",
+        action="store_true",
+        default=False,
+        help="locator 조회 지연 시간을 플랫폼/디바이스별로 측정하고 느린 locator 순위와 대안을 리포트"
+    )
+    parser.addoption(
+        "--trace-commands",
+        action="store_true",
+        default=False,
+        help="모든 WebDriver 명령을 기록해 테스트별 JSONL/Chrome trace를 Allure에 첨부"
+    )
+    parser.addoption(
+        "--record-screen",
+        action="store",
+        type=int,
+        default=0,
+        metavar="SECONDS",
+        help="테스트 동안 화면을 녹화하고 실패 시 직전 SECONDS초 영상을 Allure에 첨부 (0: 녹화 안 함)"
+    )
+    parser.addoption(
+        "--perf-regression",
+        action="store",
+        default="warn",
+        choices=PERF_MODES,
+        help="테스트/단계 소요 시간을 기준선(~/seoltab_AT/perf_baseline.sqlite)과 비교 "
+             "(warn: 경고만, fail: 회귀 시 실패 처리, off: 기록/비교 안 함)"
+    )
     parser.addoption(
         "--slack",
         action="store_true",
@@ -47,6 +121,61 @@ def pytest_addoption(parser):
     )
 
 
+def get_target_devices(config):
+    """
+    --devices / --all-devices 로 지정한 병렬 실행 대상 디바이스 목록을 반환합니다.
+    멀티 디바이스 모드가 아니면 빈 리스트를 반환합니다.
+    """
+    if not hasattr(config, "_target_devices"):
+        try:
+            config._target_devices = resolve_target_devices(
+                config.getoption("--devices"),
+                config.getoption("--all-devices")
+            )
+        except (ValueError, FileNotFoundError) as e:
+            # 잘못된 디바이스 이름 / 설정 파일 오류는 내부 오류 traceback 대신 사용법 오류로 표시
+            raise pytest.UsageError(str(e))
+    return config._target_devices
+
+
+def is_xdist_worker(config):
+    """현재 프로세스가 pytest-xdist 워커인지 확인"""
+    return hasattr(config, "workerinput")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """
+    멀티 디바이스 모드면 디바이스 수만큼 xdist 워커를 띄우고,
+    같은 디바이스의 테스트는 같은 워커로 보내도록(loadgroup) 설정합니다.
+    """
+    if is_xdist_worker(config) or not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    devices = get_target_devices(config)
+    if len(devices) < 2:
+        return
+
+    if not config.option.numprocesses:
+        config.option.numprocesses = len(devices)
+    if config.option.dist in ("no", "load"):
+        config.option.dist = "loadgroup"
+
+
+def pytest_generate_tests(metafunc):
+    """멀티 디바이스 모드면 driver를 사용하는 테스트를 디바이스별로 복제합니다."""
+    devices = get_target_devices(metafunc.config)
+    if not devices or "device_name" not in metafunc.fixturenames:
+        return
+
+    use_xdist = metafunc.config.pluginmanager.hasplugin("xdist")
+    params = [
+        pytest.param(name, id=name, marks=[pytest.mark.xdist_group(name)] if use_xdist else [])
+        for name in devices
+    ]
+    metafunc.parametrize("device_name", params)
+
+
 @pytest.fixture(scope="function")
 def device_name(request):
     """
@@ -55,39 +184,76 @@ def device_name(request):
     return request.config.getoption("--device")
 
 
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    디바이스별 Appium 세션을 보관하는 드라이버 풀 fixture
+    전체 테스트 세션에서 1번만 생성되고, 세션 종료 시 모든 드라이버를 종료합니다.
+    """
+    appium_url = request.config.getoption("--appium-url")
+    devices = get_target_devices(request.config)
+
+    if devices:
+        # 멀티 디바이스 모드: 디바이스마다 Appium 포트와 WDA/systemPort를 분리
+        pool = DriverPool(
+            appium_url=appium_url,
+            reset_mode=request.config.getoption("--app-reset"),
+            capabilities_loader=lambda name: isolate_capabilities(get_capabilities(name), devices.index(name)),
+            appium_urls=appium_urls_for(appium_url, devices)
+        )
+    else:
+        pool = DriverPool(
+            appium_url=appium_url,
+            reset_mode=request.config.getoption("--app-reset")
+        )
+    yield pool
+    pool.quit_all()
+
+
 @pytest.fixture(scope="function")
-def driver(device_name):
+def driver(request, driver_pool, device_name):
     """
     Appium 드라이버 fixture
-    각 테스트 함수마다 새로운 드라이버를 생성하고 종료합니다.
+    드라이버 풀에서 디바이스의 세션을 받아 재사용하고,
+    테스트가 끝나면 앱만 초기화해서 다음 테스트에 넘겨줍니다.
 
-    scope="function": 각 테스트마다 새로 생성 (기본값)
-    scope="session": 전체 테스트 세션에서 1번만 생성
-    scope="module": 모듈(파일)당 1번만 생성
+    새 세션이 꼭 필요한 테스트는 @pytest.mark.fresh_driver 마커를 사용합니다.
 
     Args:
+        driver_pool: 드라이버 풀 (session fixture)
         device_name: 디바이스 이름 (커맨드라인 옵션 또는 기본값)
     """
-    print(f"\n[SETUP] Appium 드라이버를 생성합니다 (디바이스: {device_name})...")
-
-    # device.json 파일에서 Capabilities 정보를 가져옵니다.
-    desired_caps = get_capabilities(device_name)
-
-    # AppiumOptions 객체를 생성하고, 가져온 정보로 로드합니다.
-    options = AppiumOptions().load_capabilities(desired_caps)
-
-    # Appium 드라이버 생성 (Fallback 방식)
-    try:
-        # 먼저 /wd/hub 없이 시도 (Appium 2.x 기본)
-        driver = webdriver.Remote('http://localhost:4723', options=options)
-        print(f"[SETUP] 드라이버 생성 완료 (URL: http://localhost:4723, 디바이스: {device_name}).")
-    except Exception as e:
-        # 실패 시 /wd/hub 경로로 재시도
-        print(f"[SETUP] 첫 번째 연결 실패, /wd/hub 경로로 재시도...")
-        driver = webdriver.Remote('http://localhost:4723/wd/hub', options=options)
-        print(f"[SETUP] 드라이버 생성 완료 (URL: http://localhost:4723/wd/hub, 디바이스: {device_name}).")
-
-    # Allure 환경 정보 추가
+    fresh = request.node.get_closest_marker("fresh_driver") is not None
+    print(f"\n[SETUP] Appium 드라이버를 준비합니다 (디바이스: {device_name}, 새 세션: {fresh})...")
+
+    driver = driver_pool.acquire(device_name, fresh=fresh)
+    desired_caps = driver_pool.get_capabilities(device_name)
+    if locator_profiler.enabled:
+        locator_profiler.register_driver(driver, device_name)
+    if command_tracer.enabled:
+        command_tracer.instrument(driver, device_name)
+        command_tracer.begin_test(request.node.nodeid)
+    step_timings.device = device_name
+    # 실제 UI 로그인을 검증하는 테스트는 저장한 로그인 상태를 쓰지 않고 로그아웃 상태에서 시작
+    login_state.real_login = request.node.get_closest_marker("real_login") is not None
+    if login_state.real_login:
+        start_logged_out(driver_pool, device_name, driver)
+    # 화면 녹화 링 버퍼 (--record-screen): 실패하면 makereport에서 멈추고 첨부
+    record_seconds = request.config.getoption("--record-screen")
+    recorder = None
+    if record_seconds > 0:
+        try:
+            recorder = ScreenRecorder(driver, window_seconds=record_seconds)
+            recorder.start()
+            request.node.stash[screen_recorder_key] = recorder
+        except Exception as e:
+            print(f"[RECORD] 화면 녹화 시작 실패: {e}")
+            recorder = None
+    # 성능 기준선을 디바이스별로 비교하도록 리포트에 디바이스 이름 기록 (xdist 워커 → 컨트롤러로 전달됨)
+    request.node.user_properties.append(("device", device_name))
+
+    # Allure 환경 정보 추가 (멀티 디바이스 실행 결과를 디바이스별로 구분할 수 있도록 태그 추가)
+    allure.dynamic.tag(device_name)
     allure.dynamic.parameter("디바이스", device_name)
     allure.dynamic.parameter("플랫폼", desired_caps.get("platformName", "Unknown"))
     allure.dynamic.parameter("플랫폼 버전", desired_caps.get("appium:platformVersion", "Unknown"))
@@ -95,11 +261,48 @@ def driver(device_name):
     # yield로 테스트에 driver 전달
     yield driver
 
-    # 테스트 종료 후 정리 (teardown)
-    print("\n[TEARDOWN] 테스트를 종료합니다...")
-    time.sleep(3)
-    driver.quit()
-    print("[TEARDOWN] 드라이버를 종료했습니다.")
+    # 이 테스트의 WebDriver 명령 기록 첨부 (--trace-commands)
+    if command_tracer.enabled:
+        attach_command_trace(command_tracer.end_test())
+    step_timings.device = None
+    login_state.real_login = False
+    # 실패하지 않은 테스트의 녹화는 버림 (실패한 테스트는 이미 멈추고 첨부함)
+    if recorder is not None:
+        try:
+            recorder.stop(keep=False)
+        except Exception as e:
+            print(f"[RECORD] 화면 녹화 종료 실패: {e}")
+
+    # 테스트 종료 후 정리 (teardown): 세션은 유지하고 앱만 초기화
+    print("\n[TEARDOWN] 앱을 초기화하고 드라이버를 풀에 반환합니다...")
+    driver_pool.release(device_name)
+
+
+def start_logged_out(driver_pool, device_name, driver):
+    """
+    @pytest.mark.real_login 테스트 전에 앱 데이터를 지워 로그인 화면에서 시작합니다.
+    앱 데이터를 지울 수 없는 디바이스(iOS 실기기 등)는 앱을 재실행한 뒤 로그인되어 있으면 마이페이지에서 로그아웃합니다.
+    로그아웃 상태를 만들지 못하면 실제 UI 로그인을 검증할 수 없으므로 테스트를 실패로 처리합니다.
+    """
+    if driver_pool.reset_app(device_name, RESET_CLEAR) != RESET_CLEAR:
+        try:
+            LoginPage(driver).ensure_logged_out()
+        except Exception as e:
+            pytest.fail(f"[LOGIN] real_login 테스트를 로그아웃 상태에서 시작하지 못했습니다 (디바이스: {device_name}): {e}",
+                        pytrace=False)
+    login_state.mark_logged_out(driver)
+
+
+def attach_command_trace(events):
+    """테스트 하나의 WebDriver 명령 기록을 JSONL과 Chrome trace 형식으로 Allure에 첨부합니다."""
+    if not events:
+        return
+    total_ms = sum(event["dur_ms"] for event in events)
+    print(f"[TRACE] WebDriver 명령 {len(events)}개, 총 {total_ms / 1000:.2f}초")
+    allure.attach(to_jsonl(events), name="WebDriver 명령 (JSONL)",
+                  attachment_type=allure.attachment_type.TEXT, extension="jsonl")
+    allure.attach(json.dumps(to_chrome_trace(events), ensure_ascii=False), name="WebDriver 명령 (Chrome trace)",
+                  attachment_type=allure.attachment_type.JSON)
 
 
 @pytest.fixture(scope="function")
@@ -134,19 +337,43 @@ def my_page(driver):
 
 
 @pytest.fixture
-def test_account():
+def account_lease(request):
+    """
+    계정 풀에서 테스트 동안 독점할 계정을 빌리는 fixture (테스트가 끝나면 반납)
+    병렬 워커 / 디바이스가 같은 계정으로 로그인해 서로의 세션을 끊지 않도록 합니다.
+
+    account_name으로 parametrize한 테스트는 그 계정을, 아니면 빈 계정 아무거나 빌립니다.
+    빈 계정이 없으면 다른 테스트가 반납할 때까지 기다립니다.
+    """
+    callspec = getattr(request.node, "callspec", None)
+    name = callspec.params.get("account_name") if callspec else None
+    lease = account_pool.lease(name, owner=request.node.nodeid)
+    print(f"\n[ACCOUNT] '{lease.name}' 계정을 사용합니다")
+    yield lease
+    lease.release()
+
+
+@pytest.fixture
+def test_account(account_lease):
     """
     테스트 계정 정보를 반환하는 fixture
-    기본적으로 test_account_1을 반환합니다.
+    계정 풀에서 빌린 계정의 (email, password)를 반환합니다. (단일 실행에서는 보통 test_account_1)
     """
-    return get_account_credentials("test_account_1")
+    return account_lease.credentials
+
 
+# 실패 아티팩트 수집 작업 (makereport에서 시작 → teardown 시작 시 첨부)
+failure_artifacts_key = pytest.StashKey[FailureArtifacts]()
+# 테스트 동안 녹화 중인 화면 녹화 링 버퍼 (--record-screen)
+screen_recorder_key = pytest.StashKey[ScreenRecorder]()
 
-# pytest hook: 테스트 실패 시 스크린샷 저장 및 Allure 첨부
+
+# pytest hook: 테스트 실패 시 스크린샷 / 페이지 소스 / 디바이스 로그 수집 시작
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    테스트 실패 시 자동으로 스크린샷을 캡처하고 Allure 리포트에 첨부합니다.
+    테스트 실패 시 스크린샷, 페이지 소스, 디바이스 로그를 백그라운드에서 동시에 수집하기 시작합니다.
+    리포트 hook은 기다리지 않고, 첨부는 teardown 시작 시 합니다. (pytest_runtest_teardown)
     """
     # 테스트 실행
     outcome = yield
@@ -158,30 +385,119 @@ def pytest_runtest_makereport(item, call):
         driver = item.funcargs.get('driver', None)
         if driver:
             try:
-                # 스크린샷 저장
-                screenshot_name = f"screenshots/{item.name}_{int(time.time())}.png"
-                driver.save_screenshot(screenshot_name)
-                print(f"\n[SCREENSHOT] 스크린샷 저장: {screenshot_name}")
-
-                # Allure 리포트에 스크린샷 첨부
-                with open(screenshot_name, 'rb') as image_file:
-                    allure.attach(
-                        image_file.read(),
-                        name=f"실패 스크린샷 - {item.name}",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                print(f"[ALLURE] 스크린샷을 Allure 리포트에 첨부했습니다.")
+                item.stash[failure_artifacts_key] = FailureArtifacts(
+                    driver, item.name, recorder=item.stash.get(screen_recorder_key, None)
+                )
             except Exception as e:
-                print(f"\n[ERROR] 스크린샷 저장/첨부 실패: {e}")
+                print(f"\n[ERROR] 실패 아티팩트 수집 시작 실패: {e}")
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_teardown(item):
+    """
+    앱 초기화(driver fixture teardown) 전에 실패 아티팩트 수집이 끝나기를 기다려 Allure에 첨부합니다.
+    (Allure 첨부는 테스트 실행 스레드에서 해야 하므로 여기서 첨부)
+    """
+    artifacts = item.stash.get(failure_artifacts_key, None)
+    if artifacts is not None:
+        try:
+            artifacts.attach()
+        except Exception as e:
+            print(f"\n[ERROR] 실패 아티팩트 첨부 실패: {e}")
+    yield
+
+
+def pytest_collection_modifyitems(config, items):
+    """결과 수집기가 마커별로 구분할 수 있도록 테스트의 마커를 리포트에 기록합니다. (xdist 워커 → 컨트롤러로 전달됨)"""
+    for item in items:
+        item.user_properties.append(("markers", marker_names(item)))
+
+
+def pytest_runtest_logreport(report):
+    """
+    테스트 결과를 수집합니다. (xdist 워커의 리포트도 컨트롤러에서 받음)
+    Slack / 요약 페이지 / 터미널 요약 / 성능 기준선은 모두 이 결과를 사용합니다.
+    """
+    result_collector.record(report)
+
+
+def get_run_environment():
+    """실행 환경 이름 (CI면 GitHub Actions, 아니면 로컬)"""
+    import os
+
+    is_ci = os.getenv("CI") or os.getenv("GITHUB_ACTIONS") or os.getenv("JENKINS_HOME")
+    return "GitHub Actions" if is_ci else "로컬"
+
+
+def check_perf_regression(session, mode):
+    """
+    이번 실행의 테스트/단계 소요 시간을 기준선과 비교하고 저장합니다.
+
+    Returns:
+        회귀 항목 리스트 (fail 모드에서 회귀가 있으면 session.exitstatus를 실패로 변경)
+    """
+    import sqlite3
+
+    # driver fixture를 사용한 테스트만 기록 (디바이스 없는 단위 테스트 실행은 기준선을 만들지 않음)
+    samples = device_samples(result_collector.duration_samples(KIND_TEST) + step_samples(step_timings.summary()))
+    if mode == "off" or not samples:
+        return []
+
+    git_info = get_git_info()
+    try:
+        with PerfBaseline() as store:
+            regressions = store.compare(samples, git_info["branch"])
+            store.record_run(samples, git_info["branch"], git_info["commit"], get_run_environment())
+    except sqlite3.Error as e:
+        print(f"\n⚠️  성능 기준선 저장소를 사용할 수 없습니다: {e}")
+        return []
+
+    print_regressions(regressions, mode)
+    with open("reports/perf_regressions.json", "w", encoding="utf-8") as f:
+        json.dump(regressions, f, ensure_ascii=False, indent=2)
+
+    if regressions and mode == "fail" and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    return regressions
 
 
+# 세션 시작 시각 (Slack 알림의 전체 소요 시간)
+session_start_key = pytest.StashKey[float]()
+# 컨트롤러가 파싱한 설정 파일 (xdist 워커에 전달)
+config_registry_key = pytest.StashKey[dict]()
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """pytest 시작 시 실행되는 hook"""
     import os
 
+    config.stash[session_start_key] = time.time()
+    # locator 프로파일링 / 명령 기록은 워커에서도 측정해야 하므로 먼저 설정
+    locator_profiler.enabled = config.getoption("--profile-locators")
+    command_tracer.enabled = config.getoption("--trace-commands")
+    # allure.step 구간 시간 수집 (단계별 p50/p95)
+    step_timings.register()
+
+    # xdist 워커는 allure-results를 지우지 않음 (컨트롤러가 한 번만 정리 → 하나의 Allure 실행으로 합쳐짐)
+    if is_xdist_worker(config):
+        config.option.clean_alluredir = False
+        # 컨트롤러가 파싱한 devices.json / accounts.json 사용 (파일이 그대로면 다시 읽지 않음)
+        seed_registries(config.workerinput.get("config_registry"))
+        return
+
+    # 설정 파일 스키마 검증 (테스트 시작 전에 한 번, 결과는 xdist 워커에 전달)
+    try:
+        config.stash[config_registry_key] = export_registries()
+    except ConfigError as e:
+        raise pytest.UsageError(str(e))
+
     # 리포트 디렉토리 생성
     os.makedirs("reports", exist_ok=True)
 
+    # 테스트 결과 수집 (끝날 때마다 reports/results.jsonl에 기록)
+    result_collector.start()
+
     # 스크린샷 디렉토리 생성
     os.makedirs("screenshots", exist_ok=True)
 
@@ -190,40 +506,112 @@ def pytest_configure(config):
     print("="*80)
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist 워커를 띄울 때 컨트롤러가 파싱한 설정 파일을 전달합니다."""
+    node.workerinput["config_registry"] = node.config.stash.get(config_registry_key, None)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist 워커 종료 시 워커가 수집한 통계를 컨트롤러에 합칩니다."""
+    workeroutput = getattr(node, "workeroutput", {})
+    if "wait_stats" in workeroutput:
+        wait_stats.merge(workeroutput["wait_stats"])
+    if "locator_profile" in workeroutput:
+        locator_profiler.merge(workeroutput["locator_profile"])
+    if "command_trace" in workeroutput:
+        command_tracer.merge(workeroutput["command_trace"])
+    if "step_timings" in workeroutput:
+        step_timings.merge(workeroutput["step_timings"])
+    if "screenshot_store" in workeroutput:
+        screenshot_store.merge(workeroutput["screenshot_store"])
+    if "account_pool" in workeroutput:
+        account_pool.merge(workeroutput["account_pool"])
+    if "login_state" in workeroutput:
+        login_state.merge(workeroutput["login_state"])
+
+
 def pytest_sessionfinish(session, exitstatus):
     """pytest 종료 시 실행되는 hook"""
-    import subprocess
     import os
-    import time
+    import shutil
+
+    # 리포트 생성과 Slack 알림은 컨트롤러에서 한 번만 수행
+    # (워커는 수집한 통계만 컨트롤러로 넘김 → pytest_testnodedown)
+    if is_xdist_worker(session.config):
+        session.config.workeroutput["wait_stats"] = wait_stats.as_dict()
+        session.config.workeroutput["locator_profile"] = locator_profiler.as_list()
+        session.config.workeroutput["command_trace"] = command_tracer.events
+        session.config.workeroutput["step_timings"] = step_timings.as_list()
+        session.config.workeroutput["screenshot_store"] = dict(screenshot_store.stats)
+        session.config.workeroutput["account_pool"] = dict(account_pool.stats)
+        session.config.workeroutput["login_state"] = dict(login_state.stats)
+        return
 
     print("\n" + "="*80)
     print("설탭 2.0 테스트 자동화 종료")
     print(f"종료 상태 코드: {exitstatus}")
     print("="*80)
 
+    # 테스트 결과 요약 (reports/results.jsonl)
+    result_collector.close()
+    result_collector.print_summary()
+
+    # locator별 대기 시간 통계
+    wait_stats.print_summary()
+    with open("reports/wait_stats.json", "w", encoding="utf-8") as f:
+        json.dump(wait_stats.as_dict(), f, ensure_ascii=False, indent=2)
+
+    # allure.step 단계별 소요 시간 (Allure Environment 위젯에도 표시)
+    step_timings.print_summary()
+    step_timings.save()
+    step_timings.write_allure_environment(session.config.getoption("allure_report_dir", default=None))
+
+    # Git 브랜치 / 커밋 / 작성자 / 변경 여부, CI 실행 (Allure Environment 위젯)
+    update_environment_properties(session.config.getoption("allure_report_dir", default=None),
+                                  GIT_ENVIRONMENT_PREFIX, allure_environment(get_git_info()))
+
+    # 실패 스크린샷 압축 / 중복 제거 결과
+    screenshot_store.print_summary()
+
+    # 계정 풀 임대 / 대기 횟수
+    account_pool.print_summary()
+
+    # 실제 UI 로그인 / 로그인 상태 복원 횟수
+    login_state.print_summary()
+
+    # 성능 기준선 비교 (--perf-regression, 기본값 warn)
+    check_perf_regression(session, session.config.getoption("--perf-regression"))
+    exitstatus = session.exitstatus
+
+    # locator 조회 성능 프로파일 (--profile-locators)
+    if locator_profiler.enabled:
+        locator_profiler.print_report()
+        locator_profiler.save("reports/locator_profile.json")
+        print("📂 locator 프로파일 저장: reports/locator_profile.json")
+
+    # WebDriver 명령 기록 (--trace-commands)
+    if command_tracer.enabled:
+        command_tracer.print_summary()
+        command_tracer.save()
+        print("📂 WebDriver 명령 기록 저장: reports/command_trace.jsonl, reports/command_trace.json "
+              "(chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+
     # 옵션 확인
     auto_report = session.config.getoption("--auto-report", default=False)
     send_slack = session.config.getoption("--slack", default=False)
 
-    # 테스트 결과 수집 (Slack 알림용)
+    # 테스트 결과 (Slack 알림용, 결과 수집기 기준)
+    counts = result_collector.counts()
     test_stats = {
-        "passed": 0,
-        "failed": 0,
-        "skipped": 0,
-        "total": 0
+        "passed": counts["passed"] + counts["xpassed"],
+        "failed": counts["failed"] + counts["error"],
+        "skipped": counts["skipped"] + counts["xfailed"],
+        "total": counts["total"],
+        "retries": counts["retries"],
     }
 
-    if hasattr(session, 'testscollected'):
-        test_stats["total"] = session.testscollected
-
-    if hasattr(session, 'testsfailed'):
-        test_stats["failed"] = session.testsfailed
-
-    if hasattr(session, 'testsskipped'):
-        test_stats["skipped"] = session.testsskipped
-
-    test_stats["passed"] = test_stats["total"] - test_stats["failed"] - test_stats["skipped"]
-
     if not auto_report:
         print("\n💡 Allure 리포트를 자동 생성하려면: pytest --auto-report")
         print("💡 수동 생성: ./generate_report.sh 또는 allure serve allure-results")
@@ -235,91 +623,69 @@ def pytest_sessionfinish(session, exitstatus):
 
         return
 
-    # 자동 리포트 생성
+    # 자동 리포트 생성: 정적 요약 페이지는 바로, Allure 리포트는 백그라운드에서 (pytest 종료를 막지 않음)
     print("\n" + "="*80)
     print("📊 Allure 리포트 자동 생성 시작...")
     print("="*80)
 
-    start_time = time.time()
-    report_generated = False
+    alluredir = session.config.getoption("allure_report_dir", default=None) or "allure-results"
+    report_started = False
 
     try:
         # allure-results 디렉토리 확인
-        if not os.path.exists("allure-results"):
-            print("⚠️  allure-results 디렉토리가 없습니다. 리포트 생성을 건너뜁니다.")
+        if not os.path.exists(alluredir):
+            print(f"⚠️  {alluredir} 디렉토리가 없습니다. 리포트 생성을 건너뜁니다.")
             return
 
-        # allure 명령어 존재 여부 확인
-        result = subprocess.run(
-            ["which", "allure"],
-            capture_output=True,
-            text=True
-        )
+        start_time = time.time()
+        summary_path = write_summary(alluredir, results=result_collector.summary_rows())
+        if summary_path:
+            print(f"📄 요약 페이지 생성 완료: {summary_path} (소요 시간: {time.time() - start_time:.2f}초)")
 
-        if result.returncode != 0:
+        # allure 명령어 존재 여부 확인
+        if shutil.which("allure") is None:
             print("⚠️  allure 명령어를 찾을 수 없습니다.")
             print("💡 'brew install allure'로 설치하세요.")
-            return
-
-        # Allure 리포트 생성
-        print("🔄 Allure 리포트 생성 중...")
-        result = subprocess.run(
-            ["allure", "generate", "allure-results", "--clean", "-o", "allure-report"],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        elapsed_time = time.time() - start_time
-
-        if result.returncode == 0:
-            print(f"✅ Allure 리포트 생성 완료! (소요 시간: {elapsed_time:.2f}초)")
-            print(f"📂 위치: allure-report/index.html")
-            print(f"💡 브라우저에서 보려면: allure open allure-report")
-            report_generated = True
         else:
-            print(f"❌ Allure 리포트 생성 실패 (소요 시간: {elapsed_time:.2f}초)")
-            if result.stderr:
-                print(f"에러: {result.stderr}")
+            process = start_background_generation(alluredir)
+            report_started = True
+            print(f"🔄 Allure 리포트를 백그라운드에서 생성합니다 (PID {process.pid}, 이전 실행 이력 유지)")
+            print(f"📂 위치: allure-report/index.html (진행 로그: {GENERATE_LOG_FILE})")
+            print("💡 브라우저에서 보려면: allure open allure-report")
 
-    except subprocess.TimeoutExpired:
-        elapsed_time = time.time() - start_time
-        print(f"⏱️  Allure 리포트 생성 시간 초과 (60초 초과, {elapsed_time:.2f}초)")
     except Exception as e:
-        elapsed_time = time.time() - start_time
-        print(f"❌ 예상치 못한 오류 발생 (소요 시간: {elapsed_time:.2f}초): {e}")
+        print(f"❌ 예상치 못한 오류 발생: {e}")
 
     print("="*80)
 
-    # Slack 알림 전송
-    if send_slack and report_generated:
-        from utils.slack_notifier import send_slack_notification, get_git_info
+    # Slack 알림 전송 (리포트 URL은 CI에서 배포하는 GitHub Pages 주소이므로 생성 완료를 기다리지 않음)
+    if send_slack and report_started:
+        from utils.slack_notifier import send_slack_notification
 
         print("\n" + "="*80)
         print("📢 Slack 알림 전송 중...")
         print("="*80)
 
         # CI/CD 환경 감지
-        is_ci = os.getenv("CI") or os.getenv("GITHUB_ACTIONS") or os.getenv("JENKINS_HOME")
+        environment = get_run_environment()
 
-        if is_ci:
+        if environment != "로컬":
             # CI/CD 환경: 공개 리포트 URL 생성 (GitHub Pages)
             run_id = os.getenv("GITHUB_RUN_ID", "latest")
             repo_name = os.getenv("GITHUB_REPOSITORY", "Dave-onuii/seoltab2.0_AT").split("/")[1]
             repo_owner = os.getenv("GITHUB_REPOSITORY", "Dave-onuii/seoltab2.0_AT").split("/")[0]
             report_url = f"https://{repo_owner}.github.io/{repo_name}/reports/{run_id}/index.html"
-            environment = "GitHub Actions"
         else:
             # 로컬 환경: 리포트 URL은 None (메시지에서 제외됨)
             report_url = None
-            environment = "로컬"
 
         # 테스트 결과 정보
         test_result = {
             **test_stats,
-            "duration": elapsed_time,
+            "duration": time.time() - session.config.stash[session_start_key],
             "exit_status": exitstatus,
             "environment": environment,
+            "step_timings": step_timings.format_for_slack(),
             **get_git_info()
         }
 
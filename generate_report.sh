@@ -5,8 +5,8 @@ echo "================================"
 echo "Allure 리포트 생성 중..."
 echo "================================"
 
-# Allure 리포트 생성
-allure generate allure-results --clean -o allure-report
+# Allure 리포트 생성 (이전 리포트의 history/를 유지해서 실행 추이가 이어지도록)
+python3 utils/allure_report.py generate
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -1,11 +1,12 @@
 # pages/base_page.py
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.smart_wait import SmartWait, locator_label
+from utils.element_finder import PageSnapshot
+from utils.locator_profiler import locator_profiler
 
 class BasePage:
     def __init__(self, driver):
         self.driver = driver
-        # 각 메소드에서 WebDriverWait를 직접 생성하므로, __init__에서는 삭제해도 됨
 
     def is_android(self):
         """현재 플랫폼이 Android인지 확인"""
@@ -21,11 +22,78 @@ class BasePage:
 
     # find_element 메소드를 timeout 인자를 받도록 함
     def find_element(self, locator, timeout=20):
-        return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+        condition = EC.visibility_of_element_located(locator)
+        # pytest --profile-locators: 조회 지연 시간 기록 + 더 빠른 locator 후보 실측
+        if locator_profiler.enabled:
+            return locator_profiler.find_element(self.driver, condition, locator, timeout)
+        return SmartWait(self.driver, timeout).until(condition, label=locator_label(locator))
+
+    # 여러 상태 중 먼저 나타나는 상태를 기다림 (예: 로그인 화면 vs 이미 로그인됨)
+    def wait_for_any(self, locators, timeout=20):
+        """
+        여러 요소 중 가장 먼저 보이는 요소를 기다립니다.
+
+        Args:
+            locators: {상태 이름: locator} 딕셔너리 (동시에 보이면 앞에 있는 상태가 우선)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            (상태 이름, 찾은 요소) 튜플
+
+        Raises:
+            TimeoutException: timeout 내에 어떤 요소도 보이지 않은 경우
+        """
+        conditions = {name: EC.visibility_of_element_located(locator) for name, locator in locators.items()}
+        label = " | ".join(locator_label(locator) for locator in locators.values())
+        return SmartWait(self.driver, timeout).until_any(conditions, label=label)
+
+    # 현재 화면의 page_source를 한 번만 가져와 여러 locator를 로컬에서 찾을 수 있는 스냅샷 생성
+    def take_snapshot(self):
+        return PageSnapshot(self.driver.page_source)
+
+    def resolve_elements(self, locators, snapshot=None):
+        """
+        여러 요소를 page_source 한 번으로 찾아 좌표/속성을 반환합니다.
+        스냅샷으로 평가할 수 없는 locator(예: class chain)만 실시간으로 조회합니다.
+
+        Args:
+            locators: {이름: locator} 딕셔너리
+            snapshot: 재사용할 스냅샷 (None이면 새로 생성)
+
+        Returns:
+            {이름: 요소 정보 딕셔너리 또는 None} (실시간 조회한 요소는 'element' 키에 WebElement 포함)
+        """
+        snapshot = snapshot or self.take_snapshot()
+        resolved = {}
+        for name, locator in locators.items():
+            element_info = snapshot.find(locator)
+            if element_info is PageSnapshot.UNSUPPORTED:
+                element_info = self._resolve_live(locator)
+            resolved[name] = element_info
+        return resolved
+
+    def _resolve_live(self, locator):
+        """스냅샷으로 찾을 수 없는 locator를 대기 없이 실시간 조회"""
+        for element in self.driver.find_elements(*locator):
+            if element.is_displayed():
+                rect = element.rect
+                return {
+                    'element': element,
+                    'rect': (rect['x'], rect['y'], rect['width'], rect['height']),
+                    'center': (rect['x'] + rect['width'] // 2, rect['y'] + rect['height'] // 2),
+                    'is_visible': True,
+                }
+        return None
 
     # click과 send_keys도 timeout을 전달받을 수 있도록 수정
-    def click(self, locator, timeout=20):
+    def click(self, locator, timeout=20, snapshot=None):
         print(f"BasePage: '{locator}' 요소를 클릭합니다.")
+        # 스냅샷에서 보이는 요소를 찾으면 좌표로 바로 탭 (찾기 + 클릭 왕복을 1번으로)
+        if snapshot is not None:
+            element_info = snapshot.find(locator)
+            if element_info is not PageSnapshot.UNSUPPORTED and element_info and element_info['center']:
+                self.driver.tap([element_info['center']])
+                return
         self.find_element(locator, timeout).click()
 
     def send_keys(self, locator, text, timeout=20, clear_first=False):
@@ -54,4 +122,28 @@ class BasePage:
         except Exception as e:
             # 검증에 실패하면 FAIL 로그를 남기고, 테스트 중단을 위해 에러를 다시 발생시킵니다.
             print(f"  -> FAIL: '{element_name}' 요소를 찾지 못했습니다.")
-            raise e
\ No newline at end of file
+            raise e
+
+    def verify_elements_visibility(self, locators, timeout=20, snapshot=None):
+        """
+        여러 요소가 보이는지 page_source 한 번으로 검증합니다.
+        스냅샷에서 확인되지 않은 요소만 실시간으로 (timeout까지) 다시 확인합니다.
+
+        Args:
+            locators: {요소 이름: locator} 딕셔너리
+            timeout: 실시간 확인 시 최대 대기 시간 (초)
+            snapshot: 재사용할 스냅샷 (None이면 새로 생성, 같은 화면의 click(snapshot=)과 공유 가능)
+
+        Returns:
+            {요소 이름: 요소 정보 딕셔너리}
+        """
+        print(f"VERIFY: {len(locators)}개 요소가 보이는지 한 번에 확인합니다...")
+        verified = self.resolve_elements(locators, snapshot=snapshot)
+        for element_name, element_info in verified.items():
+            if element_info:
+                print(f"  -> PASS: '{element_name}' 요소가 성공적으로 노출되었습니다.")
+            else:
+                # 스냅샷 이후에 나타나는 경우
+                element = self.verify_element_visibility(locators[element_name], element_name, timeout)
+                verified[element_name] = {'element': element, 'is_visible': True}
+        return verified
@@ -9,25 +9,52 @@ class HomePage(BasePage):
     # --- Locators ---
     INTRO_POPUP_DIALOG = (AppiumBy.ACCESSIBILITY_ID, "introPopupDialog")
     INTRO_POPUP_CLOSE_BUTTON = (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeWindow[1]/**/XCUIElementTypeImage[2]")
-    GNB_HOME = (AppiumBy.ACCESSIBILITY_ID, '\"홈\nTab 1 of 3\"')
-    GNB_TUTORING = (AppiumBy.ACCESSIBILITY_ID, '\"과외\nTab 2 of 3\"')
-    GNB_PREPARATION = (AppiumBy.ACCESSIBILITY_ID, '\"자습\nTab 3 of 3\"')
+    GNB_HOME = (AppiumBy.ACCESSIBILITY_ID, "홈\nTab 1 of 3")
+    GNB_TUTORING = (AppiumBy.ACCESSIBILITY_ID, "과외\nTab 2 of 3")
+    GNB_PREPARATION = (AppiumBy.ACCESSIBILITY_ID, "자습\nTab 3 of 3")
     MY_PAGE_BUTTON = (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeWindow[1]/**/XCUIElementTypeImage")
 
+    # 홈 탭이 먼저 보인 뒤 인트로 팝업이 늦게 뜨는 경우를 한 번 더 기다리는 시간 (초)
+    INTRO_POPUP_RECHECK_TIMEOUT = 2
+
     # --- Actions ---
     def close_intro_popup(self): 
         """인트로 팝업이 열리면 닫는 액션"""
+        # 팝업과 GNB 홈 탭 중 먼저 보이는 상태로 분기 (동시에 보이면 팝업 우선)
         try:
-            self.find_element(self.INTRO_POPUP_DIALOG, timeout=5)
+            state, _ = self.wait_for_any({
+                "popup": self.INTRO_POPUP_DIALOG,
+                "home": self.GNB_HOME,
+            }, timeout=5)
+        except TimeoutException:
+            state = None
+
+        # 홈 탭이 팝업보다 먼저 그려질 수 있으므로 팝업을 짧게 한 번 더 확인
+        if state == "home":
+            try:
+                self.find_element(self.INTRO_POPUP_DIALOG, timeout=self.INTRO_POPUP_RECHECK_TIMEOUT)
+                state = "popup"
+            except TimeoutException:
+                pass
+
+        if state == "popup":
             print("홈 페이지: 인트로 팝업이 노출되었습니다. 닫기를 시도합니다.")
             self.click(self.INTRO_POPUP_CLOSE_BUTTON)
             print("홈 페이지: 인트로 팝업을 닫았습니다.")
-        except TimeoutException:
+        else:
             print("홈 페이지: 인트로 팝업이 나타나지 않았습니다. 다음 단계로 진행합니다.")
-            pass
 
-    def go_to_my_page(self): 
+    def go_to_my_page(self, snapshot=None): 
         """상단 메뉴에서 마이페이지로 진입하는 액션"""
         print("홈 페이지: 마이페이지 버튼을 클릭합니다.")
-        self.click(self.MY_PAGE_BUTTON) # 별도의 timeout 을 설정하지 않으면 base_page 에서 설정해둔 시간이 default
-        print("홈 페이지: 마이페이지로 이동했습니다.")
\ No newline at end of file
+        self.click(self.MY_PAGE_BUTTON, snapshot=snapshot) # 별도의 timeout 을 설정하지 않으면 base_page 에서 설정해둔 시간이 default
+        print("홈 페이지: 마이페이지로 이동했습니다.")
+
+    def verify_home_is_visible(self, snapshot=None):
+        """홈 화면의 GNB 탭과 마이페이지 버튼이 모두 노출되는지 한 번에 확인"""
+        return self.verify_elements_visibility({
+            "홈 탭": self.GNB_HOME,
+            "과외 탭": self.GNB_TUTORING,
+            "자습 탭": self.GNB_PREPARATION,
+            "마이페이지 버튼": self.MY_PAGE_BUTTON,
+        }, snapshot=snapshot)
@@ -1,7 +1,10 @@
 # pages/login_page.py
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from .base_page import BasePage
-from selenium.common.exceptions import TimeoutException # 예외 처리를 위해 import
+from .home_page import HomePage
+from .my_page import MyPage
+from utils.login_state import login_state
 
 class LoginPage(BasePage):
         # iOS Locators
@@ -12,10 +15,13 @@ class LoginPage(BasePage):
     # Android Locators
     ANDROID_EMAIL_INPUT = (AppiumBy.XPATH, "//android.widget.EditText[1]")
     ANDROID_PASSWORD_INPUT = (AppiumBy.XPATH, "//android.widget.EditText[2]")
-    ANDROID_INTRO_POPUP_DIALOG = (AppiumBy.XPATH, "//android.view.View[@content-desc='ntroPopupDialog'/android.view.View/android.view.View/android.view.View/android.widget.ImageView[2]")
+    ANDROID_INTRO_POPUP_DIALOG = (AppiumBy.XPATH, "//android.view.View[@content-desc='introPopupDialog']/android.view.View/android.view.View/android.view.View/android.widget.ImageView[2]")
     
     # 공통 Locators
     LOGIN_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "로그인")
+
+    # 로그인 버튼 클릭 후 로그인 완료(인트로 팝업)를 기다리는 시간 (초)
+    LOGIN_CONFIRM_TIMEOUT = 15
     
     
     def __init__(self, driver):
@@ -34,20 +40,69 @@ class LoginPage(BasePage):
             
     # --- Actions (기능들) --- 
     def login(self, email, password):
-        """로그인 페이지가 노출되면 로그인을 진행하고 그렇지 않으면 인트로 팝업 노출여부로 로그인 여부를 체크 함"""
+        """로그인 페이지가 노출되면 로그인을 진행하고 그렇지 않으면 인트로 팝업 노출여부로 로그인 여부를 체크 함
+        같은 디바이스 + 계정으로 이미 실제 로그인한 적이 있으면 저장한 로그인 상태를 복원해 입력을 건너뜀 (utils/login_state.py)
+        다른 계정이나 알 수 없는 계정으로 로그인되어 있으면 로그아웃 후 email 계정으로 다시 로그인 함"""
+        # 이메일 입력창(로그인 필요)과 인트로 팝업(이미 로그인됨) 중 먼저 나타나는 상태로 바로 분기
+        state = self._wait_login_state()
+        current_account = login_state.logged_in_account(self.driver)
+
+        # 로그인 화면이거나 다른 계정으로 로그인되어 있으면 저장한 상태로 복원 (@pytest.mark.real_login 테스트 제외)
+        if (state == "login_form" or current_account not in (None, email)) and login_state.restore(self.driver, email):
+            state = self._wait_login_state()
+            login_state.confirm_restore(self.driver, email, state == "logged_in")
+            if state == "logged_in":
+                return
+
+        if state == "logged_in" and current_account == email:
+            print("인트로 팝업이 노출되었습니다. 이미 로그인 되어 있으므로 로그인 스크립트를 종료합니다.")
+            login_state.mark_reused(self.driver, email)
+            return
+
+        if state == "logged_in":
+            # 계정 풀이 빌려준 계정이 아니거나(다른 디바이스와 같은 계정 사용) 어떤 계정인지 모르면(이전 실행이 남긴 로그인)
+            # 그대로 쓰지 않고 로그아웃 후 빌린 계정으로 실제 로그인
+            print(f"[LOGIN] {current_account or '알 수 없는'} 계정으로 로그인되어 있습니다. "
+                  f"로그아웃 후 {email} 계정으로 로그인합니다.")
+            self._logout()
+
+        print("이메일 입력창이 노출되었습니다. 로그인을 시도합니다...")
+        self.send_keys(self.EMAIL_INPUT, email, clear_first=True)
+        self.send_keys(self.PASSWORD_INPUT, password, clear_first=True)
+        self.click(self.LOGIN_BUTTON)
+        print("로그인 버튼을 클릭했습니다.")
+
+        # 로그인이 끝나 인트로 팝업이 보이면 로그인 상태 저장 (로그인 실패는 다음 단계에서 검증)
+        # 상태 저장은 부가 기능이므로 확인 중 어떤 WebDriver 오류(타임아웃, 잘못된 locator 등)가 나도 로그인은 진행
         try:
-            self.find_element(self.EMAIL_INPUT, timeout=30)
-            print("이메일 입력창이 노출되었습니다. 로그인을 시도합니다...")
-            self.send_keys(self.EMAIL_INPUT, email, clear_first=True)
-            self.send_keys(self.PASSWORD_INPUT, password, clear_first=True)
-            self.click(self.LOGIN_BUTTON)
-            print("로그인 버튼을 클릭했습니다.")
-        except TimeoutException:
-            # 5초 내에 팝업이 나타나지 않으면, 이미 닫혔거나 없는 것으로 간주하고 조용히 넘어갑니다.
-            print("이메일 입력창이 나타나지 않았습니다. 이미 로그인 되어 있는지 확인 합니다.")
-            self.find_element(self.INTRO_POPUP_DIALOG, timeout=5)
-            print("인트로 팝업이 노출되었습니다. 로그인 스크립트를 종료합니다.")
-            pass # 아무것도 하지 않고 넘어갑니다.
+            self.find_element(self.INTRO_POPUP_DIALOG, timeout=self.LOGIN_CONFIRM_TIMEOUT)
+        except WebDriverException as e:
+            if not isinstance(e, TimeoutException):
+                print(f"⚠️  로그인 완료를 확인하지 못해 로그인 상태를 저장하지 않습니다: {e.msg}")
+            return
+        login_state.mark_logged_in(self.driver, email)
+
+    def ensure_logged_out(self):
+        """로그인되어 있으면 로그아웃해 로그인 화면에서 시작 (앱 데이터를 지울 수 없는 디바이스의 real_login 테스트용)"""
+        if self._wait_login_state() == "logged_in":
+            print("[LOGIN] 로그인되어 있어 마이페이지에서 로그아웃합니다.")
+            self._logout()
+
+    def _logout(self):
+        """홈 → 마이페이지에서 로그아웃하고 로그인 화면이 나타나는지 확인"""
+        home_page = HomePage(self.driver)
+        home_page.close_intro_popup()
+        home_page.go_to_my_page()
+        MyPage(self.driver).click_logout_button()
+        self.verify_element_visibility(self.EMAIL_INPUT, "이메일 입력창")
+
+    def _wait_login_state(self):
+        """로그인 화면("login_form") / 로그인됨("logged_in") 중 현재 상태"""
+        state, _ = self.wait_for_any({
+            "login_form": self.EMAIL_INPUT,
+            "logged_in": self.INTRO_POPUP_DIALOG,
+        }, timeout=30)
+        return state
 
     def verify_login_page_is_visible(self): # BasePage에 만든 검증 메서드를 호출합니다.
         """로그아웃 후 로그인 페이지로 정상 랜딩되었는지 로그인 버튼 노출 여부로 확인 함"""
@@ -1,6 +1,7 @@
 # pages/my_page.py
 from appium.webdriver.common.appiumby import AppiumBy
 from .base_page import BasePage
+from utils.login_state import login_state
 
 class MyPage(BasePage):
     # --- Locators ---
@@ -14,7 +15,15 @@ class MyPage(BasePage):
         email_element = self.find_element(self.EMAIL_TEXT_FIELD)
         return email_element.get_attribute('value')
 
-    def click_logout_button(self):
+    def verify_my_page_is_visible(self, snapshot=None):
+        """마이페이지의 이메일 정보와 로그아웃 버튼이 모두 노출되는지 한 번에 확인"""
+        return self.verify_elements_visibility({
+            "이메일 정보": self.EMAIL_TEXT_FIELD,
+            "로그아웃 버튼": self.LOGOUT_BUTTON,
+        }, snapshot=snapshot)
+
+    def click_logout_button(self, snapshot=None):
         """마이페이지 하단 로그아웃 버튼을 클릭"""
         print("로그아웃 버튼을 클릭합니다.")
-        self.click(self.LOGOUT_BUTTON)
\ No newline at end of file
+        self.click(self.LOGOUT_BUTTON, snapshot=snapshot)
+        login_state.mark_logged_out(self.driver)
\ No newline at end of file
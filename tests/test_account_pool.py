@@ -0,0 +1,141 @@
+"""
+테스트 계정 풀 테스트 (임시 잠금 디렉토리 사용)
+
+다른 프로세스가 잠근 계정은 빌려주지 않는지, 대기 / 타임아웃, "pool": false 계정 제외,
+같은 프로세스의 중복 임대, 이전에 쓰던 계정 우선 임대를 검증합니다.
+"""
+import multiprocessing
+import threading
+
+import pytest
+import allure
+
+import utils.account_pool as account_pool_module
+from utils.account_pool import AccountPool
+
+
+ACCOUNTS = {
+    "test_account_1": {"email": "test1@example.com", "password": "pw1"},
+    "test_account_2": {"email": "test2@example.com", "password": "pw2"},
+    "admin_account": {"email": "admin@example.com", "password": "pw", "pool": False},
+}
+
+# 잠금 파일을 프로세스 사이에서 확인하므로 fork로 자식 프로세스를 만듦 (monkeypatch한 계정 목록 유지)
+fork = multiprocessing.get_context("fork")
+
+
+@pytest.fixture(autouse=True)
+def accounts(monkeypatch):
+    """config/accounts.json 대신 테스트용 계정 목록"""
+    monkeypatch.setattr(account_pool_module, "get_account", ACCOUNTS.__getitem__)
+    monkeypatch.setattr(account_pool_module, "get_account_names", lambda: list(ACCOUNTS))
+
+
+@pytest.fixture
+def pool(tmp_path):
+    return AccountPool(lease_dir=tmp_path / "leases", timeout=0.3, poll_interval=0.05)
+
+
+def hold_account(lease_dir, name, leased, release):
+    """자식 프로세스: 계정을 빌리고 release 이벤트까지 잡고 있음"""
+    with AccountPool(lease_dir=lease_dir).lease(name, owner="child_test"):
+        leased.set()
+        release.wait(10)
+
+
+@pytest.fixture
+def child_holding(pool):
+    """다른 프로세스가 계정을 잡고 있는 상태를 만드는 함수 (테스트가 끝나면 자식 프로세스 정리)"""
+    processes = []
+
+    def start(name):
+        leased, release = fork.Event(), fork.Event()
+        process = fork.Process(target=hold_account, args=(pool.lease_dir, name, leased, release))
+        process.start()
+        processes.append(process)
+        assert leased.wait(10), "자식 프로세스가 계정을 빌리지 못했습니다"
+        return process, release
+
+    yield start
+    for process in processes:
+        process.terminate()
+        process.join(10)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("계정 풀")
+def test_account_held_by_other_process_is_skipped(pool, child_holding):
+    """다른 프로세스가 빌린 계정은 건너뛰고, 빈 계정이 없으면 사용자를 표시하며 TimeoutError를 발생시킵니다."""
+    process, _ = child_holding("test_account_1")
+
+    lease = pool.lease(owner="parent_test")
+    assert lease.name == "test_account_2"
+
+    with pytest.raises(TimeoutError) as error:
+        AccountPool(lease_dir=pool.lease_dir, poll_interval=0.05).lease(timeout=0.3)
+    message = str(error.value)
+    assert "0초 동안 빈 계정이 없습니다" in message
+    assert "test_account_1 ← " in message and "child_test" in message
+    assert "test_account_2 ← " in message and "parent_test" in message
+
+    # 비정상 종료한 프로세스의 잠금은 운영체제가 풀어줌
+    process.kill()
+    process.join(10)
+    assert AccountPool(lease_dir=pool.lease_dir).lease("test_account_1", timeout=0).name == "test_account_1"
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("계정 풀")
+def test_waits_until_other_process_releases(pool, child_holding):
+    """이름으로 지정한 계정을 다른 프로세스가 쓰고 있으면 반납될 때까지 기다립니다."""
+    process, release = child_holding("test_account_1")
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+
+    lease = pool.lease("test_account_1", timeout=10)
+    timer.join()
+
+    assert lease.email == "test1@example.com"
+    assert pool.stats["leases"] == 1 and pool.stats["waits"] == 1
+    process.join(10)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("계정 풀")
+def test_accounts_outside_pool_are_leased_only_by_name(pool):
+    """"pool": false 계정은 빈 계정으로 빌려주지 않고, 이름으로 지정할 때만 빌려줍니다."""
+    assert "admin_account" not in pool.candidates()
+
+    first, second = pool.lease(), pool.lease()
+    assert {first.name, second.name} == {"test_account_1", "test_account_2"}
+    with pytest.raises(TimeoutError):
+        pool.lease()
+
+    assert pool.lease("admin_account").credentials == ("admin@example.com", "pw")
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("계정 풀")
+def test_same_process_cannot_lease_held_account_by_name(pool):
+    """같은 프로세스에서 아직 반납하지 않은 계정을 이름으로 다시 빌리면 바로 RuntimeError를 발생시킵니다."""
+    lease = pool.lease("test_account_1")
+
+    with pytest.raises(RuntimeError):
+        pool.lease("test_account_1")
+
+    lease.release()
+    assert lease.released
+    with pool.lease("test_account_1") as again:
+        assert again.name == "test_account_1"
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("계정 풀")
+def test_prefers_last_used_account(pool):
+    """이름을 지정하지 않으면 이 프로세스에서 마지막으로 쓴 계정을 먼저 빌려줍니다. (로그인 상태 재사용)"""
+    assert pool.candidates()[0] == "test_account_1"
+    pool.lease("test_account_2").release()
+
+    assert pool.candidates() == ["test_account_2", "test_account_1"]
+    with pool.lease() as lease:
+        assert lease.name == "test_account_2"
@@ -0,0 +1,171 @@
+"""
+설정 파일 레지스트리 테스트 (임시 설정 디렉토리 사용)
+
+레이어를 합치는 순서(기본 → SEOLTAB_ENV → 실제 설정), 파일이 바뀔 때만 다시 읽는지,
+스키마 오류를 한 번에 보고하는지, xdist 워커가 컨트롤러의 파싱 결과를 다시 파싱하지 않고 쓰는지 검증합니다.
+"""
+import json
+import os
+
+import pytest
+import allure
+
+from utils.config_registry import ConfigError, ConfigRegistry, validate_accounts, validate_devices
+
+
+IPAD = {"platformName": "iOS", "appium:automationName": "XCUITest", "appium:udid": "base-udid"}
+GALAXY = {"platformName": "Android", "appium:automationName": "UiAutomator2"}
+
+
+@pytest.fixture(autouse=True)
+def no_env(monkeypatch):
+    """사용자 환경의 SEOLTAB_ENV 무시"""
+    monkeypatch.delenv("SEOLTAB_ENV", raising=False)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    """(기본 설정 디렉토리, 실제 설정 디렉토리)"""
+    config_dir, home_dir = tmp_path / "config", tmp_path / "home"
+    config_dir.mkdir()
+    home_dir.mkdir()
+    return config_dir, home_dir
+
+
+def write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def touch_later(path):
+    """내용과 크기는 그대로 두고 수정 시각만 1초 뒤로 바꿈"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def devices(dirs):
+    config_dir, home_dir = dirs
+    return ConfigRegistry("devices", validate_devices, "디바이스를", config_dir=config_dir, home_config_dir=home_dir)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("설정 레지스트리")
+def test_layers_merge_in_order(dirs, monkeypatch):
+    """기본 → SEOLTAB_ENV → 실제 설정 순서로 덮어쓰고, 같은 디바이스는 항목 단위로 합칩니다."""
+    config_dir, home_dir = dirs
+    monkeypatch.setenv("SEOLTAB_ENV", "stg")
+    write(config_dir / "devices.json", {"iPad": IPAD, "Galaxy": GALAXY})
+    write(config_dir / "devices.stg.json", {"iPad": {"appium:udid": "stg-udid", "appium:bundleId": "stg.bundle"}})
+    write(home_dir / "devices.json", {"iPad": {"appium:udid": "real-udid"}, "Pixel": GALAXY})
+    registry = devices(dirs)
+
+    assert registry.layer_paths() == [config_dir / "devices.json", config_dir / "devices.stg.json",
+                                      home_dir / "devices.json"]
+    assert registry.names() == ["iPad", "Galaxy", "Pixel"]
+    assert registry.entry("iPad") == {**IPAD, "appium:udid": "real-udid", "appium:bundleId": "stg.bundle"}
+    assert registry.entry("Galaxy") == GALAXY
+
+    # entry()는 복사본이므로 수정해도 캐시에 영향 없음
+    registry.entry("Galaxy")["platformName"] = "iOS"
+    assert registry.entry("Galaxy") == GALAXY
+    with pytest.raises(ValueError):
+        registry.entry("없는_디바이스")
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("설정 레지스트리")
+def test_reloads_only_when_signature_changes(dirs):
+    """레이어 파일의 수정 시각 / 크기가 바뀌거나 레이어가 추가될 때만 다시 읽습니다."""
+    config_dir, home_dir = dirs
+    base = config_dir / "devices.json"
+    write(base, {"iPad": IPAD})
+    registry = devices(dirs)
+
+    registry.data()
+    registry.names()
+    registry.entry("iPad")
+    assert registry.load_count == 1
+
+    touch_later(base)
+    registry.data()
+    assert registry.load_count == 2
+
+    write(base, {"iPad": IPAD, "Galaxy": GALAXY})
+    assert registry.names() == ["iPad", "Galaxy"]
+    assert registry.load_count == 3
+
+    write(home_dir / "devices.json", {"iPad": {"appium:udid": "real-udid"}})
+    assert registry.entry("iPad")["appium:udid"] == "real-udid"
+    registry.data()
+    assert registry.load_count == 4
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("설정 레지스트리")
+def test_validation_errors_are_reported_together(dirs):
+    """합친 설정의 스키마 오류를 모두 모아 ConfigError 하나로 보고합니다."""
+    config_dir, home_dir = dirs
+    write(config_dir / "devices.json", {
+        "iPad": IPAD,
+        "no_platform": {"appium:automationName": "XCUITest"},
+        "no_automation": {"platformName": "Windows"},
+        "not_object": "iPad",
+    })
+
+    with pytest.raises(ConfigError) as error:
+        devices(dirs).data()
+    message = str(error.value)
+    assert "no_platform: platformName은 iOS 또는 Android여야 합니다 (현재: None)" in message
+    assert "no_automation: platformName은 iOS 또는 Android여야 합니다 (현재: 'Windows')" in message
+    assert "no_automation: appium:automationName이 없습니다" in message
+    assert "not_object: 디바이스 설정은 객체여야 합니다" in message
+    assert "iPad:" not in message
+
+    write(config_dir / "accounts.json", {"account": {"email": "", "pool": "yes"}})
+    accounts = ConfigRegistry("accounts", validate_accounts, "계정을", config_dir=config_dir, home_config_dir=home_dir)
+    with pytest.raises(ConfigError) as error:
+        accounts.data()
+    assert all(text in str(error.value) for text in ("email가 없습니다", "password가 없습니다", "pool은 true 또는 false"))
+    assert accounts.load_count == 0
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("설정 레지스트리")
+def test_invalid_json_and_missing_files(dirs):
+    """JSON 형식 오류는 ConfigError, 레이어 파일이 하나도 없으면 FileNotFoundError (export는 None)입니다."""
+    config_dir, _ = dirs
+    registry = devices(dirs)
+
+    with pytest.raises(FileNotFoundError):
+        registry.data()
+    assert registry.export() is None
+
+    (config_dir / "devices.json").write_text("{", encoding="utf-8")
+    with pytest.raises(ConfigError, match="형식이 올바르지 않습니다"):
+        registry.data()
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("설정 레지스트리")
+def test_seeded_worker_skips_reparse(dirs):
+    """워커는 컨트롤러가 export한 결과를 seed하면 파일이 그대로인 동안 다시 파싱하지 않습니다."""
+    config_dir, _ = dirs
+    base = config_dir / "devices.json"
+    write(base, {"iPad": IPAD})
+    exported = devices(dirs).export()
+
+    worker = devices(dirs)
+    worker.seed(exported)
+    assert worker.entry("iPad") == IPAD
+    assert worker.names() == ["iPad"]
+    assert worker.load_count == 0
+
+    # 워커가 시작된 뒤 파일이 바뀌면 다시 읽음
+    touch_later(base)
+    worker.data()
+    assert worker.load_count == 1
+
+    # 비어 있는 결과(컨트롤러에 파일이 없던 경우)는 무시하고 직접 읽음
+    other = devices(dirs)
+    other.seed(None)
+    other.data()
+    assert other.load_count == 1
@@ -0,0 +1,127 @@
+"""
+드라이버 풀 테스트 (가짜 WebDriver 서버 사용)
+
+실제 디바이스 없이 세션 재사용, 앱 초기화, 세션 복구 동작을 검증합니다.
+"""
+import pytest
+import allure
+
+from utils.driver_pool import DriverPool, RESET_CLEAR, RESET_NONE, RESET_RESTART
+from utils.fake_webdriver_server import FakeWebDriverServer
+
+
+DEVICE_CAPS = {
+    "stg_iPad": {
+        "platformName": "iOS",
+        "appium:automationName": "XCUITest",
+        "appium:bundleId": "com.onuii.IOS.SolTab.stg",
+    },
+    "stg_Galaxy": {
+        "platformName": "Android",
+        "appium:automationName": "UiAutomator2",
+        "appium:appPackage": "com.seoltab.seoltab.stg",
+    },
+}
+
+
+@pytest.fixture
+def fake_server():
+    """가짜 WebDriver 서버 fixture"""
+    with FakeWebDriverServer() as server:
+        yield server
+
+
+def make_pool(server, **kwargs):
+    return DriverPool(appium_url=server.url, capabilities_loader=DEVICE_CAPS.__getitem__, **kwargs)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("드라이버 풀")
+def test_pool_reuses_session_and_restarts_app(fake_server):
+    """같은 디바이스는 세션을 한 번만 만들고, 반환 시 앱만 종료/재실행합니다."""
+    pool = make_pool(fake_server)
+
+    first = pool.acquire("stg_iPad")
+    pool.release("stg_iPad")
+    second = pool.acquire("stg_iPad")
+    pool.release("stg_iPad")
+
+    assert first is second
+    assert fake_server.command_names().count("newSession") == 1
+    assert fake_server.command_names().count("mobile: terminateApp") == 2
+    assert fake_server.command_names().count("mobile: activateApp") == 2
+    assert pool.stats["created"] == 1
+    assert pool.stats["reused"] == 1
+
+    pool.quit_all()
+    assert fake_server.command_names()[-1] == "deleteSession"
+    assert fake_server.sessions == {}
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("드라이버 풀")
+def test_pool_keeps_one_session_per_device(fake_server):
+    """디바이스마다 별도의 세션을 보관합니다."""
+    pool = make_pool(fake_server, reset_mode=RESET_NONE)
+
+    ipad = pool.acquire("stg_iPad")
+    galaxy = pool.acquire("stg_Galaxy")
+
+    assert ipad.session_id != galaxy.session_id
+    assert len(fake_server.sessions) == 2
+    pool.quit_all()
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("드라이버 풀")
+def test_pool_clear_reset_clears_app_data(fake_server):
+    """clear 모드는 앱 데이터를 삭제한 뒤 다시 실행합니다."""
+    pool = make_pool(fake_server, reset_mode=RESET_CLEAR)
+
+    pool.acquire("stg_Galaxy")
+    pool.release("stg_Galaxy")
+
+    names = fake_server.command_names()
+    assert names.index("mobile: terminateApp") < names.index("mobile: clearApp") < names.index("mobile: activateApp")
+    assert pool.reset_app("stg_Galaxy", RESET_CLEAR) == RESET_CLEAR
+    pool.quit_all()
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("드라이버 풀")
+def test_pool_clear_falls_back_to_restart_when_unsupported(fake_server, capsys):
+    """앱 데이터 삭제를 지원하지 않는 디바이스(iOS 실기기)는 세션을 유지하고 재실행으로 대신합니다. (경고 한 번)"""
+    fake_server.unsupported_scripts.add("mobile: clearApp")
+    pool = make_pool(fake_server, reset_mode=RESET_CLEAR)
+
+    first = pool.acquire("stg_iPad")
+    pool.release("stg_iPad")
+    second = pool.acquire("stg_iPad")
+    pool.release("stg_iPad")
+
+    assert first is second
+    names = fake_server.command_names()
+    assert names.count("newSession") == 1
+    assert names.count("mobile: clearApp") == 1
+    assert names.count("mobile: activateApp") == 2
+    assert capsys.readouterr().out.count("앱 데이터를 지울 수 없어") == 1
+    assert pool.reset_app("stg_iPad", RESET_CLEAR) == RESET_RESTART
+    pool.quit_all()
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("드라이버 풀")
+def test_pool_fresh_session_and_recovery(fake_server):
+    """fresh 요청이나 끊어진 세션은 새 세션으로 교체합니다."""
+    pool = make_pool(fake_server)
+
+    first = pool.acquire("stg_iPad")
+    fresh = pool.acquire("stg_iPad", fresh=True)
+    assert fresh.session_id != first.session_id
+
+    fake_server.kill_session(fresh.session_id)
+    recovered = pool.acquire("stg_iPad")
+    assert recovered.session_id != fresh.session_id
+    assert pool.stats["recovered"] == 1
+    assert fake_server.command_names().count("newSession") == 3
+    pool.quit_all()
@@ -0,0 +1,155 @@
+"""
+Git 메타데이터 테스트 (임시 저장소 사용)
+
+git CLI로 만든 임시 저장소에서 .git 디렉토리를 직접 읽은 결과가
+`git rev-parse` / `git describe --dirty`와 같은지 검증합니다.
+"""
+import shutil
+import subprocess
+
+import pytest
+import allure
+
+from utils.git_info import _cached_git_info, get_git_info
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git CLI가 없습니다")
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """커밋 3개가 있는 임시 저장소 (사용자 / 시스템 git 설정과 CI 환경 변수 무시)"""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for name in ("GITHUB_HEAD_REF", "GITHUB_REF_NAME", "GITHUB_RUN_ID", "BUILD_ID", "BUILD_URL"):
+        monkeypatch.delenv(name, raising=False)
+
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    git(path, "config", "user.name", "테스트 작성자")
+    git(path, "config", "user.email", "tester@example.com")
+    git(path, "config", "gc.auto", "0")
+    (path / "pages").mkdir()
+    # pack에서 delta로 저장되도록 조금씩만 바뀌는 큰 파일
+    lines = [f"line {number}" for number in range(500)]
+    for version in range(3):
+        lines[version] = f"changed {version}"
+        (path / "pages" / "login_page.py").write_text("\n".join(lines))
+        (path / f"file{version}.txt").write_text(f"{version}\n")
+        git(path, "add", "-A")
+        git(path, "commit", "-q", "-m", f"커밋 {version}\n\n본문")
+
+    _cached_git_info.cache_clear()
+    yield path
+    _cached_git_info.cache_clear()
+
+
+def info(repo):
+    _cached_git_info.cache_clear()
+    return get_git_info(str(repo))
+
+
+def cli_dirty(repo) -> bool:
+    return git(repo, "describe", "--always", "--dirty").endswith("-dirty")
+
+
+def assert_matches_cli(repo, branch="main"):
+    result = info(repo)
+    assert result["commit"] == git(repo, "rev-parse", "HEAD")
+    assert result["branch"] == branch
+    assert result["dirty"] == cli_dirty(repo)
+    return result
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_loose_objects(repo):
+    """loose 객체 / loose ref 저장소에서 커밋, 작성자, 메시지 첫 줄을 읽습니다."""
+    result = assert_matches_cli(repo)
+
+    assert result["author"] == "테스트 작성자"
+    assert result["author_email"] == "tester@example.com"
+    assert result["subject"] == "커밋 2"
+    assert result["dirty"] is False
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_packed_objects_after_gc(repo):
+    """git gc 후 pack(delta 포함)과 packed-refs에서 읽습니다."""
+    git(repo, "gc", "-q", "--prune=now")
+    assert not list((repo / ".git" / "objects").glob("??/*"))
+
+    assert assert_matches_cli(repo)["subject"] == "커밋 2"
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_packed_refs_only(repo):
+    """브랜치 ref 파일이 없고 packed-refs에만 있어도 커밋을 찾습니다."""
+    git(repo, "pack-refs", "--all")
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+
+    assert_matches_cli(repo)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_detached_head(repo, monkeypatch):
+    """detached HEAD는 커밋 해시를 읽고, 브랜치는 CI 환경 변수(없으면 "HEAD")를 사용합니다."""
+    git(repo, "checkout", "-q", "--detach", "HEAD~1")
+
+    assert assert_matches_cli(repo, branch="HEAD")["subject"] == "커밋 1"
+
+    monkeypatch.setenv("GITHUB_REF_NAME", "feature/login")
+    assert info(repo)["branch"] == "feature/login"
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+@pytest.mark.parametrize("change", ["staged_deletion", "cached_deletion", "worktree_edit", "worktree_deletion",
+                                    "staged_new_file", "untracked_file"])
+def test_dirty_matches_git_describe(repo, change):
+    """변경 종류마다 dirty가 git describe --dirty와 같습니다. (추적하지 않는 파일은 dirty 아님)"""
+    if change == "staged_deletion":
+        git(repo, "rm", "-q", "file0.txt")
+    elif change == "cached_deletion":
+        git(repo, "rm", "-q", "--cached", "file0.txt")
+    elif change == "worktree_edit":
+        (repo / "file1.txt").write_text("수정됨\n")
+    elif change == "worktree_deletion":
+        (repo / "pages" / "login_page.py").unlink()
+    elif change == "staged_new_file":
+        (repo / "new.txt").write_text("new\n")
+        git(repo, "add", "new.txt")
+    else:
+        (repo / "new.txt").write_text("new\n")
+
+    result = assert_matches_cli(repo)
+    assert result["dirty"] is (change != "untracked_file")
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_index_version_4(repo):
+    """경로가 압축된 index v4도 읽습니다."""
+    git(repo, "update-index", "--index-version", "4")
+    assert assert_matches_cli(repo)["dirty"] is False
+
+    git(repo, "rm", "-q", "pages/login_page.py")
+    assert assert_matches_cli(repo)["dirty"] is True
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Git 정보")
+def test_not_a_repository(tmp_path):
+    """저장소가 아니면 unknown / N/A를 반환합니다."""
+    result = info(tmp_path)
+
+    assert result["branch"] == "unknown" and result["commit"] == "N/A"
+    assert result["dirty"] is None
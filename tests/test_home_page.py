@@ -0,0 +1,65 @@
+"""
+홈 페이지 테스트 (가짜 WebDriver 서버 사용)
+
+홈 탭이 인트로 팝업보다 먼저 보여도, 조금 늦게 뜨는 팝업을 놓치지 않고 닫는지 검증합니다.
+"""
+import pytest
+import allure
+
+from pages.home_page import HomePage
+from utils.driver_pool import DriverPool, RESET_NONE
+from utils.fake_webdriver_server import FakeWebDriverServer
+
+
+DEVICE_CAPS = {
+    "stg_Galaxy": {
+        "platformName": "Android",
+        "appium:automationName": "UiAutomator2",
+        "appium:appPackage": "com.seoltab.seoltab.stg",
+    },
+}
+
+
+@pytest.fixture
+def fake_server():
+    """가짜 WebDriver 서버 fixture"""
+    with FakeWebDriverServer() as server:
+        yield server
+
+
+@pytest.fixture
+def home_page(fake_server, monkeypatch):
+    """가짜 서버에 연결한 홈 페이지 (팝업 재확인 대기 시간 단축)"""
+    monkeypatch.setattr(HomePage, "INTRO_POPUP_RECHECK_TIMEOUT", 0.3)
+    pool = DriverPool(appium_url=fake_server.url, capabilities_loader=DEVICE_CAPS.__getitem__, reset_mode=RESET_NONE)
+    yield HomePage(pool.acquire("stg_Galaxy"))
+    pool.quit_all()
+
+
+def clicked_close_button(server):
+    close_value = HomePage.INTRO_POPUP_CLOSE_BUTTON[1]
+    return (any(command["body"].get("value") == close_value
+                for command in server.commands if command["name"] == "findElement")
+            and "element.click" in server.command_names())
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("홈 페이지")
+def test_closes_popup_shown_after_home_tab(fake_server, home_page):
+    """첫 확인에서 홈 탭만 보이고 팝업이 조금 늦게 뜨면, 다시 확인해 팝업을 닫습니다."""
+    fake_server.missing_elements[HomePage.INTRO_POPUP_DIALOG[1]] = 1
+
+    home_page.close_intro_popup()
+
+    assert clicked_close_button(fake_server)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("홈 페이지")
+def test_skips_close_when_popup_never_appears(fake_server, home_page):
+    """홈 탭이 보이고 재확인 시간 동안에도 팝업이 뜨지 않으면 닫기를 시도하지 않습니다."""
+    fake_server.missing_elements[HomePage.INTRO_POPUP_DIALOG[1]] = 1000
+
+    home_page.close_intro_popup()
+
+    assert not clicked_close_button(fake_server)
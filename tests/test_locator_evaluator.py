@@ -0,0 +1,257 @@
+"""
+오프라인 locator 평가기 테스트
+
+디바이스 없이 고정된 페이지 소스에서 XPath / iOS Class Chain / iOS Predicate 평가 결과를 검증합니다.
+"""
+import json
+
+import pytest
+import allure
+
+from pages.login_page import LoginPage
+from utils.element_finder import ElementFinder
+from utils.locator_evaluator import (
+    BY_ACCESSIBILITY_ID, BY_IOS_CLASS_CHAIN, BY_IOS_PREDICATE, BY_XPATH,
+    LocatorEvaluator, LocatorSyntaxError, compile_xpath, parse_locator_code,
+)
+
+
+def _elem(elem_type, children="", **attributes):
+    attrs = "".join(f' {key}="{value}"' for key, value in attributes.items())
+    return f'<{elem_type} type="{elem_type}"{attrs}>{children}</{elem_type}>'
+
+
+# 마이페이지와 비슷한 구조의 화면 (Application > Window 2개)
+APPLICATION_SOURCE = _elem("XCUIElementTypeApplication", name="설탭", children=(
+    _elem("XCUIElementTypeWindow", name="main", children=(
+        _elem("XCUIElementTypeOther", name="header", children=(
+            _elem("XCUIElementTypeButton", name="뒤로", label="뒤로")
+            + _elem("XCUIElementTypeImage")
+            + _elem("XCUIElementTypeStaticText", name="제목", label="마이페이지", value="마이페이지")
+        ))
+        + _elem("XCUIElementTypeOther", name="content", children=(
+            _elem("XCUIElementTypeTextField", name="email", value="user@seoltab.test")
+            + _elem("XCUIElementTypeImage")
+            + _elem("XCUIElementTypeButton", name="로그아웃", label="로그아웃", enabled="true")
+            + _elem("XCUIElementTypeButton", name="탈퇴", label=" 회원   탈퇴 ", enabled="false")
+        ))
+    ))
+    + _elem("XCUIElementTypeWindow", name="alert", children=(
+        _elem("XCUIElementTypeButton", name="확인", label="Café")
+    ))
+))
+# iOS 페이지 소스는 <AppiumAUT> 래퍼로 감싸져 있음
+PAGE_SOURCE = f'<?xml version="1.0" encoding="UTF-8"?><AppiumAUT>{APPLICATION_SOURCE}</AppiumAUT>'
+
+
+@pytest.fixture(scope="module")
+def finder():
+    return ElementFinder(PAGE_SOURCE)
+
+
+def names(finder, by, value):
+    """locator에 일치하는 요소의 name (이름이 없으면 type, 문서 순서)"""
+    return [elem.get("name") or elem.get("type") for elem in finder.query_locator((by, value), strict=True)]
+
+
+XPATH_CASES = [
+    # 축
+    ('//XCUIElementTypeButton[@name="로그아웃"]/parent::*', ["content"]),
+    ('//XCUIElementTypeButton[@name="로그아웃"]/following-sibling::*', ["탈퇴"]),
+    ('//XCUIElementTypeButton[@name="로그아웃"]/preceding-sibling::*', ["email", "XCUIElementTypeImage"]),
+    ('//*[@name="email"]/ancestor::*', ["설탭", "main", "content"]),
+    ('//*[@name="email"]/ancestor-or-self::*[@name][1]', ["email"]),
+    ('//XCUIElementTypeStaticText/following::XCUIElementTypeButton', ["로그아웃", "탈퇴", "확인"]),
+    ('//XCUIElementTypeTextField/preceding::XCUIElementTypeButton', ["뒤로"]),
+    ('//*[@name="header"]/descendant-or-self::*[@name]', ["header", "뒤로", "제목"]),
+    ('//XCUIElementTypeWindow[@name="alert"]/child::node()', ["확인"]),
+    ('//*[@name="탈퇴"]/self::XCUIElementTypeButton', ["탈퇴"]),
+    # 절대 경로 (AppiumAUT 래퍼 제외)
+    ('/XCUIElementTypeApplication/XCUIElementTypeWindow[2]/XCUIElementTypeButton', ["확인"]),
+    # 위치 술어
+    ('(//XCUIElementTypeButton)[2]', ["로그아웃"]),
+    ('//XCUIElementTypeButton[2]', ["탈퇴"]),
+    ('(//XCUIElementTypeButton)[last()]', ["확인"]),
+    ('//XCUIElementTypeButton[position() < 2]', ["뒤로", "로그아웃", "확인"]),
+    ('//XCUIElementTypeOther/*[last()]', ["제목", "탈퇴"]),
+    ('//XCUIElementTypeButton[@enabled][1]', ["로그아웃"]),
+    # 함수
+    ('//*[contains(@label, "탈퇴")]', ["탈퇴"]),
+    ('//*[starts-with(@value, "user@")]', ["email"]),
+    ('//XCUIElementTypeButton[string-length(@name) = 4]', ["로그아웃"]),
+    ('//*[normalize-space(@label) = "회원 탈퇴"]', ["탈퇴"]),
+    ('//XCUIElementTypeOther[count(XCUIElementTypeButton) = 2]', ["content"]),
+    ('//XCUIElementTypeButton[not(@enabled = "false")]', ["뒤로", "로그아웃", "확인"]),
+    ('//*[concat(@name, "!") = "확인!"]', ["확인"]),
+    ('//*[translate(@name, "mn", "MN") = "MaiN"]', ["main"]),
+    ('//*[name() = "XCUIElementTypeTextField"]', ["email"]),
+    # 연산자 / 합집합
+    ('//XCUIElementTypeTextField | //XCUIElementTypeStaticText', ["제목", "email"]),
+    ('//XCUIElementTypeButton[@enabled = "true" or @name = "확인"]', ["로그아웃", "확인"]),
+    ('//XCUIElementTypeButton[@label and not(@enabled)]', ["뒤로", "확인"]),
+    ('//XCUIElementTypeWindow[count(.//XCUIElementTypeButton) > 1]', ["main"]),
+]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+@pytest.mark.parametrize("expression, expected", XPATH_CASES)
+def test_xpath(finder, expression, expected):
+    """XPath 1.0 축, 위치 술어, 함수, 연산자를 디바이스와 같은 결과로 평가합니다."""
+    assert names(finder, BY_XPATH, expression) == expected
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+@pytest.mark.parametrize("expression, expected", XPATH_CASES)
+def test_xpath_matches_lxml(expression, expected):
+    """같은 XPath를 lxml로 평가한 결과와 일치합니다. (lxml이 설치된 경우)"""
+    etree = pytest.importorskip("lxml.etree")
+    root = etree.fromstring(APPLICATION_SOURCE.encode("utf-8")).getroottree()
+    lxml_names = [elem.get("name") or elem.get("type") for elem in root.xpath(expression)]
+
+    assert lxml_names == expected
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+@pytest.mark.parametrize("chain, expected", [
+    ("**/XCUIElementTypeButton", ["뒤로", "로그아웃", "탈퇴", "확인"]),
+    ("**/XCUIElementTypeButton[2]", ["로그아웃"]),
+    ("**/XCUIElementTypeButton[-1]", ["확인"]),
+    ('**/XCUIElementTypeButton[`label BEGINSWITH "로그"`]', ["로그아웃"]),
+    ('**/XCUIElementTypeButton[`enabled == 1`][1]', ["로그아웃"]),
+    ("XCUIElementTypeWindow[1]/XCUIElementTypeOther[2]/XCUIElementTypeButton[1]", ["로그아웃"]),
+    ("XCUIElementTypeWindow/*", ["header", "content", "확인"]),
+    ('**/XCUIElementTypeOther[$name == "email"$]', ["content"]),
+    ("XCUIElementTypeWindow[2]/**/XCUIElementTypeAny", ["확인"]),
+    ("**/XCUIElementTypeOther/XCUIElementTypeImage", ["XCUIElementTypeImage", "XCUIElementTypeImage"]),
+    ("XCUIElementTypeWindow[3]", []),
+])
+def test_class_chain(finder, chain, expected):
+    """iOS Class Chain의 자손 검색(**), 인덱스(음수 포함), 술어를 평가합니다."""
+    assert names(finder, BY_IOS_CLASS_CHAIN, chain) == expected
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+@pytest.mark.parametrize("predicate, expected", [
+    ('name == "확인"', ["확인"]),
+    ('wdName == "email"', ["email"]),
+    ('type == "XCUIElementTypeButton" AND enabled == true', ["로그아웃"]),
+    ('type == "XCUIElementTypeButton" AND enabled != nil AND enabled == false', ["탈퇴"]),
+    ('name IN {"뒤로", "확인"}', ["뒤로", "확인"]),
+    ('label CONTAINS[c] "CAF"', ["확인"]),
+    ('label ==[cd] "cafe"', ["확인"]),
+    ('value LIKE "user@*.test"', ["email"]),
+    ('name MATCHES "[a-z]+"', ["main", "header", "content", "email", "alert"]),
+    ('name BEGINSWITH "로" OR name ENDSWITH "인"', ["로그아웃", "확인"]),
+    ('NOT (type == "XCUIElementTypeButton") AND label ENDSWITH "페이지"', ["제목"]),
+    ('elementType == "XCUIElementTypeImage" AND name == nil', ["XCUIElementTypeImage", "XCUIElementTypeImage"]),
+])
+def test_predicate(finder, predicate, expected):
+    """iOS Predicate 비교 연산자, 문자열 연산자, [c]/[d] 옵션, AND/OR/NOT을 평가합니다."""
+    assert names(finder, BY_IOS_PREDICATE, predicate) == expected
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+@pytest.mark.parametrize("by, value", [
+    (BY_XPATH, '//*[@name="확인"'),
+    (BY_XPATH, "//XCUIElementTypeButton[@name='x']/"),
+    (BY_IOS_CLASS_CHAIN, "**/"),
+    (BY_IOS_CLASS_CHAIN, "**/XCUIElementTypeButton[0]"),
+    (BY_IOS_CLASS_CHAIN, '**/XCUIElementTypeButton[`name == "x"]'),
+    (BY_IOS_PREDICATE, "name =="),
+])
+def test_syntax_error(finder, by, value):
+    """문법 오류는 strict 모드에서 LocatorSyntaxError, 기본 모드에서는 None을 반환합니다."""
+    with pytest.raises(LocatorSyntaxError):
+        finder.query_locator((by, value), strict=True)
+    assert finder.query_locator((by, value)) is None
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+def test_page_object_xpaths_compile():
+    """Page Object의 XPath locator는 문법 오류가 없어야 합니다."""
+    for locator in (LoginPage.ANDROID_EMAIL_INPUT, LoginPage.ANDROID_PASSWORD_INPUT, LoginPage.ANDROID_INTRO_POPUP_DIALOG):
+        compile_xpath(locator[1])
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+def test_rank_prefers_unique_then_fastest(finder):
+    """유일하게 일치하는 후보가 여러 개 일치하는 후보보다 앞에 옵니다."""
+    ranked = LocatorEvaluator(finder, repeat=1).rank({
+        "recommended": '(AppiumBy.XPATH, "//XCUIElementTypeButton")',
+        "by_type": (BY_XPATH, "//XCUIElementTypeButton"),
+        "missing": (BY_ACCESSIBILITY_ID, "없음"),
+        "accessibility_id": '(AppiumBy.ACCESSIBILITY_ID, "확인")',
+    })
+
+    assert [result["name"] for result in ranked] == ["accessibility_id", "by_type", "missing"]
+    assert [result["count"] for result in ranked] == [1, 4, 0]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+def test_rank_by_visited_is_deterministic(finder):
+    """방문한 요소 수로 정렬하면 실행마다 같은 순서입니다. (같으면 후보 순서 유지)"""
+    locators = {
+        "absolute": (BY_XPATH, "/AppiumAUT/XCUIElementTypeApplication"),
+        "by_type": (BY_XPATH, "//XCUIElementTypeApplication"),
+        "accessibility_id": (BY_ACCESSIBILITY_ID, "확인"),
+    }
+    evaluator = LocatorEvaluator(finder, repeat=1)
+    orders = {tuple(result["name"] for result in evaluator.rank(locators, by="visited")) for _ in range(20)}
+
+    assert len(orders) == 1
+    ranked = evaluator.rank(locators, by="visited")
+    assert [result["visited"] for result in ranked if result["count"] == 1] == \
+        sorted(result["visited"] for result in ranked if result["count"] == 1)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+def test_export_keeps_fixed_priority_by_default(finder, tmp_path, monkeypatch):
+    """기본 JSON 저장은 후보를 평가하지 않고 고정 우선순위 recommended를 저장합니다."""
+    def fail(*args, **kwargs):
+        raise AssertionError("기본 저장에서는 locator를 평가하지 않아야 합니다")
+    monkeypatch.setattr(LocatorEvaluator, "evaluate", fail)
+    output = tmp_path / "elements.json"
+
+    finder.export_to_json(str(output))
+
+    elements = json.loads(output.read_text(encoding="utf-8"))
+    images = [element for element in elements if element["type"] == "XCUIElementTypeImage"]
+    assert all(image["locators"]["recommended"] == image["locators"]["xpath_by_type"] for image in images)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("locator 평가기")
+def test_export_recommends_unique_locator(finder, tmp_path):
+    """rank_locators=True로 저장하면 recommended는 그 요소 하나만 찾는 후보입니다. (고정 우선순위의 type XPath는 2개 일치)"""
+    output = tmp_path / "elements.json"
+    finder.export_to_json(str(output), rank_locators=True)
+    elements = json.loads(output.read_text(encoding="utf-8"))
+
+    # 같은 화면은 항상 같은 결과
+    again = tmp_path / "again.json"
+    finder.export_to_json(str(again), rank_locators=True)
+    assert json.loads(again.read_text(encoding="utf-8")) == elements
+
+    images = [element for element in elements if element["type"] == "XCUIElementTypeImage"]
+    assert len(images) == 2
+    for image in images:
+        assert image["locators"]["recommended"] != image["locators"]["xpath_by_type"]
+
+    # JSON 배열은 문서 순서 (<AppiumAUT> 래퍼 포함)
+    for elem, element in zip(finder.root.iter(), elements):
+        recommended = element["locators"]["recommended"]
+        if recommended is None:
+            continue
+        assert finder.query_locator(parse_locator_code(recommended), strict=True) == [elem]
+
+    logout = next(element for element in elements if element["name"] == "로그아웃")
+    assert logout["locators"]["recommended"] == '(AppiumBy.ACCESSIBILITY_ID, "로그아웃")'
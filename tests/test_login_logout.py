@@ -5,7 +5,6 @@
 """
 import pytest
 import allure
-from utils.account_loader import get_account_credentials
 
 
 @allure.epic("사용자 인증")
@@ -15,6 +14,7 @@ from utils.account_loader import get_account_credentials
 @pytest.mark.smoke
 @pytest.mark.login
 @pytest.mark.logout
+@pytest.mark.real_login
 def test_login_logout(pages, test_account):
     """
     사용자가 성공적으로 로그인하고 로그아웃하는 전체 시나리오를 테스트합니다.
@@ -112,16 +112,17 @@ def test_login_only(login_page, home_page, my_page, test_account):
     # "admin_account",
 ])
 @pytest.mark.login
-def test_login_multiple_accounts(pages, account_name):
+def test_login_multiple_accounts(pages, account_name, account_lease):
     """
     여러 계정으로 로그인을 테스트합니다.
 
     Args:
         pages: 페이지 객체들 (fixture)
         account_name: 테스트할 계정 이름
+        account_lease: 계정 풀에서 빌린 account_name 계정 (fixture, 다른 워커와 동시에 사용하지 않음)
     """
     # 계정 정보 가져오기
-    id_key, pw_key = get_account_credentials(account_name)
+    id_key, pw_key = account_lease.credentials
 
     allure.dynamic.title(f"{account_name} 계정 로그인 테스트")
     allure.dynamic.description(f"{account_name} 계정으로 로그인하여 정상 동작을 확인합니다.")
@@ -0,0 +1,106 @@
+"""
+로그인 페이지 테스트 (가짜 WebDriver 서버 사용)
+
+앱이 이미 로그인되어 있을 때, 계정 풀이 빌려준 계정과 다르거나 어떤 계정인지 모르면
+그대로 쓰지 않고 로그아웃 후 빌린 계정으로 다시 로그인하는지 검증합니다.
+"""
+import pytest
+import allure
+
+import pages.login_page
+import pages.my_page
+from pages.login_page import LoginPage
+from utils.driver_pool import DriverPool, RESET_NONE
+from utils.fake_webdriver_server import FakeWebDriverServer
+from utils.login_state import LoginStateCache
+
+
+DEVICE_CAPS = {
+    "stg_Galaxy": {
+        "platformName": "Android",
+        "appium:automationName": "UiAutomator2",
+        "appium:appPackage": "com.seoltab.seoltab.stg",
+    },
+}
+LEASED_EMAIL = "test1@example.com"
+
+
+@pytest.fixture
+def fake_server():
+    """가짜 WebDriver 서버 fixture"""
+    with FakeWebDriverServer() as server:
+        yield server
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """테스트마다 비어 있는 로그인 상태 캐시 (저장 / 복원 방식 없음)"""
+    cache = LoginStateCache(restorers=[])
+    monkeypatch.setattr(pages.login_page, "login_state", cache)
+    monkeypatch.setattr(pages.my_page, "login_state", cache)
+    return cache
+
+
+@pytest.fixture
+def login_page(fake_server, cache):
+    """가짜 서버에 연결한, 이미 로그인된 상태의 Android 로그인 페이지 (첫 폴링에서 이메일 입력창이 없음)"""
+    pool = DriverPool(appium_url=fake_server.url, capabilities_loader=DEVICE_CAPS.__getitem__, reset_mode=RESET_NONE)
+    page = LoginPage(pool.acquire("stg_Galaxy"))
+    fake_server.missing_elements[page.EMAIL_INPUT[1]] = 1
+    yield page
+    pool.quit_all()
+
+
+def typed_text(server):
+    return [command["body"].get("text") for command in server.commands if command["name"] == "element.value"]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("로그인 페이지")
+@pytest.mark.parametrize("current_account", ["other@example.com", None], ids=["other_account", "unknown_account"])
+def test_login_switches_account_when_logged_in_as_another(fake_server, cache, login_page, current_account):
+    """다른 계정이나 알 수 없는 계정으로 로그인되어 있으면 로그아웃 후 빌린 계정으로 실제 로그인합니다."""
+    if current_account:
+        cache.mark_reused(login_page.driver, current_account)
+    reused = cache.stats["reused"]
+
+    login_page.login(LEASED_EMAIL, "pw1")
+
+    assert LEASED_EMAIL in typed_text(fake_server)
+    assert any(command["body"].get("value") == pages.my_page.MyPage.LOGOUT_BUTTON[1]
+               for command in fake_server.commands if command["name"] == "findElement")
+    assert cache.logged_in_account(login_page.driver) == LEASED_EMAIL
+    assert cache.stats["ui_logins"] == 1 and cache.stats["reused"] == reused
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("로그인 페이지")
+def test_login_reuses_session_of_same_account(fake_server, cache, login_page):
+    """빌린 계정으로 이미 로그인되어 있으면 로그아웃하지 않고 그대로 사용합니다."""
+    cache.mark_reused(login_page.driver, LEASED_EMAIL)
+
+    login_page.login(LEASED_EMAIL, "pw1")
+
+    assert typed_text(fake_server) == []
+    assert "element.click" not in fake_server.command_names()
+    assert cache.stats["reused"] == 2 and cache.stats["ui_logins"] == 0
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("로그인 페이지")
+def test_real_login_logs_out_when_app_data_cannot_be_cleared(fake_server, cache):
+    """앱 데이터를 지울 수 없는 디바이스(iOS 실기기)의 real_login 테스트는 로그아웃한 뒤 로그인 화면에서 시작합니다."""
+    from conftest import start_logged_out
+
+    fake_server.unsupported_scripts.add("mobile: clearApp")
+    fake_server.missing_elements[LoginPage.ANDROID_EMAIL_INPUT[1]] = 1
+    pool = DriverPool(appium_url=fake_server.url, capabilities_loader=DEVICE_CAPS.__getitem__, reset_mode=RESET_NONE)
+    driver = pool.acquire("stg_Galaxy")
+    cache.mark_reused(driver, LEASED_EMAIL)
+
+    start_logged_out(pool, "stg_Galaxy", driver)
+
+    assert any(command["body"].get("value") == pages.my_page.MyPage.LOGOUT_BUTTON[1]
+               for command in fake_server.commands if command["name"] == "findElement")
+    assert cache.logged_in_account(driver) is None
+    pool.quit_all()
@@ -0,0 +1,132 @@
+"""
+성능 회귀 기준선 테스트 (메모리 SQLite 사용)
+
+회귀 판단 규칙(최소 실행 수, MAD / 상대 / 절대 여유)과 이동 기준선의 브랜치 선택을 검증합니다.
+"""
+import pytest
+import allure
+
+from utils.perf_baseline import (
+    KIND_STEP, KIND_TEST, MAD_SCALE, MAD_THRESHOLD, MIN_BASELINE_RUNS, NO_DEVICE,
+    PerfBaseline, detect_regression, device_samples,
+)
+
+
+@pytest.fixture
+def store():
+    """메모리 SQLite 기준선 저장소"""
+    with PerfBaseline(":memory:") as baseline:
+        yield baseline
+
+
+def record(store, branch, duration, name="tests/test_login_logout.py::test_login_only", device="iPad"):
+    return store.record_run([{"kind": KIND_TEST, "name": name, "device": device, "duration": duration}],
+                            branch=branch, commit="0" * 40)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_regression_needs_min_baseline_runs():
+    """기준선이 MIN_BASELINE_RUNS회 미만이면 아무리 느려도 판단하지 않습니다."""
+    history = [1.0] * (MIN_BASELINE_RUNS - 1)
+
+    assert detect_regression(100.0, history) is None
+    assert detect_regression(100.0, history + [1.0]) is not None
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_mad_margin():
+    """흔들림이 큰 항목은 MAD 여유(MAD_THRESHOLD × 1.4826 × MAD)를 넘어야 회귀입니다."""
+    history = [10.0, 10.0, 10.0, 12.0, 8.0, 14.0, 6.0]  # 중앙값 10, MAD 2
+    threshold = 10.0 + MAD_THRESHOLD * MAD_SCALE * 2.0
+
+    assert detect_regression(threshold - 0.01, history) is None
+    result = detect_regression(threshold + 0.01, history)
+    assert result["median"] == 10.0
+    assert result["threshold"] == pytest.approx(threshold)
+    assert result["runs"] == len(history)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_relative_margin():
+    """흔들림이 없으면 중앙값의 20%(MIN_RELATIVE_SLOWDOWN)보다 더 느려져야 회귀입니다."""
+    history = [10.0] * 5
+
+    assert detect_regression(12.0, history) is None
+    result = detect_regression(12.5, history)
+    assert result["threshold"] == pytest.approx(12.0)
+    assert result["slowdown"] == pytest.approx(1.25)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_absolute_margin():
+    """짧은 항목은 0.5초(MIN_ABSOLUTE_SLOWDOWN)보다 더 느려져야 회귀입니다."""
+    history = [1.0] * 5
+
+    assert detect_regression(1.49, history) is None
+    assert detect_regression(1.51, history)["threshold"] == pytest.approx(1.5)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_zero_median():
+    """기준선 중앙값이 0이어도 나누기 오류 없이 절대 여유로 판단합니다."""
+    history = [0.0] * 5
+
+    assert detect_regression(0.4, history) is None
+    result = detect_regression(0.6, history)
+    assert result["median"] == 0.0
+    assert result["slowdown"] == float("inf")
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_baseline_uses_branch_history(store):
+    """같은 브랜치 실행이 충분하면 그 브랜치의 최근 실행만 기준선으로 사용합니다. (최근 순)"""
+    for duration in (1.0, 2.0, 3.0, 4.0, 5.0):
+        record(store, "main", duration)
+    for duration in (10.0, 11.0, 12.0, 13.0, 14.0, 15.0):
+        record(store, "feature", duration)
+
+    assert store.baseline(KIND_TEST, "tests/test_login_logout.py::test_login_only", "iPad", "main") == \
+        [5.0, 4.0, 3.0, 2.0, 1.0]
+    assert store.baseline(KIND_TEST, "tests/test_login_logout.py::test_login_only", "iPad", "feature", window=3) == \
+        [15.0, 14.0, 13.0]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_baseline_falls_back_to_all_branches(store):
+    """같은 브랜치 실행이 MIN_BASELINE_RUNS회 미만이면 전체 브랜치의 최근 실행을 사용합니다."""
+    for duration in (1.0, 2.0, 3.0, 4.0, 5.0):
+        record(store, "main", duration)
+    record(store, "feature", 9.0)
+    current = record(store, "feature", 20.0)
+    name = "tests/test_login_logout.py::test_login_only"
+
+    # 이번 실행(current)은 제외
+    assert store.baseline(KIND_TEST, name, "iPad", "feature", before_run=current) == [9.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    # 다른 항목 / 디바이스 / 종류는 섞이지 않음
+    assert store.baseline(KIND_TEST, name, "Galaxy", "feature") == []
+    assert store.baseline(KIND_STEP, name, "iPad", "feature") == []
+
+    regressions = store.compare([{"kind": KIND_TEST, "name": name, "device": "iPad", "duration": 20.0}],
+                                "feature", before_run=current)
+    assert [item["median"] for item in regressions] == [3.5]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("성능 기준선")
+def test_only_device_samples_are_recorded():
+    """디바이스 없이 실행한 테스트 / 단계(단위 테스트)는 기준선 샘플에서 제외합니다."""
+    samples = [
+        {"kind": KIND_TEST, "name": "tests/test_login_logout.py::test_login_only", "device": "iPad", "duration": 10.0},
+        {"kind": KIND_TEST, "name": "tests/test_perf_baseline.py::test_mad_margin", "device": NO_DEVICE, "duration": 0.01},
+        {"kind": KIND_STEP, "name": "로그인 수행", "device": "iPad", "duration": 3.0},
+        {"kind": KIND_STEP, "name": "설정 확인", "device": NO_DEVICE, "duration": 0.1},
+    ]
+
+    assert [sample["device"] for sample in device_samples(samples)] == ["iPad", "iPad"]
@@ -0,0 +1,174 @@
+"""
+테스트 결과 수집기 테스트 (pytester 사용)
+
+별도 pytest 프로세스에서 여러 결과의 테스트를 실행하고, setup / call / teardown 리포트가
+하나의 결과(상태, 재시도 횟수, 메시지)로 합쳐지는지 검증합니다.
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+import allure
+
+pytest_plugins = ["pytester"]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 수집기를 연결하는 conftest (+ pytest-rerunfailures와 같은 순서로 리포트를 보내는 재시도)
+INNER_CONFTEST = '''
+import pytest
+from _pytest.runner import runtestprotocol
+
+from utils.result_collector import result_collector
+
+RERUNS = 2
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "rerun: 실패하면 최대 RERUNS번 다시 실행")
+    if not config.pluginmanager.hasplugin("rerunfailures"):
+        config.pluginmanager.register(EmulatedReruns(), "emulated_reruns")
+    result_collector.start(output_file="results.jsonl")
+
+
+def pytest_runtest_logreport(report):
+    result_collector.record(report)
+
+
+def pytest_unconfigure(config):
+    result_collector.close()
+
+
+class EmulatedReruns:
+    """pytest-rerunfailures처럼 실패한 단계를 "rerun"으로 보고하고 (이번 회차 teardown은 보고하지 않음) 다시 실행"""
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        reruns = RERUNS if item.get_closest_marker("rerun") else 0
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(reruns + 1):
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            for report in reports:
+                if report.failed and report.when != "teardown" and attempt < reruns:
+                    report.outcome = "rerun"
+                    item.ihook.pytest_runtest_logreport(report=report)
+                    break
+                item.ihook.pytest_runtest_logreport(report=report)
+            else:
+                break
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+'''
+
+INNER_TESTS = '''
+import pytest
+
+attempts = {}
+
+
+@pytest.fixture
+def broken_setup():
+    raise RuntimeError("setup 실패")
+
+
+@pytest.fixture
+def broken_teardown():
+    yield
+    raise RuntimeError("teardown 실패")
+
+
+def test_passed():
+    pass
+
+
+def test_failed():
+    assert 1 == 2, "값이 다릅니다"
+
+
+def test_setup_error(broken_setup):
+    pass
+
+
+def test_teardown_error_after_pass(broken_teardown):
+    pass
+
+
+def test_skipped():
+    pytest.skip("건너뜀 사유")
+
+
+@pytest.mark.xfail(reason="알려진 버그")
+def test_xfailed():
+    assert False
+
+
+@pytest.mark.xfail(reason="알려진 버그")
+def test_xpassed():
+    pass
+
+
+@pytest.mark.rerun
+def test_flaky():
+    attempts["flaky"] = attempts.get("flaky", 0) + 1
+    assert attempts["flaky"] > 1
+
+
+@pytest.mark.rerun
+def test_always_fails():
+    assert False, "매번 실패"
+'''
+
+
+def run_inner(pytester, monkeypatch, tests=INNER_TESTS):
+    """내부 테스트를 별도 프로세스에서 실행하고 {테스트 이름: 결과}를 반환합니다."""
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.getenv("PYTHONPATH")])))
+    pytester.makeconftest(INNER_CONFTEST)
+    pytester.makepyfile(test_inner=tests)
+    pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    results = [json.loads(line) for line in (pytester.path / "results.jsonl").read_text(encoding="utf-8").splitlines()]
+    return {result["nodeid"].split("::")[-1]: result for result in results}
+
+
+def assert_outcomes(results):
+    assert {name: result["outcome"] for name, result in results.items()} == {
+        "test_passed": "passed",
+        "test_failed": "failed",
+        "test_setup_error": "error",
+        "test_teardown_error_after_pass": "error",
+        "test_skipped": "skipped",
+        "test_xfailed": "xfailed",
+        "test_xpassed": "xpassed",
+        "test_flaky": "passed",
+        "test_always_fails": "failed",
+    }
+    assert results["test_flaky"]["retries"] == 1
+    assert results["test_always_fails"]["retries"] == 2
+    assert all(result["retries"] == 0 for name, result in results.items() if "flaky" not in name and "always" not in name)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("결과 수집기")
+def test_outcome_mapping(pytester, monkeypatch):
+    """setup / teardown 오류, xfail / xpass, 건너뜀, 재시도가 테스트 하나의 결과로 합쳐집니다."""
+    results = run_inner(pytester, monkeypatch)
+
+    assert_outcomes(results)
+    assert "setup 실패" in results["test_setup_error"]["message"]
+    assert "teardown 실패" in results["test_teardown_error_after_pass"]["message"]
+    assert "건너뜀 사유" in results["test_skipped"]["message"]
+    assert "매번 실패" in results["test_always_fails"]["message"]
+    assert results["test_passed"]["message"] == ""
+    # 재시도 후 성공하면 이전 회차의 실패 메시지를 남기지 않음
+    assert results["test_flaky"]["message"] == ""
+    assert results["test_passed"]["call_duration"] <= results["test_passed"]["duration"]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("결과 수집기")
+def test_outcome_mapping_with_rerunfailures(pytester, monkeypatch):
+    """실제 pytest-rerunfailures 플러그인의 리포트로도 같은 결과가 나옵니다. (플러그인이 설치된 경우)"""
+    pytest.importorskip("pytest_rerunfailures")
+    tests = INNER_TESTS.replace("@pytest.mark.rerun", "@pytest.mark.flaky(reruns=2)")
+
+    assert_outcomes(run_inner(pytester, monkeypatch, tests))
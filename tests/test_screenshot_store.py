@@ -0,0 +1,103 @@
+"""
+스크린샷 저장소 테스트
+
+내용 주소 중복 제거, 유사 이미지 재사용 범위(이번 실행만), Allure 첨부 파일 공유를 검증합니다.
+"""
+import base64
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+import allure
+
+from utils.fake_webdriver_server import BLANK_PNG
+from utils.screenshot_store import ScreenshotStore
+
+pytest_plugins = ["pytester"]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스크린샷 저장소")
+def test_same_image_is_stored_once(tmp_path):
+    """같은 이미지는 한 번만 저장하고 두 번째부터는 저장된 파일을 재사용합니다."""
+    store = ScreenshotStore(str(tmp_path))
+
+    first = store.put(BLANK_PNG)
+    second = store.put(BLANK_PNG)
+
+    assert not first.deduplicated
+    assert second.deduplicated and second.path == first.path
+    assert first.data == second.data == first.path.read_bytes()
+    assert len(list(tmp_path.iterdir())) == 1
+    assert store.stats["stored"] == 1 and store.stats["deduplicated"] == 1
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스크린샷 저장소")
+def test_near_duplicate_only_reuses_current_run(tmp_path):
+    """거의 같은 이미지는 이번 실행에서 저장한 이미지만 재사용합니다. (이전 실행의 파일은 비교하지 않음)"""
+    pil_image = pytest.importorskip("PIL.Image")
+
+    def screenshot(clock_color):
+        # 상태바 시계처럼 구석의 작은 영역만 다른 화면
+        image = pil_image.new("RGB", (200, 100), "white")
+        image.paste((0, 0, 0), (0, 50, 100, 100))
+        image.paste(clock_color, (194, 0, 198, 4))
+        output = io.BytesIO()
+        image.save(output, format="PNG")
+        return output.getvalue()
+
+    # 이전 실행이 남긴 거의 같은 이미지
+    previous = ScreenshotStore(str(tmp_path)).put(screenshot((0, 0, 0)))
+
+    store = ScreenshotStore(str(tmp_path))
+    first = store.put(screenshot((60, 60, 60)))
+    second = store.put(screenshot((120, 120, 120)))
+
+    assert not first.deduplicated and first.path != previous.path
+    assert second.deduplicated and second.path == first.path
+    assert second.data == first.data == first.path.read_bytes()
+
+
+INNER_TEST = '''
+import base64
+from utils.screenshot_store import ScreenshotStore, attach_stored_image
+
+PNG = base64.b64decode("{png}")
+
+def test_first(tmp_path_factory):
+    store = ScreenshotStore(str(tmp_path_factory.getbasetemp() / "screenshots"))
+    attach_stored_image(store.put(PNG), "실패 스크린샷 1")
+
+def test_second(tmp_path_factory):
+    store = ScreenshotStore(str(tmp_path_factory.getbasetemp() / "screenshots"))
+    attach_stored_image(store.put(PNG), "실패 스크린샷 2")
+'''
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스크린샷 저장소")
+def test_attachment_file_is_shared_between_tests(pytester, monkeypatch):
+    """
+    같은 이미지를 첨부한 테스트들은 allure-results의 파일 하나를 참조합니다.
+    allure-pytest 내부 API(_last_executable, get_item)를 사용하므로 버전이 바뀌면 이 테스트로 확인합니다.
+    """
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.getenv("PYTHONPATH")])))
+    pytester.makepyfile(test_inner=INNER_TEST.format(png=base64.b64encode(BLANK_PNG).decode("ascii")))
+    results_dir = pytester.path / "allure-results"
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", f"--alluredir={results_dir}")
+    result.assert_outcomes(passed=2)
+
+    attachment_files = sorted(path.name for path in results_dir.glob("*-attachment.*"))
+    assert len(attachment_files) == 1
+
+    attachments = []
+    for path in results_dir.glob("*-result.json"):
+        attachments.extend(json.loads(path.read_text(encoding="utf-8")).get("attachments", []))
+    assert sorted(attachment["name"] for attachment in attachments) == ["실패 스크린샷 1", "실패 스크린샷 2"]
+    assert {attachment["source"] for attachment in attachments} == set(attachment_files)
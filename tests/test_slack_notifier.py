@@ -0,0 +1,150 @@
+"""
+Slack 알림 테스트 (로컬 가짜 Webhook 서버 사용)
+
+실제 Slack 없이 재시도 큐, 묶음 전송, 스레드 답글 동작을 검증합니다.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import allure
+
+from utils.slack_notifier import SlackNotifier, build_slack_message
+
+
+class FakeSlackServer:
+    """Incoming Webhook / chat.postMessage를 흉내 내는 로컬 서버"""
+
+    def __init__(self):
+        self.requests = []
+        # 앞에서부터 꺼내 쓰는 응답 상태 코드 (비어 있으면 200)
+        self.failures = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.requests.append({"path": self.path, "body": body,
+                                        "authorization": self.headers.get("Authorization")})
+                status = server.failures.pop(0) if server.failures else 200
+                if self.path == "/api/chat.postMessage":
+                    reply = json.dumps({"ok": True, "ts": f"1700000000.{len(server.requests):06d}"})
+                else:
+                    reply = "ok" if status == 200 else "server_error"
+                self.send_response(status)
+                self.end_headers()
+                self.wfile.write(reply.encode("utf-8"))
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def slack_server():
+    server = FakeSlackServer()
+    yield server
+    server.stop()
+
+
+def make_message(failed: int = 0, device: str = "stg_iPad") -> dict:
+    return build_slack_message(None, {
+        "passed": 3, "failed": failed, "skipped": 0, "total": 3 + failed, "duration": 12.0,
+        "exit_status": 1 if failed else 0, "environment": device, "branch": "main", "commit": "abcdef1234",
+    })
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Slack 알림")
+def test_webhook_delivery_empties_queue(slack_server, tmp_path):
+    """전송에 성공하면 큐에서 삭제합니다."""
+    notifier = SlackNotifier(webhook_url=f"{slack_server.url}/hook", queue_dir=tmp_path)
+
+    notifier.enqueue(make_message(), "main@abcdef1")
+    notifier.flush_async()
+
+    assert notifier.wait(5)
+    assert len(slack_server.requests) == 1
+    assert slack_server.requests[0]["body"]["attachments"][0]["color"] == "good"
+    assert notifier.pending() == []
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Slack 알림")
+def test_failed_delivery_stays_queued_until_retry(slack_server, tmp_path):
+    """전송에 실패하면 큐에 남기고, 재시도 시각이 되면 다시 전송합니다."""
+    notifier = SlackNotifier(webhook_url=f"{slack_server.url}/hook", queue_dir=tmp_path, retry_base_seconds=3600)
+    slack_server.failures = [500]
+
+    path = notifier.enqueue(make_message(), "main@abcdef1")
+    assert notifier.flush() == 0
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    assert entry["attempts"] == 1
+    assert "HTTP 500" in entry["last_error"]
+
+    # 재시도 시각 전에는 보내지 않음
+    assert notifier.flush() == 0
+    assert len(slack_server.requests) == 1
+
+    notifier.retry_base_seconds = 0
+    entry["next_attempt_at"] = 0
+    path.write_text(json.dumps(entry), encoding="utf-8")
+    assert notifier.flush() == 1
+    assert notifier.pending() == []
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Slack 알림")
+def test_pending_runs_of_same_commit_are_batched(slack_server, tmp_path):
+    """같은 커밋의 대기 중인 결과는 메시지 하나로 합쳐 보냅니다."""
+    notifier = SlackNotifier(webhook_url=f"{slack_server.url}/hook", queue_dir=tmp_path)
+
+    notifier.enqueue(make_message(device="stg_iPad"), "main@abcdef1")
+    notifier.enqueue(make_message(failed=1, device="stg_Galaxy"), "main@abcdef1")
+    notifier.enqueue(make_message(), "feature@1234567")
+
+    assert notifier.flush() == 3
+    assert len(slack_server.requests) == 2
+    batched = slack_server.requests[0]["body"]
+    assert len(batched["attachments"]) == 2
+    assert "2건" in batched["text"] and "1개 실패" in batched["text"]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Slack 알림")
+def test_permanent_error_moves_message_to_failed(slack_server, tmp_path):
+    """삭제된 Webhook(404) 같은 영구 오류는 재시도하지 않고 failed/로 옮깁니다."""
+    notifier = SlackNotifier(webhook_url=f"{slack_server.url}/hook", queue_dir=tmp_path)
+    slack_server.failures = [404]
+
+    notifier.enqueue(make_message(), "main@abcdef1")
+
+    assert notifier.flush() == 0
+    assert notifier.pending() == []
+    assert len(list((tmp_path / "failed").glob("*.json"))) == 1
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("Slack 알림")
+def test_bot_token_posts_runs_as_thread_replies(slack_server, tmp_path):
+    """봇 토큰을 설정하면 같은 커밋의 결과를 첫 메시지의 스레드 답글로 보냅니다."""
+    notifier = SlackNotifier(webhook_url=None, queue_dir=tmp_path, bot_token="xoxb-test", channel="C123",
+                             api_url=f"{slack_server.url}/api/chat.postMessage")
+
+    notifier.enqueue(make_message(device="stg_iPad"), "main@abcdef1")
+    notifier.flush()
+    notifier.enqueue(make_message(device="stg_Galaxy"), "main@abcdef1")
+    notifier.flush()
+
+    first, second = (request["body"] for request in slack_server.requests)
+    assert first["channel"] == "C123" and "thread_ts" not in first
+    assert second["thread_ts"] == "1700000000.000001"
+    assert slack_server.requests[0]["authorization"] == "Bearer xoxb-test"
@@ -0,0 +1,118 @@
+"""
+스마트 대기 테스트 (가짜 WebDriver 서버 사용)
+
+실제 디바이스 없이 여러 상태 중 먼저 나타나는 상태를 기다리는 동작(until_any)을 검증합니다.
+"""
+import pytest
+import allure
+from selenium.common.exceptions import InvalidSelectorException, TimeoutException
+
+from pages.login_page import LoginPage
+from utils.driver_pool import DriverPool, RESET_NONE
+from utils.fake_webdriver_server import FakeWebDriverServer
+from utils.login_state import login_state
+from utils.smart_wait import SmartWait, WaitStats
+
+
+DEVICE_CAPS = {
+    "stg_Galaxy": {
+        "platformName": "Android",
+        "appium:automationName": "UiAutomator2",
+        "appium:appPackage": "com.seoltab.seoltab.stg",
+    },
+}
+
+
+@pytest.fixture
+def fake_server():
+    """가짜 WebDriver 서버 fixture"""
+    with FakeWebDriverServer() as server:
+        yield server
+
+
+@pytest.fixture
+def login_page(fake_server):
+    """가짜 서버에 연결한 Android 로그인 페이지"""
+    pool = DriverPool(appium_url=fake_server.url, capabilities_loader=DEVICE_CAPS.__getitem__, reset_mode=RESET_NONE)
+    yield LoginPage(pool.acquire("stg_Galaxy"))
+    pool.quit_all()
+
+
+def find_count(server, value):
+    return sum(1 for command in server.commands
+               if command["name"] == "findElement" and command["body"].get("value") == value)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스마트 대기")
+def test_wait_login_state_retries_after_first_poll_miss(fake_server, login_page):
+    """첫 폴링에서 아무 요소도 없으면 다음 폴링에서 먼저 나타난 상태를 반환합니다."""
+    email_xpath = login_page.EMAIL_INPUT[1]
+    popup_xpath = login_page.INTRO_POPUP_DIALOG[1]
+    fake_server.missing_elements[email_xpath] = 1
+    fake_server.missing_elements[popup_xpath] = 100
+
+    assert login_page._wait_login_state() == "login_form"
+    assert find_count(fake_server, email_xpath) == 2
+    assert find_count(fake_server, popup_xpath) == 1
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스마트 대기")
+def test_until_any_skips_invalid_locator(fake_server, login_page):
+    """잘못된 locator인 조건만 제외하고 나머지 조건으로 계속 기다립니다."""
+    email_xpath = login_page.EMAIL_INPUT[1]
+    popup_xpath = login_page.INTRO_POPUP_DIALOG[1]
+    fake_server.missing_elements[email_xpath] = 2
+    fake_server.invalid_selectors.add(popup_xpath)
+
+    assert login_page._wait_login_state() == "login_form"
+    # 잘못된 locator는 첫 폴링 이후 다시 조회하지 않음
+    assert find_count(fake_server, popup_xpath) == 1
+    assert find_count(fake_server, email_xpath) == 3
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스마트 대기")
+def test_until_any_raises_when_all_locators_invalid(fake_server, login_page):
+    """모든 조건의 locator가 잘못되었으면 타임아웃까지 기다리지 않고 바로 실패합니다."""
+    fake_server.invalid_selectors.update({login_page.EMAIL_INPUT[1], login_page.INTRO_POPUP_DIALOG[1]})
+    stats = WaitStats()
+    wait = SmartWait(login_page.driver, timeout=30, stats=stats)
+
+    with pytest.raises(InvalidSelectorException):
+        wait.until_any({
+            "login_form": lambda driver: driver.find_element(*login_page.EMAIL_INPUT),
+            "logged_in": lambda driver: driver.find_element(*login_page.INTRO_POPUP_DIALOG),
+        }, label="login")
+
+    assert stats.as_dict()["login"]["timeouts"] == 1
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스마트 대기")
+def test_until_times_out_when_element_never_appears(fake_server, login_page):
+    """요소가 끝까지 없으면 TimeoutException을 발생시키고 통계에 타임아웃으로 기록합니다."""
+    fake_server.missing_elements[login_page.EMAIL_INPUT[1]] = 100
+    stats = WaitStats()
+
+    with pytest.raises(TimeoutException):
+        SmartWait(login_page.driver, timeout=0.5, stats=stats).until(
+            lambda driver: driver.find_element(*login_page.EMAIL_INPUT), label="email")
+
+    stat = stats.as_dict()["email"]
+    assert stat["timeouts"] == 1
+    assert stat["polls"] > 1
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("스마트 대기")
+def test_login_continues_when_confirm_locator_is_invalid(fake_server, login_page):
+    """로그인 완료 확인(인트로 팝업) locator가 잘못되어도 로그인은 실패하지 않고 상태 저장만 건너뜁니다."""
+    fake_server.invalid_selectors.add(login_page.INTRO_POPUP_DIALOG[1])
+    ui_logins = login_state.stats["ui_logins"]
+
+    login_page.login("test1@example.com", "pw1")
+
+    assert "element.click" in fake_server.command_names()
+    assert login_state.stats["ui_logins"] == ui_logins
@@ -0,0 +1,194 @@
+"""
+화면 스냅샷 비교 테스트 (작은 합성 화면 사용)
+
+마이페이지와 비슷한 화면에서 요소를 추가 / 삭제 / 이름 변경 / 순서 변경 / 부모 변경했을 때
+트리 매칭 결과와, 새 화면에서 깨지는 locator를 찾아 CLI가 실패 종료하는지 검증합니다.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import allure
+
+from pages.my_page import MyPage
+from utils.snapshot_diff import LOCATOR_BROKEN, LOCATOR_OK, Screen, SnapshotDiff, check_locators
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _elem(elem_type, name="", children=()):
+    """(type, name, 자식 리스트) 형태의 요소 정의"""
+    return [f"XCUIElementType{elem_type}", name, list(children)]
+
+
+def base_tree():
+    """Application > Window > 헤더 / 본문 (본문에 버튼 3개)"""
+    return _elem("Application", "설탭", [
+        _elem("Window", "main", [
+            _elem("Other", "header", [
+                _elem("Button", "뒤로"),
+                _elem("StaticText", "마이페이지"),
+            ]),
+            _elem("Other", "content", [
+                _elem("TextField", "email"),
+                _elem("Button", "로그아웃"),
+                _elem("Button", "탈퇴"),
+                _elem("Button", "도움말"),
+            ]),
+        ]),
+    ])
+
+
+def to_source(tree) -> str:
+    def render(node):
+        elem_type, name, children = node
+        attrs = f' type="{elem_type}" name="{name}" label="{name}" enabled="true" visible="true"' if name \
+            else f' type="{elem_type}" enabled="true" visible="true"'
+        return f"<{elem_type}{attrs}>{''.join(render(child) for child in children)}</{elem_type}>"
+    return f'<?xml version="1.0" encoding="UTF-8"?><AppiumAUT>{render(tree)}</AppiumAUT>'
+
+
+def find(tree, name):
+    """이름이 name인 요소와 그 부모"""
+    stack = [(tree, None)]
+    while stack:
+        node, parent = stack.pop()
+        if node[1] == name:
+            return node, parent
+        stack.extend((child, node) for child in node[2])
+    raise KeyError(name)
+
+
+def diff_of(old_tree, new_tree) -> SnapshotDiff:
+    return SnapshotDiff(Screen.from_page_source(to_source(old_tree), "old"),
+                        Screen.from_page_source(to_source(new_tree), "new"))
+
+
+def names(screen, indexes):
+    return [screen.store.get_attribute(index, "name") for index in indexes]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_identical_screens_have_no_changes():
+    """같은 화면끼리 비교하면 모든 요소가 매칭되고 변경이 없습니다."""
+    diff = diff_of(base_tree(), base_tree())
+
+    assert not diff.has_changes
+    assert diff.summary()["unchanged"] == len(diff.old) == len(diff.new)
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_added_element():
+    """새 화면에만 있는 요소는 추가로만 표시합니다."""
+    new = base_tree()
+    find(new, "content")[0][2].append(_elem("Button", "공지"))
+
+    diff = diff_of(base_tree(), new)
+
+    assert names(diff.new, diff.added) == ["공지"]
+    assert not diff.removed and not diff.moved and not diff.changed
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_removed_element():
+    """새 화면에서 사라진 요소는 삭제로만 표시합니다."""
+    new = base_tree()
+    content = find(new, "content")[0]
+    content[2].remove(find(new, "탈퇴")[0])
+
+    diff = diff_of(base_tree(), new)
+
+    assert names(diff.old, diff.removed) == ["탈퇴"]
+    assert not diff.added and not diff.moved and not diff.changed
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_renamed_element():
+    """이름만 바뀐 요소는 삭제 + 추가가 아니라 같은 요소의 변경으로 표시합니다."""
+    new = base_tree()
+    find(new, "로그아웃")[0][1] = "로그아웃하기"
+
+    diff = diff_of(base_tree(), new)
+
+    assert not diff.added and not diff.removed and not diff.moved
+    assert [(names(diff.old, [old]), changes) for old, _, changes in diff.changed] == [
+        (["로그아웃"], {"name": ("로그아웃", "로그아웃하기"), "label": ("로그아웃", "로그아웃하기")}),
+    ]
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_reordered_element_within_parent():
+    """같은 부모 안에서 순서를 바꾼 요소 하나만 이동으로 표시합니다. (나머지 형제는 이동 아님)"""
+    new = base_tree()
+    content = find(new, "content")[0]
+    withdraw = find(new, "탈퇴")[0]
+    content[2].remove(withdraw)
+    content[2].append(withdraw)
+
+    diff = diff_of(base_tree(), new)
+
+    assert names(diff.old, [old for old, _ in diff.moved]) == ["탈퇴"]
+    assert not diff.added and not diff.removed and not diff.changed
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_reparented_element():
+    """다른 부모로 옮긴 요소는 이름으로 매칭해 이동으로 표시합니다."""
+    new = base_tree()
+    help_button, content = find(new, "도움말")
+    content[2].remove(help_button)
+    find(new, "header")[0][2].append(help_button)
+
+    diff = diff_of(base_tree(), new)
+
+    assert names(diff.old, [old for old, _ in diff.moved]) == ["도움말"]
+    assert not diff.added and not diff.removed
+    (_, new_index), = diff.moved
+    assert diff.new.store.get_attribute(diff.new.parents[new_index], "name") == "header"
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+def test_locator_becomes_broken():
+    """이전 화면에서 찾던 locator를 새 화면에서 찾지 못하면 broken입니다."""
+    new = base_tree()
+    find(new, "로그아웃")[0][1] = "로그아웃하기"
+    old_screen = Screen.from_page_source(to_source(base_tree()))
+    new_screen = Screen.from_page_source(to_source(new))
+
+    results = check_locators(old_screen, new_screen, {
+        "MyPage.LOGOUT_BUTTON": MyPage.LOGOUT_BUTTON,
+        "MyPage.EMAIL_TEXT_FIELD": MyPage.EMAIL_TEXT_FIELD,
+    })
+
+    assert results["MyPage.LOGOUT_BUTTON"]["status"] == LOCATOR_BROKEN
+    assert (results["MyPage.LOGOUT_BUTTON"]["old_count"], results["MyPage.LOGOUT_BUTTON"]["new_count"]) == (1, 0)
+    assert results["MyPage.EMAIL_TEXT_FIELD"]["status"] == LOCATOR_OK
+
+
+@allure.epic("테스트 인프라")
+@allure.feature("화면 스냅샷 비교")
+@pytest.mark.parametrize("rename, exit_code", [(False, 0), (True, 1)], ids=["no_broken_locator", "broken_locator"])
+def test_cli_exit_code(tmp_path, rename, exit_code):
+    """CLI는 Page Object locator가 새 화면에서 깨지면 종료 코드 1, 아니면 0으로 끝납니다."""
+    new = base_tree()
+    if rename:
+        find(new, "로그아웃")[0][1] = "로그아웃하기"
+    (tmp_path / "old.xml").write_text(to_source(base_tree()), encoding="utf-8")
+    (tmp_path / "new.xml").write_text(to_source(new), encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(PROJECT_ROOT / "utils" / "snapshot_diff.py"), "old.xml", "new.xml"],
+        cwd=tmp_path, capture_output=True, text=True,
+    )
+
+    assert result.returncode == exit_code, result.stdout + result.stderr
+    assert ("새 화면에서 깨지는 locator 1개: MyPage.LOGOUT_BUTTON" in result.stdout) is rename
@@ -0,0 +1,215 @@
+"""
+테스트 계정 풀 (병렬 실행용 계정 임대)
+
+모든 테스트가 test_account_1로 로그인하면 병렬 워커 / 디바이스가 서로의 세션을 끊습니다.
+accounts.json의 계정마다 잠금 파일(fcntl.flock)을 두고, 테스트 하나가 계정 하나를 독점하도록 빌려줍니다.
+
+    - 잠금 파일: ~/seoltab_AT/account_leases/<계정>.lock (SEOLTAB_ACCOUNT_LEASE_DIR로 변경)
+      같은 호스트의 모든 pytest 프로세스(xdist 워커, 동시에 실행한 다른 작업)가 같은 잠금을 사용
+    - 프로세스가 비정상 종료해도 운영체제가 잠금을 풀어주므로 계정이 묶여 있지 않음
+    - 빈 계정이 없으면 반납될 때까지 대기 (LEASE_TIMEOUT초 초과 시 TimeoutError)
+    - 같은 프로세스에서는 이전에 쓰던 계정을 우선 빌림 (로그인 상태 재사용)
+    - accounts.json에서 "pool": false인 계정(예: 관리자 계정)은 이름으로 지정할 때만 빌려줌
+
+사용 예시:
+    with account_pool.lease(owner="tests/test_login_logout.py::test_login_only") as lease:
+        login(lease.email, lease.password)
+
+    account_pool.lease("test_account_2")     # 특정 계정이 반납될 때까지 대기
+"""
+import fcntl
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.account_loader import get_account, get_account_names
+
+
+DEFAULT_LEASE_DIR = Path(os.getenv("SEOLTAB_ACCOUNT_LEASE_DIR", Path.home() / "seoltab_AT" / "account_leases"))
+# 빈 계정을 기다리는 최대 시간 (초)
+LEASE_TIMEOUT = 600
+# 빈 계정 확인 간격 (초, 여러 워커가 동시에 확인하지 않도록 무작위로 조금씩 늘림)
+POLL_INTERVAL = 1.0
+# 대기 중 사용 중인 계정을 다시 출력하는 간격 (초)
+WAIT_REPORT_INTERVAL = 30
+
+
+class AccountLease:
+    """빌린 계정 (release() 또는 with 블록이 끝나면 반납)"""
+
+    def __init__(self, pool: "AccountPool", name: str, account: dict, lock_file):
+        self.pool = pool
+        self.name = name
+        self.account = account
+        self._lock_file = lock_file
+
+    @property
+    def email(self) -> str:
+        return self.account["email"]
+
+    @property
+    def password(self) -> str:
+        return self.account["password"]
+
+    @property
+    def credentials(self) -> tuple:
+        """(email, password) 튜플 (account_loader.get_account_credentials와 같은 형식)"""
+        return self.email, self.password
+
+    @property
+    def released(self) -> bool:
+        return self._lock_file is None
+
+    def release(self):
+        if self._lock_file is None:
+            return
+        lock_file, self._lock_file = self._lock_file, None
+        self.pool._release(self.name, lock_file)
+
+    def __enter__(self) -> "AccountLease":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class AccountPool:
+    """파일 잠금 기반 계정 임대 (프로세스 전체에서 공유)"""
+
+    def __init__(self, lease_dir: Path = DEFAULT_LEASE_DIR, timeout: float = LEASE_TIMEOUT,
+                 poll_interval: float = POLL_INTERVAL):
+        """
+        Args:
+            lease_dir: 계정별 잠금 파일 디렉토리 (같은 호스트의 모든 프로세스가 공유)
+            timeout: 빈 계정을 기다리는 최대 시간 (초)
+            poll_interval: 빈 계정 확인 간격 (초)
+        """
+        self.lease_dir = Path(lease_dir)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stats = {"leases": 0, "waits": 0, "wait_seconds": 0.0}
+        self._lock = threading.Lock()
+        self._held: Dict[str, AccountLease] = {}
+        self._last_name: Optional[str] = None
+
+    def candidates(self) -> List[str]:
+        """이름을 지정하지 않았을 때 빌려줄 계정 ("pool": false 제외, 이전에 쓰던 계정 우선)"""
+        names = [name for name in get_account_names() if get_account(name).get("pool", True)]
+        if self._last_name in names:
+            names.remove(self._last_name)
+            names.insert(0, self._last_name)
+        return names
+
+    def lease(self, name: Optional[str] = None, owner: str = "", timeout: Optional[float] = None) -> AccountLease:
+        """
+        계정을 빌립니다. 빈 계정이 없으면 반납될 때까지 기다립니다.
+
+        Args:
+            name: 빌릴 계정 키 (None이면 풀의 빈 계정 아무거나)
+            owner: 잠금 파일에 기록할 사용자 (대기 중인 다른 워커의 안내 메시지에 표시)
+            timeout: 최대 대기 시간 (초, None이면 self.timeout)
+
+        Returns:
+            AccountLease
+
+        Raises:
+            TimeoutError: 최대 대기 시간 안에 빈 계정이 없는 경우
+        """
+        names = [name] if name else self.candidates()
+        if not names:
+            raise ValueError("config/accounts.json 파일에 빌려줄 수 있는 계정이 없습니다.")
+        if name:
+            get_account(name)  # 없는 계정이면 바로 ValueError
+            if name in self._held:
+                raise RuntimeError(f"'{name}' 계정은 이 프로세스에서 이미 사용 중입니다. (반납 후 다시 빌려주세요)")
+
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        next_report = started
+        waited = False
+        while True:
+            for candidate in names:
+                lease = self._try_lease(candidate, owner)
+                if lease is not None:
+                    self._record(lease, time.monotonic() - started if waited else 0.0)
+                    return lease
+
+            now = time.monotonic()
+            if now - started >= timeout:
+                raise TimeoutError(f"{timeout:.0f}초 동안 빈 계정이 없습니다 (사용 중: {self._describe_holders(names)})")
+            if now >= next_report:
+                print(f"[ACCOUNT] 빈 계정이 없어 대기합니다 (사용 중: {self._describe_holders(names)})")
+                next_report = now + WAIT_REPORT_INTERVAL
+            waited = True
+            time.sleep(self.poll_interval * random.uniform(1.0, 1.5))
+
+    def _try_lease(self, name: str, owner: str) -> Optional[AccountLease]:
+        """잠금을 바로 얻을 수 있으면 빌리고, 누가 쓰고 있으면 None"""
+        if name in self._held:
+            return None
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lease_dir / f"{name}.lock", 'a+', encoding='utf-8')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+
+        # 다른 워커의 대기 메시지에 표시할 사용자 정보
+        lock_file.seek(0)
+        lock_file.truncate()
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        lock_file.write(f"{worker} {owner or '-'} (PID {os.getpid()}, {datetime.now():%H:%M:%S})")
+        lock_file.flush()
+        return AccountLease(self, name, get_account(name), lock_file)
+
+    def _record(self, lease: AccountLease, wait_seconds: float):
+        with self._lock:
+            self._held[lease.name] = lease
+            self._last_name = lease.name
+            self.stats["leases"] += 1
+            if wait_seconds:
+                self.stats["waits"] += 1
+                self.stats["wait_seconds"] += wait_seconds
+        if wait_seconds:
+            print(f"[ACCOUNT] {wait_seconds:.1f}초 대기 후 '{lease.name}' 계정을 빌렸습니다")
+
+    def _release(self, name: str, lock_file):
+        with self._lock:
+            self._held.pop(name, None)
+        try:
+            lock_file.seek(0)
+            lock_file.truncate()
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _describe_holders(self, names: List[str]) -> str:
+        """계정별 현재 사용자 (잠금 파일에 기록된 내용)"""
+        holders = []
+        for name in names:
+            try:
+                owner = (self.lease_dir / f"{name}.lock").read_text(encoding='utf-8').strip()
+            except OSError:
+                owner = ""
+            holders.append(f"{name} ← {owner or '?'}")
+        return ", ".join(holders)
+
+    def merge(self, stats: dict):
+        """xdist 워커가 수집한 통계를 합칩니다."""
+        for key, value in stats.items():
+            self.stats[key] = self.stats.get(key, 0) + value
+
+    def print_summary(self):
+        if not self.stats["leases"]:
+            return
+        print(f"\n👥 계정 풀: {self.stats['leases']}회 임대, "
+              f"대기 {self.stats['waits']}회 (총 {self.stats['wait_seconds']:.1f}초)")
+
+
+# 프로세스 전체에서 공유하는 계정 풀
+account_pool = AccountPool()
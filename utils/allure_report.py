@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Allure 리포트 생성 (이력 유지 + 백그라운드 생성 + 정적 요약 페이지)
+
+`allure generate --clean`은 결과가 많을수록 오래 걸리고, pytest.ini의 --clean-alluredir와 함께
+이전 실행의 history/가 사라져 Allure 추이(Trend) 그래프가 항상 1회분만 표시됩니다.
+
+    - 이력 유지: 이전 리포트의 history/를 이번 결과에 넣고 생성 → 실행마다 추이가 이어짐
+    - 백그라운드 생성: allure-results를 하드 링크로 스냅샷한 뒤 별도 프로세스에서 생성
+      (pytest는 기다리지 않고 종료, 다음 실행이 allure-results를 지워도 스냅샷은 유지)
+    - 원자적 교체: 임시 폴더에 생성한 뒤 allure-report와 바꿔서 생성 중에도 이전 리포트를 볼 수 있음
+    - 같은 결과는 다시 생성하지 않음 (결과 파일 목록 지문 비교)
+    - 정적 요약 페이지: *-result.json만 읽어 1초 안에 reports/summary.html 생성
+
+사용 예시:
+    pytest --auto-report                       (요약 페이지 생성 + 백그라운드 리포트 생성)
+    python3 utils/allure_report.py generate    (포그라운드 생성, generate_report.sh에서 사용)
+    python3 utils/allure_report.py summary     (요약 페이지만 생성)
+"""
+import fcntl
+import glob
+import hashlib
+import html
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+RESULTS_DIR = "allure-results"
+REPORT_DIR = "allure-report"
+SUMMARY_FILE = "reports/summary.html"
+GENERATE_LOG_FILE = "reports/allure_generate.log"
+# 리포트 폴더에 저장하는 결과 지문 (같은 결과면 다시 생성하지 않음)
+FINGERPRINT_FILE = ".results_fingerprint"
+GENERATE_TIMEOUT = 600
+
+STATUS_ORDER = ("failed", "broken", "skipped", "unknown", "passed")
+STATUS_LABELS = {"passed": "성공", "failed": "실패", "broken": "오류", "skipped": "건너뜀", "unknown": "알 수 없음"}
+
+
+def generate_report(results_dir: str = RESULTS_DIR, report_dir: str = REPORT_DIR,
+                    timeout: int = GENERATE_TIMEOUT) -> bool:
+    """
+    이전 리포트의 history/를 유지하면서 Allure 리포트를 생성합니다. (allure 명령어 필요)
+
+    Args:
+        results_dir: allure-results 디렉토리
+        report_dir: 리포트 출력 디렉토리
+        timeout: allure generate 최대 시간 (초)
+
+    Returns:
+        생성(또는 같은 결과라 생략)했으면 True
+    """
+    if shutil.which("allure") is None:
+        print("⚠️  allure 명령어를 찾을 수 없습니다. 💡 'brew install allure'로 설치하세요.")
+        return False
+
+    snapshot_dir = snapshot_results(results_dir)
+    try:
+        with _report_lock(report_dir):
+            return _generate_from_snapshot(snapshot_dir, report_dir, timeout)
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+
+def start_background_generation(results_dir: str = RESULTS_DIR, report_dir: str = REPORT_DIR,
+                                log_file: str = GENERATE_LOG_FILE) -> subprocess.Popen:
+    """
+    allure-results를 스냅샷한 뒤 별도 프로세스에서 리포트를 생성합니다. (바로 반환)
+
+    Returns:
+        생성 프로세스 (pytest가 종료되어도 계속 실행됨)
+    """
+    snapshot_dir = snapshot_results(results_dir)
+    os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+    with open(log_file, 'w', encoding='utf-8') as log:
+        return subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "generate-snapshot", snapshot_dir, report_dir],
+            stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, start_new_session=True
+        )
+
+
+def snapshot_results(results_dir: str) -> str:
+    """
+    allure-results를 하드 링크로 복제합니다. (복사보다 빠르고, 원본이 지워져도 유지됨)
+
+    Returns:
+        스냅샷 디렉토리 경로 (results_dir 옆의 .allure-results-*)
+    """
+    parent = os.path.dirname(os.path.abspath(results_dir))
+    snapshot_dir = tempfile.mkdtemp(prefix=".allure-results-", dir=parent)
+    for name in os.listdir(results_dir):
+        source = os.path.join(results_dir, name)
+        if not os.path.isfile(source):
+            continue
+        target = os.path.join(snapshot_dir, name)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+    return snapshot_dir
+
+
+def _generate_from_snapshot(snapshot_dir: str, report_dir: str, timeout: int) -> bool:
+    fingerprint = _results_fingerprint(snapshot_dir)
+    fingerprint_path = os.path.join(report_dir, FINGERPRINT_FILE)
+    if os.path.exists(fingerprint_path):
+        with open(fingerprint_path, 'r', encoding='utf-8') as f:
+            if f.read().strip() == fingerprint:
+                print(f"✅ 결과가 바뀌지 않아 리포트를 다시 생성하지 않습니다: {report_dir}")
+                return True
+
+    # 이전 리포트의 추이 이력을 이번 결과에 포함
+    history_dir = os.path.join(report_dir, "history")
+    if os.path.isdir(history_dir):
+        shutil.copytree(history_dir, os.path.join(snapshot_dir, "history"), dirs_exist_ok=True)
+
+    start_time = time.time()
+    new_report_dir = f"{report_dir}.new"
+    shutil.rmtree(new_report_dir, ignore_errors=True)
+    try:
+        result = subprocess.run(
+            ["allure", "generate", snapshot_dir, "--clean", "-o", new_report_dir],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        print(f"⏱️  Allure 리포트 생성 시간 초과 ({timeout}초)")
+        shutil.rmtree(new_report_dir, ignore_errors=True)
+        return False
+
+    elapsed_time = time.time() - start_time
+    if result.returncode != 0:
+        print(f"❌ Allure 리포트 생성 실패 (소요 시간: {elapsed_time:.2f}초)")
+        if result.stderr:
+            print(f"에러: {result.stderr}")
+        shutil.rmtree(new_report_dir, ignore_errors=True)
+        return False
+
+    with open(os.path.join(new_report_dir, FINGERPRINT_FILE), 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+
+    # 새 리포트로 교체 (생성 중에는 이전 리포트를 그대로 볼 수 있음)
+    old_report_dir = f"{report_dir}.old"
+    shutil.rmtree(old_report_dir, ignore_errors=True)
+    if os.path.exists(report_dir):
+        os.rename(report_dir, old_report_dir)
+    os.rename(new_report_dir, report_dir)
+    shutil.rmtree(old_report_dir, ignore_errors=True)
+
+    print(f"✅ Allure 리포트 생성 완료! (소요 시간: {elapsed_time:.2f}초)")
+    print(f"📂 위치: {report_dir}/index.html")
+    return True
+
+
+def _results_fingerprint(results_dir: str) -> str:
+    """결과 파일 목록 지문 (결과 파일 이름은 테스트마다 새 uuid)"""
+    names = sorted(name for name in os.listdir(results_dir) if name != "history")
+    return hashlib.sha256("\n".join(names).encode('utf-8')).hexdigest()
+
+
+@contextmanager
+def _report_lock(report_dir: str):
+    """같은 리포트 폴더를 동시에 생성하지 않도록 잠금 (이전 백그라운드 생성이 끝날 때까지 대기)"""
+    lock_path = f"{os.path.abspath(report_dir)}.lock"
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def update_environment_properties(results_dir: str, prefix: str, items: Dict[str, str]):
+    """
+    Allure 리포트 Environment 위젯(environment.properties)의 항목을 씁니다.
+    파일이 이미 있으면 prefix로 시작하는 항목만 새로 씁니다. (다른 항목은 유지)
+
+    Args:
+        results_dir: allure-results 디렉토리
+        prefix: 이번에 쓰는 항목의 키 접두사
+        items: {키: 값} (키는 prefix로 시작)
+    """
+    if not results_dir or not os.path.isdir(results_dir):
+        return
+
+    path = os.path.join(results_dir, "environment.properties")
+    lines = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f.read().splitlines() if not line.startswith(_escape_property_key(prefix))]
+
+    for key, value in items.items():
+        lines.append(f"{_escape_property_key(key)}={_escape_unicode(str(value))}")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _escape_property_key(key: str) -> str:
+    """.properties 키의 공백, =, : 이스케이프"""
+    for char in ('\\', ' ', '=', ':'):
+        key = key.replace(char, '\\' + char)
+    return _escape_unicode(key)
+
+
+def _escape_unicode(text: str) -> str:
+    """.properties는 ISO-8859-1로 읽히므로 한글 등은 \\uXXXX로 이스케이프"""
+    return "".join(char if ord(char) < 128 else f"\\u{ord(char):04x}" for char in text)
+
+
+def load_results(results_dir: str = RESULTS_DIR) -> List[Dict]:
+    """
+    allure-results의 테스트 결과 (*-result.json)
+
+    Returns:
+        [{"name", "full_name", "status", "duration", "device", "message"}, ...]
+    """
+    results = []
+    for path in glob.glob(os.path.join(results_dir, "*-result.json")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        parameters = {param.get("name"): param.get("value") for param in data.get("parameters", [])}
+        results.append({
+            "name": data.get("name", ""),
+            "full_name": data.get("fullName", ""),
+            "status": data.get("status", "unknown"),
+            "duration": max(0, data.get("stop", 0) - data.get("start", 0)) / 1000,
+            "device": str(parameters.get("디바이스", "-")).strip("'"),
+            "message": (data.get("statusDetails") or {}).get("message", ""),
+        })
+    return results
+
+
+def load_history_trend(report_dir: str = REPORT_DIR, limit: int = 10) -> List[Dict]:
+    """이전 리포트의 실행별 결과 개수 (history/history-trend.json, 최근 순)"""
+    path = os.path.join(report_dir, "history", "history-trend.json")
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [entry.get("data", {}) for entry in json.load(f)[:limit]]
+    except (OSError, ValueError):
+        return []
+
+
+def write_summary(results_dir: str = RESULTS_DIR, output_file: str = SUMMARY_FILE,
+                  report_dir: str = REPORT_DIR, results: Optional[List[Dict]] = None) -> Optional[str]:
+    """
+    Allure 없이 볼 수 있는 정적 요약 페이지(HTML 한 파일)를 생성합니다.
+
+    Args:
+        results_dir: allure-results 디렉토리 (results가 없을 때 읽음)
+        output_file: 출력 HTML 경로
+        report_dir: 이전 리포트 (실행 추이 표시용)
+        results: 테스트 결과 (load_results() 형식, pytest 실행 중에는 ResultCollector.summary_rows())
+
+    Returns:
+        출력 파일 경로 (결과가 없으면 None)
+    """
+    if results is None:
+        results = load_results(results_dir)
+    if not results:
+        return None
+
+    counts = {status: 0 for status in STATUS_ORDER}
+    for result in results:
+        counts[result["status"] if result["status"] in counts else "unknown"] += 1
+    results.sort(key=lambda item: (_status_rank(item["status"]), -item["duration"]))
+
+    count_cells = "".join(
+        f'<div class="count {status}"><b>{counts[status]}</b>{STATUS_LABELS[status]}</div>'
+        for status in STATUS_ORDER if counts[status]
+    )
+    rows = "".join(
+        f'<tr class="{html.escape(result["status"])}"><td>{STATUS_LABELS.get(result["status"], result["status"])}</td>'
+        f'<td title="{html.escape(result["full_name"])}">{html.escape(result["name"])}</td>'
+        f'<td>{html.escape(result["device"])}</td><td class="num">{result["duration"]:.1f}s</td>'
+        f'<td><pre>{html.escape(result["message"][:500])}</pre></td></tr>'
+        for result in results
+    )
+    trend = load_history_trend(report_dir)
+    trend_rows = "".join(
+        f'<tr><td>{index}</td>' + "".join(f'<td class="num">{entry.get(status, 0)}</td>' for status in STATUS_ORDER) + '</tr>'
+        for index, entry in enumerate(trend, start=1)
+    )
+    trend_table = (
+        '<h2>이전 실행 추이 (최근 순)</h2><table><tr><th>#</th>'
+        + "".join(f'<th>{STATUS_LABELS[status]}</th>' for status in STATUS_ORDER)
+        + f'</tr>{trend_rows}</table>'
+    ) if trend else ""
+
+    total_duration = sum(result["duration"] for result in results)
+    page = f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>설탭 2.0 테스트 요약</title>
+<style>
+body {{ font-family: -apple-system, sans-serif; margin: 24px; color: #222; }}
+.counts {{ display: flex; gap: 12px; margin: 16px 0; }}
+.count {{ padding: 8px 16px; border-radius: 6px; background: #eee; }}
+.count b {{ display: block; font-size: 24px; }}
+.count.passed {{ background: #d4edda; }} .count.failed {{ background: #f8d7da; }}
+.count.broken {{ background: #fff3cd; }} .count.skipped {{ background: #e2e3e5; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 24px; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 6px 8px; text-align: left; vertical-align: top; }}
+td.num {{ text-align: right; white-space: nowrap; }}
+tr.failed td:first-child {{ color: #c0392b; }} tr.broken td:first-child {{ color: #b7950b; }}
+pre {{ margin: 0; white-space: pre-wrap; font-size: 12px; }}
+</style></head><body>
+<h1>설탭 2.0 테스트 요약</h1>
+<p>{time.strftime("%Y-%m-%d %H:%M:%S")} · 테스트 {len(results)}개 · 합계 {total_duration:.1f}초 ·
+전체 리포트: <a href="../{html.escape(report_dir)}/index.html">{html.escape(report_dir)}/index.html</a></p>
+<div class="counts">{count_cells}</div>
+{trend_table}
+<h2>테스트 결과</h2>
+<table><tr><th>상태</th><th>테스트</th><th>디바이스</th><th>소요</th><th>메시지</th></tr>{rows}</table>
+</body></html>
+"""
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return output_file
+
+
+def _status_rank(status: str) -> int:
+    return STATUS_ORDER.index(status) if status in STATUS_ORDER else len(STATUS_ORDER)
+
+
+def main():
+    """
+    메인 함수
+
+    python3 utils/allure_report.py generate [results_dir] [report_dir]
+    python3 utils/allure_report.py summary [results_dir]
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else "generate"
+
+    if command == "generate-snapshot":
+        # start_background_generation()이 실행하는 백그라운드 작업 (스냅샷은 끝나면 삭제)
+        snapshot_dir, report_dir = sys.argv[2], sys.argv[3]
+        try:
+            with _report_lock(report_dir):
+                success = _generate_from_snapshot(snapshot_dir, report_dir, GENERATE_TIMEOUT)
+        finally:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+        sys.exit(0 if success else 1)
+
+    results_dir = sys.argv[2] if len(sys.argv) > 2 else RESULTS_DIR
+    if not os.path.isdir(results_dir):
+        print(f"❌ {results_dir} 디렉토리가 없습니다.")
+        sys.exit(1)
+
+    if command == "summary":
+        start_time = time.time()
+        path = write_summary(results_dir)
+        if path is None:
+            print(f"⚠️  {results_dir}에 테스트 결과가 없습니다.")
+            sys.exit(1)
+        print(f"📄 요약 페이지 생성: {path} ({time.time() - start_time:.2f}초)")
+    elif command == "generate":
+        report_dir = sys.argv[3] if len(sys.argv) > 3 else REPORT_DIR
+        sys.exit(0 if generate_report(results_dir, report_dir) else 1)
+    else:
+        print(f"❌ 알 수 없는 명령: {command} (generate | summary)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+WebDriver 명령 계측
+
+드라이버의 execute()를 감싸서 모든 WebDriver 명령(요소 찾기, 클릭, page_source 등)을 기록합니다.
+WebElement의 명령도 driver.execute()를 거치므로 함께 기록됩니다.
+
+기록 항목:
+    - 명령 이름, locator (요소 찾기 명령), 소요 시간, 요청/응답 크기, 오류
+    - 재시도: 같은 locator로 요소 찾기를 다시 한 횟수 (사이에 조작 명령 없이 반복 = 대기 중 폴링)
+    - 테스트 / Page Object 메소드 / 디바이스 (명령을 호출한 BasePage 하위 클래스 메소드)
+
+출력:
+    - 테스트마다 JSONL과 Chrome trace-event(JSON)를 Allure에 첨부
+    - 세션 종료 시 reports/command_trace.jsonl, reports/command_trace.json 저장
+      (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+    - 테스트 / 메소드 / 디바이스별 소요 시간 요약 출력
+
+사용 예시:
+    pytest --trace-commands
+"""
+import json
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# 요소 찾기 명령 (params의 using/value를 locator로 기록)
+FIND_COMMANDS = ('findElement', 'findElements', 'findChildElement', 'findChildElements')
+# 화면 상태를 바꾸지 않는 조회 명령 접두사
+READ_ONLY_PREFIXES = ('get', 'is')
+
+TRACE_JSONL_FILE = "reports/command_trace.jsonl"
+TRACE_CHROME_FILE = "reports/command_trace.json"
+
+
+class CommandTracer:
+    """WebDriver 명령 기록기 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.events: List[dict] = []
+        self.current_test: Optional[str] = None
+        self._test_start = 0
+        self._last_key = None
+        self._origin = time.perf_counter()
+        # perf_counter 기준 시각을 epoch(μs)로 변환하기 위한 기준점
+        self._epoch_origin_us = time.time() * 1_000_000
+
+    def instrument(self, driver, device_name: str):
+        """
+        드라이버의 execute()를 계측 래퍼로 교체합니다. (같은 드라이버는 한 번만)
+
+        Args:
+            driver: Appium WebDriver
+            device_name: 디바이스 이름 (집계 기준)
+        """
+        if getattr(driver, '_command_tracer_device', None) is not None:
+            driver._command_tracer_device = device_name
+            return driver
+
+        execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            if not tracer.enabled:
+                return execute(driver_command, params)
+            start = time.perf_counter()
+            error = None
+            response = None
+            try:
+                response = execute(driver_command, params)
+                return response
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                tracer._record(driver._command_tracer_device, driver_command, params, response,
+                               start, time.perf_counter(), error)
+
+        driver._command_tracer_device = device_name
+        driver.execute = traced_execute
+        return driver
+
+    def _record(self, device: str, command: str, params, response, start: float, end: float, error):
+        locator = None
+        if command in FIND_COMMANDS and params:
+            locator = f"{params.get('using')}={params.get('value')}"
+
+        event = {
+            "ts": self._epoch_origin_us + (start - self._origin) * 1_000_000,
+            "dur_ms": (end - start) * 1000,
+            "command": command,
+            "locator": locator,
+            "device": device,
+            "test": self.current_test,
+            "method": _page_object_method(),
+            "request_bytes": _payload_size(params),
+            "response_bytes": _payload_size(response.get('value') if isinstance(response, dict) else None),
+            "error": error,
+        }
+        with self._lock:
+            if command in FIND_COMMANDS:
+                key = (device, command, locator)
+                event["retry"] = self._last_key == key
+                self._last_key = key
+            else:
+                event["retry"] = False
+                # 조회 명령(getXxx / isXxx - 예: 폴링 중 isElementDisplayed)은 재시도 판단을 끊지 않음
+                if not command.startswith(READ_ONLY_PREFIXES):
+                    self._last_key = None
+            self.events.append(event)
+
+    def begin_test(self, nodeid: str):
+        """테스트 시작 (이후 명령은 이 테스트로 집계)"""
+        with self._lock:
+            self.current_test = nodeid
+            self._test_start = len(self.events)
+            self._last_key = None
+
+    def end_test(self) -> List[dict]:
+        """테스트 종료 - 이 테스트에서 기록한 명령 리스트를 반환합니다."""
+        with self._lock:
+            events = [event for event in self.events[self._test_start:] if event["test"] == self.current_test]
+            self.current_test = None
+            return events
+
+    def merge(self, events: List[dict]):
+        """다른 프로세스(xdist 워커)에서 기록한 명령을 합칩니다."""
+        with self._lock:
+            self.events.extend(events)
+
+    def reset(self):
+        with self._lock:
+            self.events.clear()
+            self.current_test = None
+            self._test_start = 0
+            self._last_key = None
+
+    def summarize(self, events: Optional[List[dict]] = None) -> Dict[str, Dict[str, dict]]:
+        """
+        테스트 / Page Object 메소드 / 디바이스 / 명령별 집계
+
+        Returns:
+            {"test": {이름: 통계}, "method": {...}, "device": {...}, "command": {...}}
+            통계: {"count", "retries", "errors", "total_ms", "max_ms", "request_bytes", "response_bytes"}
+        """
+        events = self.events if events is None else events
+        summary = {"test": {}, "method": {}, "device": {}, "command": {}}
+        for event in events:
+            for group in summary:
+                name = event[group] or "-"
+                stat = summary[group].setdefault(name, {
+                    "count": 0, "retries": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                    "request_bytes": 0, "response_bytes": 0,
+                })
+                stat["count"] += 1
+                stat["retries"] += event["retry"]
+                stat["errors"] += event["error"] is not None
+                stat["total_ms"] += event["dur_ms"]
+                stat["max_ms"] = max(stat["max_ms"], event["dur_ms"])
+                stat["request_bytes"] += event["request_bytes"]
+                stat["response_bytes"] += event["response_bytes"]
+        return summary
+
+    def print_summary(self, max_rows: int = 10):
+        """테스트 / 메소드 / 디바이스 / 명령별로 WebDriver 명령 시간이 긴 순서로 출력합니다."""
+        if not self.events:
+            return
+
+        summary = self.summarize()
+        total_ms = sum(event["dur_ms"] for event in self.events)
+        print(f"\n🛰️  WebDriver 명령 {len(self.events)}개, 총 {total_ms / 1000:.1f}초")
+        titles = {"test": "테스트", "method": "Page Object 메소드", "device": "디바이스", "command": "명령"}
+        for group, title in titles.items():
+            print(f"\n{title}별 (총 시간 순, 상위 {max_rows}개)")
+            print(f"{title:<60} {'명령':>6} {'재시도':>6} {'오류':>4} {'합계(s)':>8} {'최대(ms)':>9} {'응답(KB)':>9}")
+            print("-" * 108)
+            rows = sorted(summary[group].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+            for name, stat in rows[:max_rows]:
+                short_name = name if len(name) <= 58 else "..." + name[-55:]
+                print(f"{short_name:<60} {stat['count']:>6} {stat['retries']:>6} {stat['errors']:>4} "
+                      f"{stat['total_ms'] / 1000:>8.2f} {stat['max_ms']:>9.1f} {stat['response_bytes'] / 1024:>9.1f}")
+
+    def save(self, jsonl_file: str = TRACE_JSONL_FILE, chrome_file: str = TRACE_CHROME_FILE):
+        """전체 기록을 JSONL과 Chrome trace-event 형식으로 저장합니다."""
+        with open(jsonl_file, 'w', encoding='utf-8') as f:
+            f.write(to_jsonl(self.events))
+        with open(chrome_file, 'w', encoding='utf-8') as f:
+            json.dump(to_chrome_trace(self.events), f, ensure_ascii=False)
+
+
+def to_jsonl(events: List[dict]) -> str:
+    """명령 기록 → JSONL 문자열 (한 줄에 명령 하나)"""
+    return "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+
+
+def to_chrome_trace(events: List[dict]) -> dict:
+    """
+    명령 기록 → Chrome trace-event 형식
+
+    디바이스마다 프로세스(pid) 하나, 테스트 구간과 WebDriver 명령은 서로 다른 스레드(tid)로 표시합니다.
+    """
+    trace_events = []
+    pids: Dict[str, int] = {}
+    tests: Dict[tuple, List[float]] = {}
+
+    for event in events:
+        device = event["device"] or "-"
+        if device not in pids:
+            pids[device] = len(pids) + 1
+            trace_events.append({"name": "process_name", "ph": "M", "pid": pids[device], "args": {"name": device}})
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pids[device], "tid": 1, "args": {"name": "테스트"}})
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pids[device], "tid": 2,
+                                 "args": {"name": "WebDriver 명령"}})
+
+        trace_events.append({
+            "name": event["command"] if not event["locator"] else f"{event['command']} {event['locator']}",
+            "cat": "webdriver",
+            "ph": "X",
+            "ts": event["ts"],
+            "dur": event["dur_ms"] * 1000,
+            "pid": pids[device],
+            "tid": 2,
+            "args": {key: event[key] for key in ("method", "test", "request_bytes", "response_bytes", "retry", "error")},
+        })
+
+        # 테스트 구간 (첫 명령 시작 ~ 마지막 명령 종료)
+        if event["test"]:
+            span = tests.setdefault((device, event["test"]), [event["ts"], event["ts"]])
+            span[1] = max(span[1], event["ts"] + event["dur_ms"] * 1000)
+
+    for (device, test), (start, end) in tests.items():
+        trace_events.append({
+            "name": test.split("::")[-1], "cat": "test", "ph": "X", "ts": start, "dur": end - start,
+            "pid": pids[device], "tid": 1, "args": {"nodeid": test},
+        })
+
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def _page_object_method() -> Optional[str]:
+    """명령을 호출한 가장 바깥쪽(테스트에 가장 가까운) Page Object 메소드 이름"""
+    from pages.base_page import BasePage
+
+    frame = sys._getframe(2)
+    method = None
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, BasePage):
+            method = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return method
+
+
+def _payload_size(value) -> int:
+    """요청/응답 크기 (bytes, JSON 기준 근사값)"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+# 프로세스 전체에서 공유하는 기록기 (pytest --trace-commands 로 활성화)
+command_tracer = CommandTracer()
@@ -0,0 +1,199 @@
+"""
+설정 파일 레지스트리 (devices.json / accounts.json)
+
+get_capabilities / get_account를 호출할 때마다 JSON을 다시 열고 파싱하던 방식 대신,
+한 번 읽은 결과를 보관하고 파일이 바뀌었을 때(수정 시각 / 크기)만 다시 읽습니다.
+
+    - 레이어: 아래 순서로 읽어 뒤의 파일이 앞의 값을 덮어씀 (디바이스 / 계정 단위로 키를 합침)
+        1. config/<이름>.json                       (기본)
+        2. config/<이름>.<SEOLTAB_ENV>.json          (환경별 덮어쓰기, SEOLTAB_ENV를 설정한 경우)
+        3. ~/seoltab_AT/config/<이름>.json          (Self-Hosted Runner의 실제 설정, SEOLTAB_CONFIG_DIR로 변경)
+    - 스키마 검증: 읽을 때 모든 항목을 검사하고 문제를 한 번에 보고 (ConfigError)
+    - xdist: 컨트롤러가 읽은 결과를 워커에 전달 (workerinput) → 워커는 파일이 그대로면 다시 파싱하지 않음
+
+사용 예시:
+    device_registry.entry("iPad_9th_15.7_real")    # 디바이스 Capabilities (복사본)
+    account_registry.names()                       # 계정 키 목록
+"""
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+HOME_CONFIG_DIR = Path(os.getenv("SEOLTAB_CONFIG_DIR", Path.home() / "seoltab_AT" / "config"))
+PLATFORMS = ("ios", "android")
+
+
+class ConfigError(ValueError):
+    """설정 파일 형식 / 스키마 오류"""
+
+
+def validate_devices(devices: dict) -> List[str]:
+    """devices.json 스키마 검사 (디바이스마다 platformName, appium:automationName 필수)"""
+    errors = []
+    for name, capabilities in devices.items():
+        if not isinstance(capabilities, dict):
+            errors.append(f"{name}: 디바이스 설정은 객체여야 합니다")
+            continue
+        platform = capabilities.get("platformName")
+        if not isinstance(platform, str) or platform.lower() not in PLATFORMS:
+            errors.append(f"{name}: platformName은 iOS 또는 Android여야 합니다 (현재: {platform!r})")
+        if not isinstance(capabilities.get("appium:automationName"), str):
+            errors.append(f"{name}: appium:automationName이 없습니다")
+    return errors
+
+
+def validate_accounts(accounts: dict) -> List[str]:
+    """accounts.json 스키마 검사 (계정마다 email, password 문자열 필수, pool은 선택)"""
+    errors = []
+    for name, account in accounts.items():
+        if not isinstance(account, dict):
+            errors.append(f"{name}: 계정 정보는 객체여야 합니다")
+            continue
+        for key in ("email", "password"):
+            if not isinstance(account.get(key), str) or not account[key]:
+                errors.append(f"{name}: {key}가 없습니다")
+        if not isinstance(account.get("pool", True), bool):
+            errors.append(f"{name}: pool은 true 또는 false여야 합니다")
+    return errors
+
+
+class ConfigRegistry:
+    """레이어를 합친 설정 파일 하나 (파일이 바뀔 때만 다시 읽음, 프로세스 전체에서 공유)"""
+
+    def __init__(self, name: str, validator: Callable[[dict], List[str]], label: str,
+                 config_dir: Path = CONFIG_DIR, home_config_dir: Optional[Path] = HOME_CONFIG_DIR):
+        """
+        Args:
+            name: 설정 파일 이름 (확장자 제외, 예: "devices")
+            validator: 합친 설정을 검사해 오류 메시지 리스트를 반환하는 함수
+            label: 항목을 찾지 못했을 때 메시지에 쓰는 이름 + 조사 (예: "디바이스를")
+            config_dir: 기본 설정 디렉토리
+            home_config_dir: 실제 설정 디렉토리 (None이면 사용하지 않음)
+        """
+        self.name = name
+        self.validator = validator
+        self.label = label
+        self.config_dir = Path(config_dir)
+        self.home_config_dir = Path(home_config_dir) if home_config_dir else None
+        self.load_count = 0
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._data: Optional[Dict[str, dict]] = None
+
+    @property
+    def display_name(self) -> str:
+        return f"config/{self.name}.json"
+
+    def layer_paths(self) -> List[Path]:
+        """레이어 파일 경로 (덮어쓰는 순서, 없는 파일 포함)"""
+        paths = [self.config_dir / f"{self.name}.json"]
+        env = os.getenv("SEOLTAB_ENV")
+        if env:
+            paths.append(self.config_dir / f"{self.name}.{env}.json")
+        if self.home_config_dir is not None:
+            paths.append(self.home_config_dir / f"{self.name}.json")
+        return paths
+
+    def _current_signature(self) -> Tuple:
+        """존재하는 레이어 파일의 (경로, 수정 시각, 크기)"""
+        signature = []
+        for path in self.layer_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def data(self) -> Dict[str, dict]:
+        """
+        합친 설정 전체 (파일이 바뀌었으면 다시 읽음, 반환값은 수정하지 말 것)
+
+        Raises:
+            FileNotFoundError: 레이어 파일이 하나도 없는 경우
+            ConfigError: JSON 형식 / 스키마 오류
+        """
+        signature = self._current_signature()
+        with self._lock:
+            if self._data is None or signature != self._signature:
+                self._data = self._load(signature)
+                self._signature = signature
+            return self._data
+
+    def _load(self, signature: Tuple) -> Dict[str, dict]:
+        if not signature:
+            raise FileNotFoundError(f"{self.display_name} 파일을 찾을 수 없습니다. 경로를 확인해주세요.")
+
+        merged: Dict[str, dict] = {}
+        for path, _, _ in signature:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    layer = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ConfigError(f"{path} 파일의 형식이 올바르지 않습니다: {e}")
+            if not isinstance(layer, dict):
+                raise ConfigError(f"{path} 파일의 최상위는 객체여야 합니다.")
+            for key, value in layer.items():
+                # 같은 키는 항목 단위로 합침 (예: 실제 설정 파일에서 udid만 덮어쓰기)
+                if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                    merged[key] = {**merged[key], **value}
+                else:
+                    merged[key] = value
+
+        errors = self.validator(merged)
+        if errors:
+            layers = ", ".join(path for path, _, _ in signature)
+            raise ConfigError(f"{self.display_name} 설정이 올바르지 않습니다 ({layers}):\n  - " + "\n  - ".join(errors))
+
+        self.load_count += 1
+        return merged
+
+    def entry(self, key: str) -> dict:
+        """항목 하나 (호출한 쪽에서 수정해도 되도록 복사본 반환)"""
+        data = self.data()
+        if key not in data:
+            raise ValueError(f"'{key}'에 해당하는 {self.label} {self.display_name} 파일에서 찾을 수 없습니다.")
+        return copy.deepcopy(data[key])
+
+    def names(self) -> List[str]:
+        """항목 키 목록 (파일에 정의된 순서)"""
+        return list(self.data().keys())
+
+    def export(self) -> Optional[dict]:
+        """xdist 워커에 전달할 파싱 결과 (레이어 파일이 없으면 None)"""
+        try:
+            data = self.data()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            return {"signature": [list(item) for item in self._signature], "data": data}
+
+    def seed(self, exported: Optional[dict]):
+        """컨트롤러가 파싱한 결과를 넣습니다. (레이어 파일이 그대로면 다시 읽지 않음)"""
+        if not exported:
+            return
+        with self._lock:
+            self._signature = tuple(tuple(item) for item in exported["signature"])
+            self._data = exported["data"]
+
+
+def export_registries() -> Dict[str, Optional[dict]]:
+    """모든 레지스트리의 파싱 결과 (pytest_configure_node → workerinput)"""
+    return {registry.name: registry.export() for registry in REGISTRIES}
+
+
+def seed_registries(exported: Optional[Dict[str, Optional[dict]]]):
+    """워커에서 컨트롤러의 파싱 결과를 사용합니다."""
+    for registry in REGISTRIES:
+        registry.seed((exported or {}).get(registry.name))
+
+
+# 프로세스 전체에서 공유하는 레지스트리
+device_registry = ConfigRegistry("devices", validate_devices, "디바이스를")
+account_registry = ConfigRegistry("accounts", validate_accounts, "계정을")
+REGISTRIES = (device_registry, account_registry)
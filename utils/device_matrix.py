@@ -0,0 +1,113 @@
+"""
+멀티 디바이스 병렬 실행 도우미
+
+`--devices a,b,c` / `--all-devices` 로 지정한 디바이스마다 테스트를 복제하고,
+pytest-xdist 워커 하나가 디바이스 하나를 전담하도록 설정값을 계산합니다.
+
+디바이스별로 분리되는 값:
+    - Appium 서버 포트: 기본 포트 + 디바이스 순번 (4723, 4724, ...)
+    - WDA 로컬 포트(iOS), systemPort(Android), MJPEG 포트
+"""
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from utils.capabilities_loader import get_device_names
+
+
+# 디바이스 순번만큼 더해서 사용하는 기본 포트
+WDA_BASE_PORT = 8100
+SYSTEM_BASE_PORT = 8200
+MJPEG_BASE_PORT = 9100
+
+
+def parse_device_list(value: Optional[str]) -> List[str]:
+    """
+    콤마로 구분된 디바이스 목록을 리스트로 변환합니다. (중복 제거, 순서 유지)
+
+    Args:
+        value: "iPad_a,Galaxy_b" 형식의 문자열
+
+    Returns:
+        디바이스 키 리스트
+    """
+    if not value:
+        return []
+
+    devices = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in devices:
+            devices.append(name)
+    return devices
+
+
+def resolve_target_devices(devices_option: Optional[str], all_devices: bool) -> List[str]:
+    """
+    커맨드라인 옵션으로부터 병렬 실행 대상 디바이스 목록을 결정합니다.
+
+    Args:
+        devices_option: --devices 옵션 값
+        all_devices: --all-devices 옵션 여부
+
+    Returns:
+        디바이스 키 리스트 (멀티 디바이스 모드가 아니면 빈 리스트)
+    """
+    if all_devices:
+        return get_device_names()
+
+    devices = parse_device_list(devices_option)
+    if not devices:
+        return []
+
+    known = get_device_names()
+    unknown = [name for name in devices if name not in known]
+    if unknown:
+        raise ValueError(f"config/devices.json 파일에 없는 디바이스입니다: {', '.join(unknown)}")
+    return devices
+
+
+def appium_url_for(base_url: str, device_index: int) -> str:
+    """
+    디바이스 순번에 해당하는 Appium 서버 URL을 계산합니다.
+
+    Args:
+        base_url: 기본 Appium URL (예: http://localhost:4723)
+        device_index: 디바이스 순번 (0부터)
+
+    Returns:
+        포트가 순번만큼 증가한 URL (예: http://localhost:4724)
+    """
+    parts = urlsplit(base_url)
+    port = (parts.port or 4723) + device_index
+    netloc = f"{parts.hostname}:{port}"
+    return urlunsplit((parts.scheme, netloc, parts.path, parts.query, parts.fragment))
+
+
+def appium_urls_for(base_url: str, devices: List[str]) -> Dict[str, str]:
+    """디바이스별 Appium 서버 URL 딕셔너리를 반환합니다."""
+    return {name: appium_url_for(base_url, index) for index, name in enumerate(devices)}
+
+
+def isolate_capabilities(capabilities: dict, device_index: int) -> dict:
+    """
+    같은 호스트에서 여러 디바이스를 동시에 구동할 수 있도록
+    디바이스마다 겹치지 않는 로컬 포트를 Capabilities에 추가합니다.
+    devices.json에 이미 지정된 값은 그대로 둡니다.
+
+    Args:
+        capabilities: devices.json의 디바이스 설정
+        device_index: 디바이스 순번 (0부터)
+
+    Returns:
+        포트 설정이 추가된 Capabilities (원본은 변경하지 않음)
+    """
+    isolated = dict(capabilities)
+    platform = str(capabilities.get("platformName", "")).lower()
+
+    if platform == "ios":
+        isolated.setdefault("appium:wdaLocalPort", WDA_BASE_PORT + device_index)
+    elif platform == "android":
+        isolated.setdefault("appium:systemPort", SYSTEM_BASE_PORT + device_index)
+    isolated.setdefault("appium:mjpegServerPort", MJPEG_BASE_PORT + device_index)
+
+    return isolated
@@ -0,0 +1,258 @@
+"""
+Appium 드라이버 풀
+
+디바이스별로 하나의 Appium 세션을 테스트 세션 전체에서 재사용합니다.
+WDA/UiAutomator2 세션 생성(10~30초)을 테스트마다 반복하지 않고,
+테스트 사이에는 앱만 초기화(종료/재실행, 데이터 삭제)해서 깨끗한 상태로 돌려놓습니다.
+
+사용 예시:
+    pool = DriverPool("http://localhost:4723")
+    driver = pool.acquire("stg_iPad_9th_15.7_real")
+    ...
+    pool.release("stg_iPad_9th_15.7_real")
+    pool.quit_all()
+"""
+import time
+from typing import Callable, Dict, Optional
+
+from appium import webdriver
+from appium.options.common.base import AppiumOptions
+from selenium.common.exceptions import WebDriverException
+
+from utils.capabilities_loader import get_capabilities
+
+
+# 테스트 사이 앱 초기화 방식
+RESET_RESTART = "restart"   # 앱 종료 후 재실행 (로그인 등 앱 데이터 유지)
+RESET_CLEAR = "clear"       # 앱 데이터 삭제 후 재실행
+RESET_NONE = "none"         # 초기화하지 않음
+RESET_MODES = (RESET_RESTART, RESET_CLEAR, RESET_NONE)
+
+DEFAULT_APPIUM_URL = "http://localhost:4723"
+
+
+def get_app_id(capabilities: dict) -> Optional[str]:
+    """
+    Capabilities에서 앱 식별자(iOS bundleId / Android appPackage)를 꺼냅니다.
+
+    Args:
+        capabilities: devices.json의 디바이스 설정
+
+    Returns:
+        앱 식별자 (없으면 None)
+    """
+    for key in ("appium:bundleId", "bundleId", "appium:appPackage", "appPackage"):
+        if capabilities.get(key):
+            return capabilities[key]
+    return None
+
+
+def create_driver(device_name: str, appium_url: str = DEFAULT_APPIUM_URL, capabilities: Optional[dict] = None):
+    """
+    Appium 드라이버를 새로 생성합니다.
+
+    Appium 2.x 기본 경로로 먼저 접속하고, 실패하면 /wd/hub 경로로 재시도합니다.
+
+    Args:
+        device_name: devices.json에 정의된 디바이스 키
+        appium_url: Appium 서버 URL
+        capabilities: 사용할 Capabilities (None이면 devices.json에서 로드)
+
+    Returns:
+        Appium WebDriver
+    """
+    desired_caps = capabilities if capabilities is not None else get_capabilities(device_name)
+    options = AppiumOptions().load_capabilities(desired_caps)
+    appium_url = appium_url.rstrip('/')
+
+    try:
+        # 먼저 /wd/hub 없이 시도 (Appium 2.x 기본)
+        driver = webdriver.Remote(appium_url, options=options)
+        print(f"[SETUP] 드라이버 생성 완료 (URL: {appium_url}, 디바이스: {device_name}).")
+    except Exception:
+        # 실패 시 /wd/hub 경로로 재시도
+        print(f"[SETUP] 첫 번째 연결 실패, /wd/hub 경로로 재시도...")
+        driver = webdriver.Remote(f"{appium_url}/wd/hub", options=options)
+        print(f"[SETUP] 드라이버 생성 완료 (URL: {appium_url}/wd/hub, 디바이스: {device_name}).")
+
+    return driver
+
+
+class DriverPool:
+    """디바이스별 Appium 세션을 보관하고 재사용하는 풀"""
+
+    def __init__(
+        self,
+        appium_url: str = DEFAULT_APPIUM_URL,
+        reset_mode: str = RESET_RESTART,
+        driver_factory: Optional[Callable] = None,
+        capabilities_loader: Callable[[str], dict] = get_capabilities,
+        appium_urls: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            appium_url: Appium 서버 URL
+            reset_mode: 테스트 사이 앱 초기화 방식 (restart / clear / none)
+            driver_factory: 드라이버 생성 함수 (device_name, appium_url, capabilities) -> driver
+            capabilities_loader: 디바이스 이름으로 Capabilities를 가져오는 함수
+            appium_urls: 디바이스별 Appium 서버 URL (없는 디바이스는 appium_url 사용)
+        """
+        if reset_mode not in RESET_MODES:
+            raise ValueError(f"지원하지 않는 초기화 방식입니다: {reset_mode} (가능한 값: {', '.join(RESET_MODES)})")
+
+        self.appium_url = appium_url
+        self.appium_urls = appium_urls or {}
+        self.reset_mode = reset_mode
+        self.driver_factory = driver_factory or create_driver
+        self.capabilities_loader = capabilities_loader
+        self._drivers: Dict[str, object] = {}
+        self._capabilities: Dict[str, dict] = {}
+        # 앱 데이터 삭제(mobile: clearApp)를 지원하지 않는 디바이스 (iOS 실기기 등, 이후 재실행으로 대신)
+        self._clear_unsupported: set = set()
+        self.stats = {"created": 0, "reused": 0, "resets": 0, "recovered": 0}
+
+    def get_appium_url(self, device_name: str) -> str:
+        """디바이스가 사용할 Appium 서버 URL을 반환합니다."""
+        return self.appium_urls.get(device_name, self.appium_url)
+
+    def get_capabilities(self, device_name: str) -> dict:
+        """디바이스 Capabilities를 한 번만 로드해서 보관합니다."""
+        if device_name not in self._capabilities:
+            self._capabilities[device_name] = self.capabilities_loader(device_name)
+        return self._capabilities[device_name]
+
+    def acquire(self, device_name: str, fresh: bool = False):
+        """
+        디바이스의 드라이버를 가져옵니다. 살아있는 세션이 있으면 재사용합니다.
+
+        Args:
+            device_name: devices.json에 정의된 디바이스 키
+            fresh: True면 기존 세션을 종료하고 새 세션을 생성
+
+        Returns:
+            Appium WebDriver
+        """
+        driver = self._drivers.get(device_name)
+
+        if driver is not None and fresh:
+            print(f"[POOL] 새 세션이 요청되어 기존 세션을 종료합니다 (디바이스: {device_name}).")
+            self._quit(device_name)
+            driver = None
+
+        if driver is not None and not self.is_alive(device_name):
+            print(f"[POOL] 기존 세션이 응답하지 않아 새로 생성합니다 (디바이스: {device_name}).")
+            self._quit(device_name)
+            self.stats["recovered"] += 1
+            driver = None
+
+        if driver is None:
+            print(f"[POOL] 드라이버를 생성합니다 (디바이스: {device_name})...")
+            driver = self.driver_factory(
+                device_name, self.get_appium_url(device_name), self.get_capabilities(device_name)
+            )
+            self._drivers[device_name] = driver
+            self.stats["created"] += 1
+        else:
+            print(f"[POOL] 기존 세션을 재사용합니다 (디바이스: {device_name}, 세션: {driver.session_id}).")
+            self.stats["reused"] += 1
+
+        return driver
+
+    def release(self, device_name: str, reset_mode: Optional[str] = None):
+        """
+        테스트가 끝난 드라이버를 풀에 돌려놓고 앱을 초기화합니다.
+        초기화에 실패하면 세션을 버려서 다음 테스트가 새 세션을 받도록 합니다.
+
+        Args:
+            device_name: devices.json에 정의된 디바이스 키
+            reset_mode: 이번만 사용할 초기화 방식 (None이면 풀 기본값)
+        """
+        if device_name not in self._drivers:
+            return
+
+        try:
+            self.reset_app(device_name, reset_mode or self.reset_mode)
+        except Exception as e:
+            print(f"[POOL] 앱 초기화 실패, 세션을 폐기합니다 (디바이스: {device_name}): {e}")
+            self._quit(device_name)
+
+    def reset_app(self, device_name: str, reset_mode: str) -> str:
+        """
+        앱을 깨끗한 상태로 되돌립니다.
+        앱 데이터 삭제를 지원하지 않는 디바이스(iOS 실기기 등)는 clear 대신 재실행합니다. (경고는 디바이스마다 한 번)
+
+        Args:
+            device_name: devices.json에 정의된 디바이스 키
+            reset_mode: restart(종료 후 재실행) / clear(데이터 삭제 후 재실행) / none
+
+        Returns:
+            실제로 적용한 초기화 방식 (clear를 지원하지 않으면 restart, 초기화하지 않았으면 none)
+        """
+        if reset_mode == RESET_NONE:
+            return RESET_NONE
+
+        driver = self._drivers[device_name]
+        app_id = get_app_id(self.get_capabilities(device_name))
+        if not app_id:
+            print(f"[POOL] bundleId/appPackage가 없어 앱 초기화를 건너뜁니다 (디바이스: {device_name}).")
+            return RESET_NONE
+
+        start_time = time.time()
+        driver.terminate_app(app_id)
+        if reset_mode == RESET_CLEAR:
+            reset_mode = self._clear_app(device_name, driver, app_id)
+        driver.activate_app(app_id)
+
+        self.stats["resets"] += 1
+        print(f"[POOL] 앱 초기화 완료 ({reset_mode}, {time.time() - start_time:.2f}초, 디바이스: {device_name}).")
+        return reset_mode
+
+    def _clear_app(self, device_name: str, driver, app_id: str) -> str:
+        """앱 데이터 삭제 (UiAutomator2: pm clear, XCUITest: 시뮬레이터에서만 지원), 실패하면 restart로 대신"""
+        if device_name in self._clear_unsupported:
+            return RESET_RESTART
+        try:
+            driver.execute_script("mobile: clearApp", {"appId": app_id, "bundleId": app_id})
+            return RESET_CLEAR
+        except WebDriverException as e:
+            self._clear_unsupported.add(device_name)
+            print(f"⚠️  [POOL] 앱 데이터를 지울 수 없어 이 디바이스는 앱 재실행으로 초기화합니다 "
+                  f"(디바이스: {device_name}): {e.msg}")
+            return RESET_RESTART
+
+    def is_alive(self, device_name: str) -> bool:
+        """세션이 아직 응답하는지 확인합니다."""
+        driver = self._drivers.get(device_name)
+        if driver is None or not driver.session_id:
+            return False
+        try:
+            app_id = get_app_id(self.get_capabilities(device_name))
+            if app_id:
+                driver.query_app_state(app_id)
+            else:
+                driver.get_window_size()
+            return True
+        except Exception:
+            return False
+
+    def discard(self, device_name: str):
+        """디바이스의 세션을 즉시 종료하고 풀에서 제거합니다."""
+        self._quit(device_name)
+
+    def quit_all(self):
+        """풀에 있는 모든 세션을 종료합니다."""
+        for device_name in list(self._drivers):
+            self._quit(device_name)
+        print(f"[POOL] 모든 드라이버를 종료했습니다. "
+              f"(생성: {self.stats['created']}, 재사용: {self.stats['reused']}, "
+              f"앱 초기화: {self.stats['resets']}, 복구: {self.stats['recovered']})")
+
+    def _quit(self, device_name: str):
+        driver = self._drivers.pop(device_name, None)
+        if driver is None:
+            return
+        try:
+            driver.quit()
+            print(f"[POOL] 드라이버를 종료했습니다 (디바이스: {device_name}).")
+        except Exception as e:
+            print(f"[POOL] 드라이버 종료 중 오류 (무시): {e}")
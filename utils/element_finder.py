@@ -8,8 +8,25 @@ except ImportError:
     import xml.etree.ElementTree as ET
     USING_LXML = False
 
+import io
 import json
-from typing import List, Dict
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple
+
+
+from utils.locator_evaluator import (
+    BY_ACCESSIBILITY_ID, BY_XPATH, BY_ID, BY_IOS_CLASS_CHAIN, BY_IOS_PREDICATE,
+    EvaluationCost, LocatorEvaluator, LocatorSyntaxError, TreeInfo,
+    evaluate_class_chain, evaluate_predicate, evaluate_xpath,
+)
+
+# 인덱스를 만드는 속성 (정확히 일치 검색용)
+INDEXED_ATTRIBUTES = ('type', 'name', 'label', 'value', 'content-desc', 'resource-id')
+# 텍스트 검색 대상 속성
+TEXT_ATTRIBUTES = ('name', 'label', 'value')
+# 부분 문자열 검색용 n-gram 크기
+NGRAM_SIZE = 3
 
 
 class ElementFinder:
@@ -25,9 +42,77 @@ class ElementFinder:
         else:
             self.root = ET.fromstring(page_source)
 
-        # xml.etree.ElementTree용 부모 맵 생성
-        if not USING_LXML:
-            self.parent_map = {c: p for p in self.root.iter() for c in p}
+        # 절대 XPath / Class Chain 경로 캐시 (처음 필요할 때 한 번에 계산)
+        self._paths = None
+        # locator 평가용 트리 정보 (부모, 문서 순서) 캐시
+        self._tree_info = None
+
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """
+        생성 시 한 번만 전체 트리를 순회해서 검색용 인덱스를 만듭니다.
+        이후 검색은 트리를 다시 순회하지 않고 인덱스만 조회합니다.
+
+        - 속성 인덱스: type / name / label / value / content-desc / resource-id 값 → 요소 위치 리스트
+        - 텍스트 인덱스: name/label/value 의 서로 다른 문자열 목록 + 소문자 3-gram → 문자열 번호
+        """
+        # 문서 순서대로의 요소 목록 (인덱스에는 이 목록의 위치를 저장)
+        self._elements = list(self.root.iter())
+        self._attr_index: Dict[str, Dict[str, List[int]]] = {attr: {} for attr in INDEXED_ATTRIBUTES}
+        self._type_counts: Dict[str, int] = {}
+
+        self._texts: List[str] = []             # 서로 다른 name/label/value 문자열
+        self._texts_lower: List[str] = []
+        self._text_positions: List[List[int]] = []  # 문자열 번호 → 그 문자열을 가진 요소 위치
+        text_ids: Dict[str, int] = {}
+
+        for position, elem in enumerate(self._elements):
+            for attr, index in self._attr_index.items():
+                attr_value = elem.get(attr)
+                if attr_value is not None:
+                    index.setdefault(attr_value, []).append(position)
+
+            elem_type = elem.get('type', 'Unknown')
+            self._type_counts[elem_type] = self._type_counts.get(elem_type, 0) + 1
+
+            for attr in TEXT_ATTRIBUTES:
+                elem_text = elem.get(attr, '')
+                if not elem_text:
+                    continue
+                text_id = text_ids.get(elem_text)
+                if text_id is None:
+                    text_id = text_ids[elem_text] = len(self._texts)
+                    self._texts.append(elem_text)
+                    self._texts_lower.append(elem_text.lower())
+                    self._text_positions.append([])
+                positions = self._text_positions[text_id]
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+
+        # 소문자 3-gram → 문자열 번호 집합 (부분 문자열 검색 후보 축소용)
+        self._trigram_index: Dict[str, set] = {}
+        for text_id, text_lower in enumerate(self._texts_lower):
+            for i in range(len(text_lower) - NGRAM_SIZE + 1):
+                self._trigram_index.setdefault(text_lower[i:i + NGRAM_SIZE], set()).add(text_id)
+
+    def _positions_by_attr(self, attr: str, attr_value: str) -> List[int]:
+        """속성 값이 정확히 일치하는 요소 위치 리스트 (문서 순서)"""
+        return self._attr_index[attr].get(attr_value, [])
+
+    def _elements_at(self, positions) -> List:
+        return [self._elements[position] for position in positions]
+
+    def _candidate_text_ids(self, search_lower: str):
+        """검색어(소문자)를 포함할 수 있는 문자열 번호 후보"""
+        if len(search_lower) < NGRAM_SIZE:
+            return range(len(self._texts))
+
+        grams = {search_lower[i:i + NGRAM_SIZE] for i in range(len(search_lower) - NGRAM_SIZE + 1)}
+        candidate_sets = sorted((self._trigram_index.get(gram, set()) for gram in grams), key=len)
+        if not candidate_sets[0]:
+            return []
+        return set.intersection(*candidate_sets)
 
     def find_by_text(self, text: str, case_sensitive: bool = False) -> List[Dict]:
         """
@@ -40,21 +125,23 @@ class ElementFinder:
         Returns:
             찾은 요소들의 정보 리스트
         """
-        results = []
-        search_text = text if case_sensitive else text.lower()
+        # 빈 검색어는 모든 요소와 일치
+        if not text:
+            return [self._element_to_dict(elem) for elem in self._elements]
 
-        for elem in self.root.iter():
-            # name, label, value 속성에서 검색
-            for attr in ['name', 'label', 'value']:
-                elem_text = elem.get(attr, '')
-                if not case_sensitive:
-                    elem_text = elem_text.lower()
+        search_lower = text.lower()
+        positions = set()
 
-                if search_text in elem_text:
-                    results.append(self._element_to_dict(elem))
-                    break
+        # name, label, value 속성에서 검색 (3-gram 인덱스로 후보 문자열만 확인)
+        for text_id in self._candidate_text_ids(search_lower):
+            if case_sensitive:
+                matched = text in self._texts[text_id]
+            else:
+                matched = search_lower in self._texts_lower[text_id]
+            if matched:
+                positions.update(self._text_positions[text_id])
 
-        return results
+        return [self._element_to_dict(elem) for elem in self._elements_at(sorted(positions))]
 
     def find_by_type(self, element_type: str) -> List[Dict]:
         """
@@ -66,11 +153,8 @@ class ElementFinder:
         Returns:
             찾은 요소들의 정보 리스트
         """
-        results = []
-        for elem in self.root.iter():
-            if elem.get('type') == element_type:
-                results.append(self._element_to_dict(elem))
-        return results
+        return [self._element_to_dict(elem)
+                for elem in self._elements_at(self._positions_by_attr('type', element_type))]
 
     def find_buttons(self) -> List[Dict]:
         """모든 버튼 찾기"""
@@ -98,11 +182,8 @@ class ElementFinder:
         Returns:
             찾은 요소들의 정보 리스트
         """
-        results = []
-        for elem in self.root.iter():
-            if elem.get('name') == accessibility_id:
-                results.append(self._element_to_dict(elem))
-        return results
+        return [self._element_to_dict(elem)
+                for elem in self._elements_at(self._positions_by_attr('name', accessibility_id))]
 
     def get_page_summary(self) -> Dict:
         """
@@ -111,11 +192,79 @@ class ElementFinder:
         Returns:
             요소 타입별 개수
         """
-        summary = {}
-        for elem in self.root.iter():
-            elem_type = elem.get('type', 'Unknown')
-            summary[elem_type] = summary.get(elem_type, 0) + 1
-        return summary
+        return dict(self._type_counts)
+
+    def find_by_locator(self, locator: Tuple[str, str]) -> Optional[List[Dict]]:
+        """
+        Page Object의 (By, value) locator로 페이지 소스에서 요소를 직접 찾습니다.
+        Appium 왕복 없이 로컬에서 계산하며, 좌표(rect, center)도 함께 반환합니다.
+
+        Args:
+            locator: (AppiumBy.XXX, value) 튜플
+
+        Returns:
+            찾은 요소들의 정보 리스트 (지원하지 않는 locator 전략이면 None)
+        """
+        elements = self._query_locator(locator)
+        if elements is None:
+            return None
+        return [self._element_to_snapshot_dict(elem) for elem in elements]
+
+    def _query_locator(self, locator: Tuple[str, str]) -> Optional[List]:
+        """locator에 해당하는 XML 요소 리스트 (지원하지 않거나 문법 오류면 None)"""
+        return self.query_locator(locator)
+
+    def query_locator(self, locator: Tuple[str, str], cost: Optional[EvaluationCost] = None,
+                      strict: bool = False) -> Optional[List]:
+        """
+        locator에 해당하는 XML 요소 리스트 (문서 순서)
+        accessibility id / id는 속성 인덱스로, XPath / iOS Class Chain / iOS Predicate는
+        utils/locator_evaluator.py 엔진으로 평가합니다. (lxml 유무와 관계없이 같은 결과)
+
+        Args:
+            locator: (By, value) 튜플
+            cost: 방문한 요소 수를 기록할 객체
+            strict: True면 문법 오류 시 LocatorSyntaxError 발생 (False면 None 반환)
+
+        Returns:
+            XML 요소 리스트 (지원하지 않는 전략이면 None)
+        """
+        by, value = locator
+        cost = cost or EvaluationCost()
+
+        if by in (BY_ACCESSIBILITY_ID, BY_ID):
+            # accessibility id - iOS: name 속성, Android: content-desc 속성
+            # id - Android: resource-id 속성, iOS: name 속성
+            attrs = ('name', 'content-desc') if by == BY_ACCESSIBILITY_ID else ('resource-id', 'name')
+            positions = set(self._positions_by_attr(attrs[0], value)) | set(self._positions_by_attr(attrs[1], value))
+            cost.visited += len(positions)
+            return self._elements_at(sorted(positions))
+
+        evaluators = {
+            BY_XPATH: evaluate_xpath,
+            BY_IOS_CLASS_CHAIN: evaluate_class_chain,
+            BY_IOS_PREDICATE: evaluate_predicate,
+        }
+        if by not in evaluators:
+            return None
+
+        if self._tree_info is None:
+            self._tree_info = TreeInfo(self.root)
+        try:
+            return evaluators[by](self._tree_info, value, cost)
+        except LocatorSyntaxError:
+            if strict:
+                raise
+            return None
+
+    def _element_to_snapshot_dict(self, elem) -> Dict:
+        """요소 정보 + 정수 좌표(rect, center)를 담은 딕셔너리"""
+        element_dict = self._element_to_dict(elem)
+        rect = _element_rect(elem)
+        element_dict['rect'] = rect
+        element_dict['center'] = (rect[0] + rect[2] // 2, rect[1] + rect[3] // 2) if rect else None
+        element_dict['is_visible'] = _is_visible(elem, rect)
+        return element_dict
 
     def _element_to_dict(self, elem, include_locators: bool = False) -> Dict:
         """
@@ -128,18 +277,7 @@ class ElementFinder:
         Returns:
             요소 정보 딕셔너리
         """
-        element_dict = {
-            'type': elem.get('type', ''),
-            'name': elem.get('name', ''),
-            'label': elem.get('label', ''),
-            'value': elem.get('value', ''),
-            'enabled': elem.get('enabled', ''),
-            'visible': elem.get('visible', ''),
-            'x': elem.get('x', ''),
-            'y': elem.get('y', ''),
-            'width': elem.get('width', ''),
-            'height': elem.get('height', ''),
-        }
+        element_dict = _element_info(elem)
 
         # JSON 저장 시 locator 정보 추가
         if include_locators:
@@ -158,88 +296,34 @@ class ElementFinder:
         Returns:
             locator 딕셔너리 (추천 locator + 모든 가능한 옵션)
         """
-        locators = {
-            'recommended': None,
-            'accessibility_id': None,
-            'xpath_by_name': None,
-            'xpath_by_label': None,
-            'xpath_by_type': None,
-            'xpath_by_value': None,
-            'xpath_absolute': None,
-            'ios_class_chain': None,
-            'ios_predicate': None
-        }
-
-        name = element_dict.get('name', '').strip()
-        label = element_dict.get('label', '').strip()
-        value = element_dict.get('value', '').strip()
-        elem_type = element_dict.get('type', '')
+        return build_locators(element_dict, self._get_absolute_xpath(elem), self._get_class_chain_path(elem))
 
-        # 1. Accessibility ID (name 속성)
-        if name:
-            locators['accessibility_id'] = f'(AppiumBy.ACCESSIBILITY_ID, "{name}")'
-            locators['recommended'] = locators['accessibility_id']  # 가장 안정적
+    def get_locators(self, elem) -> Dict:
+        """XML 요소(query_locator 결과)에 사용 가능한 모든 locator 생성"""
+        return self._generate_all_locators(elem, _element_info(elem))
 
-        # 2. XPath - name 속성
-        if name:
-            locators['xpath_by_name'] = f'(AppiumBy.XPATH, "//*[@name=\\"{name}\\"]")'
-            if not locators['recommended']:
-                locators['recommended'] = locators['xpath_by_name']
-
-        # 3. XPath - label 속성
-        if label:
-            locators['xpath_by_label'] = f'(AppiumBy.XPATH, "//*[@label=\\"{label}\\"]")'
-            if not locators['recommended']:
-                locators['recommended'] = locators['xpath_by_label']
-
-        # 4. XPath - value 속성
-        if value:
-            escaped_value = value.replace('"', '\\"').replace('\n', '\\n')
-            locators['xpath_by_value'] = f'(AppiumBy.XPATH, "//*[@value=\\"{escaped_value}\\"]")'
-
-        # 5. XPath - type만 사용
-        if elem_type:
-            locators['xpath_by_type'] = f'(AppiumBy.XPATH, "//{elem_type}")'
-
-        # 6. XPath - type + name 조합 (더 구체적)
-        if elem_type and name:
-            locators['xpath_type_and_name'] = f'(AppiumBy.XPATH, "//{elem_type}[@name=\\"{name}\\"]")'
-
-        # 7. XPath - type + label 조합
-        if elem_type and label:
-            locators['xpath_type_and_label'] = f'(AppiumBy.XPATH, "//{elem_type}[@label=\\"{label}\\"]")'
-
-        # 8. Absolute XPath (계층 구조)
-        absolute_xpath = self._get_absolute_xpath(elem)
-        if absolute_xpath:
-            locators['xpath_absolute'] = f'(AppiumBy.XPATH, "{absolute_xpath}")'
-
-        # 9. iOS Class Chain (iOS 전용, 빠름)
-        if elem_type:
-            short_type = elem_type.replace('XCUIElementType', '')
-            if name:
-                locators['ios_class_chain'] = f'(AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementType{short_type}[`name == \\"{name}\\"`]")'
-            else:
-                locators['ios_class_chain'] = f'(AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementType{short_type}")'
-
-        # 10. iOS Predicate String (iOS 전용, 강력)
-        predicates = []
-        if name:
-            predicates.append(f'name == "{name}"')
-        if label:
-            predicates.append(f'label == "{label}"')
-        if value:
-            escaped_value = value.replace('"', '\\"')
-            predicates.append(f'value == "{escaped_value}"')
-
-        if predicates:
-            predicate_str = ' AND '.join(predicates)
-            locators['ios_predicate'] = f'(AppiumBy.IOS_PREDICATE, "{predicate_str}")'
+    def rank_recommended(self, elem, locators: Dict, evaluator: Optional[LocatorEvaluator] = None) -> Dict:
+        """
+        locator 후보를 이 화면에서 평가해 elem 하나만 찾으면서 방문한 요소 수가 가장 적은 후보를 recommended로 설정합니다.
+        소요 시간 대신 방문한 요소 수로 비교하므로 같은 화면은 항상 같은 결과가 나옵니다. (같으면 후보 순서 유지)
+        그런 후보가 없으면 build_locators의 고정 우선순위 결과를 그대로 둡니다.
 
-        # recommended가 아직 없으면 type 기반으로 설정
-        if not locators['recommended'] and elem_type:
-            locators['recommended'] = locators['xpath_by_type']
+        Args:
+            elem: 후보를 만든 XML 요소
+            locators: get_locators / build_locators 결과 (직접 수정)
+            evaluator: 재사용할 LocatorEvaluator (None이면 새로 생성)
 
+        Returns:
+            수정한 locators
+        """
+        evaluator = evaluator or LocatorEvaluator(self, repeat=1)
+        for result in evaluator.rank(locators, by="visited"):
+            if result["count"] != 1:
+                break
+            # 유일하게 일치해도 다른 요소일 수 있음 (예: AppiumAUT 래퍼의 절대 XPath "/*")
+            if self.query_locator(result["locator"]) == [elem]:
+                locators['recommended'] = locators[result["name"]]
+                break
         return locators
 
     def _get_absolute_xpath(self, elem) -> str:
@@ -252,38 +336,83 @@ class ElementFinder:
         Returns:
             절대 XPath 문자열
         """
-        path = []
-        current = elem
+        return self._get_paths()[0].get(elem)
 
-        # 루트까지 역순으로 탐색
-        while current is not None:
-            # 부모 요소 가져오기 (lxml 또는 ElementTree)
-            if USING_LXML:
-                parent = current.getparent()
-            else:
-                parent = self.parent_map.get(current)
+    def _get_class_chain_path(self, elem) -> Optional[str]:
+        """
+        요소의 위치 기반 iOS Class Chain 경로 (Application 기준, 예: XCUIElementTypeWindow[1]/XCUIElementTypeButton[2])
 
-            # 형제 요소들 가져오기
-            if parent is not None:
-                siblings = list(parent)
-            else:
-                siblings = [current]
+        Args:
+            elem: XML 요소
 
-            # 같은 타입의 형제 중에서 몇 번째인지 계산
-            same_type_siblings = [s for s in siblings if s.get('type') == current.get('type')]
+        Returns:
+            Class Chain 문자열 (Application 하위 요소가 아니면 None)
+        """
+        return self._get_paths()[1].get(elem)
 
-            if len(same_type_siblings) > 1:
-                index = same_type_siblings.index(current) + 1
-                path.insert(0, f"{current.get('type', '*')}[{index}]")
-            else:
-                path.insert(0, current.get('type', '*'))
+    def _get_paths(self) -> Tuple[Dict, Dict]:
+        """
+        모든 요소의 절대 XPath와 Class Chain 경로를 트리 한 번 순회(DFS)로 계산해서 캐시합니다.
+        부모 경로 + 자기 구간만 이어 붙이므로 요소 수에 비례(O(n))합니다.
 
-            # 다음 부모로 이동
-            current = parent
-            if current is None or current == self.root:
-                break
+        XPath 구간: 같은 type의 형제가 2개 이상일 때만 [순번]을 붙임 (루트 요소는 경로에서 생략)
+        Class Chain 구간: 항상 [순번]을 붙임 (WDA는 Application 기준으로 평가)
 
-        return '/' + '/'.join(path) if path else None
+        Returns:
+            (요소 → 절대 XPath, 요소 → Class Chain 경로) 딕셔너리 튜플
+        """
+        if getattr(self, '_paths', None) is not None:
+            return self._paths
+
+        xpaths = {self.root: '/' + self.root.get('type', '*')}
+        class_chains = {}
+
+        # (부모 요소, 부모의 XPath 접두사, 부모의 Class Chain 접두사) 스택
+        # 루트의 자식은 루트 구간을 생략하므로 접두사가 빈 문자열
+        stack = [(self.root, '', self._class_chain_prefix(self.root, None))]
+        while stack:
+            parent, xpath_prefix, chain_prefix = stack.pop()
+            children = list(parent)
+
+            # 같은 type 형제 수 (XPath용) 와 현재까지의 순번
+            type_totals = {}
+            for child in children:
+                child_type = child.get('type')
+                type_totals[child_type] = type_totals.get(child_type, 0) + 1
+            type_seen = {}
+
+            for position, child in enumerate(children, 1):
+                child_type = child.get('type')
+                type_seen[child_type] = type_seen.get(child_type, 0) + 1
+                segment_type = child.get('type', '*')
+
+                if type_totals[child_type] > 1:
+                    xpath = f"{xpath_prefix}/{segment_type}[{type_seen[child_type]}]"
+                else:
+                    xpath = f"{xpath_prefix}/{segment_type}"
+                xpaths[child] = xpath
+
+                chain = None
+                if chain_prefix is not None:
+                    # type이 없으면 '*' 로, 순번은 전체 자식 중 위치
+                    chain_index = type_seen[child_type] if child_type else position
+                    chain = f"{chain_prefix}{segment_type}[{chain_index}]"
+                    class_chains[child] = chain
+
+                if len(child):
+                    stack.append((child, xpath, self._class_chain_prefix(child, chain)))
+
+        self._paths = (xpaths, class_chains)
+        return self._paths
+
+    @staticmethod
+    def _class_chain_prefix(elem, chain: Optional[str]) -> Optional[str]:
+        """자식 요소의 Class Chain 경로 앞에 붙을 접두사 (Application 바로 아래부터 경로 시작)"""
+        if elem.get('type') == 'XCUIElementTypeApplication':
+            return ''
+        if chain is None:
+            return None
+        return chain + '/'
 
     def generate_locator_code(self, element: Dict) -> str:
         """
@@ -309,26 +438,398 @@ class ElementFinder:
         else:
             return '# 적절한 locator를 찾을 수 없습니다'
 
-    def export_to_json(self, output_file: str, include_locators: bool = True):
+    def export_to_json(self, output_file: str, include_locators: bool = True, rank_locators: bool = False):
         """
         모든 요소를 JSON 파일로 저장
 
         Args:
             output_file: 저장할 파일 경로
             include_locators: locator 정보 포함 여부 (기본값: True)
+            rank_locators: 후보 locator를 이 화면에서 평가해 recommended 선택 (rank_recommended)
+                요소마다 모든 후보를 평가하므로 요소 수의 제곱에 비례해 느려짐 (기본값: False, 고정 우선순위)
         """
+        evaluator = LocatorEvaluator(self, repeat=1) if include_locators and rank_locators else None
+
         all_elements = []
         for elem in self.root.iter():
-            all_elements.append(self._element_to_dict(elem, include_locators=include_locators))
+            element_dict = self._element_to_dict(elem, include_locators=include_locators)
+            if evaluator is not None:
+                self.rank_recommended(elem, element_dict['locators'], evaluator)
+            all_elements.append(element_dict)
 
+        # json.dump는 조각마다 write를 호출하므로 문자열로 한 번에 만들어서 저장
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_elements, f, ensure_ascii=False, indent=2)
+            f.write(json.dumps(all_elements, ensure_ascii=False, indent=2))
 
         print(f"[INFO] 총 {len(all_elements)}개의 요소를 {output_file}에 저장했습니다.")
         if include_locators:
             print(f"[INFO] 각 요소의 locators.recommended 필드를 확인하세요.")
 
 
+def _element_info(elem) -> Dict:
+    """XML 요소의 기본 속성 딕셔너리 (JSON 저장/검색 결과 공통 형식)"""
+    return {
+        'type': elem.get('type', ''),
+        'name': elem.get('name', ''),
+        'label': elem.get('label', ''),
+        'value': elem.get('value', ''),
+        'enabled': elem.get('enabled', ''),
+        'visible': elem.get('visible', ''),
+        'x': elem.get('x', ''),
+        'y': elem.get('y', ''),
+        'width': elem.get('width', ''),
+        'height': elem.get('height', ''),
+    }
+
+
+def build_locators(element_dict: Dict, absolute_xpath: Optional[str], class_chain_path: Optional[str]) -> Dict:
+    """
+    요소에 사용 가능한 모든 locator 생성 (ElementFinder / StreamingElementFinder 공용)
+    recommended는 고정 우선순위(accessibility id > name > label > type)로 정합니다.
+    트리 전체가 있는 ElementFinder.export_to_json(rank_locators=True)은 rank_recommended로 평가 순위를 적용합니다.
+
+    Args:
+        element_dict: 요소 정보 딕셔너리
+        absolute_xpath: 요소의 절대 XPath (없으면 None)
+        class_chain_path: 요소의 위치 기반 Class Chain 경로 (없으면 None)
+
+    Returns:
+        locator 딕셔너리 (추천 locator + 모든 가능한 옵션)
+    """
+    locators = {
+        'recommended': None,
+        'accessibility_id': None,
+        'xpath_by_name': None,
+        'xpath_by_label': None,
+        'xpath_by_type': None,
+        'xpath_by_value': None,
+        'xpath_absolute': None,
+        'ios_class_chain': None,
+        'ios_class_chain_absolute': None,
+        'ios_predicate': None
+    }
+
+    name = element_dict.get('name', '').strip()
+    label = element_dict.get('label', '').strip()
+    value = element_dict.get('value', '').strip()
+    elem_type = element_dict.get('type', '')
+
+    # 1. Accessibility ID (name 속성)
+    if name:
+        locators['accessibility_id'] = f'(AppiumBy.ACCESSIBILITY_ID, "{name}")'
+        locators['recommended'] = locators['accessibility_id']  # 가장 안정적
+
+    # 2. XPath - name 속성
+    if name:
+        locators['xpath_by_name'] = f'(AppiumBy.XPATH, "//*[@name=\\"{name}\\"]")'
+        if not locators['recommended']:
+            locators['recommended'] = locators['xpath_by_name']
+
+    # 3. XPath - label 속성
+    if label:
+        locators['xpath_by_label'] = f'(AppiumBy.XPATH, "//*[@label=\\"{label}\\"]")'
+        if not locators['recommended']:
+            locators['recommended'] = locators['xpath_by_label']
+
+    # 4. XPath - value 속성
+    if value:
+        escaped_value = value.replace('"', '\\"').replace('\n', '\\n')
+        locators['xpath_by_value'] = f'(AppiumBy.XPATH, "//*[@value=\\"{escaped_value}\\"]")'
+
+    # 5. XPath - type만 사용
+    if elem_type:
+        locators['xpath_by_type'] = f'(AppiumBy.XPATH, "//{elem_type}")'
+
+    # 6. XPath - type + name 조합 (더 구체적)
+    if elem_type and name:
+        locators['xpath_type_and_name'] = f'(AppiumBy.XPATH, "//{elem_type}[@name=\\"{name}\\"]")'
+
+    # 7. XPath - type + label 조합
+    if elem_type and label:
+        locators['xpath_type_and_label'] = f'(AppiumBy.XPATH, "//{elem_type}[@label=\\"{label}\\"]")'
+
+    # 8. Absolute XPath (계층 구조)
+    if absolute_xpath:
+        locators['xpath_absolute'] = f'(AppiumBy.XPATH, "{absolute_xpath}")'
+
+    # 9. iOS Class Chain (iOS 전용, 빠름)
+    if elem_type:
+        short_type = elem_type.replace('XCUIElementType', '')
+        if name:
+            locators['ios_class_chain'] = f'(AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementType{short_type}[`name == \\"{name}\\"`]")'
+        else:
+            locators['ios_class_chain'] = f'(AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementType{short_type}")'
+
+    # 9-1. 위치 기반 iOS Class Chain (Application 기준 절대 경로)
+    if class_chain_path:
+        locators['ios_class_chain_absolute'] = f'(AppiumBy.IOS_CLASS_CHAIN, "{class_chain_path}")'
+
+    # 10. iOS Predicate String (iOS 전용, 강력)
+    predicates = []
+    if name:
+        predicates.append(f'name == "{name}"')
+    if label:
+        predicates.append(f'label == "{label}"')
+    if value:
+        escaped_value = value.replace('"', '\\"')
+        predicates.append(f'value == "{escaped_value}"')
+
+    if predicates:
+        predicate_str = ' AND '.join(predicates)
+        locators['ios_predicate'] = f'(AppiumBy.IOS_PREDICATE, "{predicate_str}")'
+
+    # recommended가 아직 없으면 type 기반으로 설정
+    if not locators['recommended'] and elem_type:
+        locators['recommended'] = locators['xpath_by_type']
+
+    return locators
+
+
+def _element_rect(elem) -> Optional[Tuple[int, int, int, int]]:
+    """
+    요소의 (x, y, width, height) 정수 좌표
+    iOS는 x/y/width/height 속성, Android는 bounds="[x1,y1][x2,y2]" 속성을 사용합니다.
+    """
+    try:
+        if elem.get('x') not in (None, '') and elem.get('width') not in (None, ''):
+            return (int(float(elem.get('x'))), int(float(elem.get('y', 0) or 0)),
+                    int(float(elem.get('width'))), int(float(elem.get('height', 0) or 0)))
+        bounds = elem.get('bounds')
+        if bounds:
+            x1, y1, x2, y2 = map(int, re.findall(r'-?\d+', bounds))
+            return (x1, y1, x2 - x1, y2 - y1)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _is_visible(elem, rect) -> bool:
+    """요소가 화면에 보이는지 (visible/displayed 속성이 없으면 크기로 판단)"""
+    flag = elem.get('visible', elem.get('displayed'))
+    if flag is not None:
+        return flag.lower() == 'true'
+    return bool(rect and rect[2] > 0 and rect[3] > 0)
+
+
+class PageSnapshot:
+    """
+    page_source 한 번으로 여러 locator를 로컬에서 찾는 스냅샷
+
+    사용 예시:
+        snapshot = PageSnapshot(driver.page_source)
+        button = snapshot.find(HomePage.MY_PAGE_BUTTON)
+        if button is not PageSnapshot.UNSUPPORTED and button:
+            driver.tap([button['center']])
+    """
+
+    # 스냅샷에서 평가할 수 없는 locator (실시간 조회가 필요)
+    UNSUPPORTED = object()
+
+    def __init__(self, page_source: str):
+        self.finder = ElementFinder(page_source)
+        self._cache: Dict[Tuple[str, str], Optional[List[Dict]]] = {}
+
+    def find_all(self, locator: Tuple[str, str]):
+        """locator에 해당하는 모든 요소 (평가할 수 없으면 UNSUPPORTED)"""
+        locator = tuple(locator)
+        if locator not in self._cache:
+            self._cache[locator] = self.finder.find_by_locator(locator)
+        result = self._cache[locator]
+        return self.UNSUPPORTED if result is None else result
+
+    def find(self, locator: Tuple[str, str]):
+        """
+        locator에 해당하는 첫 번째 보이는 요소
+
+        Returns:
+            요소 정보 딕셔너리, 보이는 요소가 없으면 None, 평가할 수 없으면 UNSUPPORTED
+        """
+        result = self.find_all(locator)
+        if result is self.UNSUPPORTED:
+            return result
+        return next((element for element in result if element['is_visible']), None)
+
+
+class StreamingElementFinder:
+    """
+    페이지 소스를 스트리밍(iterparse)으로 읽으면서 검색/JSON 저장을 하는 헬퍼 클래스
+
+    전체 트리를 메모리에 만들지 않고 현재 요소의 조상 스택만 유지하며,
+    처리가 끝난 요소는 부모에서 바로 제거하므로 트리 크기와 관계없이 메모리 사용량이 일정합니다.
+    긴 스크롤 목록처럼 수 MB 크기의 페이지 소스를 다룰 때 사용합니다. (lxml 유무와 관계없이 동일하게 동작)
+
+    ElementFinder와 다른 점:
+        - 검색할 때마다 소스를 처음부터 다시 읽습니다. (인덱스 없음, 파일 경로를 주면 파일에서 바로 읽음)
+        - 뒤에 나올 형제 수를 미리 알 수 없으므로 xpath_absolute는 모든 구간에 [순번]을 붙입니다.
+          (예: /XCUIElementTypeWindow[1]/XCUIElementTypeButton[1]) - 같은 요소를 가리키는 동등한 경로입니다.
+
+    사용 예시:
+        finder = StreamingElementFinder("page_source.xml")
+        buttons = finder.find_buttons()
+        finder.export_to_json("page_elements.json")
+    """
+
+    def __init__(self, source):
+        """
+        Args:
+            source: 페이지 소스 XML 문자열/bytes, XML 파일 경로, 또는 읽기 가능한 파일 객체
+                    (파일 객체는 한 번만 읽을 수 있으므로 검색도 한 번만 가능)
+        """
+        self.source = source
+
+    @contextmanager
+    def _open(self):
+        """source를 바이트 스트림으로 엽니다."""
+        source = self.source
+        if hasattr(source, 'read'):
+            yield source
+        elif isinstance(source, bytes):
+            yield io.BytesIO(source)
+        elif source.lstrip().startswith('<'):
+            yield io.BytesIO(source.encode('utf-8'))
+        else:
+            with open(source, 'rb') as f:
+                yield f
+
+    def iter_elements(self) -> Iterator[Tuple[object, str, Optional[str]]]:
+        """
+        문서 순서대로 요소를 하나씩 돌려줍니다.
+        요소의 속성만 사용할 수 있습니다. (자식 요소는 아직 읽지 않았거나 이미 제거된 상태)
+
+        Yields:
+            (XML 요소, 절대 XPath, 위치 기반 Class Chain 경로 또는 None)
+        """
+        parse_options = {'huge_tree': True} if USING_LXML else {}
+
+        # 조상 스택: [요소, 자식 XPath 접두사, 자식 Class Chain 접두사, type별 자식 수, 자식 수]
+        stack = []
+        with self._open() as stream:
+            for event, elem in ET.iterparse(stream, events=('start', 'end'), **parse_options):
+                if event == 'end':
+                    stack.pop()
+                    if stack:
+                        # 처리가 끝난 요소는 부모에서 제거 (부모에는 항상 자식이 최대 1개만 남음)
+                        stack[-1][0].remove(elem)
+                    else:
+                        elem.clear()
+                    continue
+
+                elem_type = elem.get('type')
+                segment_type = elem.get('type', '*')
+                if not stack:
+                    # 루트: 자기 자신은 '/type', 자식 경로에서는 루트 구간을 생략
+                    xpath = '/' + segment_type
+                    chain = None
+                    stack.append([elem, '', ElementFinder._class_chain_prefix(elem, None), {}, 0])
+                else:
+                    parent, xpath_prefix, chain_prefix, type_seen, child_count = stack[-1]
+                    type_seen[elem_type] = type_seen.get(elem_type, 0) + 1
+                    stack[-1][4] = child_count = child_count + 1
+
+                    xpath = f"{xpath_prefix}/{segment_type}[{type_seen[elem_type]}]"
+                    chain = None
+                    if chain_prefix is not None:
+                        chain_index = type_seen[elem_type] if elem_type else child_count
+                        chain = f"{chain_prefix}{segment_type}[{chain_index}]"
+                    stack.append([elem, xpath, ElementFinder._class_chain_prefix(elem, chain), {}, 0])
+
+                yield elem, xpath, chain
+
+    def iter_dicts(self, include_locators: bool = False) -> Iterator[Dict]:
+        """
+        문서 순서대로 요소 정보 딕셔너리를 하나씩 돌려줍니다.
+
+        Args:
+            include_locators: locator 정보 포함 여부 (JSON 저장 시)
+        """
+        for elem, xpath, chain in self.iter_elements():
+            element_dict = _element_info(elem)
+            if include_locators:
+                element_dict['locators'] = build_locators(element_dict, xpath, chain)
+            yield element_dict
+
+    def iter_by_text(self, text: str, case_sensitive: bool = False) -> Iterator[Dict]:
+        """name/label/value 중 하나에 text가 포함된 요소 (빈 검색어는 모든 요소)"""
+        search = text if case_sensitive else text.lower()
+        for elem, _, _ in self.iter_elements():
+            for attr in TEXT_ATTRIBUTES:
+                elem_text = elem.get(attr, '')
+                if not case_sensitive:
+                    elem_text = elem_text.lower()
+                if search in elem_text:
+                    yield _element_info(elem)
+                    break
+
+    def iter_by_attr(self, attr: str, attr_value: str) -> Iterator[Dict]:
+        """속성 값이 정확히 일치하는 요소"""
+        for elem, _, _ in self.iter_elements():
+            if elem.get(attr) == attr_value:
+                yield _element_info(elem)
+
+    def find_by_text(self, text: str, case_sensitive: bool = False) -> List[Dict]:
+        """
+        텍스트로 요소 검색 (ElementFinder.find_by_text와 같은 결과)
+
+        Args:
+            text: 검색할 텍스트
+            case_sensitive: 대소문자 구분 여부
+
+        Returns:
+            찾은 요소들의 정보 리스트
+        """
+        return list(self.iter_by_text(text, case_sensitive))
+
+    def find_by_type(self, element_type: str) -> List[Dict]:
+        """요소 타입으로 검색"""
+        return list(self.iter_by_attr('type', element_type))
+
+    def find_by_accessibility_id(self, accessibility_id: str) -> List[Dict]:
+        """Accessibility ID(name 속성)로 검색"""
+        return list(self.iter_by_attr('name', accessibility_id))
+
+    find_buttons = ElementFinder.find_buttons
+    find_text_fields = ElementFinder.find_text_fields
+    find_static_texts = ElementFinder.find_static_texts
+    find_images = ElementFinder.find_images
+    generate_locator_code = ElementFinder.generate_locator_code
+
+    def get_page_summary(self) -> Dict:
+        """
+        페이지 요약 정보
+
+        Returns:
+            요소 타입별 개수
+        """
+        summary = {}
+        for elem, _, _ in self.iter_elements():
+            elem_type = elem.get('type', 'Unknown')
+            summary[elem_type] = summary.get(elem_type, 0) + 1
+        return summary
+
+    def export_to_json(self, output_file: str, include_locators: bool = True):
+        """
+        모든 요소를 JSON 파일로 저장 (요소를 읽는 대로 바로 기록)
+        ElementFinder.export_to_json과 같은 형식(indent=2 배열)으로 저장합니다.
+        트리 전체를 보관하지 않으므로 rank_locators를 지원하지 않고 recommended는 항상 고정 우선순위입니다.
+
+        Args:
+            output_file: 저장할 파일 경로
+            include_locators: locator 정보 포함 여부 (기본값: True)
+        """
+        count = 0
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for element_dict in self.iter_dicts(include_locators=include_locators):
+                item = json.dumps(element_dict, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+                f.write(('\n  ' if count == 0 else ',\n  ') + item)
+                count += 1
+            f.write('\n]' if count else ']')
+
+        print(f"[INFO] 총 {count}개의 요소를 {output_file}에 저장했습니다.")
+        if include_locators:
+            print(f"[INFO] 각 요소의 locators.recommended 필드를 확인하세요.")
+
+
 def print_elements_table(elements: List[Dict], max_rows: int = 20):
     """
     요소 리스트를 테이블 형식으로 출력
@@ -0,0 +1,122 @@
+"""
+테스트 실패 아티팩트 비동기 수집
+
+테스트가 실패하면 스크린샷, 페이지 소스, 디바이스 로그를 백그라운드 스레드 풀에서 동시에 수집하고,
+수집한 데이터는 파일을 다시 읽지 않고 메모리에서 바로 Allure에 첨부합니다.
+
+    - 스크린샷: get_screenshot_as_png()로 한 번만 받아 스크린샷 저장소(screenshots/)에 압축/중복 제거 후 첨부
+    - 페이지 소스: 실패 시점 화면의 XML (page_analyzer / ElementFinder로 바로 분석 가능)
+    - 디바이스 로그: iOS syslog / Android logcat 마지막 DEVICE_LOG_MAX_LINES줄
+    - 화면 녹화: --record-screen 사용 시 실패 직전 N초 영상 (utils/screen_recorder.py)
+
+Allure 첨부는 테스트를 실행한 스레드에서 해야 하므로,
+수집은 pytest_runtest_makereport에서 시작하고 첨부는 teardown 시작 시(앱 초기화 전) 합니다.
+
+사용 예시:
+    artifacts = FailureArtifacts(driver, item.name)   # 수집 시작 (바로 반환)
+    ...
+    artifacts.attach()                                # 수집 완료를 기다려 Allure에 첨부
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+import allure
+
+from utils.screen_recorder import ScreenRecorder, build_clip
+from utils.screenshot_store import DEFAULT_STORE_DIR, ScreenshotStore, attach_stored_image, screenshot_store
+
+
+# 동시에 수집할 수 있는 아티팩트 수 (스크린샷 + 페이지 소스 + 로그, xdist는 워커마다 따로)
+ARTIFACT_WORKERS = 4
+# 아티팩트 하나를 기다리는 최대 시간 (초)
+ARTIFACT_TIMEOUT = 30
+# 플랫폼별 디바이스 로그 종류
+DEVICE_LOG_TYPES = {'ios': 'syslog', 'android': 'logcat'}
+DEVICE_LOG_MAX_LINES = 500
+
+_executor = ThreadPoolExecutor(max_workers=ARTIFACT_WORKERS, thread_name_prefix="failure-artifact")
+
+
+class FailureArtifacts:
+    """실패 시점의 스크린샷 / 페이지 소스 / 디바이스 로그 수집 작업"""
+
+    def __init__(self, driver, test_name: str, screenshot_dir: Optional[str] = DEFAULT_STORE_DIR,
+                 recorder: Optional[ScreenRecorder] = None):
+        """
+        수집을 백그라운드에서 시작하고 바로 반환합니다.
+
+        Args:
+            driver: Appium WebDriver
+            test_name: 테스트 이름 (첨부 / 파일 이름에 사용)
+            screenshot_dir: 스크린샷 저장소 폴더 (None이면 저장하지 않고 원본 PNG를 첨부)
+            recorder: 테스트 동안 녹화 중인 화면 녹화 링 버퍼 (None이면 녹화 첨부 안 함)
+        """
+        self.test_name = test_name
+        store = None
+        if screenshot_dir:
+            store = screenshot_store if screenshot_dir == DEFAULT_STORE_DIR else ScreenshotStore(screenshot_dir)
+        self.started_at = time.perf_counter()
+        platform = str((driver.capabilities or {}).get('platformName', '')).lower()
+        self._futures = {
+            "screenshot": _executor.submit(_capture_screenshot, driver, store),
+            "page_source": _executor.submit(lambda: driver.page_source),
+        }
+        if platform in DEVICE_LOG_TYPES:
+            self._futures["device_log"] = _executor.submit(_capture_device_log, driver, DEVICE_LOG_TYPES[platform])
+        if recorder is not None:
+            self._futures["screen_recording"] = _executor.submit(lambda: build_clip(recorder.stop(keep=True)))
+
+    def attach(self, timeout: float = ARTIFACT_TIMEOUT):
+        """
+        수집이 끝나기를 기다려 Allure에 첨부합니다. (테스트 실행 스레드에서 호출)
+
+        Args:
+            timeout: 아티팩트 하나를 기다리는 최대 시간 (초)
+        """
+        results = {}
+        for kind, future in self._futures.items():
+            try:
+                results[kind] = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                print(f"[ARTIFACT] {kind} 수집 시간 초과 ({timeout}초)")
+            except Exception as e:
+                print(f"[ARTIFACT] {kind} 수집 실패: {e}")
+
+        screenshot = results.get("screenshot")
+        if isinstance(screenshot, bytes):
+            allure.attach(screenshot, name=f"실패 스크린샷 - {self.test_name}", attachment_type=allure.attachment_type.PNG)
+        elif screenshot is not None:
+            attach_stored_image(screenshot, f"실패 스크린샷 - {self.test_name}")
+            reused = " (이전과 같은 화면, 기존 파일 재사용)" if screenshot.deduplicated else ""
+            print(f"\n[SCREENSHOT] 스크린샷 저장: {screenshot.path}{reused}")
+        if results.get("page_source"):
+            allure.attach(results["page_source"], name=f"실패 페이지 소스 - {self.test_name}",
+                          attachment_type=allure.attachment_type.XML)
+        if results.get("device_log"):
+            allure.attach(results["device_log"], name=f"디바이스 로그 - {self.test_name}",
+                          attachment_type=allure.attachment_type.TEXT)
+        clips = results.get("screen_recording") or []
+        for index, clip in enumerate(clips, start=1):
+            suffix = f" ({index}/{len(clips)})" if len(clips) > 1 else ""
+            allure.attach(clip, name=f"실패 직전 화면 녹화{suffix} - {self.test_name}",
+                          attachment_type=allure.attachment_type.MP4)
+
+        elapsed = time.perf_counter() - self.started_at
+        print(f"[ALLURE] 실패 아티팩트 {len(results)}개를 Allure 리포트에 첨부했습니다. (수집 {elapsed:.2f}초)")
+
+
+def _capture_screenshot(driver, store: Optional[ScreenshotStore]):
+    """스크린샷을 한 번 받아 저장소에 저장합니다. (저장소가 없으면 PNG bytes 반환)"""
+    png = driver.get_screenshot_as_png()
+    if store is None:
+        return png
+    return store.put(png)
+
+
+def _capture_device_log(driver, log_type: str) -> str:
+    """디바이스 로그 마지막 DEVICE_LOG_MAX_LINES줄"""
+    entries = (driver.get_log(log_type) or [])[-DEVICE_LOG_MAX_LINES:]
+    return "\n".join(
+        f"{entry.get('timestamp', '')} {entry.get('level', '')} {entry.get('message', '')}" for entry in entries
+    )
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+로컬 가짜 WebDriver(Appium) HTTP 서버
+
+실제 디바이스나 Appium 서버 없이 드라이버 풀, 계측 래퍼 등 테스트 인프라를
+검증하기 위한 최소한의 W3C WebDriver 서버입니다. 받은 명령은 모두 기록됩니다.
+
+사용 예시:
+    with FakeWebDriverServer() as server:
+        pool = DriverPool(server.url)
+        driver = pool.acquire("stg_iPad_9th_15.7_real")
+        print(server.command_names())
+
+    # 단독 실행 (pytest --appium-url http://127.0.0.1:4723 으로 연결)
+    python3 utils/fake_webdriver_server.py 4723
+"""
+import base64
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+# 1x1 투명 PNG
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+DEFAULT_PAGE_SOURCE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<AppiumAUT>'
+    '<XCUIElementTypeApplication type="XCUIElementTypeApplication" name="(STG) 설탭" label="(STG) 설탭" '
+    'enabled="true" visible="true" x="0" y="0" width="810" height="1080">'
+    '<XCUIElementTypeWindow type="XCUIElementTypeWindow" enabled="true" visible="true" x="0" y="0" width="810" height="1080">'
+    '<XCUIElementTypeButton type="XCUIElementTypeButton" name="로그인" label="로그인" '
+    'enabled="true" visible="true" x="305" y="600" width="200" height="48"/>'
+    '</XCUIElementTypeWindow>'
+    '</XCUIElementTypeApplication>'
+    '</AppiumAUT>'
+)
+
+
+class FakeWebDriverServer:
+    """스레드에서 동작하는 가짜 WebDriver 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, page_source: str = DEFAULT_PAGE_SOURCE):
+        """
+        Args:
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 빈 포트 자동 선택)
+            page_source: GET /source 에 응답할 페이지 소스
+        """
+        self.page_source = page_source
+        self.sessions: Dict[str, dict] = {}
+        self.commands: List[dict] = []
+        self.response_delay = 0.0
+        self.app_state = 4  # RUNNING_IN_FOREGROUND
+        # 요소 찾기 응답 조정 (locator 값 기준)
+        #   missing_elements: {값: 남은 실패 횟수} → 그 횟수만큼 no such element 응답 후 찾음
+        #   invalid_selectors: 항상 invalid selector 응답
+        self.missing_elements: Dict[str, int] = {}
+        self.invalid_selectors: set = set()
+        # 실패 응답할 mobile: 스크립트 (예: iOS 실기기의 "mobile: clearApp")
+        self.unsupported_scripts: set = set()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeWebDriverServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버를 실행합니다 (단독 실행용)."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeWebDriverServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def command_names(self) -> List[str]:
+        """기록된 명령 이름 목록 (execute/sync 는 스크립트 이름으로 기록)"""
+        return [command["name"] for command in self.commands]
+
+    def kill_session(self, session_id: str):
+        """세션이 서버 쪽에서 끊어진 상황을 흉내냅니다."""
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def _record(self, name: str, method: str, path: str, body: dict):
+        with self._lock:
+            self.commands.append({"name": name, "method": method, "path": path, "body": body, "ts": time.time()})
+
+    def handle(self, method: str, path: str, body: dict):
+        """요청을 처리하고 (상태 코드, value) 를 반환합니다."""
+        if self.response_delay:
+            time.sleep(self.response_delay)
+
+        path = re.sub(r"^/wd/hub", "", path)
+
+        if method == "GET" and path == "/status":
+            self._record("status", method, path, body)
+            return 200, {"ready": True, "message": "fake webdriver server"}
+
+        if method == "POST" and path == "/session":
+            session_id = uuid.uuid4().hex
+            requested = body.get("capabilities", {}).get("alwaysMatch", {})
+            capabilities = {key.replace("appium:", ""): value for key, value in requested.items()}
+            with self._lock:
+                self.sessions[session_id] = capabilities
+            self._record("newSession", method, path, body)
+            return 200, {"sessionId": session_id, "capabilities": capabilities}
+
+        match = re.match(r"^/session/([^/]+)(/.*)?$", path)
+        if not match:
+            return 404, {"error": "unknown command", "message": f"{method} {path}"}
+
+        session_id, command = match.group(1), match.group(2) or ""
+        if session_id not in self.sessions:
+            self._record("invalidSession", method, path, body)
+            return 404, {"error": "invalid session id", "message": f"세션이 없습니다: {session_id}"}
+
+        if method == "DELETE" and command == "":
+            with self._lock:
+                self.sessions.pop(session_id, None)
+            self._record("deleteSession", method, path, body)
+            return 200, None
+
+        if command == "/execute/sync":
+            script = body.get("script", "")
+            self._record(script, method, path, body)
+            if script in self.unsupported_scripts:
+                return 500, {"error": "unknown error", "message": f"{script}는 이 디바이스에서 지원하지 않습니다"}
+            if script == "mobile: queryAppState":
+                return 200, self.app_state
+            if script == "mobile: terminateApp":
+                return 200, True
+            return 200, None
+
+        if command == "/source":
+            self._record("getPageSource", method, path, body)
+            return 200, self.page_source
+
+        if command == "/screenshot":
+            self._record("screenshot", method, path, body)
+            return 200, base64.b64encode(BLANK_PNG).decode("ascii")
+
+        if command == "/appium/stop_recording_screen":
+            self._record("stopRecordingScreen", method, path, body)
+            return 200, base64.b64encode(f"fake-mp4 {time.time():.3f}".encode("ascii")).decode("ascii")
+
+        if command == "/window/rect":
+            self._record("getWindowRect", method, path, body)
+            return 200, {"x": 0, "y": 0, "width": 810, "height": 1080}
+
+        if command == "/element":
+            self._record("findElement", method, path, body)
+            error = self._find_error(body.get("value", ""))
+            if error:
+                return error
+            return 200, {"element-6066-11e4-a52e-4f735466cecf": uuid.uuid4().hex}
+
+        if command == "/elements":
+            self._record("findElements", method, path, body)
+            error = self._find_error(body.get("value", ""))
+            if error and error[1]["error"] == "invalid selector":
+                return error
+            if error:
+                return 200, []
+            return 200, [{"element-6066-11e4-a52e-4f735466cecf": uuid.uuid4().hex}]
+
+        element_match = re.match(r"^/element/([^/]+)/(\w+)(?:/(\w+))?$", command)
+        if element_match:
+            action, argument = element_match.group(2), element_match.group(3)
+            self._record(f"element.{action}", method, path, body)
+            if action == "displayed" or action == "enabled":
+                return 200, True
+            if action == "attribute":
+                return 200, argument
+            if action == "rect":
+                return 200, {"x": 0, "y": 0, "width": 10, "height": 10}
+            return 200, None
+
+        self._record(command.strip("/"), method, path, body)
+        return 200, None
+
+    def _find_error(self, value: str):
+        """요소 찾기가 실패해야 하면 (상태 코드, 오류) 를, 아니면 None을 반환합니다."""
+        if value in self.invalid_selectors:
+            return 400, {"error": "invalid selector", "message": f"잘못된 locator입니다: {value}"}
+        with self._lock:
+            remaining = self.missing_elements.get(value, 0)
+            if remaining <= 0:
+                return None
+            self.missing_elements[value] = remaining - 1
+        return 404, {"error": "no such element", "message": f"요소를 찾을 수 없습니다: {value}"}
+
+
+def _make_handler(server: FakeWebDriverServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self, method: str):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else {}
+            except json.JSONDecodeError:
+                body = {}
+
+            status, value = server.handle(method, self.path, body)
+            payload = json.dumps({"value": value}).encode("utf-8")
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+        def log_message(self, format, *args):
+            # 테스트 출력이 지저분해지지 않도록 접근 로그는 남기지 않습니다.
+            pass
+
+    return Handler
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 4723
+    fake_server = FakeWebDriverServer(port=port)
+    print(f"가짜 WebDriver 서버 실행 중: {fake_server.url} (종료: Ctrl+C)")
+    try:
+        fake_server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n종료합니다...")
@@ -0,0 +1,404 @@
+"""
+Git 메타데이터 (subprocess 없이 .git 디렉토리를 직접 읽음)
+
+`git rev-parse`를 알림 / 기준선 저장마다 두 번씩 실행하던 방식 대신,
+.git/HEAD, refs, packed-refs, 커밋 객체(loose / pack), index를 직접 읽어 세션에서 한 번만 계산합니다.
+
+제공 항목:
+    - branch, commit: 브랜치 (CI의 detached HEAD는 GITHUB_HEAD_REF / GITHUB_REF_NAME), 커밋 해시
+    - author, author_email, subject: 커밋 작성자, 커밋 메시지 첫 줄
+    - dirty: 추적 중인 파일에 커밋하지 않은 변경(스테이지 포함)이 있는지 (git describe --dirty 기준, 알 수 없으면 None)
+    - run_id, run_url: CI 실행 번호 / GitHub Actions 실행 URL
+
+사용 예시:
+    info = get_git_info()          # 같은 저장소는 한 번만 계산 (캐시)
+    info["branch"], info["commit"], info["dirty"]
+"""
+import functools
+import hashlib
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+
+# pack 객체 종류
+OBJ_COMMIT, OBJ_TREE, OBJ_BLOB, OBJ_TAG, OBJ_OFS_DELTA, OBJ_REF_DELTA = 1, 2, 3, 4, 6, 7
+OBJECT_TYPES = {OBJ_COMMIT: "commit", OBJ_TREE: "tree", OBJ_BLOB: "blob", OBJ_TAG: "tag"}
+# index 항목 모드 (디렉토리 / 서브모듈은 비교하지 않음)
+GITLINK_MODE = 0o160000
+UNKNOWN = {"branch": "unknown", "commit": "N/A"}
+# Allure environment.properties에서 Git / CI 항목을 구분하는 접두사
+GIT_ENVIRONMENT_PREFIX = "git."
+
+
+class GitRepository:
+    """.git 디렉토리 읽기 (HEAD / refs / 객체 / index)"""
+
+    def __init__(self, git_dir: Path, work_tree: Path):
+        self.git_dir = git_dir
+        self.work_tree = work_tree
+        # worktree의 .git은 공용 디렉토리(commondir)에 refs / objects가 있음
+        common_dir_file = git_dir / "commondir"
+        self.common_dir = (git_dir / common_dir_file.read_text().strip()).resolve() if common_dir_file.exists() else git_dir
+        self._packs = None
+
+    @classmethod
+    def discover(cls, start: Optional[Path] = None) -> Optional["GitRepository"]:
+        """start(기본값: 현재 디렉토리)부터 상위로 올라가며 저장소를 찾습니다."""
+        path = Path(start or os.getcwd()).resolve()
+        for directory in (path, *path.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                return cls(dot_git, directory)
+            if dot_git.is_file():
+                # worktree / 서브모듈: "gitdir: <경로>"
+                content = dot_git.read_text().strip()
+                if content.startswith("gitdir:"):
+                    return cls((directory / content[len("gitdir:"):].strip()).resolve(), directory)
+        return None
+
+    def head(self) -> Tuple[Optional[str], Optional[str]]:
+        """(브랜치 이름 또는 None(detached), 커밋 해시)"""
+        content = (self.git_dir / "HEAD").read_text().strip()
+        if content.startswith("ref:"):
+            ref = content[len("ref:"):].strip()
+            branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+            return branch, self.resolve_ref(ref)
+        return None, content
+
+    def resolve_ref(self, ref: str) -> Optional[str]:
+        """refs/heads/... → 커밋 해시 (loose ref 우선, 없으면 packed-refs)"""
+        for _ in range(10):
+            for base in (self.git_dir, self.common_dir):
+                path = base / ref
+                if path.is_file():
+                    value = path.read_text().strip()
+                    break
+            else:
+                return self._packed_refs().get(ref)
+            if not value.startswith("ref:"):
+                return value
+            ref = value[len("ref:"):].strip()
+        return None
+
+    def _packed_refs(self) -> Dict[str, str]:
+        path = self.common_dir / "packed-refs"
+        refs = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                if line and not line.startswith(("#", "^")):
+                    sha, _, name = line.partition(" ")
+                    refs[name] = sha
+        return refs
+
+    def read_object(self, sha: str) -> Tuple[str, bytes]:
+        """
+        객체 읽기 (loose 객체 또는 pack)
+
+        Returns:
+            (종류, 내용)
+        """
+        loose = self.common_dir / "objects" / sha[:2] / sha[2:]
+        if loose.exists():
+            raw = zlib.decompress(loose.read_bytes())
+            header, _, body = raw.partition(b"\0")
+            return header.split(b" ")[0].decode(), body
+        for pack in self._pack_files():
+            offset = pack.find(sha)
+            if offset is not None:
+                kind, body = pack.read(offset, self)
+                return OBJECT_TYPES[kind], body
+        raise KeyError(sha)
+
+    def _pack_files(self):
+        if self._packs is None:
+            pack_dir = self.common_dir / "objects" / "pack"
+            self._packs = [PackFile(path) for path in sorted(pack_dir.glob("*.idx"))] if pack_dir.exists() else []
+        return self._packs
+
+    def commit_info(self, sha: str) -> Dict[str, str]:
+        """커밋 객체의 tree, 작성자, 메시지 첫 줄"""
+        _, body = self.read_object(sha)
+        headers, _, message = body.decode("utf-8", errors="replace").partition("\n\n")
+        info = {"tree": "", "author": "", "author_email": "", "subject": message.strip().split("\n")[0]}
+        for line in headers.split("\n"):
+            if line.startswith("tree "):
+                info["tree"] = line[5:]
+            elif line.startswith("author "):
+                name, _, rest = line[7:].partition(" <")
+                info["author"] = name
+                info["author_email"] = rest.partition(">")[0]
+        return info
+
+    def tree_entries(self, tree_sha: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+        """tree를 재귀로 펼친 (경로, blob 해시)"""
+        _, body = self.read_object(tree_sha)
+        position = 0
+        while position < len(body):
+            space = body.index(b" ", position)
+            nul = body.index(b"\0", space)
+            mode = int(body[position:space], 8)
+            name = body[space + 1:nul].decode("utf-8", errors="surrogateescape")
+            sha = body[nul + 1:nul + 21].hex()
+            position = nul + 21
+            if mode == 0o040000:
+                yield from self.tree_entries(sha, f"{prefix}{name}/")
+            elif mode != GITLINK_MODE:
+                yield f"{prefix}{name}", sha
+
+    def index_entries(self) -> Iterator[dict]:
+        """.git/index 항목 (버전 2 / 3 / 4)"""
+        data = (self.git_dir / "index").read_bytes()
+        signature, version, count = struct.unpack(">4sLL", data[:12])
+        if signature != b"DIRC" or version not in (2, 3, 4):
+            raise ValueError(f"지원하지 않는 index 형식: {signature} v{version}")
+
+        position = 12
+        previous_path = b""
+        for _ in range(count):
+            start = position
+            (ctime_s, ctime_ns, mtime_s, mtime_ns, dev, ino, mode, uid, gid, size) = struct.unpack(
+                ">10L", data[position:position + 40])
+            sha = data[position + 40:position + 60].hex()
+            flags = struct.unpack(">H", data[position + 60:position + 62])[0]
+            position += 62
+            extended = 0
+            if version >= 3 and flags & 0x4000:
+                extended = struct.unpack(">H", data[position:position + 2])[0]
+                position += 2
+
+            if version == 4:
+                # 이전 경로에서 N바이트를 지우고 이어붙이는 압축 경로
+                strip, position = _read_offset_varint(data, position)
+                nul = data.index(b"\0", position)
+                path = previous_path[:len(previous_path) - strip] + data[position:nul]
+                position = nul + 1
+            else:
+                nul = data.index(b"\0", position)
+                path = data[position:nul]
+                # 항목 길이는 8바이트 배수 (NUL 1~8개)
+                position = start + ((nul - start) // 8 + 1) * 8
+            previous_path = path
+
+            yield {
+                "path": path.decode("utf-8", errors="surrogateescape"),
+                "sha": sha,
+                "mode": mode,
+                "size": size,
+                "mtime_ns": mtime_s * 1_000_000_000 + mtime_ns,
+                "stage": (flags >> 12) & 0x3,
+                "skip_worktree": bool(extended & 0x4000),
+            }
+
+    def is_dirty(self, head_tree: str) -> bool:
+        """추적 중인 파일이 HEAD와 다르거나(스테이지 포함) 작업 트리에서 수정/삭제되었는지"""
+        head_files = dict(self.tree_entries(head_tree))
+        index_paths = set()
+        for entry in self.index_entries():
+            if entry["stage"] != 0:
+                return True  # 충돌 중
+            if entry["mode"] == GITLINK_MODE:
+                continue
+            index_paths.add(entry["path"])
+            if head_files.get(entry["path"]) != entry["sha"]:
+                return True  # 스테이지된 변경 / 새 파일
+            if not entry["skip_worktree"] and _worktree_changed(self.work_tree / entry["path"], entry):
+                return True
+        return index_paths != set(head_files)  # 스테이지된 삭제
+
+
+class PackFile:
+    """pack 파일 (.idx v2 + .pack) 객체 읽기"""
+
+    def __init__(self, idx_path: Path):
+        self.idx_path = idx_path
+        self.pack_path = idx_path.with_suffix(".pack")
+        self._index: Optional[Dict[str, int]] = None
+
+    def find(self, sha: str) -> Optional[int]:
+        """객체 해시 → pack 안의 위치"""
+        if self._index is None:
+            self._index = _read_pack_index(self.idx_path)
+        return self._index.get(sha)
+
+    def read(self, offset: int, repository: GitRepository) -> Tuple[int, bytes]:
+        """위치의 객체를 읽어 (종류, 내용)을 반환합니다. (delta는 원본에 적용)"""
+        with open(self.pack_path, "rb") as f:
+            f.seek(offset)
+            byte = f.read(1)[0]
+            kind = (byte >> 4) & 0x7
+            while byte & 0x80:
+                byte = f.read(1)[0]
+
+            if kind == OBJ_OFS_DELTA:
+                byte = f.read(1)[0]
+                distance = byte & 0x7F
+                while byte & 0x80:
+                    byte = f.read(1)[0]
+                    distance = ((distance + 1) << 7) | (byte & 0x7F)
+                delta = _inflate(f)
+                base_kind, base = self.read(offset - distance, repository)
+                return base_kind, _apply_delta(base, delta)
+            if kind == OBJ_REF_DELTA:
+                base_sha = f.read(20).hex()
+                delta = _inflate(f)
+                base_type, base = repository.read_object(base_sha)
+                base_kind = next(key for key, value in OBJECT_TYPES.items() if value == base_type)
+                return base_kind, _apply_delta(base, delta)
+            return kind, _inflate(f)
+
+
+def _read_pack_index(idx_path: Path) -> Dict[str, int]:
+    """.idx v2 → {객체 해시: pack 안의 위치}"""
+    data = idx_path.read_bytes()
+    if data[:4] != b"\377tOc" or struct.unpack(">L", data[4:8])[0] != 2:
+        raise ValueError(f"지원하지 않는 pack index: {idx_path}")
+    count = struct.unpack(">L", data[8 + 255 * 4:8 + 256 * 4])[0]
+    sha_start = 8 + 256 * 4
+    offset_start = sha_start + count * 20 + count * 4
+    large_start = offset_start + count * 4
+    index = {}
+    for i in range(count):
+        sha = data[sha_start + i * 20:sha_start + (i + 1) * 20].hex()
+        offset = struct.unpack(">L", data[offset_start + i * 4:offset_start + (i + 1) * 4])[0]
+        if offset & 0x80000000:
+            large = (offset & 0x7FFFFFFF) * 8
+            offset = struct.unpack(">Q", data[large_start + large:large_start + large + 8])[0]
+        index[sha] = offset
+    return index
+
+
+def _inflate(f) -> bytes:
+    """파일의 현재 위치부터 zlib 스트림 하나를 풉니다."""
+    decompressor = zlib.decompressobj()
+    output = b""
+    while not decompressor.eof:
+        chunk = f.read(4096)
+        if not chunk:
+            break
+        output += decompressor.decompress(chunk)
+    return output
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """git delta 적용 (복사 / 삽입 명령)"""
+    _, position = _read_size_varint(delta, 0)
+    _, position = _read_size_varint(delta, position)
+    output = bytearray()
+    while position < len(delta):
+        op = delta[position]
+        position += 1
+        if op & 0x80:
+            offset = size = 0
+            for bit in range(4):
+                if op & (1 << bit):
+                    offset |= delta[position] << (8 * bit)
+                    position += 1
+            for bit in range(3):
+                if op & (1 << (4 + bit)):
+                    size |= delta[position] << (8 * bit)
+                    position += 1
+            output += base[offset:offset + (size or 0x10000)]
+        elif op:
+            output += delta[position:position + op]
+            position += op
+        else:
+            raise ValueError("잘못된 delta 명령")
+    return bytes(output)
+
+
+def _read_size_varint(data: bytes, position: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def _read_offset_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """index v4 경로 압축 길이 (OFS_DELTA와 같은 인코딩)"""
+    byte = data[position]
+    position += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[position]
+        position += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, position
+
+
+def _worktree_changed(path: Path, entry: dict) -> bool:
+    """작업 트리 파일이 index 항목과 다른지 (크기 / 수정 시각이 같으면 그대로, 다르면 내용 해시 비교)"""
+    try:
+        stat = path.lstat()
+    except OSError:
+        return True  # 삭제됨
+    if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+        return False
+    if path.is_symlink():
+        content = os.readlink(path).encode("utf-8", errors="surrogateescape")
+    else:
+        content = path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest() != entry["sha"]
+
+
+def ci_context() -> Dict[str, Optional[str]]:
+    """CI 실행 번호 / URL (GitHub Actions, Jenkins)"""
+    run_id = os.getenv("GITHUB_RUN_ID") or os.getenv("BUILD_ID")
+    run_url = os.getenv("BUILD_URL")
+    if os.getenv("GITHUB_RUN_ID") and os.getenv("GITHUB_REPOSITORY"):
+        server = os.getenv("GITHUB_SERVER_URL", "https://github.com")
+        run_url = f"{server}/{os.getenv('GITHUB_REPOSITORY')}/actions/runs/{os.getenv('GITHUB_RUN_ID')}"
+    return {"run_id": run_id, "run_url": run_url}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_git_info(start: str) -> Dict:
+    info = {**UNKNOWN, "author": None, "author_email": None, "subject": None, "dirty": None, **ci_context()}
+    try:
+        repository = GitRepository.discover(Path(start))
+        if repository is None:
+            return info
+        branch, commit = repository.head()
+        # CI(actions/checkout)는 detached HEAD로 체크아웃하므로 환경 변수의 브랜치 사용
+        info["branch"] = branch or os.getenv("GITHUB_HEAD_REF") or os.getenv("GITHUB_REF_NAME") or "HEAD"
+        if not commit:
+            return info
+        info["commit"] = commit
+        commit_info = repository.commit_info(commit)
+        info.update({key: commit_info[key] for key in ("author", "author_email", "subject")})
+        info["dirty"] = repository.is_dirty(commit_info["tree"])
+    except (OSError, ValueError, KeyError, zlib.error, struct.error, IndexError) as e:
+        print(f"⚠️  Git 정보를 읽지 못했습니다: {e}")
+    return info
+
+
+def get_git_info(start: Optional[str] = None) -> Dict:
+    """
+    현재 Git 브랜치 / 커밋 / 작성자 / 변경 여부 / CI 실행 정보 (저장소마다 한 번만 계산)
+
+    Args:
+        start: 저장소를 찾기 시작할 경로 (기본값: 현재 디렉토리)
+
+    Returns:
+        dict: branch, commit, author, author_email, subject, dirty, run_id, run_url
+    """
+    return dict(_cached_git_info(str(Path(start or os.getcwd()).resolve())))
+
+
+def allure_environment(info: Dict) -> Dict[str, str]:
+    """Allure Environment 위젯에 표시할 Git / CI 항목 (키는 GIT_ENVIRONMENT_PREFIX로 시작)"""
+    prefix = GIT_ENVIRONMENT_PREFIX
+    items = {f"{prefix}branch": info["branch"], f"{prefix}commit": info["commit"][:7]}
+    if info.get("author"):
+        items[f"{prefix}author"] = info["author"]
+    if info.get("dirty") is not None:
+        items[f"{prefix}dirty"] = "true" if info["dirty"] else "false"
+    if info.get("run_url") or info.get("run_id"):
+        items[f"{prefix}ci_run"] = info.get("run_url") or info["run_id"]
+    return items
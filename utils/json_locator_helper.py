@@ -4,10 +4,51 @@ JSON 파일에서 locator를 쉽게 찾는 헬퍼 유틸리티
 
 사용 예시:
     python3 utils/json_locator_helper.py student_home.json "수강신청"
+    python3 utils/json_locator_helper.py "수강신청"     # elements/ 의 모든 화면에서 검색
+
+컬럼형 스냅샷(utils/snapshot_store.py, *.snapshot.json)도 같은 방법으로 검색할 수 있습니다.
+    python3 utils/json_locator_helper.py elements/student_home.snapshot.json "수강신청"
 """
 import json
 import sys
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Union
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils.snapshot_store import SnapshotStore, is_snapshot_data
+from utils.locator_index import LocatorIndex
+
+
+# 파일 경로 → (수정 시간, 로드 결과) - 같은 파일을 여러 번 검색할 때 다시 읽지 않음
+_load_cache: Dict[str, tuple] = {}
+
+
+def load_elements(json_file: str) -> Union[List[Dict], SnapshotStore]:
+    """
+    JSON 파일 로드
+
+    Args:
+        json_file: 기존 형식(요소 리스트) JSON 또는 컬럼형 스냅샷 파일 경로
+
+    Returns:
+        요소 리스트 또는 SnapshotStore (둘 다 요소를 딕셔너리처럼 순회할 수 있음)
+    """
+    path = str(Path(json_file).resolve())
+    mtime_ns = Path(path).stat().st_mtime_ns
+    cached = _load_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    elements = SnapshotStore.from_data(data) if is_snapshot_data(data) else data
+    _load_cache[path] = (mtime_ns, elements)
+    return elements
 
 
 def search_elements(json_file: str, search_term: str, search_in: List[str] = None) -> List[Dict]:
@@ -25,8 +66,9 @@ def search_elements(json_file: str, search_term: str, search_in: List[str] = Non
     if search_in is None:
         search_in = ['name', 'label', 'value']
 
-    with open(json_file, 'r', encoding='utf-8') as f:
-        elements = json.load(f)
+    elements = load_elements(json_file)
+    if isinstance(elements, SnapshotStore):
+        return elements.search(search_term, search_in)
 
     results = []
     search_lower = search_term.lower()
@@ -41,21 +83,22 @@ def search_elements(json_file: str, search_term: str, search_in: List[str] = Non
     return results
 
 
-def print_locator_info(element: Dict, index: int = None):
+def print_locator_info(element: Dict, index: int = None, screen: str = None):
     """
     요소의 locator 정보를 보기 좋게 출력
 
     Args:
         element: 요소 딕셔너리
         index: 인덱스 번호 (여러 개일 때)
+        screen: 화면 이름 (전체 화면 검색 결과일 때)
     """
     if index is not None:
         print(f"\n{'='*80}")
-        print(f"결과 #{index}")
+        print(f"결과 #{index}" + (f" [{screen}]" if screen else ""))
         print('='*80)
     else:
         print(f"\n{'='*80}")
-        print("요소 정보")
+        print("요소 정보" + (f" [{screen}]" if screen else ""))
         print('='*80)
 
     # 기본 정보
@@ -91,8 +134,9 @@ def search_by_type(json_file: str, element_type: str) -> List[Dict]:
     Returns:
         찾은 요소 리스트
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        elements = json.load(f)
+    elements = load_elements(json_file)
+    if isinstance(elements, SnapshotStore):
+        return elements.find_by_type(element_type)
 
     return [elem for elem in elements if elem.get('type') == element_type]
 
@@ -119,8 +163,7 @@ def get_elements_summary(json_file: str):
     Args:
         json_file: JSON 파일 경로
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        elements = json.load(f)
+    elements = load_elements(json_file)
 
     print(f"\n{'='*80}")
     print(f"파일: {json_file}")
@@ -148,19 +191,63 @@ def get_elements_summary(json_file: str):
     print(f"👁️  Visible=true인 요소: {visible_count}개 ({visible_count/len(elements)*100:.1f}%)")
 
 
+def search_all_screens(search_term: str, max_results: int = 10):
+    """
+    elements/ 의 모든 화면을 한 번에 검색해서 순위대로 출력
+    (수정된 스냅샷 파일만 다시 색인한 뒤 검색)
+
+    Args:
+        search_term: 검색할 텍스트 또는 요소 타입
+        max_results: 최대 출력 개수
+    """
+    with LocatorIndex() as index:
+        update = index.update()
+        screens = index.get_screens()
+        print(f"\n📚 인덱스: 화면 {len(screens)}개, 요소 {sum(screens.values())}개 "
+              f"(다시 색인: {update['indexed']}개, 제거: {update['removed']}개)")
+
+        if search_term.startswith('XCUIElementType'):
+            hits = index.search_by_type(search_term)
+            print(f"\n'{search_term}' 타입 전체 화면 검색 결과: {len(hits)}개 발견")
+        elif search_term[0].isupper() and not ' ' in search_term:
+            full_type = f"XCUIElementType{search_term}"
+            hits = index.search_by_type(full_type)
+            print(f"\n'{full_type}' 타입 전체 화면 검색 결과: {len(hits)}개 발견")
+        else:
+            hits = index.search(search_term)
+            print(f"\n'{search_term}' 전체 화면 검색 결과: {len(hits)}개 발견")
+
+    if not hits:
+        print("❌ 검색 결과가 없습니다.")
+        return
+
+    for i, hit in enumerate(hits[:max_results], 1):
+        print_locator_info(hit['element'], index=i, screen=hit['screen'])
+
+    if len(hits) > max_results:
+        print(f"\n... 및 {len(hits) - max_results}개 더")
+
+
 def main():
     """메인 함수 - CLI 인터페이스"""
     if len(sys.argv) < 2:
         print("사용법:")
         print(f"  {sys.argv[0]} <json_file> [search_term]")
+        print(f"  {sys.argv[0]} <search_term>                  # 모든 화면에서 검색")
         print(f"\n예시:")
         print(f"  {sys.argv[0]} student_home.json              # 요약 정보")
         print(f"  {sys.argv[0]} student_home.json 수강신청      # '수강신청' 검색")
         print(f"  {sys.argv[0]} student_home.json Button       # Button 타입 검색")
+        print(f"  {sys.argv[0]} 수강신청                        # elements/ 전체 화면에서 '수강신청' 검색")
         sys.exit(1)
 
     json_file = sys.argv[1]
 
+    # 인자가 하나이고 파일이 아니면 전체 화면 검색
+    if len(sys.argv) == 2 and not json_file.endswith('.json') and not Path(json_file).is_file():
+        search_all_screens(json_file)
+        return
+
     # 검색어가 없으면 요약 정보만 출력
     if len(sys.argv) < 3:
         get_elements_summary(json_file)
@@ -0,0 +1,1151 @@
+#!/usr/bin/env python3
+"""
+오프라인 locator 평가기 - 디바이스 없이 스냅샷에서 locator를 평가합니다.
+
+지원하는 locator:
+    - accessibility id : name(iOS) / content-desc(Android) 속성 일치
+    - XPath            : XPath 1.0 (축, 술어, contains/starts-with 등 주요 함수, and/or, |)
+    - iOS Class Chain  : `**/Type[`predicate`][n]`, `[$predicate$]`, 음수 인덱스, XCUIElementTypeAny / *
+    - iOS Predicate    : ==, !=, <, >, BEGINSWITH, ENDSWITH, CONTAINS, LIKE, MATCHES, IN, [c]/[d] 옵션, AND/OR/NOT
+
+lxml이 있어도 없어도 같은 엔진으로 평가하므로 결과가 동일합니다.
+평가 결과로 일치 요소 수와 비용(소요 시간, 방문한 요소 수)을 알려주고,
+여러 locator 후보 중 "유일하게 일치하면서 가장 빠른" locator를 추천합니다.
+
+사용 예시:
+    # pages/*.py 의 locator를 elements/ 스냅샷으로 검증 (CI에서 사용)
+    python3 utils/locator_evaluator.py
+    python3 utils/locator_evaluator.py elements/student_home.json new_capture.xml
+"""
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python path에 추가 (CLI로 실행할 때)
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+# AppiumBy 전략 문자열
+BY_ACCESSIBILITY_ID = 'accessibility id'
+BY_XPATH = 'xpath'
+BY_ID = 'id'
+BY_IOS_CLASS_CHAIN = '-ios class chain'
+BY_IOS_PREDICATE = '-ios predicate string'
+
+# locator 코드 문자열의 AppiumBy 상수 이름 → 전략 문자열
+APPIUM_BY_NAMES = {
+    'ACCESSIBILITY_ID': BY_ACCESSIBILITY_ID,
+    'XPATH': BY_XPATH,
+    'ID': BY_ID,
+    'IOS_CLASS_CHAIN': BY_IOS_CLASS_CHAIN,
+    'IOS_PREDICATE': BY_IOS_PREDICATE,
+}
+
+APPLICATION_TYPE = 'XCUIElementTypeApplication'
+ANY_TYPES = ('*', 'XCUIElementTypeAny')
+
+
+class LocatorSyntaxError(ValueError):
+    """locator 문법 오류"""
+
+
+class EvaluationCost:
+    """평가 중 방문한 요소 수 (기기와 무관한 결정적 비용)"""
+
+    def __init__(self):
+        self.visited = 0
+
+
+def _element_type(elem) -> str:
+    """요소 타입 (type 속성, 없으면 태그 이름)"""
+    return elem.get('type') or elem.tag
+
+
+# ----------------------------------------------------------------------
+# 트리 정보 (부모, 문서 순서)
+# ----------------------------------------------------------------------
+
+# iOS(WDA) 페이지 소스의 최상위 래퍼 태그
+WDA_WRAPPER_TAG = 'AppiumAUT'
+
+
+class _Document:
+    """XPath의 문서 노드 (루트 요소의 부모)"""
+
+    tag = '#document'
+
+    def __init__(self, root):
+        self.root = root
+
+    def __iter__(self):
+        return iter([self.root])
+
+    def __len__(self):
+        return 1
+
+    def get(self, key, default=None):
+        return default
+
+
+class TreeInfo:
+    """XML 트리의 부모 관계와 문서 순서 (평가할 때마다 다시 만들지 않도록 캐시)"""
+
+    def __init__(self, root):
+        # iOS 페이지 소스의 <AppiumAUT> 래퍼는 디바이스의 XPath 문서에 없으므로 제외
+        # (디바이스에서 "/XCUIElementTypeApplication/..." 절대 XPath가 일치하는 것과 동일하게)
+        if root.tag == WDA_WRAPPER_TAG and len(root) == 1:
+            root = root[0]
+        self.root = root
+        self.document = _Document(root)
+        self.parents = {root: self.document}
+        self.order = {self.document: -1}
+        self.elements = []
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            self.order[elem] = len(self.elements)
+            self.elements.append(elem)
+            children = list(elem)
+            for child in children:
+                self.parents[child] = elem
+            stack.extend(reversed(children))
+
+    def sort(self, nodes) -> list:
+        """문서 순서로 정렬하고 중복 제거"""
+        unique = {id(node): node for node in nodes}
+        return sorted(unique.values(), key=self._order_key)
+
+    def _order_key(self, node):
+        if isinstance(node, _Attribute):
+            return (self.order[node.elem], 1, node.name)
+        return (self.order[node], 0, '')
+
+    def application(self):
+        """class chain / predicate 검색의 기준 요소 (XCUIElementTypeApplication)"""
+        for elem in self.elements:
+            if _element_type(elem) == APPLICATION_TYPE:
+                return elem
+        return None
+
+    def descendants(self, elem, cost: EvaluationCost) -> list:
+        """자기 자신을 제외한 모든 자손 (문서 순서)"""
+        result = []
+        stack = list(reversed(list(elem)))
+        while stack:
+            node = stack.pop()
+            cost.visited += 1
+            result.append(node)
+            stack.extend(reversed(list(node)))
+        return result
+
+
+class _Attribute:
+    """XPath 속성 노드"""
+
+    __slots__ = ('elem', 'name', 'value')
+
+    def __init__(self, elem, name, value):
+        self.elem = elem
+        self.name = name
+        self.value = value
+
+
+# ----------------------------------------------------------------------
+# XPath 1.0
+# ----------------------------------------------------------------------
+
+_XPATH_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>"[^"]*"|'[^']*')
+      | (?P<number>\d+(?:\.\d*)?|\.\d+)
+      | (?P<op>//|::|\.\.|!=|<=|>=|[/\[\]()@,|=<>*.+-])
+      | (?P<name>[A-Za-z_][\w.\-]*(?::[A-Za-z_][\w.\-]*)?)
+    )""", re.VERBOSE)
+
+_AXES = ('child', 'descendant', 'descendant-or-self', 'self', 'parent', 'ancestor', 'ancestor-or-self',
+         'following-sibling', 'preceding-sibling', 'following', 'preceding', 'attribute')
+_REVERSE_AXES = ('parent', 'ancestor', 'ancestor-or-self', 'preceding-sibling', 'preceding')
+_NODE_TYPES = ('node', 'text', 'comment', 'processing-instruction')
+
+
+def _tokenize_xpath(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _XPATH_TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise LocatorSyntaxError(f"XPath 문법 오류 (위치 {position}): {expression}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+        while position < len(expression) and expression[position].isspace():
+            position += 1
+    return tokens
+
+
+class _XPathParser:
+    """XPath 식을 평가 함수 트리로 변환하는 재귀 하강 파서"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize_xpath(expression)
+        self.index = 0
+
+    def parse(self):
+        expr = self._or()
+        if self.index != len(self.tokens):
+            self._error()
+        return expr
+
+    def _error(self):
+        raise LocatorSyntaxError(f"XPath 문법 오류: {self.expression}")
+
+    def _peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        if self.index + offset < len(self.tokens):
+            return self.tokens[self.index + offset]
+        return (None, None)
+
+    def _accept(self, value: str) -> bool:
+        kind, token = self._peek()
+        if token == value and kind in ('op', 'name'):
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, value: str):
+        if not self._accept(value):
+            self._error()
+
+    # 연산자 (우선순위 낮은 순)
+    def _or(self):
+        left = self._and()
+        while self._peek() == ('name', 'or'):
+            self.index += 1
+            right = self._and()
+            left = (lambda a, b: lambda ctx: _boolean(a(ctx)) or _boolean(b(ctx)))(left, right)
+        return left
+
+    def _and(self):
+        left = self._equality()
+        while self._peek() == ('name', 'and'):
+            self.index += 1
+            right = self._equality()
+            left = (lambda a, b: lambda ctx: _boolean(a(ctx)) and _boolean(b(ctx)))(left, right)
+        return left
+
+    def _equality(self):
+        left = self._relational()
+        while self._peek()[1] in ('=', '!=') and self._peek()[0] == 'op':
+            op = self._peek()[1]
+            self.index += 1
+            right = self._relational()
+            left = (lambda a, b, o: lambda ctx: _compare(a(ctx), b(ctx), o))(left, right, op)
+        return left
+
+    def _relational(self):
+        left = self._additive()
+        while self._peek()[1] in ('<', '<=', '>', '>=') and self._peek()[0] == 'op':
+            op = self._peek()[1]
+            self.index += 1
+            right = self._additive()
+            left = (lambda a, b, o: lambda ctx: _compare(a(ctx), b(ctx), o))(left, right, op)
+        return left
+
+    def _additive(self):
+        left = self._unary()
+        while self._peek()[1] in ('+', '-') and self._peek()[0] == 'op':
+            op = self._peek()[1]
+            self.index += 1
+            right = self._unary()
+            if op == '+':
+                left = (lambda a, b: lambda ctx: _number(a(ctx)) + _number(b(ctx)))(left, right)
+            else:
+                left = (lambda a, b: lambda ctx: _number(a(ctx)) - _number(b(ctx)))(left, right)
+        return left
+
+    def _unary(self):
+        if self._peek() == ('op', '-'):
+            self.index += 1
+            operand = self._unary()
+            return lambda ctx: -_number(operand(ctx))
+        return self._union()
+
+    def _union(self):
+        left = self._path()
+        while self._peek() == ('op', '|'):
+            self.index += 1
+            right = self._path()
+            left = (lambda a, b: lambda ctx: ctx.tree.sort(_nodes(a(ctx)) + _nodes(b(ctx))))(left, right)
+        return left
+
+    # 경로
+    def _path(self):
+        kind, token = self._peek()
+        if kind == 'op' and token in ('/', '//'):
+            self.index += 1
+            steps = [] if token == '/' else [('descendant-or-self', 'node', None, [])]
+            if token == '//' or self._starts_step():
+                steps += self._relative_steps()
+            return lambda ctx: _run_steps([ctx.tree.document], steps, ctx)
+
+        if self._starts_step():
+            steps = self._relative_steps()
+            return lambda ctx: _run_steps([ctx.node], steps, ctx)
+
+        # 필터 식: (식)[술어] / 경로
+        primary = self._primary()
+        predicates = self._predicates()
+        if predicates:
+            primary = (lambda p, preds: lambda ctx: _filter(ctx.tree.sort(_nodes(p(ctx))), preds, ctx))(primary, predicates)
+        if self._peek()[1] in ('/', '//') and self._peek()[0] == 'op':
+            token = self._peek()[1]
+            self.index += 1
+            steps = ([('descendant-or-self', 'node', None, [])] if token == '//' else []) + self._relative_steps()
+            return (lambda p, s: lambda ctx: _run_steps(_nodes(p(ctx)), s, ctx))(primary, steps)
+        return primary
+
+    def _starts_step(self) -> bool:
+        kind, token = self._peek()
+        if kind == 'op':
+            return token in ('.', '..', '@', '*')
+        if kind == 'name':
+            # 함수 호출이 아닌 이름 (노드 타입 테스트는 step)
+            next_token = self._peek(1)
+            return next_token != ('op', '(') or token in _NODE_TYPES
+        return False
+
+    def _relative_steps(self) -> list:
+        steps = [self._step()]
+        while self._peek()[1] in ('/', '//') and self._peek()[0] == 'op':
+            if self._peek()[1] == '//':
+                steps.append(('descendant-or-self', 'node', None, []))
+            self.index += 1
+            steps.append(self._step())
+        return steps
+
+    def _step(self):
+        if self._accept('.'):
+            return ('self', 'node', None, [])
+        if self._accept('..'):
+            return ('parent', 'node', None, [])
+
+        axis = 'child'
+        if self._accept('@'):
+            axis = 'attribute'
+        elif self._peek()[0] == 'name' and self._peek(1) == ('op', '::'):
+            axis = self._peek()[1]
+            if axis not in _AXES:
+                self._error()
+            self.index += 2
+
+        kind, token = self._peek()
+        if kind == 'op' and token == '*':
+            self.index += 1
+            test = ('name', None)
+        elif kind == 'name':
+            self.index += 1
+            if token in _NODE_TYPES and self._peek() == ('op', '('):
+                self.index += 1
+                self._expect(')')
+                test = (token, None)
+            else:
+                test = ('name', token)
+        else:
+            self._error()
+        return (axis, test[0], test[1], self._predicates())
+
+    def _predicates(self) -> list:
+        predicates = []
+        while self._accept('['):
+            predicates.append(self._or())
+            self._expect(']')
+        return predicates
+
+    def _primary(self):
+        kind, token = self._peek()
+        if kind == 'string':
+            self.index += 1
+            value = token[1:-1]
+            return lambda ctx: value
+        if kind == 'number':
+            self.index += 1
+            number = float(token)
+            return lambda ctx: number
+        if kind == 'op' and token == '(':
+            self.index += 1
+            expr = self._or()
+            self._expect(')')
+            return expr
+        if kind == 'name' and self._peek(1) == ('op', '('):
+            self.index += 2
+            args = []
+            if not self._accept(')'):
+                args.append(self._or())
+                while self._accept(','):
+                    args.append(self._or())
+                self._expect(')')
+            function = _XPATH_FUNCTIONS.get(token)
+            if function is None:
+                raise LocatorSyntaxError(f"지원하지 않는 XPath 함수입니다: {token}()")
+            return (lambda f, a: lambda ctx: f(ctx, *[arg(ctx) for arg in a]))(function, args)
+        self._error()
+
+
+class _Context:
+    __slots__ = ('tree', 'node', 'position', 'size', 'cost')
+
+    def __init__(self, tree: TreeInfo, node, position: int, size: int, cost: EvaluationCost):
+        self.tree = tree
+        self.node = node
+        self.position = position
+        self.size = size
+        self.cost = cost
+
+
+def _axis_nodes(tree: TreeInfo, node, axis: str, cost: EvaluationCost) -> list:
+    """축 방향의 노드 (역방향 축은 가까운 순서)"""
+    if isinstance(node, _Attribute):
+        # 속성 노드는 자식/형제가 없고 부모는 소유 요소
+        if axis == 'self' or axis == 'descendant-or-self':
+            return [node]
+        if axis == 'parent':
+            return [node.elem]
+        if axis in ('ancestor', 'ancestor-or-self'):
+            ancestors = _axis_nodes(tree, node.elem, 'ancestor-or-self', cost)
+            return [node] + ancestors if axis == 'ancestor-or-self' else ancestors
+        return []
+
+    if axis == 'child':
+        result = list(node)
+    elif axis == 'descendant':
+        result = tree.descendants(node, cost)
+    elif axis == 'descendant-or-self':
+        result = [node] + tree.descendants(node, cost)
+    elif axis == 'self':
+        result = [node]
+    elif axis == 'attribute':
+        items = node.attrib.items() if hasattr(node, 'attrib') else []
+        result = [_Attribute(node, name, value) for name, value in items]
+    elif axis in ('parent', 'ancestor', 'ancestor-or-self'):
+        result = [node] if axis == 'ancestor-or-self' else []
+        parent = tree.parents.get(node)
+        while parent is not None:
+            result.append(parent)
+            if axis == 'parent':
+                break
+            parent = tree.parents.get(parent)
+    elif axis in ('following-sibling', 'preceding-sibling'):
+        parent = tree.parents.get(node)
+        siblings = list(parent) if parent is not None else []
+        position = next(i for i, sibling in enumerate(siblings) if sibling is node) if siblings else 0
+        result = siblings[position + 1:] if axis == 'following-sibling' else list(reversed(siblings[:position]))
+    elif axis in ('following', 'preceding'):
+        order = tree.order.get(node, -1)
+        ancestors = set(map(id, _axis_nodes(tree, node, 'ancestor', cost)))
+        if axis == 'following':
+            descendants = set(map(id, tree.descendants(node, cost)))
+            result = [elem for elem in tree.elements[order + 1:] if id(elem) not in descendants]
+        else:
+            result = [elem for elem in reversed(tree.elements[:max(order, 0)]) if id(elem) not in ancestors]
+    else:
+        result = []
+
+    cost.visited += len(result)
+    return result
+
+
+def _matches_test(node, axis: str, test_kind: str, test_name: Optional[str]) -> bool:
+    if test_kind == 'node':
+        return True
+    if test_kind != 'name':
+        # text(), comment() 등 - 페이지 소스에는 텍스트 노드가 없음
+        return False
+    if axis == 'attribute':
+        return isinstance(node, _Attribute) and (test_name is None or node.name == test_name)
+    if isinstance(node, (_Attribute, _Document)):
+        return False
+    return test_name is None or node.tag == test_name
+
+
+def _filter(nodes: list, predicates: list, ctx: _Context) -> list:
+    for predicate in predicates:
+        size = len(nodes)
+        kept = []
+        for position, node in enumerate(nodes, 1):
+            value = predicate(_Context(ctx.tree, node, position, size, ctx.cost))
+            if isinstance(value, float):
+                if value == position:
+                    kept.append(node)
+            elif _boolean(value):
+                kept.append(node)
+        nodes = kept
+    return nodes
+
+
+def _run_steps(context_nodes: list, steps: list, ctx: _Context) -> list:
+    nodes = context_nodes
+    for axis, test_kind, test_name, predicates in steps:
+        result = []
+        for node in nodes:
+            candidates = [candidate for candidate in _axis_nodes(ctx.tree, node, axis, ctx.cost)
+                          if _matches_test(candidate, axis, test_kind, test_name)]
+            result.extend(_filter(candidates, predicates, ctx))
+        nodes = ctx.tree.sort(result) if len(nodes) > 1 or axis in _REVERSE_AXES else result
+    return nodes
+
+
+def _nodes(value) -> list:
+    if not isinstance(value, list):
+        raise LocatorSyntaxError("노드 집합이 필요한 위치에 다른 값이 사용되었습니다.")
+    return value
+
+
+def _string_value(node) -> str:
+    if isinstance(node, _Attribute):
+        return node.value
+    if isinstance(node, _Document):
+        return _string_value(node.root)
+    return ''.join(node.itertext())
+
+
+def _string(value) -> str:
+    if isinstance(value, list):
+        return _string_value(value[0]) if value else ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+def _number(value) -> float:
+    if isinstance(value, (bool, float)):
+        return float(value)
+    try:
+        return float(_string(value).strip())
+    except ValueError:
+        return float('nan')
+
+
+def _boolean(value) -> bool:
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, float):
+        return value != 0 and value == value
+    return bool(value)
+
+
+_COMPARATORS: Dict[str, Callable] = {
+    '=': lambda a, b: a == b, '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b, '>=': lambda a, b: a >= b,
+}
+
+
+def _compare(left, right, op: str) -> bool:
+    """XPath 1.0 비교 규칙 (노드 집합은 하나라도 만족하면 참)"""
+    compare = _COMPARATORS[op]
+    if isinstance(left, list) or isinstance(right, list):
+        left_values = [_string_value(node) for node in left] if isinstance(left, list) else [left]
+        right_values = [_string_value(node) for node in right] if isinstance(right, list) else [right]
+        return any(_compare(a, b, op) for a in left_values for b in right_values)
+    if op in ('=', '!='):
+        if isinstance(left, bool) or isinstance(right, bool):
+            return compare(_boolean(left), _boolean(right))
+        if isinstance(left, float) or isinstance(right, float):
+            return compare(_number(left), _number(right))
+        return compare(_string(left), _string(right))
+    return compare(_number(left), _number(right))
+
+
+_XPATH_FUNCTIONS: Dict[str, Callable] = {
+    'last': lambda ctx: float(ctx.size),
+    'position': lambda ctx: float(ctx.position),
+    'count': lambda ctx, nodes: float(len(_nodes(nodes))),
+    'not': lambda ctx, value: not _boolean(value),
+    'true': lambda ctx: True,
+    'false': lambda ctx: False,
+    'boolean': lambda ctx, value: _boolean(value),
+    'number': lambda ctx, value=None: _number([ctx.node] if value is None else value),
+    'string': lambda ctx, value=None: _string([ctx.node] if value is None else value),
+    'contains': lambda ctx, a, b: _string(b) in _string(a),
+    'starts-with': lambda ctx, a, b: _string(a).startswith(_string(b)),
+    'ends-with': lambda ctx, a, b: _string(a).endswith(_string(b)),
+    'string-length': lambda ctx, value=None: float(len(_string([ctx.node] if value is None else value))),
+    'normalize-space': lambda ctx, value=None: ' '.join(_string([ctx.node] if value is None else value).split()),
+    'concat': lambda ctx, *values: ''.join(_string(value) for value in values),
+    'translate': lambda ctx, value, source, target: _string(value).translate(
+        {ord(c): (_string(target)[i] if i < len(_string(target)) else None) for i, c in enumerate(_string(source))}),
+    'name': lambda ctx, nodes=None: _node_name(([ctx.node] if nodes is None else _nodes(nodes))),
+    'local-name': lambda ctx, nodes=None: _node_name(([ctx.node] if nodes is None else _nodes(nodes))),
+}
+
+
+def _node_name(nodes: list) -> str:
+    if not nodes:
+        return ''
+    node = nodes[0]
+    if isinstance(node, _Attribute):
+        return node.name
+    return '' if isinstance(node, _Document) else node.tag
+
+
+_xpath_cache: Dict[str, Callable] = {}
+
+
+def compile_xpath(expression: str) -> Callable:
+    """XPath 식을 평가 함수로 변환합니다. (같은 식은 캐시)"""
+    compiled = _xpath_cache.get(expression)
+    if compiled is None:
+        compiled = _xpath_cache[expression] = _XPathParser(expression).parse()
+    return compiled
+
+
+def evaluate_xpath(tree: TreeInfo, expression: str, cost: Optional[EvaluationCost] = None) -> list:
+    """
+    XPath 식에 일치하는 요소 (문서 순서)
+
+    Raises:
+        LocatorSyntaxError: 문법 오류 또는 노드 집합이 아닌 결과
+    """
+    cost = cost or EvaluationCost()
+    result = compile_xpath(expression)(_Context(tree, tree.document, 1, 1, cost))
+    if not isinstance(result, list):
+        raise LocatorSyntaxError(f"XPath 결과가 요소 집합이 아닙니다: {expression}")
+    return [node for node in result if not isinstance(node, (_Attribute, _Document))]
+
+
+# ----------------------------------------------------------------------
+# iOS Predicate String (NSPredicate)
+# ----------------------------------------------------------------------
+
+_PREDICATE_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<op>==|!=|<>|<=|>=|=<|=>|&&|\|\||[=<>!(){},]|\[[cdCD]+\])
+      | (?P<name>[A-Za-z_][\w.]*)
+    )""", re.VERBOSE)
+
+_STRING_OPERATORS = ('BEGINSWITH', 'ENDSWITH', 'CONTAINS', 'LIKE', 'MATCHES', 'IN')
+_LITERALS = {'TRUE': True, 'YES': True, 'FALSE': False, 'NO': False, 'NIL': None, 'NULL': None}
+
+
+def _unescape(text: str) -> str:
+    return re.sub(r'\\(.)', lambda m: {'n': '\n', 't': '\t'}.get(m.group(1), m.group(1)), text)
+
+
+class _PredicateParser:
+    """NSPredicate 문자열을 (요소 → bool) 함수로 변환하는 파서"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = []
+        position = 0
+        while position < len(expression):
+            if expression[position:].strip() == '':
+                break
+            match = _PREDICATE_TOKEN.match(expression, position)
+            if not match or match.end() == position:
+                raise LocatorSyntaxError(f"Predicate 문법 오류 (위치 {position}): {expression}")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.index = 0
+
+    def parse(self) -> Callable:
+        expr = self._or()
+        if self.index != len(self.tokens):
+            self._error()
+        return expr
+
+    def _error(self):
+        raise LocatorSyntaxError(f"Predicate 문법 오류: {self.expression}")
+
+    def _peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def _keyword(self, *words) -> Optional[str]:
+        kind, token = self._peek()
+        if kind == 'name' and token.upper() in words:
+            self.index += 1
+            return token.upper()
+        if kind == 'op' and token in words:
+            self.index += 1
+            return token
+        return None
+
+    def _or(self):
+        left = self._and()
+        while self._keyword('OR', '||'):
+            right = self._and()
+            left = (lambda a, b: lambda elem: a(elem) or b(elem))(left, right)
+        return left
+
+    def _and(self):
+        left = self._not()
+        while self._keyword('AND', '&&'):
+            right = self._not()
+            left = (lambda a, b: lambda elem: a(elem) and b(elem))(left, right)
+        return left
+
+    def _not(self):
+        if self._keyword('NOT', '!'):
+            operand = self._not()
+            return lambda elem: not operand(elem)
+        return self._primary()
+
+    def _primary(self):
+        if self._keyword('('):
+            expr = self._or()
+            if not self._keyword(')'):
+                self._error()
+            return expr
+        if self._keyword('TRUEPREDICATE'):
+            return lambda elem: True
+        if self._keyword('FALSEPREDICATE'):
+            return lambda elem: False
+        return self._comparison()
+
+    def _comparison(self):
+        kind, key_path = self._peek()
+        if kind != 'name':
+            self._error()
+        self.index += 1
+        attribute = _predicate_attribute(key_path)
+
+        kind, token = self._peek()
+        if kind == 'op' and token in ('==', '=', '!=', '<>', '<', '<=', '=<', '>', '>=', '=>'):
+            operator = {'=': '==', '<>': '!=', '=<': '<=', '=>': '>='}.get(token, token)
+            self.index += 1
+        elif kind == 'name' and token.upper() in _STRING_OPERATORS:
+            operator = token.upper()
+            self.index += 1
+        else:
+            self._error()
+
+        options = ''
+        if self._peek()[0] == 'op' and self._peek()[1].startswith('['):
+            options = self._peek()[1][1:-1].lower()
+            self.index += 1
+
+        value = self._value(allow_list=(operator == 'IN'))
+        return _make_comparison(attribute, operator, options, value)
+
+    def _value(self, allow_list: bool = False):
+        kind, token = self._peek()
+        if kind == 'string':
+            self.index += 1
+            return _unescape(token[1:-1])
+        if kind == 'number':
+            self.index += 1
+            return float(token)
+        if kind == 'name' and token.upper() in _LITERALS:
+            self.index += 1
+            return _LITERALS[token.upper()]
+        if allow_list and self._keyword('{'):
+            values = [self._value()]
+            while self._keyword(','):
+                values.append(self._value())
+            if not self._keyword('}'):
+                self._error()
+            return values
+        self._error()
+
+
+def _predicate_attribute(key_path: str) -> str:
+    """predicate 키 경로 → XML 속성 이름 (wdName → name, elementType → type)"""
+    if key_path.startswith('wd') and len(key_path) > 2 and key_path[2].isupper():
+        key_path = key_path[2].lower() + key_path[3:]
+    if key_path in ('elementType', 'className'):
+        return 'type'
+    if key_path.startswith('rect.'):
+        return key_path[5:]
+    return key_path
+
+
+def _fold(text: str, options: str) -> str:
+    if 'd' in options:
+        text = ''.join(c for c in unicodedata.normalize('NFD', text) if not unicodedata.combining(c))
+    if 'c' in options:
+        text = text.lower()
+    return text
+
+
+def _make_comparison(attribute: str, operator: str, options: str, value) -> Callable:
+    def compare(elem) -> bool:
+        actual = elem.get(attribute)
+        if value is None:
+            return (actual is None) == (operator == '==')
+        if actual is None:
+            actual = ''
+
+        if isinstance(value, bool) or (isinstance(value, float) and operator in ('==', '!=')
+                                       and actual.lower() in ('true', 'false')):
+            # 불리언 속성: true/false, 1/0, YES/NO
+            expected = bool(value)
+            result = (actual.lower() == 'true') == expected
+            return result if operator == '==' else (not result if operator == '!=' else False)
+
+        if isinstance(value, float):
+            try:
+                number = float(actual)
+            except ValueError:
+                return operator == '!='
+            return _COMPARATORS['=' if operator == '==' else operator](number, value)
+
+        if isinstance(value, list):
+            folded = _fold(actual, options)
+            return any(folded == _fold(str(item), options) for item in value)
+
+        left, right = _fold(actual, options), _fold(value, options)
+        if operator == '==':
+            return left == right
+        if operator == '!=':
+            return left != right
+        if operator == 'BEGINSWITH':
+            return left.startswith(right)
+        if operator == 'ENDSWITH':
+            return left.endswith(right)
+        if operator == 'CONTAINS':
+            return right in left
+        if operator == 'LIKE':
+            pattern = ''.join('.*' if c == '*' else '.' if c == '?' else re.escape(c) for c in right)
+            return re.fullmatch(pattern, left, re.DOTALL) is not None
+        if operator == 'MATCHES':
+            return re.fullmatch(right, left, re.DOTALL | (re.IGNORECASE if 'c' in options else 0)) is not None
+        if operator == 'IN':
+            return left in right
+        return _COMPARATORS[operator](left, right)
+
+    return compare
+
+
+_predicate_cache: Dict[str, Callable] = {}
+
+
+def compile_predicate(expression: str) -> Callable:
+    """NSPredicate 문자열을 (요소 → bool) 함수로 변환합니다. (같은 식은 캐시)"""
+    compiled = _predicate_cache.get(expression)
+    if compiled is None:
+        compiled = _predicate_cache[expression] = _PredicateParser(expression).parse()
+    return compiled
+
+
+def evaluate_predicate(tree: TreeInfo, expression: str, cost: Optional[EvaluationCost] = None) -> Optional[list]:
+    """
+    iOS Predicate에 일치하는 Application 하위 요소 (Application이 없으면 None)
+
+    Raises:
+        LocatorSyntaxError: 문법 오류
+    """
+    cost = cost or EvaluationCost()
+    predicate = compile_predicate(expression)
+    application = tree.application()
+    if application is None:
+        return None
+    return [elem for elem in tree.descendants(application, cost) if predicate(elem)]
+
+
+# ----------------------------------------------------------------------
+# iOS Class Chain
+# ----------------------------------------------------------------------
+
+def _parse_class_chain(chain: str) -> List[Tuple[bool, str, list]]:
+    """
+    class chain → [(자손 검색 여부, 타입, [필터...])]
+    필터: ('index', n) / ('predicate', 함수) / ('descendant', 함수)
+    """
+    segments = []
+    position = 0
+    descendant = False
+    length = len(chain)
+
+    while position < length:
+        if chain.startswith('**', position):
+            descendant = True
+            position += 2
+            if position >= length or chain[position] != '/':
+                raise LocatorSyntaxError(f"Class Chain 문법 오류 ('**' 뒤에는 '/'가 필요): {chain}")
+            position += 1
+            continue
+
+        match = re.compile(r'\*|[A-Za-z_]\w*').match(chain, position)
+        if not match:
+            raise LocatorSyntaxError(f"Class Chain 문법 오류 (위치 {position}): {chain}")
+        elem_type = match.group()
+        position = match.end()
+
+        filters = []
+        while position < length and chain[position] == '[':
+            position += 1
+            if position < length and chain[position] in '`$':
+                quote = chain[position]
+                end = chain.find(quote, position + 1)
+                if end < 0 or end + 1 >= length or chain[end + 1] != ']':
+                    raise LocatorSyntaxError(f"Class Chain 문법 오류 (닫히지 않은 {quote}): {chain}")
+                predicate = compile_predicate(chain[position + 1:end])
+                filters.append(('predicate' if quote == '`' else 'descendant', predicate))
+                position = end + 2
+            else:
+                end = chain.find(']', position)
+                try:
+                    index = int(chain[position:end]) if end > 0 else 0
+                except ValueError:
+                    index = 0
+                if index == 0:
+                    raise LocatorSyntaxError(f"Class Chain 문법 오류 (인덱스는 1부터 또는 음수): {chain}")
+                filters.append(('index', index))
+                position = end + 1
+
+        segments.append((descendant, elem_type, filters))
+        descendant = False
+
+        if position < length:
+            if chain[position] != '/':
+                raise LocatorSyntaxError(f"Class Chain 문법 오류 (위치 {position}): {chain}")
+            position += 1
+            if position == length:
+                raise LocatorSyntaxError(f"Class Chain 문법 오류 (끝이 '/'): {chain}")
+
+    if descendant or not segments:
+        raise LocatorSyntaxError(f"Class Chain 문법 오류: {chain}")
+    return segments
+
+
+_class_chain_cache: Dict[str, list] = {}
+
+
+def evaluate_class_chain(tree: TreeInfo, chain: str, cost: Optional[EvaluationCost] = None) -> Optional[list]:
+    """
+    iOS Class Chain에 일치하는 요소 (Application 기준, Application이 없으면 None)
+    각 구간은 앞 구간 결과 요소마다 자식(** 뒤는 자손) 중 타입/술어가 맞는 요소를 고른 뒤 인덱스를 적용합니다.
+
+    Raises:
+        LocatorSyntaxError: 문법 오류
+    """
+    cost = cost or EvaluationCost()
+    segments = _class_chain_cache.get(chain)
+    if segments is None:
+        segments = _class_chain_cache[chain] = _parse_class_chain(chain)
+
+    application = tree.application()
+    if application is None:
+        return None
+
+    nodes = [application]
+    for descendant, elem_type, filters in segments:
+        result = []
+        for node in nodes:
+            if descendant:
+                candidates = tree.descendants(node, cost)
+            else:
+                candidates = list(node)
+                cost.visited += len(candidates)
+            if elem_type not in ANY_TYPES:
+                candidates = [elem for elem in candidates if _element_type(elem) == elem_type]
+
+            for kind, argument in filters:
+                if kind == 'index':
+                    position = argument - 1 if argument > 0 else len(candidates) + argument
+                    candidates = [candidates[position]] if 0 <= position < len(candidates) else []
+                elif kind == 'predicate':
+                    candidates = [elem for elem in candidates if argument(elem)]
+                else:
+                    candidates = [elem for elem in candidates
+                                  if any(argument(child) for child in tree.descendants(elem, cost))]
+            result.extend(candidates)
+        nodes = tree.sort(result) if len(nodes) > 1 else result
+    return nodes
+
+
+# ----------------------------------------------------------------------
+# locator 평가 / 추천
+# ----------------------------------------------------------------------
+
+def parse_locator_code(code: str) -> Tuple[str, str]:
+    """
+    ElementFinder가 생성한 locator 코드 문자열을 (By, value) 튜플로 변환합니다.
+    예: '(AppiumBy.XPATH, "//*[@name=\\"로그인\\"]")' → ('xpath', '//*[@name="로그인"]')
+
+    Raises:
+        LocatorSyntaxError: 형식이 맞지 않는 경우
+    """
+    match = re.fullmatch(r'\(AppiumBy\.(\w+), "(.*)"\)', code, re.DOTALL)
+    if not match or match.group(1) not in APPIUM_BY_NAMES:
+        raise LocatorSyntaxError(f"locator 코드 형식이 아닙니다: {code}")
+    return APPIUM_BY_NAMES[match.group(1)], _unescape(match.group(2))
+
+
+class LocatorEvaluator:
+    """ElementFinder(스냅샷)에서 locator를 평가하고 비용을 측정합니다."""
+
+    def __init__(self, finder, repeat: int = 3):
+        """
+        Args:
+            finder: 평가 대상 화면의 ElementFinder
+            repeat: 소요 시간 측정 반복 횟수 (가장 짧은 시간을 사용)
+        """
+        self.finder = finder
+        self.repeat = repeat
+
+    def evaluate(self, locator) -> Dict:
+        """
+        locator 하나를 평가합니다.
+
+        Args:
+            locator: (By, value) 튜플 또는 ElementFinder가 생성한 locator 코드 문자열
+
+        Returns:
+            {"locator": (By, value), "count": 일치 수 (평가 불가면 None), "elapsed_ms": 소요 시간,
+             "visited": 방문한 요소 수, "error": 오류 메시지 또는 None}
+        """
+        try:
+            if isinstance(locator, str):
+                locator = parse_locator_code(locator)
+            locator = tuple(locator)
+        except LocatorSyntaxError as e:
+            return {"locator": locator, "count": None, "elapsed_ms": None, "visited": 0, "error": str(e)}
+
+        best = None
+        elements = None
+        cost = EvaluationCost()
+        for _ in range(max(1, self.repeat)):
+            cost = EvaluationCost()
+            start_time = time.perf_counter()
+            try:
+                elements = self.finder.query_locator(locator, cost=cost, strict=True)
+            except LocatorSyntaxError as e:
+                return {"locator": locator, "count": None, "elapsed_ms": None, "visited": 0, "error": str(e)}
+            elapsed = time.perf_counter() - start_time
+            best = elapsed if best is None else min(best, elapsed)
+
+        return {
+            "locator": locator,
+            "count": None if elements is None else len(elements),
+            "elapsed_ms": best * 1000,
+            "visited": cost.visited,
+            "error": None if elements is not None else f"지원하지 않는 locator 전략입니다: {locator[0]}",
+        }
+
+    def rank(self, locators: Dict[str, object], by: str = "elapsed_ms") -> List[Dict]:
+        """
+        locator 후보를 측정값으로 정렬합니다.
+        순위: 유일하게 일치(1개) > 여러 개 일치 > 일치 없음/평가 불가, 같은 그룹 안에서는 by 값이 작은 순
+
+        Args:
+            locators: {"이름": locator 코드 문자열 또는 (By, value)} (None 값은 건너뜀)
+            by: 그룹 안의 정렬 기준 ("elapsed_ms": 소요 시간, "visited": 방문한 요소 수 - 실행마다 같은 결과,
+                값이 같으면 locators 순서 유지)
+
+        Returns:
+            평가 결과 리스트 (각 결과에 "name" 키 추가)
+        """
+        results = []
+        for name, locator in locators.items():
+            if not locator or name == 'recommended':
+                continue
+            result = self.evaluate(locator)
+            result["name"] = name
+            results.append(result)
+
+        def sort_key(result):
+            count = result["count"]
+            group = 0 if count == 1 else 1 if count else 2
+            return (group, result[by] if result["count"] is not None else float('inf'))
+
+        return sorted(results, key=sort_key)
+
+    def recommend(self, locators: Dict[str, object]) -> Optional[str]:
+        """측정 결과가 가장 좋은 locator 이름 (일치하는 후보가 없으면 None)"""
+        ranked = self.rank(locators)
+        if ranked and ranked[0]["count"]:
+            return ranked[0]["name"]
+        return None
+
+
+def validate_page_locators(snapshot_files: List[str], locators: Optional[Dict[str, Tuple[str, str]]] = None) -> Dict[str, Dict]:
+    """
+    Page Object locator를 스냅샷 파일 전체에서 평가합니다.
+
+    Args:
+        snapshot_files: 스냅샷(.json / .snapshot.json) 또는 페이지 소스(.xml) 파일 리스트
+        locators: {"이름": (By, value)} (기본값: HomePage, LoginPage, MyPage 상수)
+
+    Returns:
+        {"이름": {"locator": (By, value), "error": 오류 또는 None, "screens": {화면: 평가 결과}}}
+    """
+    from utils.snapshot_diff import Screen, collect_page_locators
+
+    if locators is None:
+        locators = collect_page_locators()
+
+    evaluators = {}
+    for path in snapshot_files:
+        evaluators[Path(path).name] = LocatorEvaluator(Screen.load(str(path)).finder)
+
+    report = {}
+    for name, locator in locators.items():
+        screens = {screen: evaluator.evaluate(locator) for screen, evaluator in evaluators.items()}
+        errors = {result["error"] for result in screens.values() if result["error"]}
+        report[name] = {"locator": locator, "error": next(iter(errors), None), "screens": screens}
+    return report
+
+
+def main():
+    """메인 함수 - Page Object locator 검증 CLI"""
+    from utils.locator_index import ELEMENTS_DIR, snapshot_files_in
+
+    snapshot_files = sys.argv[1:] or [str(path) for path in snapshot_files_in(ELEMENTS_DIR)]
+    if not snapshot_files:
+        print("❌ 검증에 사용할 스냅샷 파일이 없습니다.")
+        sys.exit(1)
+
+    report = validate_page_locators(snapshot_files)
+
+    print(f"\n{'='*100}")
+    print(f"Page Object locator 검증 (스냅샷 {len(snapshot_files)}개)")
+    print('='*100)
+    print(f"{'Locator':<40} {'상태':<10} {'일치 화면':<36} {'평균(ms)':>8}")
+    print("-" * 100)
+
+    errors = []
+    not_found = []
+    for name, result in report.items():
+        if result["error"]:
+            errors.append(name)
+            print(f"{name:<40} {'오류':<10} {result['error'][:60]}")
+            continue
+
+        matched = {screen: item["count"] for screen, item in result["screens"].items() if item["count"]}
+        timings = [item["elapsed_ms"] for item in result["screens"].values() if item["elapsed_ms"] is not None]
+        average = sum(timings) / len(timings) if timings else 0.0
+        if not matched:
+            not_found.append(name)
+            status = "없음"
+        elif any(count > 1 for count in matched.values()):
+            status = "중복"
+        else:
+            status = "유일"
+        matched_text = ", ".join(f"{screen.split('.')[0]}({count})" for screen, count in matched.items()) or "-"
+        print(f"{name:<40} {status:<10} {matched_text[:36]:<36} {average:>8.3f}")
+
+    print("-" * 100)
+    if not_found:
+        print(f"ℹ️  스냅샷에서 찾지 못한 locator {len(not_found)}개 (해당 화면의 스냅샷이 없을 수 있음)")
+    if errors:
+        print(f"❌ 문법 오류 / 평가 불가 locator {len(errors)}개: {', '.join(errors)}")
+        sys.exit(1)
+    print("✅ 모든 locator의 문법이 올바릅니다.")
+
+
+if __name__ == "__main__":
+    # 스크립트로 실행하면 이 파일이 __main__ 모듈이 되므로, element_finder가 사용하는
+    # utils.locator_evaluator 모듈의 main을 호출해 예외 클래스를 하나로 맞춤
+    from utils.locator_evaluator import main as _main
+    _main()
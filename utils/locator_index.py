@@ -0,0 +1,244 @@
+"""
+elements/*.json 전체를 검색하는 locator 인덱스 (SQLite)
+
+화면 스냅샷 파일들을 SQLite 파일 하나에 색인해두고, 모든 화면을 한 번에 검색합니다.
+    - 수정 시간(mtime)/크기가 바뀐 파일만 다시 색인 (삭제된 파일은 인덱스에서 제거)
+    - SQLite FTS5 trigram 토크나이저로 부분 문자열 검색 (지원하지 않는 SQLite면 LIKE 검색)
+    - 결과 순위: 정확히 일치 > 앞부분 일치 > 포함, 보이는 요소 / Accessibility ID가 있는 요소 우선
+
+같은 화면의 기존 JSON(student_home.json)과 컬럼형 스냅샷(student_home.snapshot.json)이
+함께 있으면 컬럼형 스냅샷만 색인합니다.
+
+사용 예시:
+    index = LocatorIndex()
+    index.update()
+    for hit in index.search("수강신청"):
+        print(hit['screen'], hit['element']['locators']['recommended'])
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.snapshot_store import SNAPSHOT_SUFFIX, SnapshotStore, is_snapshot_data
+
+
+project_root = Path(__file__).parent.parent
+ELEMENTS_DIR = project_root / 'elements'
+DEFAULT_INDEX_PATH = ELEMENTS_DIR / '.locator_index.sqlite'
+
+# trigram 토크나이저는 3글자 이상 검색어에만 사용할 수 있음
+TRIGRAM_MIN_LENGTH = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    screen TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    element_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    label TEXT NOT NULL,
+    value TEXT NOT NULL,
+    visible TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS elements_path ON elements (path);
+CREATE INDEX IF NOT EXISTS elements_type ON elements (type);
+"""
+
+
+def screen_name(path: Path) -> str:
+    """파일 경로 → 화면 이름 (student_home.snapshot.json → student_home)"""
+    name = path.name
+    if name.endswith(SNAPSHOT_SUFFIX):
+        return name[:-len(SNAPSHOT_SUFFIX)]
+    return path.stem
+
+
+def snapshot_files_in(directory: Path) -> List[Path]:
+    """폴더의 화면 스냅샷 파일 (같은 화면의 기존 JSON과 컬럼형 스냅샷이 있으면 컬럼형 스냅샷)"""
+    files = {}
+    for path in sorted(Path(directory).glob('*.json')):
+        screen = screen_name(path)
+        if screen not in files or path.name.endswith(SNAPSHOT_SUFFIX):
+            files[screen] = path
+    return [files[screen] for screen in sorted(files)]
+
+
+def load_element_dicts(json_file: Path) -> List[Dict]:
+    """기존 JSON 또는 컬럼형 스냅샷 파일의 요소를 딕셔너리 리스트로 읽습니다."""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if is_snapshot_data(data):
+        store = SnapshotStore.from_data(data)
+        return [store.to_dict(index) for index in range(len(store))]
+    return data
+
+
+class LocatorIndex:
+    """elements/ 폴더의 모든 화면 스냅샷을 색인하는 SQLite 인덱스"""
+
+    def __init__(self, index_path: Path = DEFAULT_INDEX_PATH, elements_dir: Path = ELEMENTS_DIR):
+        """
+        Args:
+            index_path: 인덱스 SQLite 파일 경로
+            elements_dir: 스냅샷 JSON 파일이 있는 폴더
+        """
+        self.index_path = Path(index_path)
+        self.elements_dir = Path(elements_dir)
+        self.conn = sqlite3.connect(str(self.index_path))
+        self.conn.executescript(SCHEMA)
+        self.use_fts = self._create_fts_table()
+
+    def _create_fts_table(self) -> bool:
+        """FTS5 trigram 테이블 생성 (지원하지 않으면 False → LIKE 검색)"""
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS elements_fts "
+                "USING fts5(name, label, value, tokenize='trigram')"
+            )
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def snapshot_files(self) -> List[Path]:
+        """색인 대상 파일 (같은 화면은 컬럼형 스냅샷을 우선)"""
+        return snapshot_files_in(self.elements_dir)
+
+    def update(self) -> Dict[str, int]:
+        """
+        수정된 파일만 다시 색인합니다.
+
+        Returns:
+            {"indexed": 다시 색인한 파일 수, "removed": 제거한 파일 수, "unchanged": 그대로인 파일 수}
+        """
+        result = {"indexed": 0, "removed": 0, "unchanged": 0}
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.conn.execute("SELECT path, mtime_ns, size FROM files")
+        }
+
+        current = set()
+        with self.conn:
+            for path in self.snapshot_files():
+                key = str(path.resolve())
+                current.add(key)
+                stat = path.stat()
+                if indexed.get(key) == (stat.st_mtime_ns, stat.st_size):
+                    result["unchanged"] += 1
+                    continue
+                self._remove_file(key)
+                self._index_file(key, path, stat)
+                result["indexed"] += 1
+
+            for key in set(indexed) - current:
+                self._remove_file(key)
+                result["removed"] += 1
+
+        return result
+
+    def _index_file(self, key: str, path: Path, stat):
+        elements = load_element_dicts(path)
+        for position, element in enumerate(elements):
+            cursor = self.conn.execute(
+                "INSERT INTO elements (path, position, type, name, label, value, visible, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, position, element.get('type', ''), element.get('name', ''), element.get('label', ''),
+                 element.get('value', ''), element.get('visible', ''), json.dumps(element, ensure_ascii=False))
+            )
+            if self.use_fts:
+                self.conn.execute(
+                    "INSERT INTO elements_fts (rowid, name, label, value) VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid, element.get('name', ''), element.get('label', ''), element.get('value', ''))
+                )
+        self.conn.execute(
+            "INSERT INTO files (path, screen, mtime_ns, size, element_count) VALUES (?, ?, ?, ?, ?)",
+            (key, screen_name(path), stat.st_mtime_ns, stat.st_size, len(elements))
+        )
+
+    def _remove_file(self, key: str):
+        if self.use_fts:
+            self.conn.execute("DELETE FROM elements_fts WHERE rowid IN (SELECT id FROM elements WHERE path = ?)", (key,))
+        self.conn.execute("DELETE FROM elements WHERE path = ?", (key,))
+        self.conn.execute("DELETE FROM files WHERE path = ?", (key,))
+
+    def search(self, search_term: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        모든 화면에서 name/label/value에 검색어가 포함된 요소를 순위대로 찾습니다. (대소문자 구분 없음)
+
+        Args:
+            search_term: 검색할 텍스트
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            [{"screen": 화면 이름, "path": 파일 경로, "position": 요소 번호, "element": 요소 딕셔너리}, ...]
+        """
+        term = search_term.lower()
+        # 순위: 정확히 일치(0) > 앞부분 일치(1) > 포함(2), 보이는 요소, Accessibility ID가 있는 요소 우선
+        rank = (
+            "CASE WHEN lower(e.name) = :term OR lower(e.label) = :term OR lower(e.value) = :term THEN 0 "
+            "WHEN lower(e.name) LIKE :prefix ESCAPE '\\' OR lower(e.label) LIKE :prefix ESCAPE '\\' THEN 1 "
+            "ELSE 2 END, e.visible = 'true' DESC, e.name != '' DESC"
+        )
+        like = '%' + _escape_like(term) + '%'
+        params = {"term": term, "prefix": _escape_like(term) + '%', "like": like}
+
+        if self.use_fts and len(term) >= TRIGRAM_MIN_LENGTH:
+            # trigram 검색은 대소문자를 구분하지 않는 부분 문자열 검색
+            params["match"] = '"' + search_term.replace('"', '""') + '"'
+            query = (
+                "SELECT f.screen, e.path, e.position, e.data FROM elements_fts "
+                "JOIN elements e ON e.id = elements_fts.rowid JOIN files f ON f.path = e.path "
+                f"WHERE elements_fts MATCH :match ORDER BY {rank}, bm25(elements_fts), f.screen, e.position"
+            )
+        else:
+            query = (
+                "SELECT f.screen, e.path, e.position, e.data FROM elements e JOIN files f ON f.path = e.path "
+                "WHERE lower(e.name) LIKE :like ESCAPE '\\' OR lower(e.label) LIKE :like ESCAPE '\\' "
+                "OR lower(e.value) LIKE :like ESCAPE '\\' "
+                f"ORDER BY {rank}, f.screen, e.position"
+            )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        return [self._hit(row) for row in self.conn.execute(query, params)]
+
+    def search_by_type(self, element_type: str, limit: Optional[int] = None) -> List[Dict]:
+        """모든 화면에서 요소 타입으로 검색 (보이는 요소, Accessibility ID가 있는 요소 우선)"""
+        query = (
+            "SELECT f.screen, e.path, e.position, e.data FROM elements e JOIN files f ON f.path = e.path "
+            "WHERE e.type = ? ORDER BY e.visible = 'true' DESC, e.name != '' DESC, f.screen, e.position"
+        )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [self._hit(row) for row in self.conn.execute(query, (element_type,))]
+
+    def get_screens(self) -> Dict[str, int]:
+        """색인된 화면별 요소 수"""
+        return dict(self.conn.execute("SELECT screen, element_count FROM files ORDER BY screen"))
+
+    @staticmethod
+    def _hit(row) -> Dict:
+        screen, path, position, data = row
+        return {"screen": screen, "path": path, "position": position, "element": json.loads(data)}
+
+
+def _escape_like(text: str) -> str:
+    """LIKE 패턴 특수 문자 이스케이프"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
@@ -0,0 +1,283 @@
+"""
+locator 조회 성능 프로파일러
+
+pytest --profile-locators 로 실행하면 BasePage.find_element의 모든 조회를 측정합니다.
+    - 조회 지연 시간: 요소를 찾은 폴링 1회(find_element + is_displayed 왕복)에 걸린 시간
+    - 대기 시간: 요소가 보일 때까지 기다린 전체 시간
+    - 플랫폼 / 디바이스별로 따로 집계 (같은 locator라도 iOS/Android, 기기마다 속도가 다름)
+
+locator마다 처음 찾았을 때 한 번 page_source를 받아 ElementFinder가 만드는 다른 locator 후보를 만들고,
+오프라인 평가(utils/locator_evaluator.py)로 같은 요소 하나만 가리키는 후보를 고른 뒤
+실제 디바이스에서 find_elements 시간을 측정해 더 빠른 locator를 추천합니다.
+
+사용 예시:
+    pytest --profile-locators
+    # → 느린 locator 순위 출력 + reports/locator_profile.json 저장
+"""
+import json
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.smart_wait import SmartWait, locator_label
+from utils.stats import percentile
+
+
+# 후보 locator 실측 반복 횟수 (가장 짧은 시간을 사용)
+PROFILE_REPEAT = 3
+# 이 배수 이상 빨라야 추천 (측정 오차로 인한 추천 방지)
+SUGGEST_MIN_SPEEDUP = 1.5
+# 플랫폼별로 사용할 수 없는 전략
+PLATFORM_UNSUPPORTED = {
+    'android': ('-ios class chain', '-ios predicate string'),
+    'ios': (),
+}
+
+
+class _TimedCondition:
+    """조건 함수 호출 시간을 기록하는 래퍼 (마지막 호출 = 요소를 찾은 폴링)"""
+
+    def __init__(self, condition):
+        self.condition = condition
+        self.last_elapsed = 0.0
+
+    def __call__(self, driver):
+        start_time = time.perf_counter()
+        try:
+            return self.condition(driver)
+        finally:
+            self.last_elapsed = time.perf_counter() - start_time
+
+
+class LocatorProfiler:
+    """locator별 조회 지연 시간 수집기 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self._entries: Dict[Tuple[str, str, str], dict] = {}
+        self._device_names: Dict[str, str] = {}
+
+    def register_driver(self, driver, device_name: str):
+        """드라이버 세션을 devices.json 디바이스 이름과 연결합니다 (리포트 표시용)."""
+        with self._lock:
+            self._device_names[driver.session_id] = device_name
+
+    def _platform_and_device(self, driver) -> Tuple[str, str]:
+        caps = driver.capabilities or {}
+        platform = str(caps.get('platformName', 'unknown')).lower()
+        device = (self._device_names.get(driver.session_id) or caps.get('deviceName')
+                  or caps.get('appium:deviceName') or caps.get('udid') or 'unknown')
+        return platform, device
+
+    def _entry(self, locator, platform: str, device: str) -> dict:
+        key = (locator_label(locator), platform, device)
+        if key not in self._entries:
+            self._entries[key] = {
+                "locator": list(locator), "label": key[0], "platform": platform, "device": device,
+                "lookups": [], "waits": [], "failures": 0, "alternatives": None,
+            }
+        return self._entries[key]
+
+    def find_element(self, driver, condition, locator, timeout: float):
+        """
+        SmartWait로 요소를 기다리면서 조회 시간을 기록합니다. (BasePage.find_element에서 사용)
+
+        Args:
+            driver: Appium WebDriver
+            condition: 조건 함수 (예: EC.visibility_of_element_located(locator))
+            locator: (By, value) 튜플
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            조건 함수의 반환값 (찾은 요소)
+        """
+        platform, device = self._platform_and_device(driver)
+        timed = _TimedCondition(condition)
+        start_time = time.perf_counter()
+        try:
+            element = SmartWait(driver, timeout).until(timed, label=locator_label(locator))
+        except Exception:
+            with self._lock:
+                self._entry(locator, platform, device)["failures"] += 1
+            raise
+
+        with self._lock:
+            entry = self._entry(locator, platform, device)
+            entry["lookups"].append(timed.last_elapsed * 1000)
+            entry["waits"].append(time.perf_counter() - start_time)
+            need_alternatives = entry["alternatives"] is None
+            if need_alternatives:
+                entry["alternatives"] = []  # 다른 스레드가 중복 측정하지 않도록 먼저 표시
+
+        if need_alternatives:
+            alternatives = measure_alternatives(driver, locator, platform)
+            with self._lock:
+                self._entry(locator, platform, device)["alternatives"] = alternatives
+        return element
+
+    def merge(self, entries: List[dict]):
+        """다른 프로세스(xdist 워커)에서 수집한 결과를 합칩니다."""
+        with self._lock:
+            for incoming in entries:
+                entry = self._entry(tuple(incoming["locator"]), incoming["platform"], incoming["device"])
+                entry["lookups"].extend(incoming["lookups"])
+                entry["waits"].extend(incoming["waits"])
+                entry["failures"] += incoming["failures"]
+                if not entry["alternatives"] and incoming["alternatives"]:
+                    entry["alternatives"] = incoming["alternatives"]
+
+    def as_list(self) -> List[dict]:
+        """수집한 결과 사본 (xdist workeroutput 전달용)"""
+        with self._lock:
+            return json.loads(json.dumps(list(self._entries.values())))
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self._device_names.clear()
+
+    def report(self) -> List[dict]:
+        """
+        느린 locator 순위 (조회 지연 시간 중앙값이 긴 순서)
+
+        Returns:
+            [{"label", "platform", "device", "count", "failures", "median_ms", "p95_ms",
+              "total_wait", "suggestion": 추천 후보 또는 None}, ...]
+        """
+        rows = []
+        for entry in self.as_list():
+            lookups = entry["lookups"]
+            row = {
+                "label": entry["label"],
+                "platform": entry["platform"],
+                "device": entry["device"],
+                "count": len(lookups),
+                "failures": entry["failures"],
+                "median_ms": statistics.median(lookups) if lookups else None,
+                "p95_ms": percentile(lookups, 95) if lookups else None,
+                "total_wait": sum(entry["waits"]),
+                "alternatives": entry["alternatives"] or [],
+                "suggestion": _suggest(entry["alternatives"] or []),
+            }
+            rows.append(row)
+        rows.sort(key=lambda row: row["median_ms"] if row["median_ms"] is not None else -1.0, reverse=True)
+        return rows
+
+    def print_report(self, max_rows: int = 15):
+        """느린 locator 순위와 추천 locator를 출력합니다."""
+        rows = self.report()
+        if not rows:
+            return
+
+        print(f"\n🐢 느린 locator 순위 (조회 지연 시간 중앙값 순, 상위 {max_rows}개)")
+        print(f"{'Locator':<58} {'플랫폼':<8} {'디바이스':<24} {'횟수':>5} {'실패':>4} "
+              f"{'중앙값(ms)':>10} {'p95(ms)':>9}")
+        print("-" * 126)
+        for row in rows[:max_rows]:
+            label = row["label"] if len(row["label"]) <= 56 else row["label"][:53] + "..."
+            median = f"{row['median_ms']:.1f}" if row["median_ms"] is not None else "-"
+            p95 = f"{row['p95_ms']:.1f}" if row["p95_ms"] is not None else "-"
+            print(f"{label:<58} {row['platform']:<8} {row['device'][:24]:<24} {row['count']:>5} "
+                  f"{row['failures']:>4} {median:>10} {p95:>9}")
+            suggestion = row["suggestion"]
+            if suggestion:
+                print(f"    💡 추천: {suggestion['code']} "
+                      f"({suggestion['baseline_ms']:.1f}ms → {suggestion['lookup_ms']:.1f}ms, "
+                      f"{suggestion['speedup']:.1f}배 빠름)")
+
+    def save(self, output_file: str):
+        """순위와 측정 결과를 JSON으로 저장합니다."""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+
+def measure_alternatives(driver, locator, platform: str, repeat: int = PROFILE_REPEAT) -> List[dict]:
+    """
+    현재 화면에서 locator가 가리키는 요소의 다른 locator 후보를 실측합니다.
+
+    page_source를 한 번 받아 ElementFinder로 후보를 만들고, 오프라인 평가에서
+    요소 하나만 일치하는 후보만 디바이스에서 find_elements 시간을 잽니다.
+    원래 locator도 같은 방식으로 재서 비교 기준(baseline_ms)으로 사용합니다.
+
+    Args:
+        driver: Appium WebDriver
+        locator: 원래 locator (By, value)
+        platform: 플랫폼 이름 (소문자)
+        repeat: 실측 반복 횟수 (가장 짧은 시간을 사용)
+
+    Returns:
+        [{"name", "code", "locator", "lookup_ms", "matches", "baseline_ms"}, ...] (빠른 순)
+    """
+    from utils.element_finder import ElementFinder
+    from utils.locator_evaluator import LocatorEvaluator
+
+    try:
+        finder = ElementFinder(driver.page_source)
+        elements = finder.query_locator(tuple(locator))
+    except Exception as e:
+        print(f"[PROFILE] 후보 locator 생성 실패 ({locator_label(locator)}): {e}")
+        return []
+    if not elements:
+        return []
+
+    unsupported = PLATFORM_UNSUPPORTED.get(platform, ())
+    codes = finder.get_locators(elements[0])
+    candidates = []
+    for result in LocatorEvaluator(finder, repeat=1).rank(codes):
+        if result["count"] != 1 or result["locator"][0] in unsupported or result["locator"] == tuple(locator):
+            continue
+        candidates.append(result)
+
+    if not candidates:
+        return []
+
+    baseline_ms, _ = _measure_live(driver, tuple(locator), repeat)
+    if baseline_ms is None:
+        return []
+    alternatives = []
+    for result in candidates:
+        lookup_ms, matches = _measure_live(driver, result["locator"], repeat)
+        if not matches:
+            continue
+        alternatives.append({
+            "name": result["name"],
+            "code": codes[result["name"]],
+            "locator": list(result["locator"]),
+            "lookup_ms": lookup_ms,
+            "matches": matches,
+            "baseline_ms": baseline_ms,
+        })
+    return sorted(alternatives, key=lambda alternative: alternative["lookup_ms"])
+
+
+def _measure_live(driver, locator, repeat: int) -> Tuple[Optional[float], int]:
+    """find_elements 1회 왕복 시간 (ms, 최솟값, 실패하면 None)과 일치 요소 수"""
+    best = None
+    matches = 0
+    for _ in range(max(1, repeat)):
+        start_time = time.perf_counter()
+        try:
+            matches = len(driver.find_elements(*locator))
+        except Exception:
+            return None, 0
+        elapsed = (time.perf_counter() - start_time) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, matches
+
+
+def _suggest(alternatives: List[dict]) -> Optional[dict]:
+    """원래 locator보다 SUGGEST_MIN_SPEEDUP배 이상 빠른 후보 중 가장 빠른 후보"""
+    for alternative in alternatives:
+        if alternative["matches"] != 1 or not alternative["lookup_ms"]:
+            continue
+        speedup = alternative["baseline_ms"] / alternative["lookup_ms"]
+        if speedup >= SUGGEST_MIN_SPEEDUP:
+            return {**alternative, "speedup": speedup}
+        return None
+    return None
+
+
+# 프로세스 전체에서 공유하는 프로파일러 (pytest --profile-locators 로 활성화)
+locator_profiler = LocatorProfiler()
@@ -0,0 +1,218 @@
+"""
+로그인 상태 캐시
+
+거의 모든 테스트가 LoginPage.login으로 이메일 / 비밀번호를 입력(요소마다 클릭, 지우기, 입력)한 뒤에야 홈에 도착합니다.
+디바이스 + 계정마다 실제 UI 로그인은 한 번만 하고, 그 직후 로그인된 앱 상태를 저장해 두었다가
+이후 테스트에서 로그인 화면이 나오면 저장한 상태를 복원해 입력 과정을 건너뜁니다.
+
+    - 복원 방식은 교체 가능 (LoginStateRestorer): 기본은 Android 앱 데이터(shared_prefs) 스냅샷 / 복원
+      딥링크나 토큰 주입이 가능한 빌드라면 login_state.register_restorer()로 추가
+    - iOS에는 기본 복원 방식이 없어 저장 / 복원 단계가 동작하지 않음 (복원 방식을 추가하기 전까지는
+      같은 계정으로 로그인된 앱을 그대로 쓰는 경우 외에는 매번 실제 UI 로그인)
+    - 복원 후에도 로그인 화면이 보이면 스냅샷을 버리고 실제 로그인으로 진행 (토큰 만료 등)
+    - 디바이스가 어떤 계정으로 로그인되어 있는지 기록해, 계정 풀이 다른 계정을 빌려줬을 때 그 계정의 상태로 복원
+    - @pytest.mark.real_login 테스트는 캐시를 사용하지 않고 로그아웃 상태에서 실제 UI 로그인을 수행
+      (앱 데이터를 지울 수 없는 iOS 실기기는 마이페이지에서 로그아웃, 로그아웃하지 못하면 테스트 실패)
+    - 상태는 프로세스(xdist 워커) 메모리에만 보관 (인증 토큰을 디스크에 남기지 않음)
+
+사용 예시 (프로젝트 전용 복원 방식 추가):
+    class DeepLinkRestorer(LoginStateRestorer):
+        name = "deeplink"
+        def supports(self, driver): return True
+        def capture(self, driver, app_id): return issue_token_for_test()
+        def restore(self, driver, app_id, state):
+            driver.execute_script("mobile: deepLink", {"url": f"seoltab://login?token={state}", "package": app_id})
+            return True
+
+    login_state.register_restorer(DeepLinkRestorer(), first=True)
+"""
+import base64
+import io
+import threading
+import time
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+from utils.driver_pool import get_app_id
+
+
+class LoginStateRestorer:
+    """로그인 상태 저장 / 복원 방식 (플랫폼이나 빌드에 맞게 상속해서 구현)"""
+
+    name = "base"
+
+    def supports(self, driver) -> bool:
+        """이 드라이버(플랫폼)에서 사용할 수 있는지"""
+        return False
+
+    def capture(self, driver, app_id: str) -> Optional[object]:
+        """로그인 직후 상태를 저장합니다. (저장할 수 없으면 None)"""
+        return None
+
+    def restore(self, driver, app_id: str, state: object) -> bool:
+        """저장한 상태를 앱에 넣고 앱을 다시 실행합니다. (성공 여부는 호출한 쪽에서 화면으로 확인)"""
+        return False
+
+
+class AndroidAppDataRestorer(LoginStateRestorer):
+    """
+    Android 앱 데이터 스냅샷 (Appium pull_folder / push_file, debuggable 빌드 필요)
+
+    로그인 토큰이 저장되는 shared_prefs만 복사합니다. 앱을 종료한 뒤 파일을 덮어쓰고 다시 실행합니다.
+    """
+
+    name = "android-app-data"
+    DATA_DIRS = ("shared_prefs",)
+
+    def supports(self, driver) -> bool:
+        return driver.capabilities.get("platformName", "").lower() == "android"
+
+    def capture(self, driver, app_id: str) -> Optional[Dict[str, bytes]]:
+        files = {}
+        for directory in self.DATA_DIRS:
+            archive = zipfile.ZipFile(io.BytesIO(base64.b64decode(driver.pull_folder(f"@{app_id}/{directory}"))))
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                # 압축 안의 경로는 폴더 이름을 포함할 수도, 안 할 수도 있음
+                name = info.filename.split("/", 1)[1] if info.filename.startswith(f"{directory}/") else info.filename
+                files[f"{directory}/{name}"] = archive.read(info)
+        return files or None
+
+    def restore(self, driver, app_id: str, state: Dict[str, bytes]) -> bool:
+        driver.terminate_app(app_id)
+        for path, content in state.items():
+            driver.push_file(f"@{app_id}/{path}", base64data=base64.b64encode(content).decode("ascii"))
+        driver.activate_app(app_id)
+        return True
+
+
+class LoginStateCache:
+    """디바이스 + 계정별 로그인 상태 캐시 (프로세스 전체에서 공유)"""
+
+    def __init__(self, restorers: Optional[List[LoginStateRestorer]] = None):
+        self.restorers: List[LoginStateRestorer] = list(restorers) if restorers is not None else [AndroidAppDataRestorer()]
+        # 현재 테스트가 @pytest.mark.real_login인지 (driver fixture에서 설정)
+        self.real_login = False
+        self.stats = {"ui_logins": 0, "restored": 0, "restore_failures": 0, "reused": 0}
+        self._lock = threading.Lock()
+        self._states: Dict[Tuple[str, str], Tuple[LoginStateRestorer, object]] = {}
+        self._current: Dict[str, str] = {}
+        # 상태 저장이 안 되는 디바이스 (매번 다시 시도하지 않음)
+        self._unsupported: set = set()
+
+    def register_restorer(self, restorer: LoginStateRestorer, first: bool = False):
+        """복원 방식을 추가합니다. (first=True면 기본 방식보다 먼저 시도)"""
+        if first:
+            self.restorers.insert(0, restorer)
+        else:
+            self.restorers.append(restorer)
+
+    @staticmethod
+    def device_key(driver) -> str:
+        """디바이스 식별자 (udid, 없으면 deviceName)"""
+        capabilities = driver.capabilities
+        return str(capabilities.get("udid") or capabilities.get("appium:udid")
+                   or capabilities.get("deviceName") or capabilities.get("appium:deviceName") or driver.session_id)
+
+    def logged_in_account(self, driver) -> Optional[str]:
+        """이 디바이스가 마지막으로 로그인한 계정 (로그아웃했거나 모르면 None)"""
+        return self._current.get(self.device_key(driver))
+
+    def has_state(self, driver, email: str) -> bool:
+        return (self.device_key(driver), email) in self._states
+
+    def restore(self, driver, email: str) -> bool:
+        """
+        저장한 로그인 상태를 복원합니다. (real_login 테스트이거나 저장한 상태가 없으면 False)
+
+        Returns:
+            복원을 시도했으면 True (실제 로그인 여부는 화면으로 확인 후 confirm_restore 호출)
+        """
+        if self.real_login:
+            return False
+        saved = self._states.get((self.device_key(driver), email))
+        if saved is None:
+            return False
+
+        restorer, state = saved
+        start_time = time.time()
+        try:
+            restored = restorer.restore(driver, get_app_id(driver.capabilities), state)
+        except Exception as e:
+            print(f"[LOGIN] 로그인 상태 복원 실패 ({restorer.name}): {e}")
+            restored = False
+        if not restored:
+            self.invalidate(driver, email)
+            return False
+        print(f"[LOGIN] 저장한 로그인 상태를 복원했습니다 ({restorer.name}, {time.time() - start_time:.2f}초, 계정: {email})")
+        return True
+
+    def confirm_restore(self, driver, email: str, logged_in: bool):
+        """복원 후 화면 확인 결과를 반영합니다. (로그인 화면이면 스냅샷을 버림)"""
+        with self._lock:
+            if logged_in:
+                self.stats["restored"] += 1
+                self._current[self.device_key(driver)] = email
+            else:
+                self.stats["restore_failures"] += 1
+        if not logged_in:
+            print("[LOGIN] 복원 후에도 로그인 화면이 보여 저장한 상태를 버리고 실제 로그인합니다")
+            self.invalidate(driver, email)
+
+    def mark_reused(self, driver, email: str):
+        """앱이 이미 로그인되어 있어 그대로 사용"""
+        with self._lock:
+            self.stats["reused"] += 1
+            self._current[self.device_key(driver)] = email
+
+    def mark_logged_in(self, driver, email: str):
+        """
+        실제 UI 로그인이 끝난 직후 호출합니다. 이 디바이스 + 계정의 상태가 없으면 저장합니다.
+        """
+        device = self.device_key(driver)
+        with self._lock:
+            self.stats["ui_logins"] += 1
+            self._current[device] = email
+        if (device, email) in self._states or device in self._unsupported:
+            return
+
+        app_id = get_app_id(driver.capabilities)
+        for restorer in self.restorers:
+            if not app_id or not restorer.supports(driver):
+                continue
+            try:
+                state = restorer.capture(driver, app_id)
+            except Exception as e:
+                print(f"[LOGIN] 로그인 상태 저장 실패 ({restorer.name}): {e}")
+                continue
+            if state is not None:
+                with self._lock:
+                    self._states[(device, email)] = (restorer, state)
+                print(f"[LOGIN] 로그인 상태를 저장했습니다 ({restorer.name}, 계정: {email}) → 이후 테스트는 로그인 입력을 건너뜀")
+                return
+        self._unsupported.add(device)
+        print(f"[LOGIN] 이 디바이스는 로그인 상태를 저장할 수 없어 매번 실제 로그인합니다 (디바이스: {device})")
+
+    def mark_logged_out(self, driver):
+        """로그아웃 (앱이 로그인 화면으로 돌아감)"""
+        self._current.pop(self.device_key(driver), None)
+
+    def invalidate(self, driver, email: str):
+        with self._lock:
+            self._states.pop((self.device_key(driver), email), None)
+
+    def merge(self, stats: dict):
+        """xdist 워커가 수집한 통계를 합칩니다."""
+        for key, value in stats.items():
+            self.stats[key] = self.stats.get(key, 0) + value
+
+    def print_summary(self):
+        if not any(self.stats.values()):
+            return
+        print(f"\n🔑 로그인: 실제 UI 로그인 {self.stats['ui_logins']}회, 상태 복원 {self.stats['restored']}회 "
+              f"(복원 실패 {self.stats['restore_failures']}회), 로그인 유지 {self.stats['reused']}회")
+
+
+# 프로세스 전체에서 공유하는 로그인 상태 캐시
+login_state = LoginStateCache()
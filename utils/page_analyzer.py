@@ -20,10 +20,14 @@ sys.path.insert(0, str(project_root))
 from appium import webdriver
 from appium.options.common import AppiumOptions
 from utils.capabilities_loader import get_capabilities
-from utils.element_finder import ElementFinder, print_elements_table
+from utils.element_finder import ElementFinder, StreamingElementFinder, print_elements_table
 import json
 
 
+# 이 크기(문자 수) 이상의 페이지 소스는 트리를 메모리에 만들지 않고 스트리밍으로 분석
+STREAMING_THRESHOLD = 2 * 1024 * 1024
+
+
 def print_menu():
     """메뉴 출력"""
     print("\n" + "="*60)
@@ -77,13 +81,26 @@ def main():
     print("\n⚠️  앱을 분석하려는 화면까지 수동으로 이동한 후 Enter를 누르세요...")
     input()
 
+    finder = None
+    last_page_source = None
+
     try:
         while True:
             # 현재 페이지 소스 가져오기
             print("\n📸 현재 화면의 페이지 소스를 캡처하는 중...")
             page_source = driver.page_source
-            finder = ElementFinder(page_source)
-            print("✅ 캡처 완료!\n")
+
+            # 화면이 바뀌지 않았으면 이미 인덱스를 만든 finder를 재사용
+            if page_source != last_page_source:
+                if len(page_source) >= STREAMING_THRESHOLD:
+                    finder = StreamingElementFinder(page_source)
+                    print(f"✅ 캡처 완료! (페이지 소스 {len(page_source) / 1024 / 1024:.1f}MB - 스트리밍 모드)\n")
+                else:
+                    finder = ElementFinder(page_source)
+                    print("✅ 캡처 완료!\n")
+                last_page_source = page_source
+            else:
+                print("✅ 화면 변화 없음 - 이전 분석 결과를 재사용합니다.\n")
 
             print_menu()
             choice = input("\n선택하세요 (0-9): ").strip()
@@ -166,7 +183,12 @@ def main():
                     filename += '.json'
 
                 output_path = project_root / filename
-                finder.export_to_json(str(output_path))
+                if isinstance(finder, ElementFinder):
+                    # 요소가 많으면 오래 걸리므로 선택했을 때만 후보 locator를 평가해 recommended 선택
+                    rank_locators = input("recommended를 후보 평가로 선택? (y/n, 기본: n): ").strip().lower() == 'y'
+                    finder.export_to_json(str(output_path), rank_locators=rank_locators)
+                else:
+                    finder.export_to_json(str(output_path))
 
             else:
                 print("❌ 잘못된 선택입니다. 다시 선택해주세요.")
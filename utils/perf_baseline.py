@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+성능 회귀 기준선 저장소 (SQLite)
+
+allure-report는 매번 --clean으로 다시 만들어지므로 실행 간 소요 시간 이력이 남지 않습니다.
+실행마다 테스트 / allure.step 단계 소요 시간을 브랜치, 커밋과 함께 로컬 SQLite에 저장하고,
+같은 브랜치의 최근 실행(이동 기준선)과 비교해 통계적으로 의미 있게 느려진 항목을 찾습니다.
+
+회귀 판단 (항목 + 디바이스별):
+    - 기준선: 같은 브랜치의 최근 BASELINE_WINDOW회 실행 (부족하면 전체 브랜치)
+    - 기준선이 MIN_BASELINE_RUNS회 미만이면 판단하지 않음
+    - 이번 값 > 중앙값 + max(MAD_THRESHOLD × 1.4826 × MAD, 중앙값 × MIN_RELATIVE_SLOWDOWN, MIN_ABSOLUTE_SLOWDOWN)
+
+사용 예시:
+    pytest --perf-regression warn   (기본값: 경고만 출력)
+    pytest --perf-regression fail   (회귀가 있으면 실행 실패 처리)
+    pytest --perf-regression off    (기록/비교 안 함)
+
+    # 최근 실행 이력과 항목별 추이 보기
+    python3 utils/perf_baseline.py
+    python3 utils/perf_baseline.py "로그인 수행"
+"""
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+DEFAULT_DB_PATH = Path(os.getenv("SEOLTAB_PERF_DB", Path.home() / "seoltab_AT" / "perf_baseline.sqlite"))
+
+PERF_MODES = ("warn", "fail", "off")
+
+KIND_TEST = "test"
+KIND_STEP = "step"
+# driver fixture를 사용하지 않은 테스트 / 단계의 디바이스 (결과 수집기, 단계 시간 수집기 공통)
+NO_DEVICE = "-"
+
+# 기준선 계산에 사용할 최근 실행 수
+BASELINE_WINDOW = 20
+# 기준선으로 판단하기 위한 최소 실행 수
+MIN_BASELINE_RUNS = 5
+# MAD 배수 (정규분포에서 표준편차 3배 수준)
+MAD_THRESHOLD = 3.0
+# MAD → 표준편차 환산 계수
+MAD_SCALE = 1.4826
+# 최소 상대 증가율 / 최소 절대 증가량 (초) - 작은 흔들림은 회귀로 보지 않음
+MIN_RELATIVE_SLOWDOWN = 0.2
+MIN_ABSOLUTE_SLOWDOWN = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    branch TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    environment TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS durations (
+    run_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    device TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS durations_key ON durations (kind, name, device, run_id);
+"""
+
+
+class PerfBaseline:
+    """실행별 소요 시간 저장 및 이동 기준선 비교"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: ~/seoltab_AT/perf_baseline.sqlite, SEOLTAB_PERF_DB 환경 변수로 변경)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record_run(self, samples: List[Dict], branch: str, commit: str, environment: str = "로컬") -> int:
+        """
+        이번 실행의 소요 시간을 저장합니다.
+
+        Args:
+            samples: [{"kind": "test" | "step", "name": 이름, "device": 디바이스, "duration": 초}, ...]
+            branch: Git 브랜치
+            commit: Git 커밋 해시
+            environment: 실행 환경 (로컬 / GitHub Actions 등)
+
+        Returns:
+            저장한 실행 id
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, branch, commit_sha, environment) VALUES (?, ?, ?, ?)",
+                (time.time(), branch, commit, environment)
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO durations (run_id, kind, name, device, duration) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, sample["kind"], sample["name"], sample["device"], sample["duration"]) for sample in samples]
+            )
+        return run_id
+
+    def baseline(self, kind: str, name: str, device: str, branch: str,
+                 before_run: Optional[int] = None, window: int = BASELINE_WINDOW) -> List[float]:
+        """
+        이동 기준선 (같은 브랜치의 최근 window회 실행, 부족하면 전체 브랜치)
+
+        Args:
+            kind, name, device: 비교 항목
+            branch: Git 브랜치
+            before_run: 이 실행 id 이전의 실행만 사용 (None이면 전체)
+            window: 사용할 최근 실행 수
+
+        Returns:
+            소요 시간 리스트 (최근 순)
+        """
+        before_run = before_run if before_run is not None else sys.maxsize
+        query = (
+            "SELECT d.duration FROM durations d JOIN runs r ON r.id = d.run_id "
+            "WHERE d.kind = ? AND d.name = ? AND d.device = ? AND d.run_id < ? {branch_filter} "
+            "ORDER BY d.run_id DESC LIMIT ?"
+        )
+        values = [row[0] for row in self.conn.execute(
+            query.format(branch_filter="AND r.branch = ?"), (kind, name, device, before_run, branch, window)
+        )]
+        if len(values) < MIN_BASELINE_RUNS:
+            values = [row[0] for row in self.conn.execute(
+                query.format(branch_filter=""), (kind, name, device, before_run, window)
+            )]
+        return values
+
+    def compare(self, samples: List[Dict], branch: str, before_run: Optional[int] = None) -> List[Dict]:
+        """
+        이번 실행 값을 이동 기준선과 비교합니다.
+
+        Returns:
+            느려진 항목 리스트 (느려진 비율 순)
+            [{"kind", "name", "device", "duration", "median", "threshold", "slowdown", "runs"}, ...]
+        """
+        regressions = []
+        for sample in samples:
+            history = self.baseline(sample["kind"], sample["name"], sample["device"], branch, before_run)
+            result = detect_regression(sample["duration"], history)
+            if result:
+                regressions.append({**sample, **result})
+        regressions.sort(key=lambda item: item["slowdown"], reverse=True)
+        return regressions
+
+    def recent_runs(self, limit: int = 10) -> List[Dict]:
+        """최근 실행 목록"""
+        rows = self.conn.execute(
+            "SELECT r.id, r.started_at, r.branch, r.commit_sha, r.environment, COUNT(d.run_id), "
+            "SUM(CASE WHEN d.kind = ? THEN d.duration ELSE 0 END) "
+            "FROM runs r LEFT JOIN durations d ON d.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+            (KIND_TEST, limit)
+        )
+        keys = ("id", "started_at", "branch", "commit", "environment", "samples", "test_total")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def trend(self, name: str, limit: int = 20) -> List[Dict]:
+        """항목 이름(테스트 nodeid 또는 단계 이름)의 실행별 소요 시간 추이"""
+        rows = self.conn.execute(
+            "SELECT r.id, r.started_at, r.branch, r.commit_sha, d.kind, d.device, d.duration "
+            "FROM durations d JOIN runs r ON r.id = d.run_id WHERE d.name = ? ORDER BY r.id DESC LIMIT ?",
+            (name, limit)
+        )
+        keys = ("id", "started_at", "branch", "commit", "kind", "device", "duration")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def detect_regression(duration: float, history: List[float]) -> Optional[Dict]:
+    """
+    기준선 대비 통계적으로 의미 있게 느려졌는지 판단합니다. (중앙값 + MAD)
+
+    Args:
+        duration: 이번 소요 시간 (초)
+        history: 기준선 소요 시간 리스트
+
+    Returns:
+        느려졌으면 {"median", "threshold", "slowdown", "runs"}, 아니면 None
+    """
+    if len(history) < MIN_BASELINE_RUNS:
+        return None
+
+    median = statistics.median(history)
+    mad = statistics.median(abs(value - median) for value in history)
+    margin = max(MAD_THRESHOLD * MAD_SCALE * mad, median * MIN_RELATIVE_SLOWDOWN, MIN_ABSOLUTE_SLOWDOWN)
+    threshold = median + margin
+    if duration <= threshold:
+        return None
+    return {
+        "median": median,
+        "threshold": threshold,
+        "slowdown": duration / median if median else float('inf'),
+        "runs": len(history),
+    }
+
+
+def step_samples(step_rows: List[Dict]) -> List[Dict]:
+    """StepTimingCollector.summary() 결과 → 저장용 샘플 (단계 + 디바이스별 이번 실행 중앙값)"""
+    return [
+        {"kind": KIND_STEP, "name": row["step"], "device": row["device"], "duration": row["p50"]}
+        for row in step_rows
+    ]
+
+
+def device_samples(samples: List[Dict]) -> List[Dict]:
+    """디바이스에서 실행한 샘플만 (단위 테스트 / 디바이스 없는 실행이 기준선에 섞이지 않도록)"""
+    return [sample for sample in samples if sample["device"] and sample["device"] != NO_DEVICE]
+
+
+def print_regressions(regressions: List[Dict], mode: str):
+    """회귀 항목을 출력합니다."""
+    if not regressions:
+        print("\n📈 성능 기준선 비교: 유의미하게 느려진 항목이 없습니다.")
+        return
+
+    icon = "❌" if mode == "fail" else "⚠️ "
+    print(f"\n{icon} 성능 회귀 {len(regressions)}건 (이동 기준선 대비)")
+    print(f"{'종류':<5} {'항목':<56} {'디바이스':<24} {'이번(s)':>8} {'기준(s)':>8} {'배율':>6}")
+    print("-" * 112)
+    for item in regressions:
+        name = item["name"] if len(item["name"]) <= 54 else "..." + item["name"][-51:]
+        print(f"{item['kind']:<5} {name:<56} {item['device'][:24]:<24} "
+              f"{item['duration']:>8.2f} {item['median']:>8.2f} {item['slowdown']:>5.1f}x")
+
+
+def main():
+    """메인 함수 - 최근 실행 이력 / 항목별 추이 출력"""
+    if not DEFAULT_DB_PATH.exists():
+        print(f"❌ 기준선 파일이 없습니다: {DEFAULT_DB_PATH}")
+        sys.exit(1)
+
+    with PerfBaseline() as store:
+        if len(sys.argv) > 1:
+            name = sys.argv[1]
+            print(f"\n📈 '{name}' 소요 시간 추이 (최근 순)")
+            print(f"{'실행':>5} {'일시':<17} {'브랜치':<20} {'커밋':<8} {'디바이스':<24} {'소요(s)':>8}")
+            print("-" * 90)
+            for row in store.trend(name):
+                started = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["started_at"]))
+                print(f"{row['id']:>5} {started:<17} {row['branch'][:20]:<20} {row['commit'][:7]:<8} "
+                      f"{row['device'][:24]:<24} {row['duration']:>8.2f}")
+            return
+
+        print(f"\n📚 최근 실행 ({DEFAULT_DB_PATH})")
+        print(f"{'실행':>5} {'일시':<17} {'브랜치':<20} {'커밋':<8} {'환경':<16} {'항목':>5} {'테스트 합계(s)':>14}")
+        print("-" * 92)
+        for run in store.recent_runs():
+            started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started_at"]))
+            print(f"{run['id']:>5} {started:<17} {run['branch'][:20]:<20} {run['commit'][:7]:<8} "
+                  f"{run['environment'][:16]:<16} {run['samples']:>5} {run['test_total'] or 0:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
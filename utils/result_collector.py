@@ -0,0 +1,228 @@
+"""
+테스트 결과 수집기
+
+pytest_runtest_logreport로 테스트마다 setup / call / teardown 리포트를 받아 하나의 결과로 합칩니다.
+(xdist 워커의 리포트도 컨트롤러에서 받으므로 컨트롤러 한 곳에서 수집)
+
+결과 항목:
+    - 상태: passed / failed / error(setup·teardown 실패) / skipped / xfailed / xpassed
+    - 소요 시간 (setup + call + teardown), 실행(call) 시간, 재시도 횟수 (pytest-rerunfailures)
+    - 디바이스, 마커, 실패 메시지
+
+테스트가 끝날 때마다 reports/results.jsonl에 한 줄씩 기록하고,
+세션 종료 시 터미널 요약, Slack 알림, 요약 페이지, 성능 기준선이 모두 이 결과를 사용합니다.
+
+사용 예시:
+    result_collector.start()               # pytest_configure (컨트롤러)
+    result_collector.record(report)        # pytest_runtest_logreport
+    result_collector.counts()              # {"passed": 3, "failed": 1, ...}
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+RESULTS_JSONL_FILE = "reports/results.jsonl"
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+# 결과에 기록하지 않는 마커 (pytest 내부 / 실행 분배용)
+IGNORED_MARKERS = ("parametrize", "usefixtures", "xdist_group", "filterwarnings")
+MESSAGE_MAX_LENGTH = 1000
+
+
+class ResultCollector:
+    """테스트 결과 수집기 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[str, dict] = {}
+        self._stream = None
+        self.active = False
+        self.results: List[dict] = []
+
+    def start(self, output_file: Optional[str] = RESULTS_JSONL_FILE):
+        """
+        수집을 시작합니다. (xdist 컨트롤러 또는 단일 프로세스에서 한 번)
+
+        Args:
+            output_file: 결과를 한 줄씩 기록할 JSONL 파일 (None이면 기록하지 않음)
+        """
+        self.reset()
+        if output_file:
+            os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+            self._stream = open(output_file, 'w', encoding='utf-8')
+        self.active = True
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def reset(self):
+        with self._lock:
+            self._pending.clear()
+            self.results.clear()
+
+    def record(self, report) -> Optional[dict]:
+        """
+        테스트 리포트(setup / call / teardown) 하나를 반영합니다.
+
+        Returns:
+            teardown까지 끝나 확정된 결과 (아직 진행 중이면 None)
+        """
+        if not self.active:
+            return None
+
+        with self._lock:
+            result = self._pending.get(report.nodeid)
+            if result is None:
+                result = self._pending[report.nodeid] = _new_result(report.nodeid)
+
+            properties = dict(report.user_properties)
+            result["device"] = properties.get("device", result["device"])
+            result["markers"] = properties.get("markers", result["markers"])
+            result["duration"] += report.duration
+
+            # pytest-rerunfailures: 실패한 단계가 "rerun"으로 보고되고 같은 테스트가 다시 실행됨
+            if report.outcome == "rerun":
+                result["retries"] += 1
+                result["rerunning"] = True
+                return None
+
+            if report.when == "setup":
+                result["rerunning"] = False
+                result["outcome"] = "passed"
+                result["message"] = ""
+            if report.when == "call":
+                result["call_duration"] = report.duration
+            _apply_outcome(result, report)
+
+            if report.when != "teardown" or result["rerunning"]:
+                return None
+
+            del self._pending[report.nodeid]
+            del result["rerunning"]
+            result["finished_at"] = time.time()
+            self.results.append(result)
+            if self._stream is not None:
+                self._stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+                self._stream.flush()
+            return result
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 테스트 수 ({"passed", "failed", "error", "skipped", "xfailed", "xpassed", "total", "retries"})"""
+        with self._lock:
+            counts = {outcome: 0 for outcome in OUTCOMES}
+            for result in self.results:
+                counts[result["outcome"]] += 1
+            counts["total"] = len(self.results)
+            counts["retries"] = sum(result["retries"] for result in self.results)
+            return counts
+
+    def duration_samples(self, kind: str = "test") -> List[dict]:
+        """성공한 테스트의 실행(call) 시간 (성능 기준선 저장용 샘플)"""
+        with self._lock:
+            return [
+                {"kind": kind, "name": result["nodeid"], "device": result["device"], "duration": result["call_duration"]}
+                for result in self.results if result["outcome"] == "passed"
+            ]
+
+    def summary_rows(self) -> List[dict]:
+        """요약 페이지용 행 (allure_report.write_summary의 results 형식)"""
+        with self._lock:
+            return [
+                {
+                    "name": result["nodeid"].split("::")[-1],
+                    "full_name": result["nodeid"],
+                    "status": _ALLURE_STATUS.get(result["outcome"], result["outcome"]),
+                    "duration": result["duration"],
+                    "device": result["device"],
+                    "message": result["message"],
+                }
+                for result in self.results
+            ]
+
+    def print_summary(self, max_rows: int = 5):
+        """상태별 개수, 재시도한 테스트, 오래 걸린 테스트를 출력합니다."""
+        if not self.results:
+            return
+
+        counts = self.counts()
+        labels = {"passed": "✅ 성공", "failed": "❌ 실패", "error": "💥 오류", "skipped": "⏭️  건너뜀",
+                  "xfailed": "🔸 예상된 실패", "xpassed": "🔹 예상 밖 성공"}
+        parts = [f"{labels[outcome]} {counts[outcome]}" for outcome in OUTCOMES if counts[outcome]]
+        total_time = sum(result["duration"] for result in self.results)
+        print(f"\n🧾 테스트 결과: {' / '.join(parts)} (총 {counts['total']}개, {total_time:.1f}초)")
+
+        retried = [result for result in self.results if result["retries"]]
+        if retried:
+            print(f"\n🔁 재시도한 테스트 {len(retried)}개")
+            for result in retried:
+                print(f"   {result['outcome']:<8} 재시도 {result['retries']}회  {result['nodeid']}")
+
+        print(f"\n🐢 오래 걸린 테스트 (상위 {max_rows}개)")
+        for result in sorted(self.results, key=lambda item: item["duration"], reverse=True)[:max_rows]:
+            print(f"   {result['duration']:>7.2f}s  {result['outcome']:<8} {result['device'][:24]:<24} {result['nodeid']}")
+
+
+# 요약 페이지(Allure 상태 이름) 변환
+_ALLURE_STATUS = {"error": "broken", "xfailed": "skipped", "xpassed": "passed"}
+
+
+def _new_result(nodeid: str) -> dict:
+    return {
+        "nodeid": nodeid,
+        "outcome": "passed",
+        "duration": 0.0,
+        "call_duration": 0.0,
+        "retries": 0,
+        "device": "-",
+        "markers": [],
+        "message": "",
+        "rerunning": False,
+    }
+
+
+def _apply_outcome(result: dict, report):
+    """단계 리포트의 결과를 테스트 결과에 반영합니다."""
+    wasxfail = hasattr(report, "wasxfail")
+    if report.when == "call":
+        if report.passed:
+            result["outcome"] = "xpassed" if wasxfail else "passed"
+        elif report.skipped:
+            result["outcome"] = "xfailed" if wasxfail else "skipped"
+        else:
+            result["outcome"] = "failed"
+    elif report.failed and result["outcome"] in ("passed", "xpassed"):
+        # setup / teardown 실패
+        result["outcome"] = "error"
+    elif report.skipped and report.when == "setup":
+        result["outcome"] = "xfailed" if wasxfail else "skipped"
+
+    if not report.passed and not result["message"]:
+        result["message"] = _failure_message(report)
+
+
+def _failure_message(report) -> str:
+    """실패 / 건너뜀 사유 한 줄 요약"""
+    longrepr = report.longrepr
+    if isinstance(longrepr, tuple) and len(longrepr) == 3:
+        message = str(longrepr[2])
+    else:
+        crash = getattr(longrepr, "reprcrash", None)
+        message = crash.message if crash is not None else report.longreprtext
+    return message[:MESSAGE_MAX_LENGTH]
+
+
+def marker_names(item) -> List[str]:
+    """테스트에 붙은 마커 이름 (중복 제거, IGNORED_MARKERS 제외)"""
+    names = []
+    for marker in item.iter_markers():
+        if marker.name not in IGNORED_MARKERS and marker.name not in names:
+            names.append(marker.name)
+    return names
+
+
+# 프로세스 전체에서 공유하는 수집기
+result_collector = ResultCollector()
@@ -0,0 +1,149 @@
+"""
+화면 녹화 링 버퍼 (실패 직전 N초 영상)
+
+실패 시점의 스크린샷 한 장으로는 실패를 만든 화면 전환(예: HomePage.close_intro_popup의 인트로 팝업)을
+볼 수 없는 경우가 많습니다. 테스트 동안 Appium 화면 녹화를 SEGMENT_SECONDS 단위 조각으로 나눠 계속 녹화하고,
+메모리에는 최근 window_seconds초를 덮는 조각만 남깁니다. (오래된 조각은 버림 → 긴 테스트도 메모리 일정)
+
+테스트가 실패하면 녹화를 멈추고 남은 조각(실패 직전 window_seconds초 ~ window_seconds + SEGMENT_SECONDS초)을
+하나의 영상으로 합쳐 Allure에 첨부합니다. 성공한 테스트의 녹화는 저장하지 않고 버립니다.
+    - ffmpeg가 있으면 조각을 재인코딩 없이 하나의 mp4로 합침 (-c copy)
+    - ffmpeg가 없으면 조각을 순서대로 각각 첨부
+
+녹화는 디바이스 쪽(iOS: XCTest + ffmpeg, Android: screenrecord)에서 이루어지고,
+조각을 바꿀 때만 WebDriver 명령(stop/start_recording_screen)을 보냅니다.
+
+사용 예시:
+    pytest --record-screen 30   (실패 직전 30초 녹화 첨부)
+"""
+import base64
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+
+# 녹화 조각 길이 (초) - 짧을수록 첨부 영상이 window에 가깝지만 교체 명령이 많아짐
+SEGMENT_SECONDS = 10
+# 플랫폼별 녹화 옵션 (화질을 낮춰 전송/메모리 사용량을 줄임)
+RECORDING_OPTIONS = {
+    'ios': {'videoQuality': 'low', 'videoFps': 10},
+    'android': {'bitRate': 1_000_000},
+}
+
+
+class ScreenRecorder:
+    """테스트 하나 동안의 화면 녹화 링 버퍼"""
+
+    def __init__(self, driver, window_seconds: int = 30, segment_seconds: int = SEGMENT_SECONDS):
+        """
+        Args:
+            driver: Appium WebDriver
+            window_seconds: 실패 시 첨부할 녹화 길이 (초)
+            segment_seconds: 녹화 조각 길이 (초)
+        """
+        self.driver = driver
+        self.window_seconds = window_seconds
+        self.segment_seconds = segment_seconds
+        platform = str((driver.capabilities or {}).get('platformName', '')).lower()
+        self.options = RECORDING_OPTIONS.get(platform, {})
+        # (조각 시작, 조각 종료, mp4 bytes) - window를 덮는 조각 + 녹화 중인 조각만 유지
+        self._segments = deque(maxlen=math.ceil(window_seconds / segment_seconds) + 1)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._recording = False
+        self._segment_started = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """녹화를 시작하고 조각 교체 스레드를 띄웁니다."""
+        with self._lock:
+            self._start_segment()
+        self._thread = threading.Thread(target=self._rotate, name="screen-recorder", daemon=True)
+        self._thread.start()
+
+    def stop(self, keep: bool = True) -> List[bytes]:
+        """
+        녹화를 멈춥니다. (여러 번 호출해도 한 번만 멈춤)
+
+        Args:
+            keep: True면 마지막 window_seconds초를 덮는 조각을 반환, False면 녹화를 버림
+
+        Returns:
+            mp4 조각 리스트 (오래된 순)
+        """
+        self._stopped.set()
+        with self._lock:
+            if self._recording:
+                self._stop_segment(keep)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.segment_seconds)
+        if not keep:
+            self._segments.clear()
+            return []
+        cutoff = time.monotonic() - self.window_seconds
+        return [data for _, end, data in self._segments if end >= cutoff]
+
+    def _rotate(self):
+        """SEGMENT_SECONDS마다 녹화를 끊어 조각으로 보관하고 새 조각을 시작합니다."""
+        while not self._stopped.wait(self.segment_seconds):
+            with self._lock:
+                if self._stopped.is_set() or not self._recording:
+                    return
+                try:
+                    self._stop_segment(keep=True)
+                    self._start_segment()
+                except Exception as e:
+                    print(f"[RECORD] 화면 녹화 조각 교체 실패, 녹화를 중단합니다: {e}")
+                    self._recording = False
+                    return
+
+    def _start_segment(self):
+        # timeLimit: 교체 스레드가 멈춰도 디바이스 녹화가 끝없이 이어지지 않도록 제한
+        self.driver.start_recording_screen(timeLimit=self.segment_seconds * 3, forceRestart=True, **self.options)
+        self._segment_started = time.monotonic()
+        self._recording = True
+
+    def _stop_segment(self, keep: bool):
+        self._recording = False
+        data = self.driver.stop_recording_screen()
+        if keep and data:
+            self._segments.append((self._segment_started, time.monotonic(), base64.b64decode(data)))
+
+
+def build_clip(segments: List[bytes]) -> List[bytes]:
+    """
+    녹화 조각을 ffmpeg로 하나의 mp4로 합칩니다. (재인코딩 없음)
+    ffmpeg가 없거나 합치기에 실패하면 조각을 그대로 반환합니다.
+
+    Returns:
+        첨부할 mp4 리스트
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if len(segments) < 2 or ffmpeg is None:
+        return segments
+
+    with tempfile.TemporaryDirectory(prefix="screen-recording-") as work_dir:
+        list_file = os.path.join(work_dir, "segments.txt")
+        with open(list_file, 'w', encoding='utf-8') as f:
+            for index, data in enumerate(segments):
+                path = os.path.join(work_dir, f"{index:03d}.mp4")
+                with open(path, 'wb') as segment_file:
+                    segment_file.write(data)
+                f.write(f"file '{path}'\n")
+
+        output = os.path.join(work_dir, "clip.mp4")
+        result = subprocess.run(
+            [ffmpeg, "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", output],
+            capture_output=True, text=True, timeout=60
+        )
+        if result.returncode != 0:
+            print(f"[RECORD] 녹화 조각 합치기 실패, 조각별로 첨부합니다: {result.stderr.strip()}")
+            return segments
+        with open(output, 'rb') as f:
+            return [f.read()]
@@ -0,0 +1,245 @@
+"""
+스크린샷 저장소 (내용 주소 기반 + 유사 이미지 중복 제거)
+
+같은 화면에서 반복해서 실패하면 같은 스크린샷이 테스트마다 원본 PNG로 저장/첨부되어
+allure-results와 gh-pages 브랜치가 커집니다. 이 저장소는
+    - 스크린샷을 줄이고(긴 변 MAX_DIMENSION) WebP(지원하지 않으면 JPEG)로 다시 인코딩
+    - 이미지 내용으로 파일 이름을 정해(내용 주소) 같은 이미지는 한 번만 저장
+    - 지각 해시(dHash)가 거의 같은(해밍 거리 DHASH_THRESHOLD 이하) 이미지는 이번 실행에서 저장한 이미지를 재사용
+      (이전 실행의 이미지로 바꿔 첨부하지 않도록, 폴더 전체가 아니라 이번 프로세스가 저장 / 재사용한 이미지만 비교)
+하고, Allure 첨부는 이미지 바이트를 테스트마다 복사하지 않고 저장된 파일 하나를 참조합니다.
+(첨부할 바이트는 put()이 메모리에 들고 있는 인코딩 결과를 사용하므로 저장한 파일을 다시 읽지 않습니다)
+
+Pillow는 requirements.txt의 필수 의존성입니다. 설치되지 않은 환경에서는 원본 PNG를 그대로 저장하고
+완전히 같은 이미지(sha256)만 중복 제거합니다.
+
+파일 이름:
+    Pillow 있음: {dHash 16자리}-{sha256 앞 12자리}.webp / .jpg
+    Pillow 없음: {sha256 앞 28자리}.png
+
+사용 예시:
+    stored = screenshot_store.put(driver.get_screenshot_as_png())
+    attach_stored_image(stored, "실패 스크린샷")
+"""
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+import allure
+import allure_commons
+
+try:
+    from PIL import Image, features
+    USING_PILLOW = True
+except ImportError:
+    USING_PILLOW = False
+
+
+DEFAULT_STORE_DIR = "screenshots"
+# 저장할 이미지의 긴 변 최대 길이 (px)
+MAX_DIMENSION = 1280
+# WebP / JPEG 품질
+ENCODE_QUALITY = 80
+# 같은 화면으로 볼 dHash 해밍 거리 (64비트 중)
+DHASH_THRESHOLD = 4
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """저장소에 저장된 이미지"""
+    key: str
+    path: Path
+    extension: str
+    mime_type: str
+    deduplicated: bool
+    # 저장된 파일의 내용 (인코딩된 이미지 bytes)
+    data: bytes = field(repr=False)
+
+
+class ScreenshotStore:
+    """내용 주소 기반 스크린샷 저장소 (여러 스레드 / xdist 워커에서 동시에 사용 가능)"""
+
+    def __init__(self, root: str = DEFAULT_STORE_DIR):
+        """
+        Args:
+            root: 이미지를 저장할 폴더
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self.stats = {"stored": 0, "deduplicated": 0, "original_bytes": 0, "stored_bytes": 0}
+        # 이번 실행에서 저장 / 재사용한 이미지 → dHash (유사 이미지 비교 대상)
+        self._run_images: Dict[Path, Optional[int]] = {}
+        # 이번 실행에서 저장 / 재사용한 이미지 → 인코딩된 bytes (재사용할 때 파일을 다시 읽지 않음)
+        self._run_data: Dict[Path, bytes] = {}
+
+    def put(self, png: bytes) -> StoredImage:
+        """
+        스크린샷(PNG bytes)을 저장합니다. 같은 이미지가 이미 있거나 이번 실행에서 거의 같은 이미지를 저장했으면
+        그 이미지를 반환합니다.
+
+        Args:
+            png: 원본 PNG bytes (driver.get_screenshot_as_png())
+
+        Returns:
+            StoredImage (data: 저장된 파일의 인코딩된 bytes)
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        if USING_PILLOW:
+            image = Image.open(io.BytesIO(png))
+            dhash = difference_hash(image)
+            encoded, extension, mime_type = _reencode(image)
+            key = f"{dhash:016x}-{hashlib.sha256(encoded).hexdigest()[:12]}"
+        else:
+            dhash = None
+            encoded, extension, mime_type = png, "png", "image/png"
+            key = hashlib.sha256(png).hexdigest()[:28]
+
+        with self._lock:
+            self.stats["original_bytes"] += len(png)
+            existing = self._find(key, extension, dhash)
+            if existing is not None:
+                self.stats["deduplicated"] += 1
+                self._run_images.setdefault(existing, _parse_dhash(existing.stem))
+                # 같은 key면 내용이 같으므로 방금 인코딩한 bytes를 그대로 사용
+                data = self._run_data.setdefault(existing, encoded)
+                return StoredImage(existing.stem, existing, existing.suffix[1:], mime_type, True, data)
+
+            path = self.root / f"{key}.{extension}"
+            _write_atomic(path, encoded)
+            self._run_images[path] = dhash
+            self._run_data[path] = encoded
+            self.stats["stored"] += 1
+            self.stats["stored_bytes"] += len(encoded)
+            return StoredImage(key, path, extension, mime_type, False, encoded)
+
+    def merge(self, stats: Dict[str, int]):
+        """다른 프로세스(xdist 워커)의 저장 통계를 합칩니다."""
+        with self._lock:
+            for name, value in stats.items():
+                self.stats[name] = self.stats.get(name, 0) + value
+
+    def print_summary(self):
+        """이번 실행의 스크린샷 저장 / 중복 제거 결과를 출력합니다."""
+        total = self.stats["stored"] + self.stats["deduplicated"]
+        if not total:
+            return
+        saved = self.stats["original_bytes"] - self.stats["stored_bytes"]
+        print(f"\n🖼️  스크린샷 {total}개 중 {self.stats['stored']}개 저장, {self.stats['deduplicated']}개 중복 재사용 "
+              f"(원본 {self.stats['original_bytes'] / 1024:.0f}KB → 저장 {self.stats['stored_bytes'] / 1024:.0f}KB, "
+              f"{saved / 1024:.0f}KB 절약)")
+
+    def _find(self, key: str, extension: str, dhash: Optional[int]) -> Optional[Path]:
+        """같은 이미지(같은 key) 파일 또는 이번 실행에서 저장한 dHash가 가까운 이미지 파일"""
+        exact = self.root / f"{key}.{extension}"
+        if exact.exists():
+            return exact
+        if dhash is None:
+            return None
+        for path, stored_hash in self._run_images.items():
+            if (path.suffix == f".{extension}" and stored_hash is not None
+                    and bin(stored_hash ^ dhash).count("1") <= DHASH_THRESHOLD):
+                return path
+        return None
+
+
+def difference_hash(image, hash_size: int = 8) -> int:
+    """
+    지각 해시 dHash (64비트) - 흑백 (hash_size+1)×hash_size로 줄인 뒤 가로로 이웃한 픽셀 밝기 비교
+    상태바 시계처럼 작은 차이는 해시가 거의 바뀌지 않습니다.
+    """
+    small = image.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def _reencode(image):
+    """긴 변을 MAX_DIMENSION 이하로 줄이고 WebP(불가하면 JPEG)로 인코딩"""
+    image = image.convert("RGB")
+    image.thumbnail((MAX_DIMENSION, MAX_DIMENSION), Image.LANCZOS)
+    output = io.BytesIO()
+    if features.check("webp"):
+        image.save(output, format="WEBP", quality=ENCODE_QUALITY, method=4)
+        return output.getvalue(), "webp", "image/webp"
+    image.save(output, format="JPEG", quality=ENCODE_QUALITY, optimize=True)
+    return output.getvalue(), "jpg", "image/jpeg"
+
+
+def _parse_dhash(stem: str) -> Optional[int]:
+    prefix = stem.split("-", 1)[0]
+    if len(prefix) != 16:
+        return None
+    try:
+        return int(prefix, 16)
+    except ValueError:
+        return None
+
+
+def _write_atomic(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 이름을 바꿔 다른 프로세스가 쓰다 만 파일을 읽지 않도록 저장"""
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# 이번 실행에서 allure-results에 이미 쓴 첨부 파일 (같은 이미지는 한 번만 씀)
+_attached_files: Dict[str, bool] = {}
+_attach_lock = threading.Lock()
+
+
+def attach_stored_image(stored: StoredImage, name: str):
+    """
+    저장된 이미지를 Allure에 첨부합니다. (테스트 실행 스레드에서 호출)
+    allure-results에는 이미지 파일을 한 번만 쓰고, 같은 이미지를 첨부하는 테스트는 그 파일을 참조합니다.
+    allure-pytest 리포터를 찾을 수 없으면 일반 첨부(allure.attach)를 사용합니다.
+    (allure-pytest의 내부 API를 사용하므로 tests/test_screenshot_store.py가 동작을 고정합니다)
+
+    Args:
+        stored: ScreenshotStore.put()의 결과
+        name: 첨부 이름
+    """
+    reporter = _allure_reporter()
+    executable = reporter._last_executable() if reporter is not None else None
+    if executable is None:
+        allure.attach(stored.data, name=name, attachment_type=stored.mime_type, extension=stored.extension)
+        return
+
+    from allure_commons.model2 import Attachment
+
+    file_name = f"{stored.key}-attachment.{stored.extension}"
+    reporter.get_item(executable).attachments.append(Attachment(name=name, source=file_name, type=stored.mime_type))
+    with _attach_lock:
+        if file_name in _attached_files:
+            return
+        _attached_files[file_name] = True
+    allure_commons.plugin_manager.hook.report_attached_data(body=stored.data, file_name=file_name)
+
+
+def _allure_reporter():
+    """allure-pytest 리포터 (AllureReporter, 활성화되지 않았으면 None)"""
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None and hasattr(reporter, "_last_executable") and hasattr(reporter, "get_item"):
+            return reporter
+    return None
+
+
+# 프로세스 전체에서 공유하는 저장소
+screenshot_store = ScreenshotStore()
@@ -2,12 +2,59 @@
 Slack 알림 유틸리티
 
 Allure 리포트 생성 후 Slack 채널에 알림을 보냅니다.
+
+    - 전송: 프로세스 안의 HTTP 연결 풀(urllib3)로 백그라운드 스레드에서 전송 (pytest 종료를 막지 않음)
+    - 재시도 큐: 메시지를 먼저 디스크(~/seoltab_AT/slack_queue)에 저장하고, 전송에 실패하면
+      지수 백오프로 다음 실행(또는 `python3 utils/slack_notifier.py flush`)에서 다시 전송
+    - 묶음 전송: 같은 브랜치 + 커밋의 대기 중인 결과(여러 실행 / 디바이스)는 메시지 하나로 합쳐 전송
+      SLACK_BOT_TOKEN + SLACK_CHANNEL을 설정하면 같은 커밋의 결과를 첫 메시지의 스레드 답글로 전송
+
+사용 예시:
+    send_slack_notification(report_url, test_result)   # 큐에 저장 후 백그라운드 전송
+    python3 utils/slack_notifier.py flush             # 큐에 남은 메시지 전송
 """
+import atexit
+import fcntl
 import os
 import json
-import subprocess
+import sys
+import threading
+import time
+import uuid
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import urllib3
+
+# 프로젝트 루트를 Python path에 추가 (python3 utils/slack_notifier.py flush로 직접 실행할 때)
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils.git_info import get_git_info  # noqa: F401 (기존 import 경로 유지)
+
+
+DEFAULT_QUEUE_DIR = Path(os.getenv("SEOLTAB_SLACK_QUEUE", Path.home() / "seoltab_AT" / "slack_queue"))
+SLACK_API_URL = "https://slack.com/api/chat.postMessage"
+# 요청 하나의 최대 시간 (초)
+SEND_TIMEOUT = 5
+# 전송 재시도 (지수 백오프: RETRY_BASE_SECONDS × 2^(시도 횟수 - 1), 최대 RETRY_MAX_SECONDS)
+MAX_ATTEMPTS = 8
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+# 프로세스 종료 시 백그라운드 전송을 기다리는 최대 시간 (초, 남은 메시지는 큐에 유지)
+EXIT_FLUSH_TIMEOUT = 5
+# 다시 보내도 성공할 수 없는 응답 (잘못된 payload / 삭제된 Webhook) → failed/로 이동
+PERMANENT_ERROR_STATUSES = (400, 403, 404, 410)
+# 큐 메시지 파일 이름 접두사 (같은 폴더의 threads.json과 구분)
+QUEUE_FILE_PREFIX = "msg-"
+# 스레드 부모 메시지를 기억하는 기간 (초)
+THREAD_TTL_SECONDS = 24 * 3600
+
+# 프로세스 전체에서 공유하는 HTTP 연결 풀 (재시도는 큐에서 처리)
+_http = urllib3.PoolManager(num_pools=2, maxsize=2, retries=False,
+                            timeout=urllib3.Timeout(connect=3, read=SEND_TIMEOUT))
 
 
 def send_slack_notification(
@@ -17,30 +64,47 @@ def send_slack_notification(
 ) -> bool:
     """
     Slack 채널에 Allure 리포트 알림을 보냅니다.
+    메시지를 재시도 큐에 저장한 뒤 백그라운드에서 전송하고 바로 반환합니다.
 
     Args:
         report_url: Allure 리포트 URL
-        test_result: 테스트 결과 정보 (passed, failed, skipped, total, duration)
+        test_result: 테스트 결과 정보 (passed, failed, skipped, total, retries, duration, step_timings)
         webhook_url: Slack Webhook URL (None이면 환경 변수에서 읽음)
 
     Returns:
-        bool: 성공 시 True, 실패 시 False
+        bool: 큐에 저장했으면 True, Slack 설정이 없으면 False
     """
-    # Webhook URL 가져오기
-    if webhook_url is None:
-        webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-
-    if not webhook_url:
+    notifier = SlackNotifier(webhook_url=webhook_url)
+    if not notifier.configured:
         print("⚠️  SLACK_WEBHOOK_URL 환경 변수가 설정되지 않았습니다.")
         print("💡 Slack 알림을 사용하려면 환경 변수를 설정하세요:")
         print("   export SLACK_WEBHOOK_URL='https://hooks.slack.com/services/...'")
         return False
 
+    batch_key = f"{test_result.get('branch', 'unknown')}@{str(test_result.get('commit', 'N/A'))[:7]}"
+    notifier.enqueue(build_slack_message(report_url, test_result), batch_key)
+    notifier.flush_async()
+    print(f"📨 Slack 알림을 전송 큐에 저장했습니다. (백그라운드 전송, 실패 시 다음 실행에서 재시도: {notifier.queue_dir})")
+    return True
+
+
+def build_slack_message(report_url: Optional[str], test_result: dict) -> dict:
+    """
+    테스트 결과 Slack 메시지 (attachments 형식)
+
+    Args:
+        report_url: Allure 리포트 URL (None이면 로컬 확인 방법 안내)
+        test_result: 테스트 결과 정보
+
+    Returns:
+        Slack 메시지 payload
+    """
     # 테스트 결과 파싱
     passed = test_result.get("passed", 0)
     failed = test_result.get("failed", 0)
     skipped = test_result.get("skipped", 0)
     total = test_result.get("total", 0)
+    retries = test_result.get("retries", 0)
     duration = test_result.get("duration", 0)
     exit_status = test_result.get("exit_status", 0)
 
@@ -73,6 +137,7 @@ def send_slack_notification(
                             f"❌ Failed: {failed}\n"
                             f"⏭️  Skipped: {skipped}\n"
                             f"📊 Total: {total}"
+                            + (f"\n🔁 Retries: {retries}" if retries else "")
                         ),
                         "short": True
                     },
@@ -115,83 +180,270 @@ def send_slack_notification(
         })
 
 
-    # Commit 정보가 있으면 추가
+    # 단계별 소요 시간 (allure.step p50/p95)이 있으면 추가
+    step_timings = test_result.get("step_timings")
+    if step_timings:
+        slack_message["attachments"][0]["fields"].append({
+            "title": "⏱️  단계별 소요 시간 (p50 / p95)",
+            "value": step_timings,
+            "short": False
+        })
+
+    # Commit 정보가 있으면 추가 (메시지 첫 줄, 작성자, 커밋하지 않은 변경 여부)
     if commit and commit != "N/A":
+        commit_text = f"`{commit[:7]}`"
+        if test_result.get("subject"):
+            commit_text += f" {test_result['subject']}"
+        if test_result.get("author"):
+            commit_text += f" ({test_result['author']})"
+        if test_result.get("dirty"):
+            commit_text += "\n⚠️  커밋하지 않은 변경 사항 포함"
         slack_message["attachments"][0]["fields"].append({
             "title": "Commit",
-            "value": f"`{commit[:7]}`",
+            "value": commit_text,
             "short": False
         })
 
-    # curl로 Slack에 전송
-    try:
-        result = subprocess.run(
-            [
-                "curl",
-                "-X", "POST",
-                "-H", "Content-Type: application/json",
-                "-d", json.dumps(slack_message),
-                webhook_url
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode == 0 and result.stdout.strip() == "ok":
-            print(f"✅ Slack 알림 전송 성공!")
-            return True
-        else:
-            print(f"❌ Slack 알림 전송 실패")
-            if result.stderr:
-                print(f"   에러: {result.stderr}")
-            return False
-
-    except subprocess.TimeoutExpired:
-        print("⏱️  Slack 알림 전송 시간 초과 (10초)")
-        return False
-    except Exception as e:
-        print(f"❌ Slack 알림 전송 중 오류 발생: {e}")
-        return False
-
-
-def get_git_info() -> dict:
-    """
-    현재 Git 브랜치 및 커밋 정보를 가져옵니다.
+    # CI 실행 링크 (GitHub Actions / Jenkins)
+    run_url = test_result.get("run_url")
+    run_id = test_result.get("run_id")
+    if run_url or run_id:
+        slack_message["attachments"][0]["fields"].append({
+            "title": "CI 실행",
+            "value": f"<{run_url}|#{run_id}>" if run_url else f"#{run_id}",
+            "short": False
+        })
 
-    Returns:
-        dict: branch, commit 정보
-    """
-    info = {
-        "branch": "unknown",
-        "commit": "N/A"
+    return slack_message
+
+
+class SlackNotifier:
+    """디스크 재시도 큐 + 연결 풀 기반 Slack 전송기"""
+
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        queue_dir: Path = DEFAULT_QUEUE_DIR,
+        bot_token: Optional[str] = None,
+        channel: Optional[str] = None,
+        api_url: str = SLACK_API_URL,
+        retry_base_seconds: float = RETRY_BASE_SECONDS
+    ):
+        """
+        Args:
+            webhook_url: Slack Webhook URL (None이면 SLACK_WEBHOOK_URL 환경 변수)
+            queue_dir: 재시도 큐 디렉토리 (기본값: ~/seoltab_AT/slack_queue, SEOLTAB_SLACK_QUEUE 환경 변수로 변경)
+            bot_token: 스레드 답글용 봇 토큰 (None이면 SLACK_BOT_TOKEN 환경 변수)
+            channel: 봇이 메시지를 보낼 채널 ID (None이면 SLACK_CHANNEL 환경 변수)
+            api_url: chat.postMessage API URL
+            retry_base_seconds: 재시도 백오프 기본 간격 (초)
+        """
+        self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
+        self.bot_token = bot_token or os.getenv("SLACK_BOT_TOKEN")
+        self.channel = channel or os.getenv("SLACK_CHANNEL")
+        self.api_url = api_url
+        self.retry_base_seconds = retry_base_seconds
+        self.queue_dir = Path(queue_dir)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def use_threads(self) -> bool:
+        """봇 토큰 + 채널이 있으면 chat.postMessage로 스레드 답글 전송"""
+        return bool(self.bot_token and self.channel)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.webhook_url) or self.use_threads
+
+    def enqueue(self, message: dict, batch_key: str) -> Path:
+        """
+        메시지를 재시도 큐에 저장합니다. (Webhook URL / 토큰은 저장하지 않음)
+
+        Args:
+            message: Slack 메시지 payload
+            batch_key: 묶음 전송 기준 (같은 키의 대기 메시지는 하나로 합치거나 같은 스레드로 전송)
+
+        Returns:
+            큐 파일 경로
+        """
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"message": message, "batch_key": batch_key, "created_at": time.time(),
+                 "attempts": 0, "next_attempt_at": 0, "last_error": None}
+        path = self.queue_dir / f"{QUEUE_FILE_PREFIX}{time.time():.6f}-{uuid.uuid4().hex[:8]}.json"
+        _write_json_atomic(path, entry)
+        return path
+
+    def pending(self) -> List[Path]:
+        """큐에 남아 있는 메시지 파일 (오래된 순)"""
+        if not self.queue_dir.exists():
+            return []
+        return sorted(self.queue_dir.glob(f"{QUEUE_FILE_PREFIX}*.json"))
+
+    def flush(self) -> int:
+        """
+        재시도 시각이 된 메시지를 전송합니다. 다른 프로세스가 전송 중이면 바로 반환합니다.
+
+        Returns:
+            전송한 메시지 수
+        """
+        if not self.configured or not self.queue_dir.exists():
+            return 0
+
+        with open(self.queue_dir / ".lock", 'w') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            try:
+                return self._flush_locked()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def flush_async(self) -> threading.Thread:
+        """
+        백그라운드 스레드에서 flush()를 실행합니다.
+        프로세스 종료 시 최대 EXIT_FLUSH_TIMEOUT초 기다리고, 못 보낸 메시지는 큐에 남습니다.
+        """
+        self._thread = threading.Thread(target=self._flush_safely, name="slack-notifier", daemon=True)
+        self._thread.start()
+        atexit.register(self.wait, EXIT_FLUSH_TIMEOUT)
+        return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """백그라운드 전송이 끝나기를 기다립니다. (끝났으면 True)"""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _flush_safely(self):
+        try:
+            sent = self.flush()
+            if sent:
+                print(f"✅ Slack 알림 전송 성공! ({sent}건)")
+        except Exception as e:
+            print(f"❌ Slack 알림 전송 중 오류 발생 (큐에 남겨 다음 실행에서 재시도): {e}")
+
+    def _flush_locked(self) -> int:
+        now = time.time()
+        batches: Dict[str, List[tuple]] = {}
+        for path in self.pending():
+            try:
+                entry = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self._move_to_failed(path)
+                continue
+            if entry.get("next_attempt_at", 0) <= now:
+                batches.setdefault(entry["batch_key"], []).append((path, entry))
+
+        sent = 0
+        for batch_key, items in batches.items():
+            if self.use_threads:
+                # 같은 커밋의 결과는 첫 메시지의 스레드 답글로 하나씩 전송
+                for path, entry in items:
+                    error, permanent = self._post_threaded(batch_key, entry["message"])
+                    sent += self._settle([(path, entry)], error, permanent)
+            else:
+                error, permanent = self._post_webhook(merge_messages([entry["message"] for _, entry in items], batch_key))
+                sent += self._settle(items, error, permanent)
+        return sent
+
+    def _settle(self, items: List[tuple], error: Optional[str], permanent: bool) -> int:
+        """전송 결과 반영: 성공하면 삭제, 실패하면 재시도 시각 기록 (횟수 초과 / 영구 오류는 failed/로 이동)"""
+        if error is None:
+            for path, _ in items:
+                path.unlink(missing_ok=True)
+            return len(items)
+
+        print(f"❌ Slack 알림 전송 실패 ({len(items)}건): {error}")
+        for path, entry in items:
+            entry["attempts"] += 1
+            entry["last_error"] = error
+            if permanent or entry["attempts"] >= MAX_ATTEMPTS:
+                _write_json_atomic(path, entry)
+                self._move_to_failed(path)
+                continue
+            delay = min(self.retry_base_seconds * 2 ** (entry["attempts"] - 1), RETRY_MAX_SECONDS)
+            entry["next_attempt_at"] = time.time() + delay
+            _write_json_atomic(path, entry)
+        return 0
+
+    def _move_to_failed(self, path: Path):
+        failed_dir = self.queue_dir / "failed"
+        failed_dir.mkdir(exist_ok=True)
+        os.replace(path, failed_dir / path.name)
+        print(f"⚠️  Slack 메시지를 더 이상 재시도하지 않습니다: {failed_dir / path.name}")
+
+    def _post_webhook(self, message: dict) -> tuple:
+        """Incoming Webhook 전송 → (오류 메시지 또는 None, 영구 오류 여부)"""
+        try:
+            response = _http.request("POST", self.webhook_url, body=json.dumps(message).encode('utf-8'),
+                                     headers={"Content-Type": "application/json"})
+        except urllib3.exceptions.HTTPError as e:
+            return f"{type(e).__name__}: {e}", False
+        body = response.data.decode('utf-8', errors='replace').strip()
+        if response.status == 200 and body == "ok":
+            return None, False
+        return f"HTTP {response.status} {body[:200]}", response.status in PERMANENT_ERROR_STATUSES
+
+    def _post_threaded(self, batch_key: str, message: dict) -> tuple:
+        """chat.postMessage 전송 (같은 batch_key의 첫 메시지가 스레드 부모) → (오류 메시지 또는 None, 영구 오류 여부)"""
+        threads = self._load_threads()
+        parent = threads.get(batch_key)
+        payload = {"channel": self.channel, **message}
+        if parent:
+            payload["thread_ts"] = parent["ts"]
+        try:
+            response = _http.request(
+                "POST", self.api_url, body=json.dumps(payload).encode('utf-8'),
+                headers={"Content-Type": "application/json; charset=utf-8",
+                         "Authorization": f"Bearer {self.bot_token}"}
+            )
+        except urllib3.exceptions.HTTPError as e:
+            return f"{type(e).__name__}: {e}", False
+        if response.status != 200:
+            return f"HTTP {response.status}", response.status in PERMANENT_ERROR_STATUSES
+        try:
+            result = json.loads(response.data.decode('utf-8'))
+        except ValueError:
+            return "응답을 해석할 수 없습니다", False
+        if not result.get("ok"):
+            # ratelimited 등 일시적 오류만 재시도
+            return f"Slack API 오류: {result.get('error')}", result.get("error") != "ratelimited"
+        if not parent:
+            threads[batch_key] = {"ts": result["ts"], "created_at": time.time()}
+            self._save_threads(threads)
+        return None, False
+
+    def _load_threads(self) -> Dict[str, dict]:
+        path = self.queue_dir / "threads.json"
+        try:
+            threads = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        cutoff = time.time() - THREAD_TTL_SECONDS
+        return {key: value for key, value in threads.items() if value.get("created_at", 0) >= cutoff}
+
+    def _save_threads(self, threads: Dict[str, dict]):
+        _write_json_atomic(self.queue_dir / "threads.json", threads)
+
+
+def merge_messages(messages: List[dict], batch_key: str) -> dict:
+    """같은 batch_key의 대기 메시지를 하나로 합칩니다. (attachments를 이어붙임)"""
+    if len(messages) == 1:
+        return messages[0]
+    failed = sum(1 for message in messages if message["attachments"][0].get("color") == "danger")
+    summary = f"❌ {failed}개 실패" if failed else "✅ 모두 통과"
+    return {
+        "text": f"📦 테스트 결과 {len(messages)}건 ({batch_key}) - {summary}",
+        "attachments": [attachment for message in messages for attachment in message["attachments"]],
     }
 
-    try:
-        # 현재 브랜치
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info["branch"] = result.stdout.strip()
-
-        # 현재 커밋 해시
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info["commit"] = result.stdout.strip()
-
-    except Exception:
-        pass
-
-    return info
+
+def _write_json_atomic(path: Path, data):
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    os.replace(temp_path, path)
 
 
 def get_local_report_url() -> str:
@@ -207,6 +459,13 @@ def get_local_report_url() -> str:
 
 
 if __name__ == "__main__":
+    # 큐에 남은 메시지 전송
+    if len(sys.argv) > 1 and sys.argv[1] == "flush":
+        notifier = SlackNotifier()
+        print(f"📨 Slack 전송 큐: {len(notifier.pending())}건 ({notifier.queue_dir})")
+        print(f"✅ 전송: {notifier.flush()}건, 남은 메시지: {len(notifier.pending())}건")
+        sys.exit(0)
+
     # 테스트용
     print("Slack 알림 테스트")
     print("=" * 60)
@@ -226,7 +485,7 @@ if __name__ == "__main__":
     # 로컬 리포트 URL
     report_url = get_local_report_url()
 
-    # Slack 알림 전송
+    # Slack 알림 전송 (큐에 저장 후 백그라운드 전송, 종료 시 최대 EXIT_FLUSH_TIMEOUT초 대기)
     success = send_slack_notification(report_url, test_result)
 
     if success:
@@ -0,0 +1,217 @@
+"""
+스마트 폴링 대기 엔진
+
+Selenium WebDriverWait(고정 0.5초 폴링)을 대체합니다.
+    - 지수 폴링: 처음에는 짧게(0.1초) 확인하고 점점 간격을 늘림 (최대 1초)
+    - 적응형 폴링: 조건 확인에 걸린 시간(Appium 왕복 시간)만큼 대기 시간을 줄임
+    - 여러 조건 중 먼저 만족되는 상태를 바로 반환 (until_any)
+      잘못된 locator(InvalidSelectorException)인 조건은 제외하고 나머지 조건으로 계속 대기
+    - locator별 대기 시간 통계 (wait_stats)
+
+사용 예시:
+    state, element = SmartWait(driver, timeout=30).until_any({
+        "login_form": EC.visibility_of_element_located(EMAIL_INPUT),
+        "logged_in": EC.visibility_of_element_located(INTRO_POPUP),
+    })
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+
+DEFAULT_INITIAL_POLL = 0.1
+DEFAULT_MAX_POLL = 1.0
+DEFAULT_BACKOFF = 1.5
+
+
+class WaitStats:
+    """locator별 대기 시간 통계 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, dict] = {}
+
+    def record(self, label: str, elapsed: float, polls: int, success: bool):
+        """대기 결과 1건을 기록합니다."""
+        with self._lock:
+            stat = self._stats.setdefault(label, {
+                "count": 0, "timeouts": 0, "polls": 0, "total": 0.0, "max": 0.0
+            })
+            stat["count"] += 1
+            stat["polls"] += polls
+            stat["total"] += elapsed
+            stat["max"] = max(stat["max"], elapsed)
+            if not success:
+                stat["timeouts"] += 1
+
+    def merge(self, other: Dict[str, dict]):
+        """다른 프로세스(xdist 워커)에서 수집한 통계를 합칩니다."""
+        with self._lock:
+            for label, incoming in other.items():
+                stat = self._stats.setdefault(label, {
+                    "count": 0, "timeouts": 0, "polls": 0, "total": 0.0, "max": 0.0
+                })
+                for key in ("count", "timeouts", "polls", "total"):
+                    stat[key] += incoming[key]
+                stat["max"] = max(stat["max"], incoming["max"])
+
+    def as_dict(self) -> Dict[str, dict]:
+        """통계 사본을 반환합니다. (평균 대기 시간 포함)"""
+        with self._lock:
+            return {
+                label: {**stat, "avg": stat["total"] / stat["count"] if stat["count"] else 0.0}
+                for label, stat in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def print_summary(self, max_rows: int = 15):
+        """총 대기 시간이 긴 순서로 locator별 통계를 출력합니다."""
+        stats = self.as_dict()
+        if not stats:
+            return
+
+        print(f"\n⏳ locator별 대기 시간 통계 (총 대기 시간 순, 상위 {max_rows}개)")
+        print(f"{'Locator':<60} {'횟수':>5} {'타임아웃':>8} {'평균(s)':>8} {'최대(s)':>8} {'합계(s)':>8}")
+        print("-" * 102)
+        rows = sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True)
+        for label, stat in rows[:max_rows]:
+            short_label = label if len(label) <= 58 else label[:55] + "..."
+            print(f"{short_label:<60} {stat['count']:>5} {stat['timeouts']:>8} "
+                  f"{stat['avg']:>8.2f} {stat['max']:>8.2f} {stat['total']:>8.2f}")
+
+
+# 프로세스 전체에서 공유하는 통계
+wait_stats = WaitStats()
+
+
+def locator_label(locator) -> str:
+    """(By, value) 튜플을 통계용 문자열로 변환합니다."""
+    if isinstance(locator, tuple) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    return str(locator)
+
+
+class SmartWait:
+    """지수/적응형 폴링으로 조건을 기다리는 대기 객체"""
+
+    def __init__(
+        self,
+        driver,
+        timeout: float,
+        initial_poll: float = DEFAULT_INITIAL_POLL,
+        max_poll: float = DEFAULT_MAX_POLL,
+        backoff: float = DEFAULT_BACKOFF,
+        ignored_exceptions: tuple = (NoSuchElementException, StaleElementReferenceException),
+        stats: Optional[WaitStats] = wait_stats
+    ):
+        """
+        Args:
+            driver: Appium WebDriver
+            timeout: 최대 대기 시간 (초)
+            initial_poll: 첫 폴링 간격 (초)
+            max_poll: 최대 폴링 간격 (초)
+            backoff: 폴링 간격 증가 배수
+            ignored_exceptions: 조건 확인 중 무시할 예외
+            stats: 대기 시간을 기록할 통계 객체 (None이면 기록하지 않음)
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.ignored_exceptions = ignored_exceptions
+        self.stats = stats
+
+    def until(self, condition: Callable, label: str = "", message: str = ""):
+        """
+        조건이 참(truthy)을 반환할 때까지 기다립니다.
+
+        Args:
+            condition: driver를 인자로 받는 조건 함수 (예: EC.visibility_of_element_located(locator))
+            label: 통계에 사용할 이름 (보통 locator 문자열)
+            message: 타임아웃 시 예외 메시지
+
+        Returns:
+            조건 함수의 반환값
+
+        Raises:
+            TimeoutException: timeout 내에 조건이 만족되지 않은 경우
+        """
+        _, value = self.until_any({label or "condition": condition}, label=label, message=message)
+        return value
+
+    def until_any(self, conditions: Dict[str, Callable], label: str = "", message: str = "") -> Tuple[str, object]:
+        """
+        여러 조건 중 가장 먼저 만족되는 조건을 기다립니다.
+        매 폴링마다 조건을 딕셔너리 순서대로 확인하므로, 동시에 만족되면 앞의 조건이 우선합니다.
+        잘못된 locator(InvalidSelectorException)인 조건은 경고를 출력하고 이후 폴링에서 제외합니다.
+
+        Args:
+            conditions: {상태 이름: 조건 함수} 딕셔너리
+            label: 통계에 사용할 이름 (없으면 상태 이름들을 이어 붙임)
+            message: 타임아웃 시 예외 메시지
+
+        Returns:
+            (만족된 상태 이름, 조건 함수의 반환값)
+
+        Raises:
+            TimeoutException: timeout 내에 어떤 조건도 만족되지 않은 경우
+            InvalidSelectorException: 모든 조건의 locator가 잘못된 경우
+        """
+        label = label or " | ".join(conditions)
+        active = dict(conditions)
+        start_time = time.monotonic()
+        deadline = start_time + self.timeout
+        interval = self.initial_poll
+        polls = 0
+        last_error = None
+
+        while True:
+            poll_start = time.monotonic()
+            polls += 1
+
+            for name, condition in list(active.items()):
+                try:
+                    value = condition(self.driver)
+                except InvalidSelectorException as e:
+                    # 잘못된 locator 하나 때문에 다른 상태를 기다리지 못하는 일이 없도록 이 조건만 제외
+                    print(f"⚠️  잘못된 locator라 '{name}' 조건을 제외하고 대기합니다: {e.msg}")
+                    del active[name]
+                    if not active:
+                        self._record(label, time.monotonic() - start_time, polls, False)
+                        raise
+                    continue
+                except self.ignored_exceptions as e:
+                    last_error = e
+                    continue
+                if value:
+                    self._record(label, time.monotonic() - start_time, polls, True)
+                    return name, value
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            # 조건 확인에 걸린 시간만큼 덜 기다리고, 남은 timeout을 넘기지 않음
+            sleep_time = min(max(0.0, interval - (now - poll_start)), deadline - now)
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            interval = min(interval * self.backoff, self.max_poll)
+
+        self._record(label, time.monotonic() - start_time, polls, False)
+        raise TimeoutException(message or f"{self.timeout}초 안에 조건을 만족하지 못했습니다: {label}",
+                               stacktrace=getattr(last_error, "stacktrace", None))
+
+    def _record(self, label: str, elapsed: float, polls: int, success: bool):
+        if self.stats is not None:
+            self.stats.record(label, elapsed, polls, success)
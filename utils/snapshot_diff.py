@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+화면 스냅샷 비교 (앱 빌드 간 UI 변경 감지)
+
+저장해둔 화면 스냅샷(elements/*.json, *.snapshot.json, 페이지 소스 .xml)과 새로 캡처한 화면을
+트리 매칭으로 비교해서 추가/삭제/이동/변경된 요소를 찾고,
+Page Object locator(HomePage, LoginPage, MyPage 상수) 중 새 화면에서 깨지는 것을 알려줍니다.
+디바이스 테스트를 돌리지 않고도 새 빌드에서 locator를 몇 초 만에 다시 검증할 수 있습니다.
+
+트리 매칭 (GumTree 방식, 요소 수에 거의 비례):
+    1. 위→아래: 내용이 같은 서브트리(해시 일치)를 통째로 매칭
+    2. 이름 매칭: type + name이 양쪽에서 유일한 요소끼리 매칭 (부모가 바뀐 요소)
+    3. 아래→위: 매칭된 자손을 많이 공유하는 같은 type의 부모끼리 매칭하고,
+       그 자식들 중 남은 요소를 type/name 순서대로 매칭
+    4. 위→아래 복구: 매칭된 부모의 남은 자식을 type/name 순서대로 매칭
+
+사용 예시:
+    python3 utils/snapshot_diff.py elements/student_home.json new_student_home.xml
+"""
+import bisect
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python path에 추가 (CLI로 실행할 때)
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils.element_finder import ElementFinder
+from utils.snapshot_store import SnapshotStore
+
+
+# 요소 식별에 사용하는 속성 (서브트리 해시)
+LABEL_KEYS = ('type', 'name', 'label', 'value')
+# 변경 여부를 비교하는 속성
+COMPARE_KEYS = ('name', 'label', 'value', 'enabled', 'visible', 'x', 'y', 'width', 'height')
+# 아래→위 매칭에서 부모끼리 매칭하기 위한 최소 자손 공유 비율 (Dice 계수)
+MIN_DICE = 0.5
+
+
+class Screen:
+    """비교할 화면 하나 (스냅샷 + locator 평가용 ElementFinder)"""
+
+    def __init__(self, store: SnapshotStore, finder: Optional[ElementFinder] = None, source: str = ''):
+        """
+        Args:
+            store: 화면의 컬럼형 스냅샷
+            finder: locator 평가에 사용할 ElementFinder (없으면 스냅샷에서 페이지 소스를 만들어 생성)
+            source: 화면을 읽어온 파일 경로 (보고서 표시용)
+        """
+        self.store = store
+        self.source = source
+        self._finder = finder
+
+        self.parents: List[int] = store.columns['parent']
+        self.children: List[List[int]] = [[] for _ in self.parents]
+        for index, parent in enumerate(self.parents):
+            if parent >= 0:
+                self.children[parent].append(index)
+
+        self.labels = [tuple(store.get_attribute(index, key) for key in LABEL_KEYS) for index in range(len(store))]
+
+        # 서브트리 해시와 크기 (문서 순서에서 자식은 항상 부모보다 뒤에 있으므로 역순으로 계산)
+        self.hashes = [0] * len(store)
+        self.sizes = [1] * len(store)
+        for index in range(len(store) - 1, -1, -1):
+            children = self.children[index]
+            self.hashes[index] = hash((self.labels[index], tuple(self.hashes[child] for child in children)))
+            self.sizes[index] += sum(self.sizes[child] for child in children)
+
+    @classmethod
+    def load(cls, path: str) -> 'Screen':
+        """스냅샷 파일(.json / .snapshot.json) 또는 페이지 소스 파일(.xml)을 읽습니다."""
+        if str(path).endswith('.xml'):
+            finder = ElementFinder(Path(path).read_text(encoding='utf-8'))
+            return cls(SnapshotStore.from_finder(finder), finder, str(path))
+        return cls(SnapshotStore.load(str(path)), source=str(path))
+
+    @classmethod
+    def from_page_source(cls, page_source: str, source: str = 'page_source') -> 'Screen':
+        """driver.page_source 문자열로 화면을 만듭니다."""
+        finder = ElementFinder(page_source)
+        return cls(SnapshotStore.from_finder(finder), finder, source)
+
+    @property
+    def finder(self) -> ElementFinder:
+        if self._finder is None:
+            self._finder = ElementFinder(self.store.to_page_source())
+        return self._finder
+
+    def __len__(self):
+        return len(self.parents)
+
+    def xpath(self, index: int) -> str:
+        return self.store._get_paths()[0][index]
+
+    def descendants(self, index: int) -> List[int]:
+        """서브트리의 모든 요소 (자기 자신 포함, 문서 순서)"""
+        # 문서 순서에서 서브트리는 연속된 구간
+        return list(range(index, index + self.sizes[index]))
+
+
+class TreeMatcher:
+    """두 화면 트리의 요소를 1:1로 매칭합니다."""
+
+    def __init__(self, old: Screen, new: Screen):
+        self.old = old
+        self.new = new
+        self.old_to_new: Dict[int, int] = {}
+        self.new_to_old: Dict[int, int] = {}
+
+    def match(self) -> Dict[int, int]:
+        """
+        Returns:
+            이전 화면 요소 번호 → 새 화면 요소 번호
+        """
+        self._match_top_down()
+        self._match_unique_names()
+        self._match_bottom_up()
+        return self.old_to_new
+
+    def _add(self, old_index: int, new_index: int):
+        self.old_to_new[old_index] = new_index
+        self.new_to_old[new_index] = old_index
+
+    def _add_subtree(self, old_index: int, new_index: int):
+        # 해시가 같은 서브트리는 구조가 같으므로 문서 순서대로 짝지음
+        for old_child, new_child in zip(self.old.descendants(old_index), self.new.descendants(new_index)):
+            if old_child not in self.old_to_new and new_child not in self.new_to_old:
+                self._add(old_child, new_child)
+
+    def _match_top_down(self):
+        """내용이 같은 서브트리를 큰 것부터 통째로 매칭"""
+        new_by_hash: Dict[int, List[int]] = {}
+        for index, subtree_hash in enumerate(self.new.hashes):
+            new_by_hash.setdefault(subtree_hash, []).append(index)
+        old_by_hash: Dict[int, List[int]] = {}
+        for index, subtree_hash in enumerate(self.old.hashes):
+            old_by_hash.setdefault(subtree_hash, []).append(index)
+
+        for old_index in sorted(range(len(self.old)), key=lambda index: -self.old.sizes[index]):
+            if old_index in self.old_to_new:
+                continue
+            subtree_hash = self.old.hashes[old_index]
+
+            # 이름 없는 단일 요소는 같은 것이 여러 개면 구분할 수 없으므로 나중 단계에서 매칭
+            if self.old.sizes[old_index] == 1 and not any(self.old.labels[old_index][1:]):
+                if len(new_by_hash.get(subtree_hash, [])) > 1 or len(old_by_hash[subtree_hash]) > 1:
+                    continue
+
+            # 이미 매칭된 후보는 목록에서 제거해두고 남은 후보만 확인
+            candidates = new_by_hash[subtree_hash] = [
+                index for index in new_by_hash.get(subtree_hash, []) if index not in self.new_to_old
+            ]
+            if not candidates:
+                continue
+
+            # 같은 해시가 여러 개면 부모가 이미 매칭된 후보 > 문서 내 상대 위치가 가까운 후보
+            new_parent = self.old_to_new.get(self.old.parents[old_index])
+            relative = old_index / max(len(self.old), 1)
+            new_index = min(candidates, key=lambda index: (
+                self.new.parents[index] != new_parent,
+                abs(index / max(len(self.new), 1) - relative),
+            ))
+            self._add_subtree(old_index, new_index)
+
+    def _match_unique_names(self):
+        """type + name이 양쪽에서 하나뿐인 요소끼리 매칭 (부모가 바뀌어도 찾을 수 있음)"""
+        def unique_keys(screen: Screen, mapped: Dict[int, int]) -> Dict[Tuple[str, str], Optional[int]]:
+            keys: Dict[Tuple[str, str], Optional[int]] = {}
+            for index, (elem_type, name, _, _) in enumerate(screen.labels):
+                if name:
+                    keys[(elem_type, name)] = None if (elem_type, name) in keys else index
+            return {key: index for key, index in keys.items() if index is not None and index not in mapped}
+
+        old_keys = unique_keys(self.old, self.old_to_new)
+        new_keys = unique_keys(self.new, self.new_to_old)
+        for key, old_index in old_keys.items():
+            new_index = new_keys.get(key)
+            if new_index is not None:
+                self._add(old_index, new_index)
+
+    def _match_bottom_up(self):
+        """매칭된 자손을 많이 공유하는 부모끼리 매칭하고, 그 자식 중 남은 요소를 매칭"""
+        # 문서 역순 = 자식이 부모보다 먼저 처리됨
+        for old_index in range(len(self.old) - 1, -1, -1):
+            if old_index not in self.old_to_new and self.old.children[old_index]:
+                new_index = self._best_container(old_index)
+                if new_index is not None:
+                    self._add(old_index, new_index)
+            if old_index in self.old_to_new:
+                self._match_children(old_index, self.old_to_new[old_index])
+
+        # 루트는 항상 같은 요소
+        if len(self.old) and len(self.new) and 0 not in self.old_to_new and 0 not in self.new_to_old:
+            self._add(0, 0)
+
+        # 위→아래로 한 번 더: 매칭된 부모의 남은 자식을 매칭 (자손이 모두 바뀐 요소도 위치로 매칭됨)
+        for old_index in range(len(self.old)):
+            if old_index in self.old_to_new:
+                self._match_children(old_index, self.old_to_new[old_index])
+
+    def _best_container(self, old_index: int) -> Optional[int]:
+        """매칭된 자손의 새 화면 조상 중 자손 공유 비율이 가장 높은 같은 type 요소"""
+        elem_type = self.old.labels[old_index][0]
+        common: Dict[int, int] = {}
+        for descendant in self.old.descendants(old_index)[1:]:
+            mapped = self.old_to_new.get(descendant)
+            if mapped is None:
+                continue
+            ancestor = self.new.parents[mapped]
+            while ancestor >= 0:
+                common[ancestor] = common.get(ancestor, 0) + 1
+                ancestor = self.new.parents[ancestor]
+
+        best, best_dice = None, MIN_DICE
+        for candidate, shared in common.items():
+            if candidate in self.new_to_old or self.new.labels[candidate][0] != elem_type:
+                continue
+            dice = 2 * shared / ((self.old.sizes[old_index] - 1) + (self.new.sizes[candidate] - 1))
+            if dice > best_dice or (dice == best_dice and best is not None and candidate > best):
+                best, best_dice = candidate, dice
+        return best
+
+    def _match_children(self, old_parent: int, new_parent: int):
+        """매칭된 부모의 남은 자식을 (type, name, label) → type 순서로 매칭"""
+        old_children = [index for index in self.old.children[old_parent] if index not in self.old_to_new]
+        new_children = [index for index in self.new.children[new_parent] if index not in self.new_to_old]
+        if not old_children or not new_children:
+            return
+
+        for key_size in (3, 1):
+            remaining: Dict[tuple, List[int]] = {}
+            for index in reversed(new_children):
+                if index not in self.new_to_old:
+                    remaining.setdefault(self.new.labels[index][:key_size], []).append(index)
+            for index in old_children:
+                if index in self.old_to_new:
+                    continue
+                candidates = remaining.get(self.old.labels[index][:key_size])
+                if candidates:
+                    # 역순으로 담았으므로 pop()이 문서 순서상 첫 번째 후보
+                    self._add(index, candidates.pop())
+
+
+class SnapshotDiff:
+    """두 화면의 비교 결과"""
+
+    def __init__(self, old: Screen, new: Screen):
+        self.old = old
+        self.new = new
+        self.mapping = TreeMatcher(old, new).match()
+
+        self.removed = [index for index in range(len(old)) if index not in self.mapping]
+        matched_new = set(self.mapping.values())
+        self.added = [index for index in range(len(new)) if index not in matched_new]
+
+        moved = self._find_moved()
+        self.moved: List[Tuple[int, int]] = [(index, self.mapping[index]) for index in sorted(moved)]
+        self.changed: List[Tuple[int, int, Dict[str, Tuple[str, str]]]] = []
+        for old_index, new_index in sorted(self.mapping.items()):
+            changes = {
+                key: (old.store.get_attribute(old_index, key), new.store.get_attribute(new_index, key))
+                for key in COMPARE_KEYS
+                if old.store.get_attribute(old_index, key) != new.store.get_attribute(new_index, key)
+            }
+            if changes:
+                self.changed.append((old_index, new_index, changes))
+
+    def _find_moved(self) -> set:
+        """
+        이동한 요소: 부모가 바뀐 요소 + 같은 부모 안에서 순서가 바뀐 요소
+        순서 변경은 매칭된 형제들의 새 위치에서 가장 긴 증가 부분 수열(LIS)에 들지 못한 요소만 표시합니다.
+        (요소 하나를 맨 뒤로 옮겨도 나머지 형제는 이동으로 표시되지 않음)
+        """
+        moved = set()
+        for old_index, new_index in self.mapping.items():
+            old_parent = self.old.parents[old_index]
+            new_parent = self.new.parents[new_index]
+            if old_parent >= 0 and new_parent >= 0 and self.mapping.get(old_parent) != new_parent:
+                moved.add(old_index)
+
+        for old_parent, new_parent in self.mapping.items():
+            kept = [index for index in self.old.children[old_parent]
+                    if index in self.mapping and self.new.parents[self.mapping[index]] == new_parent]
+            in_order = _longest_increasing([self.mapping[index] for index in kept])
+            moved.update(index for position, index in enumerate(kept) if position not in in_order)
+        return moved
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.moved or self.changed)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'moved': len(self.moved),
+            'changed': len(self.changed),
+            'unchanged': len(self.mapping) - len({old for old, _, _ in self.changed} | {old for old, _ in self.moved}),
+        }
+
+    def describe(self, screen: Screen, index: int) -> str:
+        """요소를 한 줄로 표시 (타입 + 이름/라벨 + 절대 XPath)"""
+        elem_type, name, label, _ = screen.labels[index]
+        short_type = elem_type.replace('XCUIElementType', '') or '*'
+        text = (name or label).replace('\n', ' ')
+        text = text if len(text) <= 30 else text[:27] + '...'
+        return f"{short_type} \"{text}\" {screen.xpath(index)}" if text else f"{short_type} {screen.xpath(index)}"
+
+
+def _longest_increasing(values: List[int]) -> set:
+    """가장 긴 증가 부분 수열에 속하는 위치 집합 (O(n log n))"""
+    tails: List[int] = []         # 길이별 마지막 값
+    tail_positions: List[int] = []
+    previous = [-1] * len(values)
+    for position, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    result = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        result.add(position)
+        position = previous[position]
+    return result
+
+
+def collect_page_locators(page_classes=None) -> Dict[str, Tuple[str, str]]:
+    """
+    Page Object 클래스의 locator 상수를 모읍니다.
+
+    Args:
+        page_classes: Page Object 클래스 리스트 (기본값: HomePage, LoginPage, MyPage)
+
+    Returns:
+        {"HomePage.GNB_HOME": (By, value), ...}
+    """
+    if page_classes is None:
+        from pages.home_page import HomePage
+        from pages.login_page import LoginPage
+        from pages.my_page import MyPage
+        page_classes = [HomePage, LoginPage, MyPage]
+
+    locators = {}
+    for page_class in page_classes:
+        for attr, value in vars(page_class).items():
+            if (attr.isupper() and isinstance(value, tuple) and len(value) == 2
+                    and all(isinstance(part, str) for part in value)):
+                locators[f"{page_class.__name__}.{attr}"] = value
+    return locators
+
+
+# locator 검사 결과 상태
+LOCATOR_OK = "ok"                   # 양쪽에서 찾음
+LOCATOR_BROKEN = "broken"           # 이전 화면에서는 찾았지만 새 화면에서는 못 찾음
+LOCATOR_CHANGED = "changed"         # 양쪽에서 찾았지만 일치하는 요소 수가 다름
+LOCATOR_NEW = "new"                 # 새 화면에서만 찾음
+LOCATOR_ABSENT = "absent"           # 양쪽 모두 없음 (이 화면의 locator가 아님)
+LOCATOR_UNSUPPORTED = "unsupported"  # 스냅샷에서 평가할 수 없는 locator
+
+
+def check_locators(old: Screen, new: Screen, locators: Dict[str, Tuple[str, str]]) -> Dict[str, Dict]:
+    """
+    locator마다 이전/새 화면에서 찾은 요소 수를 비교합니다.
+
+    Args:
+        old: 이전 화면
+        new: 새 화면
+        locators: {"이름": (By, value)} 딕셔너리
+
+    Returns:
+        {"이름": {"locator": (By, value), "status": 상태, "old_count": n, "new_count": n}}
+    """
+    results = {}
+    for name, locator in locators.items():
+        old_found = old.finder.find_by_locator(locator)
+        new_found = new.finder.find_by_locator(locator)
+
+        if old_found is None or new_found is None:
+            status, old_count, new_count = LOCATOR_UNSUPPORTED, None, None
+        else:
+            old_count, new_count = len(old_found), len(new_found)
+            if old_count and not new_count:
+                status = LOCATOR_BROKEN
+            elif new_count and not old_count:
+                status = LOCATOR_NEW
+            elif not old_count:
+                status = LOCATOR_ABSENT
+            elif old_count != new_count:
+                status = LOCATOR_CHANGED
+            else:
+                status = LOCATOR_OK
+
+        results[name] = {"locator": locator, "status": status, "old_count": old_count, "new_count": new_count}
+    return results
+
+
+def print_diff_report(diff: SnapshotDiff, locator_results: Optional[Dict[str, Dict]] = None, max_rows: int = 20):
+    """비교 결과를 보기 좋게 출력"""
+    summary = diff.summary()
+    print(f"\n{'='*80}")
+    print(f"화면 비교: {diff.old.source} → {diff.new.source}")
+    print('='*80)
+    print(f"요소 수: {len(diff.old)} → {len(diff.new)}  "
+          f"(추가 {summary['added']}, 삭제 {summary['removed']}, 이동 {summary['moved']}, "
+          f"변경 {summary['changed']}, 동일 {summary['unchanged']})")
+
+    sections = [
+        ("➕ 추가된 요소", [diff.describe(diff.new, index) for index in diff.added]),
+        ("➖ 삭제된 요소", [diff.describe(diff.old, index) for index in diff.removed]),
+        ("↪️  이동한 요소", [f"{diff.describe(diff.old, old)} → {diff.new.xpath(new)}" for old, new in diff.moved]),
+        ("✏️  변경된 요소", [
+            f"{diff.describe(diff.old, old)}  " + ", ".join(
+                f"{key}: {before!r} → {after!r}" for key, (before, after) in changes.items())
+            for old, _, changes in diff.changed
+        ]),
+    ]
+    for title, lines in sections:
+        if not lines:
+            continue
+        print(f"\n{title} ({len(lines)}개)")
+        print("-" * 80)
+        for line in lines[:max_rows]:
+            print(f"  {line}")
+        if len(lines) > max_rows:
+            print(f"  ... 및 {len(lines) - max_rows}개 더")
+
+    if locator_results:
+        print(f"\n📍 Page Object locator 검사")
+        print("-" * 80)
+        icons = {LOCATOR_OK: "✅", LOCATOR_BROKEN: "❌", LOCATOR_CHANGED: "⚠️ ", LOCATOR_NEW: "🆕",
+                 LOCATOR_ABSENT: "➖", LOCATOR_UNSUPPORTED: "❔"}
+        for name, result in locator_results.items():
+            if result['status'] == LOCATOR_UNSUPPORTED:
+                counts = "평가 불가"
+            else:
+                counts = f"{result['old_count']} → {result['new_count']}개"
+            print(f"  {icons[result['status']]} {name:<40} {result['status']:<12} {counts}")
+
+        broken = [name for name, result in locator_results.items() if result['status'] == LOCATOR_BROKEN]
+        if broken:
+            print(f"\n❌ 새 화면에서 깨지는 locator {len(broken)}개: {', '.join(broken)}")
+        else:
+            print(f"\n✅ 깨지는 locator가 없습니다.")
+
+
+def main():
+    """메인 함수 - CLI 인터페이스"""
+    if len(sys.argv) < 3:
+        print("사용법:")
+        print(f"  {sys.argv[0]} <old_snapshot> <new_snapshot>")
+        print(f"\n예시:")
+        print(f"  {sys.argv[0]} elements/student_home.json new_student_home.xml")
+        print(f"  {sys.argv[0]} elements/student_home.json elements/student_home_v2.snapshot.json")
+        sys.exit(1)
+
+    old = Screen.load(sys.argv[1])
+    new = Screen.load(sys.argv[2])
+    diff = SnapshotDiff(old, new)
+    locator_results = check_locators(old, new, collect_page_locators())
+    print_diff_report(diff, locator_results)
+
+    # 깨지는 locator가 있으면 실패 종료 코드 (CI에서 사용)
+    if any(result['status'] == LOCATOR_BROKEN for result in locator_results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+컬럼형 화면 스냅샷 저장소
+
+`ElementFinder.export_to_json()`으로 저장한 elements/*.json 은 요소마다 10개 키의 딕셔너리와
+9개 이상의 locator 문자열을 그대로 저장하므로 대부분이 반복되는 키와 중복 문자열입니다.
+이 모듈은 같은 정보를 작은 컬럼형 형식으로 저장하고 읽습니다.
+
+    - 문자열 테이블: 모든 속성 문자열을 한 번만 저장하고 컬럼에는 번호만 저장
+    - 좌표(x, y, width, height): 정수로 저장
+    - 부모 컬럼: 트리 구조를 요소 번호로 저장
+    - locator: 저장하지 않고, 요소를 조회할 때 트리 구조에서 계산 (build_locators)
+
+파일 형식:
+    {"format": "seoltab-snapshot", "version": 1, "strings": [...],
+     "columns": {"type": [...], "name": [...], ..., "x": [...], "parent": [...]}}
+
+사용 예시:
+    # 기존 JSON 또는 페이지 소스를 컬럼형 스냅샷으로 변환
+    python3 utils/snapshot_store.py elements/student_home.json
+
+    store = SnapshotStore.load("elements/student_home.snapshot.json")
+    for element in store.search("수강신청"):
+        print(element['locators']['recommended'])
+"""
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 프로젝트 루트를 Python path에 추가 (CLI로 실행할 때)
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils.element_finder import ElementFinder, build_locators
+
+
+SNAPSHOT_FORMAT = 'seoltab-snapshot'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = '.snapshot.json'
+
+# 문자열 테이블 번호로 저장하는 속성
+STRING_COLUMNS = ('type', 'name', 'label', 'value', 'enabled', 'visible')
+# 정수로 저장하는 좌표 속성
+COORDINATE_COLUMNS = ('x', 'y', 'width', 'height')
+# 요소 딕셔너리의 키 순서 (ElementFinder._element_to_dict와 동일)
+ELEMENT_KEYS = STRING_COLUMNS + COORDINATE_COLUMNS
+
+
+def _encode_coordinate(value: str):
+    """좌표 문자열 → 정수 (빈 값은 None, 정수가 아니면 문자열 그대로)"""
+    if value == '':
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return value
+    return number if str(number) == value else value
+
+
+def _decode_coordinate(value) -> str:
+    return '' if value is None else str(value)
+
+
+class SnapshotElement(Mapping):
+    """
+    스냅샷의 요소 하나 (읽기 전용 딕셔너리처럼 동작)
+    속성은 컬럼에서 바로 읽고, 'locators'는 처음 조회할 때 계산합니다.
+    """
+
+    __slots__ = ('_store', 'index', '_locators')
+
+    def __init__(self, store: 'SnapshotStore', index: int):
+        self._store = store
+        self.index = index
+        self._locators = None
+
+    def __getitem__(self, key):
+        if key == 'locators':
+            if self._locators is None:
+                self._locators = self._store.get_locators(self.index)
+            return self._locators
+        return self._store.get_attribute(self.index, key)
+
+    def __iter__(self):
+        yield from ELEMENT_KEYS
+        yield 'locators'
+
+    def __len__(self):
+        return len(ELEMENT_KEYS) + 1
+
+    def __repr__(self):
+        return f"SnapshotElement({self.index}, type={self['type']!r}, name={self['name']!r})"
+
+
+class SnapshotStore:
+    """컬럼형 스냅샷 (문자열 테이블 + 정수 좌표 + 부모 번호)"""
+
+    def __init__(self, strings: List[str], columns: Dict[str, list]):
+        """
+        Args:
+            strings: 문자열 테이블 (0번은 빈 문자열)
+            columns: 컬럼 이름 → 요소 수만큼의 값 리스트
+        """
+        self.strings = strings
+        self.columns = columns
+        # 절대 XPath / Class Chain 경로 (처음 locator를 조회할 때 한 번에 계산)
+        self._paths: Optional[Tuple[List[str], List[Optional[str]]]] = None
+
+    # ------------------------------------------------------------------
+    # 생성 / 저장 / 로드
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict], parents: List[int]) -> 'SnapshotStore':
+        """
+        요소 딕셔너리 리스트(문서 순서)와 부모 번호 리스트로 스냅샷을 만듭니다.
+
+        Args:
+            rows: type/name/label/... 키를 가진 요소 딕셔너리 리스트
+            parents: 요소별 부모 요소 번호 (루트는 -1)
+        """
+        strings = ['']
+        string_ids = {'': 0}
+        columns = {name: [] for name in ELEMENT_KEYS}
+
+        for row in rows:
+            for name in STRING_COLUMNS:
+                text = row.get(name, '')
+                string_id = string_ids.get(text)
+                if string_id is None:
+                    string_id = string_ids[text] = len(strings)
+                    strings.append(text)
+                columns[name].append(string_id)
+            for name in COORDINATE_COLUMNS:
+                columns[name].append(_encode_coordinate(row.get(name, '')))
+
+        columns['parent'] = list(parents)
+        return cls(strings, columns)
+
+    @classmethod
+    def from_page_source(cls, page_source: str) -> 'SnapshotStore':
+        """driver.page_source XML 문자열로 스냅샷을 만듭니다."""
+        return cls.from_finder(ElementFinder(page_source))
+
+    @classmethod
+    def from_finder(cls, finder: ElementFinder) -> 'SnapshotStore':
+        """이미 파싱한 ElementFinder로 스냅샷을 만듭니다."""
+        elements = finder._elements
+        positions = {elem: position for position, elem in enumerate(elements)}
+
+        parents = [-1] * len(elements)
+        for position, elem in enumerate(elements):
+            for child in elem:
+                parents[positions[child]] = position
+
+        return cls.from_rows([finder._element_to_dict(elem) for elem in elements], parents)
+
+    @classmethod
+    def from_legacy_elements(cls, elements: List[Dict]) -> 'SnapshotStore':
+        """
+        export_to_json()으로 저장한 기존 형식의 요소 리스트를 변환합니다.
+        트리 구조는 각 요소의 locators.xpath_absolute 경로에서 복원합니다.
+        (부모 경로 = 마지막 구간을 뗀 경로, 루트 바로 아래 요소의 부모는 첫 번째 요소)
+
+        Raises:
+            ValueError: xpath_absolute가 없거나 부모 요소를 찾을 수 없는 경우
+        """
+        parents = []
+        path_positions = {}
+
+        for position, element in enumerate(elements):
+            locator = (element.get('locators') or {}).get('xpath_absolute') or ''
+            if not locator.startswith('(AppiumBy.XPATH, "'):
+                raise ValueError(f"{position}번 요소에 xpath_absolute가 없어 트리 구조를 복원할 수 없습니다.")
+            xpath = locator[len('(AppiumBy.XPATH, "'):-len('")')]
+
+            if position == 0:
+                parents.append(-1)
+            else:
+                parent_path = xpath[:xpath.rindex('/')]
+                if parent_path == '':
+                    parents.append(0)
+                elif parent_path in path_positions:
+                    parents.append(path_positions[parent_path])
+                else:
+                    raise ValueError(f"{position}번 요소의 부모를 찾을 수 없습니다: {xpath}")
+            path_positions[xpath] = position
+
+        return cls.from_rows(elements, parents)
+
+    @classmethod
+    def load(cls, snapshot_file: str) -> 'SnapshotStore':
+        """
+        스냅샷 파일을 읽습니다. 기존 형식(요소 리스트) JSON이면 메모리에서 변환합니다.
+
+        Args:
+            snapshot_file: 스냅샷 파일 경로
+        """
+        with open(snapshot_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls.from_data(data)
+
+    @classmethod
+    def from_data(cls, data) -> 'SnapshotStore':
+        """json.load 결과(컬럼형 딕셔너리 또는 기존 요소 리스트)로 스냅샷을 만듭니다."""
+        if isinstance(data, list):
+            return cls.from_legacy_elements(data)
+        if data.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError("컬럼형 스냅샷 파일이 아닙니다.")
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {data.get('version')}")
+        return cls(data['strings'], data['columns'])
+
+    def to_page_source(self) -> str:
+        """
+        스냅샷을 페이지 소스 XML로 되돌립니다. (ElementFinder로 locator를 평가할 때 사용)
+        태그 이름은 type 속성을 사용하고, type이 없는 루트는 AppiumAUT로 만듭니다.
+        """
+        nodes = []
+        for index, parent in enumerate(self.columns['parent']):
+            attributes = {key: self.get_attribute(index, key) for key in ELEMENT_KEYS}
+            tag = attributes['type'] or ('AppiumAUT' if parent < 0 else 'XCUIElementTypeOther')
+            attributes = {key: value for key, value in attributes.items() if value != ''}
+            if parent < 0:
+                node = ET.Element(tag, attributes)
+            else:
+                node = ET.SubElement(nodes[parent], tag, attributes)
+            nodes.append(node)
+
+        if not nodes:
+            return '<AppiumAUT/>'
+        return ET.tostring(nodes[0], encoding='unicode')
+
+    def save(self, output_file: str):
+        """스냅샷을 공백 없는 JSON으로 저장합니다."""
+        data = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'strings': self.strings,
+            'columns': self.columns,
+        }
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.columns['parent'])
+
+    def __getitem__(self, index: int) -> SnapshotElement:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return SnapshotElement(self, index)
+
+    def __iter__(self) -> Iterator[SnapshotElement]:
+        for index in range(len(self)):
+            yield SnapshotElement(self, index)
+
+    def get_attribute(self, index: int, key: str) -> str:
+        """요소 속성 값 (문자열)"""
+        if key in STRING_COLUMNS:
+            return self.strings[self.columns[key][index]]
+        if key in COORDINATE_COLUMNS:
+            return _decode_coordinate(self.columns[key][index])
+        raise KeyError(key)
+
+    def get_rect(self, index: int) -> Optional[Tuple[int, int, int, int]]:
+        """요소의 (x, y, width, height) 정수 좌표 (좌표가 없으면 None)"""
+        rect = tuple(self.columns[name][index] for name in COORDINATE_COLUMNS)
+        if all(isinstance(value, int) for value in rect):
+            return rect
+        return None
+
+    def to_dict(self, index: int, include_locators: bool = True) -> Dict:
+        """요소를 기존 JSON 형식의 딕셔너리로 변환합니다."""
+        element_dict = {key: self.get_attribute(index, key) for key in ELEMENT_KEYS}
+        if include_locators:
+            element_dict['locators'] = self.get_locators(index)
+        return element_dict
+
+    def get_locators(self, index: int) -> Dict:
+        """요소의 locator 딕셔너리 (트리 구조에서 계산)"""
+        xpaths, class_chains = self._get_paths()
+        element_dict = {key: self.get_attribute(index, key) for key in ELEMENT_KEYS}
+        return build_locators(element_dict, xpaths[index], class_chains[index])
+
+    def _get_paths(self) -> Tuple[List[str], List[Optional[str]]]:
+        """
+        부모 컬럼으로 모든 요소의 절대 XPath와 Class Chain 경로를 계산합니다.
+        ElementFinder._get_paths()와 같은 규칙을 사용합니다.
+        """
+        if self._paths is not None:
+            return self._paths
+
+        types = [self.strings[string_id] for string_id in self.columns['type']]
+        parents = self.columns['parent']
+        count = len(parents)
+
+        # 부모별 같은 type 자식 수
+        type_totals: Dict[Tuple[int, str], int] = {}
+        for index in range(count):
+            key = (parents[index], types[index])
+            type_totals[key] = type_totals.get(key, 0) + 1
+
+        xpaths: List[str] = [''] * count
+        class_chains: List[Optional[str]] = [None] * count
+        xpath_prefixes: List[str] = [''] * count     # 자식 XPath 앞에 붙을 접두사
+        chain_prefixes: List[Optional[str]] = [None] * count
+        type_seen: Dict[Tuple[int, str], int] = {}
+        child_positions: Dict[int, int] = {}
+
+        # 요소는 문서 순서이므로 부모가 항상 자식보다 먼저 나옴
+        for index in range(count):
+            elem_type = types[index]
+            segment_type = elem_type or '*'
+            parent = parents[index]
+
+            if parent < 0:
+                # 루트: 자기 자신은 '/type', 자식 경로에서는 루트 구간을 생략
+                xpaths[index] = '/' + segment_type
+                chain = None
+            else:
+                key = (parent, elem_type)
+                type_seen[key] = type_seen.get(key, 0) + 1
+                child_positions[parent] = child_positions.get(parent, 0) + 1
+
+                if type_totals[key] > 1:
+                    xpaths[index] = f"{xpath_prefixes[parent]}/{segment_type}[{type_seen[key]}]"
+                else:
+                    xpaths[index] = f"{xpath_prefixes[parent]}/{segment_type}"
+                xpath_prefixes[index] = xpaths[index]
+
+                chain = None
+                if chain_prefixes[parent] is not None:
+                    chain_index = type_seen[key] if elem_type else child_positions[parent]
+                    chain = f"{chain_prefixes[parent]}{segment_type}[{chain_index}]"
+                class_chains[index] = chain
+
+            if elem_type == 'XCUIElementTypeApplication':
+                chain_prefixes[index] = ''
+            elif chain is not None:
+                chain_prefixes[index] = chain + '/'
+
+        self._paths = (xpaths, class_chains)
+        return self._paths
+
+    def search(self, search_term: str, search_in: List[str] = None) -> List[SnapshotElement]:
+        """
+        속성에 검색어가 포함된 요소 (대소문자 구분 없음)
+        문자열 테이블에서 일치하는 문자열을 먼저 찾고, 해당 번호를 가진 요소만 고릅니다.
+
+        Args:
+            search_term: 검색할 텍스트
+            search_in: 검색할 필드 리스트 (기본값: ['name', 'label', 'value'])
+        """
+        if search_in is None:
+            search_in = ['name', 'label', 'value']
+
+        search_lower = search_term.lower()
+        matched_ids = {string_id for string_id, text in enumerate(self.strings) if search_lower in text.lower()}
+        columns = [self.columns[name] for name in search_in if name in STRING_COLUMNS]
+
+        return [SnapshotElement(self, index) for index in range(len(self))
+                if any(column[index] in matched_ids for column in columns)]
+
+    def find_by_type(self, element_type: str) -> List[SnapshotElement]:
+        """요소 타입으로 검색"""
+        try:
+            string_id = self.strings.index(element_type)
+        except ValueError:
+            return []
+        return [SnapshotElement(self, index)
+                for index, type_id in enumerate(self.columns['type']) if type_id == string_id]
+
+
+def is_snapshot_data(data) -> bool:
+    """json.load 결과가 컬럼형 스냅샷인지 확인합니다."""
+    return isinstance(data, dict) and data.get('format') == SNAPSHOT_FORMAT
+
+
+def convert_file(input_file: str, output_file: Optional[str] = None) -> str:
+    """
+    기존 JSON(요소 리스트) 또는 페이지 소스 XML 파일을 컬럼형 스냅샷으로 변환합니다.
+
+    Args:
+        input_file: elements/*.json 또는 페이지 소스 .xml 파일
+        output_file: 저장할 경로 (기본값: 입력 파일 이름 + .snapshot.json)
+
+    Returns:
+        저장한 파일 경로
+    """
+    input_path = Path(input_file)
+    if output_file is None:
+        output_file = str(input_path.with_name(input_path.stem + SNAPSHOT_SUFFIX))
+
+    if input_path.suffix == '.xml':
+        store = SnapshotStore.from_page_source(input_path.read_text(encoding='utf-8'))
+    else:
+        store = SnapshotStore.load(str(input_path))
+    store.save(output_file)
+    return output_file
+
+
+def main():
+    """메인 함수 - 변환 CLI"""
+    if len(sys.argv) < 2:
+        print("사용법:")
+        print(f"  {sys.argv[0]} <json_or_xml_file> [output_file]")
+        print(f"\n예시:")
+        print(f"  {sys.argv[0]} elements/student_home.json   # elements/student_home.snapshot.json 생성")
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    output_file = convert_file(input_file, sys.argv[2] if len(sys.argv) > 2 else None)
+
+    # 크기 / 로드 시간 비교
+    input_size = Path(input_file).stat().st_size
+    output_size = Path(output_file).stat().st_size
+    start_time = time.perf_counter()
+    store = SnapshotStore.load(output_file)
+    load_time = time.perf_counter() - start_time
+
+    print(f"✅ {output_file} 저장 완료 (요소 {len(store)}개)")
+    print(f"   크기: {input_size / 1024:.1f}KB → {output_size / 1024:.1f}KB "
+          f"({input_size / max(output_size, 1):.1f}배 감소)")
+    print(f"   로드 시간: {load_time * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
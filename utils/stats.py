@@ -0,0 +1,17 @@
+"""
+통계 도우미
+
+여러 리포트(locator 조회 시간, allure.step 단계 시간)가 같은 방식으로 요약하도록 공통 계산을 모아둡니다.
+
+사용 예시:
+    percentile([0.4, 1.2, 0.8], 95)    # 1.2
+"""
+import math
+from typing import List
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
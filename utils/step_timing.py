@@ -0,0 +1,166 @@
+"""
+allure.step 단계별 소요 시간 수집기
+
+테스트의 `with allure.step("로그인 수행"):` 구간 시간을 세션 전체에서 모아
+단계 이름 + 디바이스별 p50/p95를 계산합니다. (allure_commons 플러그인 훅 사용)
+
+출력:
+    - 세션 종료 시 단계별 소요 시간 표 출력, reports/step_timings.json 저장
+    - Allure 리포트 Environment 위젯 (allure-results/environment.properties)
+    - Slack 알림 메시지 (send_slack_notification의 test_result["step_timings"])
+
+사용 예시:
+    step_timings.register()          # pytest_configure에서 한 번
+    step_timings.device = "stg_iPad" # driver fixture에서 현재 디바이스 지정
+    ...
+    step_timings.print_summary()
+"""
+import json
+import os
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional
+
+import allure_commons
+
+from utils.allure_report import update_environment_properties
+from utils.stats import percentile
+
+
+STEP_TIMINGS_FILE = "reports/step_timings.json"
+# environment.properties에서 단계 시간 항목을 구분하는 접두사
+ENVIRONMENT_KEY_PREFIX = "step."
+
+
+class StepTimingCollector:
+    """allure.step 구간 시간 수집기 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._registered = False
+        self._open: Dict[str, tuple] = {}
+        self._samples: Dict[tuple, dict] = {}
+        # 현재 테스트가 사용하는 디바이스 (driver fixture에서 지정)
+        self.device: Optional[str] = None
+
+    def register(self):
+        """allure_commons 플러그인으로 등록합니다. (여러 번 호출해도 한 번만 등록)"""
+        if not self._registered:
+            allure_commons.plugin_manager.register(self)
+            self._registered = True
+
+    def unregister(self):
+        if self._registered:
+            allure_commons.plugin_manager.unregister(self)
+            self._registered = False
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        with self._lock:
+            self._open[uuid] = (title, self.device or "-", time.perf_counter())
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        end_time = time.perf_counter()
+        with self._lock:
+            if uuid not in self._open:
+                return
+            title, device, start_time = self._open.pop(uuid)
+            sample = self._samples.setdefault((title, device), {"durations": [], "failures": 0})
+            sample["durations"].append(end_time - start_time)
+            if exc_type is not None:
+                sample["failures"] += 1
+
+    def as_list(self) -> List[dict]:
+        """수집한 구간 시간 사본 (xdist workeroutput 전달용)"""
+        with self._lock:
+            return [
+                {"step": step, "device": device, "durations": list(sample["durations"]), "failures": sample["failures"]}
+                for (step, device), sample in self._samples.items()
+            ]
+
+    def merge(self, samples: List[dict]):
+        """다른 프로세스(xdist 워커)에서 수집한 구간 시간을 합칩니다."""
+        with self._lock:
+            for incoming in samples:
+                sample = self._samples.setdefault((incoming["step"], incoming["device"]), {"durations": [], "failures": 0})
+                sample["durations"].extend(incoming["durations"])
+                sample["failures"] += incoming["failures"]
+
+    def reset(self):
+        with self._lock:
+            self._open.clear()
+            self._samples.clear()
+
+    def summary(self) -> List[dict]:
+        """
+        단계 이름 + 디바이스별 통계 (p50이 긴 순서)
+
+        Returns:
+            [{"step", "device", "count", "failures", "p50", "p95", "max", "total"}, ...] (시간 단위: 초)
+        """
+        rows = []
+        for sample in self.as_list():
+            durations = sample["durations"]
+            rows.append({
+                "step": sample["step"],
+                "device": sample["device"],
+                "count": len(durations),
+                "failures": sample["failures"],
+                "p50": statistics.median(durations),
+                "p95": percentile(durations, 95),
+                "max": max(durations),
+                "total": sum(durations),
+            })
+        rows.sort(key=lambda row: row["p50"], reverse=True)
+        return rows
+
+    def print_summary(self, max_rows: int = 15):
+        """단계별 소요 시간 표를 출력합니다."""
+        rows = self.summary()
+        if not rows:
+            return
+
+        print(f"\n🪜 단계별 소요 시간 (p50 순, 상위 {max_rows}개)")
+        print(f"{'단계':<40} {'디바이스':<28} {'횟수':>5} {'실패':>4} {'p50(s)':>8} {'p95(s)':>8} {'최대(s)':>8}")
+        print("-" * 106)
+        for row in rows[:max_rows]:
+            print(f"{row['step'][:40]:<40} {row['device'][:28]:<28} {row['count']:>5} {row['failures']:>4} "
+                  f"{row['p50']:>8.2f} {row['p95']:>8.2f} {row['max']:>8.2f}")
+
+    def save(self, output_file: str = STEP_TIMINGS_FILE):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def write_allure_environment(self, alluredir: str, max_rows: int = 20):
+        """
+        단계별 p50/p95를 Allure 리포트 Environment 위젯에 표시되도록 environment.properties에 씁니다.
+        파일이 이미 있으면 단계 시간 항목만 새로 씁니다.
+
+        Args:
+            alluredir: allure-results 디렉토리
+            max_rows: 기록할 최대 단계 수 (p50이 긴 순서)
+        """
+        rows = self.summary()
+        if not rows:
+            return
+        update_environment_properties(alluredir, ENVIRONMENT_KEY_PREFIX, {
+            f"{ENVIRONMENT_KEY_PREFIX}{row['step']} [{row['device']}]":
+                f"p50 {row['p50']:.2f}s / p95 {row['p95']:.2f}s (n={row['count']})"
+            for row in rows[:max_rows]
+        })
+
+    def format_for_slack(self, max_rows: int = 8) -> Optional[str]:
+        """Slack 메시지용 단계별 소요 시간 표 (코드 블록)"""
+        rows = self.summary()
+        if not rows:
+            return None
+        table = [f"{'단계':<24} {'디바이스':<16} {'p50':>6} {'p95':>6}"]
+        for row in rows[:max_rows]:
+            table.append(f"{row['step'][:24]:<24} {row['device'][:16]:<16} {row['p50']:>5.1f}s {row['p95']:>5.1f}s")
+        return "```\n" + "\n".join(table) + "\n```"
+
+
+# 프로세스 전체에서 공유하는 수집기
+step_timings = StepTimingCollector()